@@ -1,9 +1,35 @@
-# Note: For some reason, just importing the Qiskit libraries seems to take ~2 seconds and importing the IPython libraries seems to take ~1 second. Thus, to avoid delays when re-running the game, move the code to actually run the game to a separate cell
+# Note: For some reason, just importing the Qiskit libraries seems to take ~2 seconds and importing the IPython libraries seems to take ~1 second. Thus, both are only imported when first needed and, as soon as this code is run, the quantum backend is warmed up (Qiskit imported, backend created, first job executed) on a background thread (see start_warm_up()). To avoid delays when re-running the game, the code to actually run the game should still be in a separate cell
+from time import perf_counter
+# Used to measure how long it takes to run (import) this code -- see print_startup_time_report()
+MODULE_IMPORT_START_TIME = perf_counter()
+
+from array import array
+from bisect import bisect_left
+from collections import Counter, deque, OrderedDict
+from concurrent.futures import as_completed, Future, ProcessPoolExecutor, ThreadPoolExecutor
 from enum import auto, Enum
-from IPython.display import clear_output
+from functools import lru_cache, partial
+from io import StringIO
 from math import floor, log2
-from qiskit import Aer, execute, QuantumCircuit
+from pathlib import Path
+from queue import Empty, Queue
+from tempfile import TemporaryDirectory
+from threading import Condition, get_ident, Lock, Thread
 from time import sleep
+import asyncio
+import hashlib
+import json
+import multiprocessing
+import numpy as np
+import os
+import random
+import re
+import secrets
+import shutil
+import struct
+import sys
+import unicodedata
+import weakref
 
 
 # Every answer and guess has to contain this many letters/characters
@@ -15,18 +41,177 @@ MAX_ATTEMPTS = 6
 # Max number of guesses user can make in one attempt
 MAX_GUESSES_PER_ATTEMPT = 2
 
-# List (technically, tuple) of all possible answers
+# Each letter ('A' to 'Z' -> 0 to 25) fits in 5 bits, so a word fits in (5 * WORD_LENGTH) bits -- i.e. 25 bits, which fits in one 32-bit integer
+BITS_PER_LETTER = 5
+# Bit mask used to extract a single letter from a packed word
+LETTER_MASK = (1 << BITS_PER_LETTER) - 1
+
+
+def pack_word(word: str, word_length: int = WORD_LENGTH, bits_per_letter: int = BITS_PER_LETTER) -> int:
+    """Packs a word into a single integer, bits_per_letter bits per letter, with the first letter in the most significant bits
+    
+    Since the first letter is the most significant, sorting the packed integers gives the same order as sorting the words alphabetically
+    Eg. 'ABBEY' -> (0 << 20) | (1 << 15) | (1 << 10) | (4 << 5) | 24 = 33944
+
+    Raises ValueError if the word does not consist of word_length upper case letters (A-Z)
+    """
+    if (len(word) != word_length) or not (word.isascii() and word.isalpha() and word.isupper()):
+        raise ValueError(f'Cannot pack word: {word!r}')
+
+    packed_word = 0
+    for letter in word:
+        packed_word = (packed_word << bits_per_letter) | (ord(letter) - ord('A'))
+    return packed_word
+
+
+def unpack_word(packed_word: int, word_length: int = WORD_LENGTH, bits_per_letter: int = BITS_PER_LETTER, letter_mask: int = LETTER_MASK) -> str:
+    """Reverse of pack_word(): Converts a packed integer back into the word it represents
+    
+    Eg. 33944 -> 'ABBEY'
+    """
+    letters = []
+    for _ in range(word_length):
+        letters.append(chr(ord('A') + (packed_word & letter_mask)))
+        packed_word >>= bits_per_letter
+    # Letters were extracted from last to first
+    return ''.join(reversed(letters))
+
+
+def load_packed_words(file_path: Path) -> array:
+    """Returns the packed words (see pack_word()) stored in the given file
+    
+    If the packed (.bin) file doesn't exist, the plain text word list with the same name (.txt, one word per line) is read and packed instead
+    Raises ValueError if the words are not in strictly increasing (alphabetical) order
+    """
+    packed_words = array('I')
+    file_path = Path(file_path)
+    if file_path.exists():
+        packed_words.frombytes(file_path.read_bytes())
+        # Files are always stored in little-endian byte order
+        if sys.byteorder == 'big':
+            packed_words.byteswap()
+    else:
+        text_file_path = file_path.with_suffix('.txt')
+        if not text_file_path.exists():
+            raise FileNotFoundError(f'Word list not found: neither {file_path} nor {text_file_path} exists (set the QUANTUM_WORDLE_WORD_LISTS_DIRECTORY environment variable to the folder containing the word lists)')
+        with open(text_file_path) as text_file:
+            # Skip blank lines (eg. at the end of the file)
+            packed_words.extend(pack_word(word.strip().upper()) for word in text_file if word.strip())
+        file_path = text_file_path
+
+    # Compare each word with the next one
+    if np.any(np.diff(np.frombuffer(packed_words, dtype=np.uint32).astype(np.int64)) <= 0):
+        raise ValueError(f'Words in {file_path} are not in strictly increasing (alphabetical) order -- regenerate it with process-word-list.py')
+    return packed_words
+
+
+class PackedWordList:
+    """Read-only list of words, stored compactly as packed integers (see pack_word()) rather than as strings
+    
+    The packed words are only loaded from disk the first time the list is actually used, and each word is only decoded back into a string when it is accessed (eg. to be displayed)
+    The packed word files are generated by process-word-list.py (with the --packed option). If a packed file is missing, the plain text word list next to it (same name, but .txt) is packed on the fly instead
+    The words in each file must be in strictly increasing (alphabetical) order, since they are binary searched -- this is checked when they are loaded, so that an unsorted file fails loudly rather than causing lookups to silently miss
+    """
+
+    def __init__(self, *file_paths: Path):
+        # If multiple files are given, the list consists of the words in all of them, in the order the files were given
+        self.file_paths: tuple[Path] = file_paths
+        # Loaded on first use (see packed_words)
+        self._packed_words: array = None
+        # Index (in the combined list) at which each file's words end. Each file's words are sorted, which lets us binary search them
+        self._file_end_indices: list[int] = None
+
+    @property
+    def packed_words(self) -> array:
+        """Array of packed words (32-bit unsigned integers), loaded from disk on first access"""
+        if self._packed_words is None:
+            packed_words = array('I')
+            file_end_indices = []
+            for file_path in self.file_paths:
+                packed_words.extend(load_packed_words(file_path))
+                file_end_indices.append(len(packed_words))
+            self._file_end_indices = file_end_indices
+            self._packed_words = packed_words
+        return self._packed_words
+
+    def __len__(self) -> int:
+        return len(self.packed_words)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(unpack_word(packed_word) for packed_word in self.packed_words[index])
+        return unpack_word(self.packed_words[index])
+
+    def __iter__(self):
+        return map(unpack_word, self.packed_words)
+
+    def __contains__(self, word: str) -> bool:
+        try:
+            self.index(word)
+        except ValueError:
+            return False
+        return True
+
+    def index(self, word: str) -> int:
+        """Returns the index of the given word in the list. Raises ValueError if the word is not in the list"""
+        # Raises ValueError if word cannot be packed (and, thus, can't be in the list)
+        packed_word = pack_word(word)
+        packed_words = self.packed_words
+
+        # Binary search the (sorted) words from each file
+        file_start_index = 0
+        for file_end_index in self._file_end_indices:
+            index = bisect_left(packed_words, packed_word, file_start_index, file_end_index)
+            if (index < file_end_index) and (packed_words[index] == packed_word):
+                return index
+            file_start_index = file_end_index
+        raise ValueError(f'{word!r} is not in word list')
+
+    def to_letter_array(self, word_length: int = WORD_LENGTH, bits_per_letter: int = BITS_PER_LETTER, letter_mask: int = LETTER_MASK) -> np.ndarray:
+        """Returns the words as a 2D array of letters (see words_to_letter_array()), decoded directly from the packed words without creating any strings"""
+        packed_words = np.frombuffer(self.packed_words, dtype=np.uint32)
+        # Amount that each letter needs to be shifted right by to extract it
+        # Eg. Assuming word_length = 5 and bits_per_letter = 5: [20, 15, 10, 5, 0]
+        letter_shifts = bits_per_letter * np.arange(word_length - 1, -1, -1, dtype=np.uint32)
+        return ((packed_words[:, np.newaxis] >> letter_shifts) & letter_mask).astype(np.uint8)
+
+
+def find_word_lists_directory() -> Path:
+    """Returns the folder containing the word list files
+    
+    In order of preference:
+        The folder given by the QUANTUM_WORDLE_WORD_LISTS_DIRECTORY environment variable
+        The wordle-word-lists folder next to the folder containing this code (only known when this code is run as a file, not from a notebook cell)
+        The wordle-word-lists folder relative to the current working directory, which is the repo root when running the notebook
+    """
+    if 'QUANTUM_WORDLE_WORD_LISTS_DIRECTORY' in os.environ:
+        return Path(os.environ['QUANTUM_WORDLE_WORD_LISTS_DIRECTORY'])
+    if '__file__' in globals():
+        word_lists_directory = Path(__file__).resolve().parent.parent / 'wordle-word-lists'
+        if word_lists_directory.is_dir():
+            return word_lists_directory
+    return Path('internal-use-only/wordle-word-lists')
+
+
+# Folder containing the word list files
+WORD_LISTS_DIRECTORY = find_word_lists_directory()
+# Folder that files built from the word lists (eg. the feedback matrix) are cached in, so that they are found again no matter which folder the code is run from
+# Can be overridden by setting the QUANTUM_WORDLE_CACHE_DIRECTORY environment variable. Otherwise, they are kept next to the word lists they were built from
+CACHE_DIRECTORY = Path(os.environ.get('QUANTUM_WORDLE_CACHE_DIRECTORY', WORD_LISTS_DIRECTORY))
+
+# List of all possible answers
 # Number of words: 2,309
 # Source: https://gist.github.com/cfreshman/a7b776506c73284511034e63af1017ee
-ANSWERS = (
-    'ABACK', 'ABASE', 'ABATE', 'ABBEY', 'ABBOT', 'ABHOR', 'ABIDE', 'ABLED', 'ABODE', 'ABORT', 'ABOUT', 'ABOVE', 'ABUSE', 'ABYSS', 'ACORN', 'ACRID', 'ACTOR', 'ACUTE', 'ADAGE', 'ADAPT', 'ADEPT', 'ADMIN', 'ADMIT', 'ADOBE', 'ADOPT', 'ADORE', 'ADORN', 'ADULT', 'AFFIX', 'AFIRE', 'AFOOT', 'AFOUL', 'AFTER', 'AGAIN', 'AGAPE', 'AGATE', 'AGENT', 'AGILE', 'AGING', 'AGLOW', 'AGONY', 'AGREE', 'AHEAD', 'AIDER', 'AISLE', 'ALARM', 'ALBUM', 'ALERT', 'ALGAE', 'ALIBI', 'ALIEN', 'ALIGN', 'ALIKE', 'ALIVE', 'ALLAY', 'ALLEY', 'ALLOT', 'ALLOW', 'ALLOY', 'ALOFT', 'ALONE', 'ALONG', 'ALOOF', 'ALOUD', 'ALPHA', 'ALTAR', 'ALTER', 'AMASS', 'AMAZE', 'AMBER', 'AMBLE', 'AMEND', 'AMISS', 'AMITY', 'AMONG', 'AMPLE', 'AMPLY', 'AMUSE', 'ANGEL', 'ANGER', 'ANGLE', 'ANGRY', 'ANGST', 'ANIME', 'ANKLE', 'ANNEX', 'ANNOY', 'ANNUL', 'ANODE', 'ANTIC', 'ANVIL', 'AORTA', 'APART', 'APHID', 'APING', 'APNEA', 'APPLE', 'APPLY', 'APRON', 'APTLY', 'ARBOR', 'ARDOR', 'ARENA', 'ARGUE', 'ARISE', 'ARMOR', 'AROMA', 'AROSE', 'ARRAY', 'ARROW', 'ARSON', 'ARTSY', 'ASCOT', 'ASHEN', 'ASIDE', 'ASKEW', 'ASSAY', 'ASSET', 'ATOLL', 'ATONE', 'ATTIC', 'AUDIO', 'AUDIT', 'AUGUR', 'AUNTY', 'AVAIL', 'AVERT', 'AVIAN', 'AVOID', 'AWAIT', 'AWAKE', 'AWARD', 'AWARE', 'AWASH', 'AWFUL', 'AWOKE', 'AXIAL', 'AXIOM', 'AXION', 'AZURE', 'BACON', 'BADGE', 'BADLY', 'BAGEL', 'BAGGY', 'BAKER', 'BALER', 'BALMY', 'BANAL', 'BANJO', 'BARGE', 'BARON', 'BASAL', 'BASIC', 'BASIL', 'BASIN', 'BASIS', 'BASTE', 'BATCH', 'BATHE', 'BATON', 'BATTY', 'BAWDY', 'BAYOU', 'BEACH', 'BEADY', 'BEARD', 'BEAST', 'BEECH', 'BEEFY', 'BEFIT', 'BEGAN', 'BEGAT', 'BEGET', 'BEGIN', 'BEGUN', 'BEING', 'BELCH', 'BELIE', 'BELLE', 'BELLY', 'BELOW', 'BENCH', 'BERET', 'BERRY', 'BERTH', 'BESET', 'BETEL', 'BEVEL', 'BEZEL', 'BIBLE', 'BICEP', 'BIDDY', 'BIGOT', 'BILGE', 'BILLY', 'BINGE', 'BINGO', 'BIOME', 'BIRCH', 'BIRTH', 'BISON', 'BITTY', 'BLACK', 'BLADE', 'BLAME', 'BLAND', 'BLANK', 'BLARE', 'BLAST', 'BLAZE', 'BLEAK', 'BLEAT', 'BLEED', 'BLEEP', 'BLEND', 'BLESS', 'BLIMP', 'BLIND', 'BLINK', 'BLISS', 'BLITZ', 'BLOAT', 'BLOCK', 'BLOKE', 'BLOND', 'BLOOD', 'BLOOM', 'BLOWN', 'BLUER', 'BLUFF', 'BLUNT', 'BLURB', 'BLURT', 'BLUSH', 'BOARD', 'BOAST', 'BOBBY', 'BONEY', 'BONGO', 'BONUS', 'BOOBY', 'BOOST', 'BOOTH', 'BOOTY', 'BOOZE', 'BOOZY', 'BORAX', 'BORNE', 'BOSOM', 'BOSSY', 'BOTCH', 'BOUGH', 'BOULE', 'BOUND', 'BOWEL', 'BOXER', 'BRACE', 'BRAID', 'BRAIN', 'BRAKE', 'BRAND', 'BRASH', 'BRASS', 'BRAVE', 'BRAVO', 'BRAWL', 'BRAWN', 'BREAD', 'BREAK', 'BREED', 'BRIAR', 'BRIBE', 'BRICK', 'BRIDE', 'BRIEF', 'BRINE', 'BRING', 'BRINK', 'BRINY', 'BRISK', 'BROAD', 'BROIL', 'BROKE', 'BROOD', 'BROOK', 'BROOM', 'BROTH', 'BROWN', 'BRUNT', 'BRUSH', 'BRUTE', 'BUDDY', 'BUDGE', 'BUGGY', 'BUGLE', 'BUILD', 'BUILT', 'BULGE', 'BULKY', 'BULLY', 'BUNCH', 'BUNNY', 'BURLY', 'BURNT', 'BURST', 'BUSED', 'BUSHY', 'BUTCH', 'BUTTE', 'BUXOM', 'BUYER', 'BYLAW', 'CABAL', 'CABBY', 'CABIN', 'CABLE', 'CACAO', 'CACHE', 'CACTI', 'CADDY', 'CADET', 'CAGEY', 'CAIRN', 'CAMEL', 'CAMEO', 'CANAL', 'CANDY', 'CANNY', 'CANOE', 'CANON', 'CAPER', 'CAPUT', 'CARAT', 'CARGO', 'CAROL', 'CARRY', 'CARVE', 'CASTE', 'CATCH', 'CATER', 'CATTY', 'CAULK', 'CAUSE', 'CAVIL', 'CEASE', 'CEDAR', 'CELLO', 'CHAFE', 'CHAFF', 'CHAIN', 'CHAIR', 'CHALK', 'CHAMP', 'CHANT', 'CHAOS', 'CHARD', 'CHARM', 'CHART', 'CHASE', 'CHASM', 'CHEAP', 'CHEAT', 'CHECK', 'CHEEK', 'CHEER', 'CHESS', 'CHEST', 'CHICK', 'CHIDE', 'CHIEF', 'CHILD', 'CHILI', 'CHILL', 'CHIME', 'CHINA', 'CHIRP', 'CHOCK', 'CHOIR', 'CHOKE', 'CHORD', 'CHORE', 'CHOSE', 'CHUCK', 'CHUMP', 'CHUNK', 'CHURN', 'CHUTE', 'CIDER', 'CIGAR', 'CINCH', 'CIRCA', 'CIVIC', 'CIVIL', 'CLACK', 'CLAIM', 'CLAMP', 'CLANG', 'CLANK', 'CLASH', 'CLASP', 'CLASS', 'CLEAN', 'CLEAR', 'CLEAT', 'CLEFT', 'CLERK', 'CLICK', 'CLIFF', 'CLIMB', 'CLING', 'CLINK', 'CLOAK', 'CLOCK', 'CLONE', 'CLOSE', 'CLOTH', 'CLOUD', 'CLOUT', 'CLOVE', 'CLOWN', 'CLUCK', 'CLUED', 'CLUMP', 'CLUNG', 'COACH', 'COAST', 'COBRA', 'COCOA', 'COLON', 'COLOR', 'COMET', 'COMFY', 'COMIC', 'COMMA', 'CONCH', 'CONDO', 'CONIC', 'COPSE', 'CORAL', 'CORER', 'CORNY', 'COUCH', 'COUGH', 'COULD', 'COUNT', 'COUPE', 'COURT', 'COVEN', 'COVER', 'COVET', 'COVEY', 'COWER', 'COYLY', 'CRACK', 'CRAFT', 'CRAMP', 'CRANE', 'CRANK', 'CRASH', 'CRASS', 'CRATE', 'CRAVE', 'CRAWL', 'CRAZE', 'CRAZY', 'CREAK', 'CREAM', 'CREDO', 'CREED', 'CREEK', 'CREEP', 'CREME', 'CREPE', 'CREPT', 'CRESS', 'CREST', 'CRICK', 'CRIED', 'CRIER', 'CRIME', 'CRIMP', 'CRISP', 'CROAK', 'CROCK', 'CRONE', 'CRONY', 'CROOK', 'CROSS', 'CROUP', 'CROWD', 'CROWN', 'CRUDE', 'CRUEL', 'CRUMB', 'CRUMP', 'CRUSH', 'CRUST', 'CRYPT', 'CUBIC', 'CUMIN', 'CURIO', 'CURLY', 'CURRY', 'CURSE', 'CURVE', 'CURVY', 'CUTIE', 'CYBER', 'CYCLE', 'CYNIC', 'DADDY', 'DAILY', 'DAIRY', 'DAISY', 'DALLY', 'DANCE', 'DANDY', 'DATUM', 'DAUNT', 'DEALT', 'DEATH', 'DEBAR', 'DEBIT', 'DEBUG', 'DEBUT', 'DECAL', 'DECAY', 'DECOR', 'DECOY', 'DECRY', 'DEFER', 'DEIGN', 'DEITY', 'DELAY', 'DELTA', 'DELVE', 'DEMON', 'DEMUR', 'DENIM', 'DENSE', 'DEPOT', 'DEPTH', 'DERBY', 'DETER', 'DETOX', 'DEUCE', 'DEVIL', 'DIARY', 'DICEY', 'DIGIT', 'DILLY', 'DIMLY', 'DINER', 'DINGO', 'DINGY', 'DIODE', 'DIRGE', 'DIRTY', 'DISCO', 'DITCH', 'DITTO', 'DITTY', 'DIVER', 'DIZZY', 'DODGE', 'DODGY', 'DOGMA', 'DOING', 'DOLLY', 'DONOR', 'DONUT', 'DOPEY', 'DOUBT', 'DOUGH', 'DOWDY', 'DOWEL', 'DOWNY', 'DOWRY', 'DOZEN', 'DRAFT', 'DRAIN', 'DRAKE', 'DRAMA', 'DRANK', 'DRAPE', 'DRAWL', 'DRAWN', 'DREAD', 'DREAM', 'DRESS', 'DRIED', 'DRIER', 'DRIFT', 'DRILL', 'DRINK', 'DRIVE', 'DROIT', 'DROLL', 'DRONE', 'DROOL', 'DROOP', 'DROSS', 'DROVE', 'DROWN', 'DRUID', 'DRUNK', 'DRYER', 'DRYLY', 'DUCHY', 'DULLY', 'DUMMY', 'DUMPY', 'DUNCE', 'DUSKY', 'DUSTY', 'DUTCH', 'DUVET', 'DWARF', 'DWELL', 'DWELT', 'DYING', 'EAGER', 'EAGLE', 'EARLY', 'EARTH', 'EASEL', 'EATEN', 'EATER', 'EBONY', 'ECLAT', 'EDICT', 'EDIFY', 'EERIE', 'EGRET', 'EIGHT', 'EJECT', 'EKING', 'ELATE', 'ELBOW', 'ELDER', 'ELECT', 'ELEGY', 'ELFIN', 'ELIDE', 'ELITE', 'ELOPE', 'ELUDE', 'EMAIL', 'EMBED', 'EMBER', 'EMCEE', 'EMPTY', 'ENACT', 'ENDOW', 'ENEMA', 'ENEMY', 'ENJOY', 'ENNUI', 'ENSUE', 'ENTER', 'ENTRY', 'ENVOY', 'EPOCH', 'EPOXY', 'EQUAL', 'EQUIP', 'ERASE', 'ERECT', 'ERODE', 'ERROR', 'ERUPT', 'ESSAY', 'ESTER', 'ETHER', 'ETHIC', 'ETHOS', 'ETUDE', 'EVADE', 'EVENT', 'EVERY', 'EVICT', 'EVOKE', 'EXACT', 'EXALT', 'EXCEL', 'EXERT', 'EXILE', 'EXIST', 'EXPEL', 'EXTOL', 'EXTRA', 'EXULT', 'EYING', 'FABLE', 'FACET', 'FAINT', 'FAIRY', 'FAITH', 'FALSE', 'FANCY', 'FANNY', 'FARCE', 'FATAL', 'FATTY', 'FAULT', 'FAUNA', 'FAVOR', 'FEAST', 'FECAL', 'FEIGN', 'FELLA', 'FELON', 'FEMME', 'FEMUR', 'FENCE', 'FERAL', 'FERRY', 'FETAL', 'FETCH', 'FETID', 'FETUS', 'FEVER', 'FEWER', 'FIBER', 'FICUS', 'FIELD', 'FIEND', 'FIERY', 'FIFTH', 'FIFTY', 'FIGHT', 'FILER', 'FILET', 'FILLY', 'FILMY', 'FILTH', 'FINAL', 'FINCH', 'FINER', 'FIRST', 'FISHY', 'FIXER', 'FIZZY', 'FJORD', 'FLACK', 'FLAIL', 'FLAIR', 'FLAKE', 'FLAKY', 'FLAME', 'FLANK', 'FLARE', 'FLASH', 'FLASK', 'FLECK', 'FLEET', 'FLESH', 'FLICK', 'FLIER', 'FLING', 'FLINT', 'FLIRT', 'FLOAT', 'FLOCK', 'FLOOD', 'FLOOR', 'FLORA', 'FLOSS', 'FLOUR', 'FLOUT', 'FLOWN', 'FLUFF', 'FLUID', 'FLUKE', 'FLUME', 'FLUNG', 'FLUNK', 'FLUSH', 'FLUTE', 'FLYER', 'FOAMY', 'FOCAL', 'FOCUS', 'FOGGY', 'FOIST', 'FOLIO', 'FOLLY', 'FORAY', 'FORCE', 'FORGE', 'FORGO', 'FORTE', 'FORTH', 'FORTY', 'FORUM', 'FOUND', 'FOYER', 'FRAIL', 'FRAME', 'FRANK', 'FRAUD', 'FREAK', 'FREED', 'FREER', 'FRESH', 'FRIAR', 'FRIED', 'FRILL', 'FRISK', 'FRITZ', 'FROCK', 'FROND', 'FRONT', 'FROST', 'FROTH', 'FROWN', 'FROZE', 'FRUIT', 'FUDGE', 'FUGUE', 'FULLY', 'FUNGI', 'FUNKY', 'FUNNY', 'FUROR', 'FURRY', 'FUSSY', 'FUZZY', 'GAFFE', 'GAILY', 'GAMER', 'GAMMA', 'GAMUT', 'GASSY', 'GAUDY', 'GAUGE', 'GAUNT', 'GAUZE', 'GAVEL', 'GAWKY', 'GAYER', 'GAYLY', 'GAZER', 'GECKO', 'GEEKY', 'GEESE', 'GENIE', 'GENRE', 'GHOST', 'GHOUL', 'GIANT', 'GIDDY', 'GIPSY', 'GIRLY', 'GIRTH', 'GIVEN', 'GIVER', 'GLADE', 'GLAND', 'GLARE', 'GLASS', 'GLAZE', 'GLEAM', 'GLEAN', 'GLIDE', 'GLINT', 'GLOAT', 'GLOBE', 'GLOOM', 'GLORY', 'GLOSS', 'GLOVE', 'GLYPH', 'GNASH', 'GNOME', 'GODLY', 'GOING', 'GOLEM', 'GOLLY', 'GONAD', 'GONER', 'GOODY', 'GOOEY', 'GOOFY', 'GOOSE', 'GORGE', 'GOUGE', 'GOURD', 'GRACE', 'GRADE', 'GRAFT', 'GRAIL', 'GRAIN', 'GRAND', 'GRANT', 'GRAPE', 'GRAPH', 'GRASP', 'GRASS', 'GRATE', 'GRAVE', 'GRAVY', 'GRAZE', 'GREAT', 'GREED', 'GREEN', 'GREET', 'GRIEF', 'GRILL', 'GRIME', 'GRIMY', 'GRIND', 'GRIPE', 'GROAN', 'GROIN', 'GROOM', 'GROPE', 'GROSS', 'GROUP', 'GROUT', 'GROVE', 'GROWL', 'GROWN', 'GRUEL', 'GRUFF', 'GRUNT', 'GUARD', 'GUAVA', 'GUESS', 'GUEST', 'GUIDE', 'GUILD', 'GUILE', 'GUILT', 'GUISE', 'GULCH', 'GULLY', 'GUMBO', 'GUMMY', 'GUPPY', 'GUSTO', 'GUSTY', 'GYPSY', 'HABIT', 'HAIRY', 'HALVE', 'HANDY', 'HAPPY', 'HARDY', 'HAREM', 'HARPY', 'HARRY', 'HARSH', 'HASTE', 'HASTY', 'HATCH', 'HATER', 'HAUNT', 'HAUTE', 'HAVEN', 'HAVOC', 'HAZEL', 'HEADY', 'HEARD', 'HEART', 'HEATH', 'HEAVE', 'HEAVY', 'HEDGE', 'HEFTY', 'HEIST', 'HELIX', 'HELLO', 'HENCE', 'HERON', 'HILLY', 'HINGE', 'HIPPO', 'HIPPY', 'HITCH', 'HOARD', 'HOBBY', 'HOIST', 'HOLLY', 'HOMER', 'HONEY', 'HONOR', 'HORDE', 'HORNY', 'HORSE', 'HOTEL', 'HOTLY', 'HOUND', 'HOUSE', 'HOVEL', 'HOVER', 'HOWDY', 'HUMAN', 'HUMID', 'HUMOR', 'HUMPH', 'HUMUS', 'HUNCH', 'HUNKY', 'HURRY', 'HUSKY', 'HUSSY', 'HUTCH', 'HYDRO', 'HYENA', 'HYMEN', 'HYPER', 'ICILY', 'ICING', 'IDEAL', 'IDIOM', 'IDIOT', 'IDLER', 'IDYLL', 'IGLOO', 'ILIAC', 'IMAGE', 'IMBUE', 'IMPEL', 'IMPLY', 'INANE', 'INBOX', 'INCUR', 'INDEX', 'INEPT', 'INERT', 'INFER', 'INGOT', 'INLAY', 'INLET', 'INNER', 'INPUT', 'INTER', 'INTRO', 'IONIC', 'IRATE', 'IRONY', 'ISLET', 'ISSUE', 'ITCHY', 'IVORY', 'JAUNT', 'JAZZY', 'JELLY', 'JERKY', 'JETTY', 'JEWEL', 'JIFFY', 'JOINT', 'JOIST', 'JOKER', 'JOLLY', 'JOUST', 'JUDGE', 'JUICE', 'JUICY', 'JUMBO', 'JUMPY', 'JUNTA', 'JUNTO', 'JUROR', 'KAPPA', 'KARMA', 'KAYAK', 'KEBAB', 'KHAKI', 'KINKY', 'KIOSK', 'KITTY', 'KNACK', 'KNAVE', 'KNEAD', 'KNEED', 'KNEEL', 'KNELT', 'KNIFE', 'KNOCK', 'KNOLL', 'KNOWN', 'KOALA', 'KRILL', 'LABEL', 'LABOR', 'LADEN', 'LADLE', 'LAGER', 'LANCE', 'LANKY', 'LAPEL', 'LAPSE', 'LARGE', 'LARVA', 'LASSO', 'LATCH', 'LATER', 'LATHE', 'LATTE', 'LAUGH', 'LAYER', 'LEACH', 'LEAFY', 'LEAKY', 'LEANT', 'LEAPT', 'LEARN', 'LEASE', 'LEASH', 'LEAST', 'LEAVE', 'LEDGE', 'LEECH', 'LEERY', 'LEFTY', 'LEGAL', 'LEGGY', 'LEMON', 'LEMUR', 'LEPER', 'LEVEL', 'LEVER', 'LIBEL', 'LIEGE', 'LIGHT', 'LIKEN', 'LILAC', 'LIMBO', 'LIMIT', 'LINEN', 'LINER', 'LINGO', 'LIPID', 'LITHE', 'LIVER', 'LIVID', 'LLAMA', 'LOAMY', 'LOATH', 'LOBBY', 'LOCAL', 'LOCUS', 'LODGE', 'LOFTY', 'LOGIC', 'LOGIN', 'LOOPY', 'LOOSE', 'LORRY', 'LOSER', 'LOUSE', 'LOUSY', 'LOVER', 'LOWER', 'LOWLY', 'LOYAL', 'LUCID', 'LUCKY', 'LUMEN', 'LUMPY', 'LUNAR', 'LUNCH', 'LUNGE', 'LUPUS', 'LURCH', 'LURID', 'LUSTY', 'LYING', 'LYMPH', 'LYRIC', 'MACAW', 'MACHO', 'MACRO', 'MADAM', 'MADLY', 'MAFIA', 'MAGIC', 'MAGMA', 'MAIZE', 'MAJOR', 'MAKER', 'MAMBO', 'MAMMA', 'MAMMY', 'MANGA', 'MANGE', 'MANGO', 'MANGY', 'MANIA', 'MANIC', 'MANLY', 'MANOR', 'MAPLE', 'MARCH', 'MARRY', 'MARSH', 'MASON', 'MASSE', 'MATCH', 'MATEY', 'MAUVE', 'MAXIM', 'MAYBE', 'MAYOR', 'MEALY', 'MEANT', 'MEATY', 'MECCA', 'MEDAL', 'MEDIA', 'MEDIC', 'MELEE', 'MELON', 'MERCY', 'MERGE', 'MERIT', 'MERRY', 'METAL', 'METER', 'METRO', 'MICRO', 'MIDGE', 'MIDST', 'MIGHT', 'MILKY', 'MIMIC', 'MINCE', 'MINER', 'MINIM', 'MINOR', 'MINTY', 'MINUS', 'MIRTH', 'MISER', 'MISSY', 'MOCHA', 'MODAL', 'MODEL', 'MODEM', 'MOGUL', 'MOIST', 'MOLAR', 'MOLDY', 'MONEY', 'MONTH', 'MOODY', 'MOOSE', 'MORAL', 'MORON', 'MORPH', 'MOSSY', 'MOTEL', 'MOTIF', 'MOTOR', 'MOTTO', 'MOULT', 'MOUND', 'MOUNT', 'MOURN', 'MOUSE', 'MOUTH', 'MOVER', 'MOVIE', 'MOWER', 'MUCKY', 'MUCUS', 'MUDDY', 'MULCH', 'MUMMY', 'MUNCH', 'MURAL', 'MURKY', 'MUSHY', 'MUSIC', 'MUSKY', 'MUSTY', 'MYRRH', 'NADIR', 'NAIVE', 'NANNY', 'NASAL', 'NASTY', 'NATAL', 'NAVAL', 'NAVEL', 'NEEDY', 'NEIGH', 'NERDY', 'NERVE', 'NEVER', 'NEWER', 'NEWLY', 'NICER', 'NICHE', 'NIECE', 'NIGHT', 'NINJA', 'NINNY', 'NINTH', 'NOBLE', 'NOBLY', 'NOISE', 'NOISY', 'NOMAD', 'NOOSE', 'NORTH', 'NOSEY', 'NOTCH', 'NOVEL', 'NUDGE', 'NURSE', 'NUTTY', 'NYLON', 'NYMPH', 'OAKEN', 'OBESE', 'OCCUR', 'OCEAN', 'OCTAL', 'OCTET', 'ODDER', 'ODDLY', 'OFFAL', 'OFFER', 'OFTEN', 'OLDEN', 'OLDER', 'OLIVE', 'OMBRE', 'OMEGA', 'ONION', 'ONSET', 'OPERA', 'OPINE', 'OPIUM', 'OPTIC', 'ORBIT', 'ORDER', 'ORGAN', 'OTHER', 'OTTER', 'OUGHT', 'OUNCE', 'OUTDO', 'OUTER', 'OUTGO', 'OVARY', 'OVATE', 'OVERT', 'OVINE', 'OVOID', 'OWING', 'OWNER', 'OXIDE', 'OZONE', 'PADDY', 'PAGAN', 'PAINT', 'PALER', 'PALSY', 'PANEL', 'PANIC', 'PANSY', 'PAPAL', 'PAPER', 'PARER', 'PARKA', 'PARRY', 'PARSE', 'PARTY', 'PASTA', 'PASTE', 'PASTY', 'PATCH', 'PATIO', 'PATSY', 'PATTY', 'PAUSE', 'PAYEE', 'PAYER', 'PEACE', 'PEACH', 'PEARL', 'PECAN', 'PEDAL', 'PENAL', 'PENCE', 'PENNE', 'PENNY', 'PERCH', 'PERIL', 'PERKY', 'PESKY', 'PESTO', 'PETAL', 'PETTY', 'PHASE', 'PHONE', 'PHONY', 'PHOTO', 'PIANO', 'PICKY', 'PIECE', 'PIETY', 'PIGGY', 'PILOT', 'PINCH', 'PINEY', 'PINKY', 'PINTO', 'PIPER', 'PIQUE', 'PITCH', 'PITHY', 'PIVOT', 'PIXEL', 'PIXIE', 'PIZZA', 'PLACE', 'PLAID', 'PLAIN', 'PLAIT', 'PLANE', 'PLANK', 'PLANT', 'PLATE', 'PLAZA', 'PLEAD', 'PLEAT', 'PLIED', 'PLIER', 'PLUCK', 'PLUMB', 'PLUME', 'PLUMP', 'PLUNK', 'PLUSH', 'POESY', 'POINT', 'POISE', 'POKER', 'POLAR', 'POLKA', 'POLYP', 'POOCH', 'POPPY', 'PORCH', 'POSER', 'POSIT', 'POSSE', 'POUCH', 'POUND', 'POUTY', 'POWER', 'PRANK', 'PRAWN', 'PREEN', 'PRESS', 'PRICE', 'PRICK', 'PRIDE', 'PRIED', 'PRIME', 'PRIMO', 'PRINT', 'PRIOR', 'PRISM', 'PRIVY', 'PRIZE', 'PROBE', 'PRONE', 'PRONG', 'PROOF', 'PROSE', 'PROUD', 'PROVE', 'PROWL', 'PROXY', 'PRUDE', 'PRUNE', 'PSALM', 'PUBIC', 'PUDGY', 'PUFFY', 'PULPY', 'PULSE', 'PUNCH', 'PUPIL', 'PUPPY', 'PUREE', 'PURER', 'PURGE', 'PURSE', 'PUSHY', 'PUTTY', 'PYGMY', 'QUACK', 'QUAIL', 'QUAKE', 'QUALM', 'QUARK', 'QUART', 'QUASH', 'QUASI', 'QUEEN', 'QUEER', 'QUELL', 'QUERY', 'QUEST', 'QUEUE', 'QUICK', 'QUIET', 'QUILL', 'QUILT', 'QUIRK', 'QUITE', 'QUOTA', 'QUOTE', 'QUOTH', 'RABBI', 'RABID', 'RACER', 'RADAR', 'RADII', 'RADIO', 'RAINY', 'RAISE', 'RAJAH', 'RALLY', 'RALPH', 'RAMEN', 'RANCH', 'RANDY', 'RANGE', 'RAPID', 'RARER', 'RASPY', 'RATIO', 'RATTY', 'RAVEN', 'RAYON', 'RAZOR', 'REACH', 'REACT', 'READY', 'REALM', 'REARM', 'REBAR', 'REBEL', 'REBUS', 'REBUT', 'RECAP', 'RECUR', 'RECUT', 'REEDY', 'REFER', 'REFIT', 'REGAL', 'REHAB', 'REIGN', 'RELAX', 'RELAY', 'RELIC', 'REMIT', 'RENAL', 'RENEW', 'REPAY', 'REPEL', 'REPLY', 'RERUN', 'RESET', 'RESIN', 'RETCH', 'RETRO', 'RETRY', 'REUSE', 'REVEL', 'REVUE', 'RHINO', 'RHYME', 'RIDER', 'RIDGE', 'RIFLE', 'RIGHT', 'RIGID', 'RIGOR', 'RINSE', 'RIPEN', 'RIPER', 'RISEN', 'RISER', 'RISKY', 'RIVAL', 'RIVER', 'RIVET', 'ROACH', 'ROAST', 'ROBIN', 'ROBOT', 'ROCKY', 'RODEO', 'ROGER', 'ROGUE', 'ROOMY', 'ROOST', 'ROTOR', 'ROUGE', 'ROUGH', 'ROUND', 'ROUSE', 'ROUTE', 'ROVER', 'ROWDY', 'ROWER', 'ROYAL', 'RUDDY', 'RUDER', 'RUGBY', 'RULER', 'RUMBA', 'RUMOR', 'RUPEE', 'RURAL', 'RUSTY', 'SADLY', 'SAFER', 'SAINT', 'SALAD', 'SALLY', 'SALON', 'SALSA', 'SALTY', 'SALVE', 'SALVO', 'SANDY', 'SANER', 'SAPPY', 'SASSY', 'SATIN', 'SATYR', 'SAUCE', 'SAUCY', 'SAUNA', 'SAUTE', 'SAVOR', 'SAVOY', 'SAVVY', 'SCALD', 'SCALE', 'SCALP', 'SCALY', 'SCAMP', 'SCANT', 'SCARE', 'SCARF', 'SCARY', 'SCENE', 'SCENT', 'SCION', 'SCOFF', 'SCOLD', 'SCONE', 'SCOOP', 'SCOPE', 'SCORE', 'SCORN', 'SCOUR', 'SCOUT', 'SCOWL', 'SCRAM', 'SCRAP', 'SCREE', 'SCREW', 'SCRUB', 'SCRUM', 'SCUBA', 'SEDAN', 'SEEDY', 'SEGUE', 'SEIZE', 'SEMEN', 'SENSE', 'SEPIA', 'SERIF', 'SERUM', 'SERVE', 'SETUP', 'SEVEN', 'SEVER', 'SEWER', 'SHACK', 'SHADE', 'SHADY', 'SHAFT', 'SHAKE', 'SHAKY', 'SHALE', 'SHALL', 'SHALT', 'SHAME', 'SHANK', 'SHAPE', 'SHARD', 'SHARE', 'SHARK', 'SHARP', 'SHAVE', 'SHAWL', 'SHEAR', 'SHEEN', 'SHEEP', 'SHEER', 'SHEET', 'SHEIK', 'SHELF', 'SHELL', 'SHIED', 'SHIFT', 'SHINE', 'SHINY', 'SHIRE', 'SHIRK', 'SHIRT', 'SHOAL', 'SHOCK', 'SHONE', 'SHOOK', 'SHOOT', 'SHORE', 'SHORN', 'SHORT', 'SHOUT', 'SHOVE', 'SHOWN', 'SHOWY', 'SHREW', 'SHRUB', 'SHRUG', 'SHUCK', 'SHUNT', 'SHUSH', 'SHYLY', 'SIEGE', 'SIEVE', 'SIGHT', 'SIGMA', 'SILKY', 'SILLY', 'SINCE', 'SINEW', 'SINGE', 'SIREN', 'SISSY', 'SIXTH', 'SIXTY', 'SKATE', 'SKIER', 'SKIFF', 'SKILL', 'SKIMP', 'SKIRT', 'SKULK', 'SKULL', 'SKUNK', 'SLACK', 'SLAIN', 'SLANG', 'SLANT', 'SLASH', 'SLATE', 'SLEEK', 'SLEEP', 'SLEET', 'SLEPT', 'SLICE', 'SLICK', 'SLIDE', 'SLIME', 'SLIMY', 'SLING', 'SLINK', 'SLOOP', 'SLOPE', 'SLOSH', 'SLOTH', 'SLUMP', 'SLUNG', 'SLUNK', 'SLURP', 'SLUSH', 'SLYLY', 'SMACK', 'SMALL', 'SMART', 'SMASH', 'SMEAR', 'SMELL', 'SMELT', 'SMILE', 'SMIRK', 'SMITE', 'SMITH', 'SMOCK', 'SMOKE', 'SMOKY', 'SMOTE', 'SNACK', 'SNAIL', 'SNAKE', 'SNAKY', 'SNARE', 'SNARL', 'SNEAK', 'SNEER', 'SNIDE', 'SNIFF', 'SNIPE', 'SNOOP', 'SNORE', 'SNORT', 'SNOUT', 'SNOWY', 'SNUCK', 'SNUFF', 'SOAPY', 'SOBER', 'SOGGY', 'SOLAR', 'SOLID', 'SOLVE', 'SONAR', 'SONIC', 'SOOTH', 'SOOTY', 'SORRY', 'SOUND', 'SOUTH', 'SOWER', 'SPACE', 'SPADE', 'SPANK', 'SPARE', 'SPARK', 'SPASM', 'SPAWN', 'SPEAK', 'SPEAR', 'SPECK', 'SPEED', 'SPELL', 'SPELT', 'SPEND', 'SPENT', 'SPERM', 'SPICE', 'SPICY', 'SPIED', 'SPIEL', 'SPIKE', 'SPIKY', 'SPILL', 'SPILT', 'SPINE', 'SPINY', 'SPIRE', 'SPITE', 'SPLAT', 'SPLIT', 'SPOIL', 'SPOKE', 'SPOOF', 'SPOOK', 'SPOOL', 'SPOON', 'SPORE', 'SPORT', 'SPOUT', 'SPRAY', 'SPREE', 'SPRIG', 'SPUNK', 'SPURN', 'SPURT', 'SQUAD', 'SQUAT', 'SQUIB', 'STACK', 'STAFF', 'STAGE', 'STAID', 'STAIN', 'STAIR', 'STAKE', 'STALE', 'STALK', 'STALL', 'STAMP', 'STAND', 'STANK', 'STARE', 'STARK', 'START', 'STASH', 'STATE', 'STAVE', 'STEAD', 'STEAK', 'STEAL', 'STEAM', 'STEED', 'STEEL', 'STEEP', 'STEER', 'STEIN', 'STERN', 'STICK', 'STIFF', 'STILL', 'STILT', 'STING', 'STINK', 'STINT', 'STOCK', 'STOIC', 'STOKE', 'STOLE', 'STOMP', 'STONE', 'STONY', 'STOOD', 'STOOL', 'STOOP', 'STORE', 'STORK', 'STORM', 'STORY', 'STOUT', 'STOVE', 'STRAP', 'STRAW', 'STRAY', 'STRIP', 'STRUT', 'STUCK', 'STUDY', 'STUFF', 'STUMP', 'STUNG', 'STUNK', 'STUNT', 'STYLE', 'SUAVE', 'SUGAR', 'SUING', 'SUITE', 'SULKY', 'SULLY', 'SUMAC', 'SUNNY', 'SUPER', 'SURER', 'SURGE', 'SURLY', 'SUSHI', 'SWAMI', 'SWAMP', 'SWARM', 'SWASH', 'SWATH', 'SWEAR', 'SWEAT', 'SWEEP', 'SWEET', 'SWELL', 'SWEPT', 'SWIFT', 'SWILL', 'SWINE', 'SWING', 'SWIRL', 'SWISH', 'SWOON', 'SWOOP', 'SWORD', 'SWORE', 'SWORN', 'SWUNG', 'SYNOD', 'SYRUP', 'TABBY', 'TABLE', 'TABOO', 'TACIT', 'TACKY', 'TAFFY', 'TAINT', 'TAKEN', 'TAKER', 'TALLY', 'TALON', 'TAMER', 'TANGO', 'TANGY', 'TAPER', 'TAPIR', 'TARDY', 'TAROT', 'TASTE', 'TASTY', 'TATTY', 'TAUNT', 'TAWNY', 'TEACH', 'TEARY', 'TEASE', 'TEDDY', 'TEETH', 'TEMPO', 'TENET', 'TENOR', 'TENSE', 'TENTH', 'TEPEE', 'TEPID', 'TERRA', 'TERSE', 'TESTY', 'THANK', 'THEFT', 'THEIR', 'THEME', 'THERE', 'THESE', 'THETA', 'THICK', 'THIEF', 'THIGH', 'THING', 'THINK', 'THIRD', 'THONG', 'THORN', 'THOSE', 'THREE', 'THREW', 'THROB', 'THROW', 'THRUM', 'THUMB', 'THUMP', 'THYME', 'TIARA', 'TIBIA', 'TIDAL', 'TIGER', 'TIGHT', 'TILDE', 'TIMER', 'TIMID', 'TIPSY', 'TITAN', 'TITHE', 'TITLE', 'TOAST', 'TODAY', 'TODDY', 'TOKEN', 'TONAL', 'TONGA', 'TONIC', 'TOOTH', 'TOPAZ', 'TOPIC', 'TORCH', 'TORSO', 'TORUS', 'TOTAL', 'TOTEM', 'TOUCH', 'TOUGH', 'TOWEL', 'TOWER', 'TOXIC', 'TOXIN', 'TRACE', 'TRACK', 'TRACT', 'TRADE', 'TRAIL', 'TRAIN', 'TRAIT', 'TRAMP', 'TRASH', 'TRAWL', 'TREAD', 'TREAT', 'TREND', 'TRIAD', 'TRIAL', 'TRIBE', 'TRICE', 'TRICK', 'TRIED', 'TRIPE', 'TRITE', 'TROLL', 'TROOP', 'TROPE', 'TROUT', 'TROVE', 'TRUCE', 'TRUCK', 'TRUER', 'TRULY', 'TRUMP', 'TRUNK', 'TRUSS', 'TRUST', 'TRUTH', 'TRYST', 'TUBAL', 'TUBER', 'TULIP', 'TULLE', 'TUMOR', 'TUNIC', 'TURBO', 'TUTOR', 'TWANG', 'TWEAK', 'TWEED', 'TWEET', 'TWICE', 'TWINE', 'TWIRL', 'TWIST', 'TWIXT', 'TYING', 'UDDER', 'ULCER', 'ULTRA', 'UMBRA', 'UNCLE', 'UNCUT', 'UNDER', 'UNDID', 'UNDUE', 'UNFED', 'UNFIT', 'UNIFY', 'UNION', 'UNITE', 'UNITY', 'UNLIT', 'UNMET', 'UNSET', 'UNTIE', 'UNTIL', 'UNWED', 'UNZIP', 'UPPER', 'UPSET', 'URBAN', 'URINE', 'USAGE', 'USHER', 'USING', 'USUAL', 'USURP', 'UTILE', 'UTTER', 'VAGUE', 'VALET', 'VALID', 'VALOR', 'VALUE', 'VALVE', 'VAPID', 'VAPOR', 'VAULT', 'VAUNT', 'VEGAN', 'VENOM', 'VENUE', 'VERGE', 'VERSE', 'VERSO', 'VERVE', 'VICAR', 'VIDEO', 'VIGIL', 'VIGOR', 'VILLA', 'VINYL', 'VIOLA', 'VIPER', 'VIRAL', 'VIRUS', 'VISIT', 'VISOR', 'VISTA', 'VITAL', 'VIVID', 'VIXEN', 'VOCAL', 'VODKA', 'VOGUE', 'VOICE', 'VOILA', 'VOMIT', 'VOTER', 'VOUCH', 'VOWEL', 'VYING', 'WACKY', 'WAFER', 'WAGER', 'WAGON', 'WAIST', 'WAIVE', 'WALTZ', 'WARTY', 'WASTE', 'WATCH', 'WATER', 'WAVER', 'WAXEN', 'WEARY', 'WEAVE', 'WEDGE', 'WEEDY', 'WEIGH', 'WEIRD', 'WELCH', 'WELSH', 'WHACK', 'WHALE', 'WHARF', 'WHEAT', 'WHEEL', 'WHELP', 'WHERE', 'WHICH', 'WHIFF', 'WHILE', 'WHINE', 'WHINY', 'WHIRL', 'WHISK', 'WHITE', 'WHOLE', 'WHOOP', 'WHOSE', 'WIDEN', 'WIDER', 'WIDOW', 'WIDTH', 'WIELD', 'WIGHT', 'WILLY', 'WIMPY', 'WINCE', 'WINCH', 'WINDY', 'WISER', 'WISPY', 'WITCH', 'WITTY', 'WOKEN', 'WOMAN', 'WOMEN', 'WOODY', 'WOOER', 'WOOLY', 'WOOZY', 'WORDY', 'WORLD', 'WORRY', 'WORSE', 'WORST', 'WORTH', 'WOULD', 'WOUND', 'WOVEN', 'WRACK', 'WRATH', 'WREAK', 'WRECK', 'WREST', 'WRING', 'WRIST', 'WRITE', 'WRONG', 'WROTE', 'WRUNG', 'WRYLY', 'YACHT', 'YEARN', 'YEAST', 'YIELD', 'YOUNG', 'YOUTH', 'ZEBRA', 'ZESTY', 'ZONAL'
-    )
+ANSWERS_FILE_PATH = WORD_LISTS_DIRECTORY / 'solutions.bin'
+ANSWERS = PackedWordList(ANSWERS_FILE_PATH)
 # List of all valid (allowed) guesses, excluding the words already in the answers list
 # Number of words: 12,546
 # Source: https://gist.github.com/cfreshman/d5fb56316158a1575898bba1eed3b5da
-ALLOWED_GUESSES_EXCLUDING_ANSWERS = (
-    'AAHED', 'AALII', 'AAPAS', 'AARGH', 'AARTI', 'ABACA', 'ABACI', 'ABACS', 'ABAFT', 'ABAHT', 'ABAKA', 'ABAMP', 'ABAND', 'ABASH', 'ABASK', 'ABAYA', 'ABBAS', 'ABBED', 'ABBES', 'ABCEE', 'ABEAM', 'ABEAR', 'ABEAT', 'ABEER', 'ABELE', 'ABENG', 'ABERS', 'ABETS', 'ABEYS', 'ABIES', 'ABIUS', 'ABJAD', 'ABJUD', 'ABLER', 'ABLES', 'ABLET', 'ABLOW', 'ABMHO', 'ABNET', 'ABOHM', 'ABOIL', 'ABOMA', 'ABOON', 'ABORD', 'ABORE', 'ABORN', 'ABRAM', 'ABRAY', 'ABRIM', 'ABRIN', 'ABRIS', 'ABSEY', 'ABSIT', 'ABUNA', 'ABUNE', 'ABURA', 'ABURN', 'ABUTS', 'ABUZZ', 'ABYES', 'ABYSM', 'ACAIS', 'ACARA', 'ACARI', 'ACCAS', 'ACCHA', 'ACCOY', 'ACCRA', 'ACEDY', 'ACENE', 'ACERB', 'ACERS', 'ACETA', 'ACHAR', 'ACHED', 'ACHER', 'ACHES', 'ACHEY', 'ACHOO', 'ACIDS', 'ACIDY', 'ACIES', 'ACING', 'ACINI', 'ACKEE', 'ACKER', 'ACMES', 'ACMIC', 'ACNED', 'ACNES', 'ACOCK', 'ACOEL', 'ACOLD', 'ACONE', 'ACRAL', 'ACRED', 'ACRES', 'ACRON', 'ACROS', 'ACRYL', 'ACTAS', 'ACTED', 'ACTIN', 'ACTON', 'ACTUS', 'ACYLS', 'ADATS', 'ADAWN', 'ADAWS', 'ADAYS', 'ADBOT', 'ADDAS', 'ADDAX', 'ADDED', 'ADDER', 'ADDIN', 'ADDIO', 'ADDLE', 'ADDRA', 'ADEAD', 'ADEEM', 'ADHAN', 'ADHOC', 'ADIEU', 'ADIOS', 'ADITS', 'ADLIB', 'ADMAN', 'ADMEN', 'ADMIX', 'ADNEX', 'ADOBO', 'ADOON', 'ADORB', 'ADOWN', 'ADOZE', 'ADRAD', 'ADRAW', 'ADRED', 'ADRET', 'ADRIP', 'ADSUM', 'ADUKI', 'ADUNC', 'ADUST', 'ADVEW', 'ADVTS', 'ADYTA', 'ADYTS', 'ADZED', 'ADZES', 'AECIA', 'AEDES', 'AEGER', 'AEGIS', 'AEONS', 'AERIE', 'AEROS', 'AESIR', 'AEVUM', 'AFALD', 'AFANC', 'AFARA', 'AFARS', 'AFEAR', 'AFFLY', 'AFION', 'AFIZZ', 'AFLAJ', 'AFLAP', 'AFLOW', 'AFOAM', 'AFORE', 'AFRET', 'AFRIT', 'AFROS', 'AFTOS', 'AGALS', 'AGAMA', 'AGAMI', 'AGAMY', 'AGARS', 'AGASP', 'AGAST', 'AGATY', 'AGAVE', 'AGAZE', 'AGBAS', 'AGENE', 'AGERS', 'AGGAG', 'AGGER', 'AGGIE', 'AGGRI', 'AGGRO', 'AGGRY', 'AGHAS', 'AGIDI', 'AGILA', 'AGIOS', 'AGISM', 'AGIST', 'AGITA', 'AGLEE', 'AGLET', 'AGLEY', 'AGLOO', 'AGLUS', 'AGMAS', 'AGOGE', 'AGOGO', 'AGONE', 'AGONS', 'AGOOD', 'AGORA', 'AGRIA', 'AGRIN', 'AGROS', 'AGRUM', 'AGUED', 'AGUES', 'AGUEY', 'AGUNA', 'AGUSH', 'AGUTI', 'AHEAP', 'AHENT', 'AHIGH', 'AHIND', 'AHING', 'AHINT', 'AHOLD', 'AHOLE', 'AHULL', 'AHURU', 'AIDAS', 'AIDED', 'AIDES', 'AIDOI', 'AIDOS', 'AIERY', 'AIGAS', 'AIGHT', 'AILED', 'AIMAG', 'AIMAK', 'AIMED', 'AIMER', 'AINEE', 'AINGA', 'AIOLI', 'AIRED', 'AIRER', 'AIRNS', 'AIRTH', 'AIRTS', 'AITCH', 'AITUS', 'AIVER', 'AIXES', 'AIYAH', 'AIYEE', 'AIYOH', 'AIYOO', 'AIZLE', 'AJIES', 'AJIVA', 'AJUGA', 'AJUPA', 'AJWAN', 'AKARA', 'AKEES', 'AKELA', 'AKENE', 'AKING', 'AKITA', 'AKKAS', 'AKKER', 'AKOIA', 'AKOJA', 'AKOYA', 'AKSED', 'AKSES', 'ALAAP', 'ALACK', 'ALALA', 'ALAMO', 'ALAND', 'ALANE', 'ALANG', 'ALANS', 'ALANT', 'ALAPA', 'ALAPS', 'ALARY', 'ALATA', 'ALATE', 'ALAYS', 'ALBAS', 'ALBEE', 'ALBID', 'ALCEA', 'ALCES', 'ALCID', 'ALCOS', 'ALDEA', 'ALDER', 'ALDOL', 'ALEAK', 'ALECK', 'ALECS', 'ALEEM', 'ALEFS', 'ALEFT', 'ALEPH', 'ALEWS', 'ALEYE', 'ALFAS', 'ALGAL', 'ALGAS', 'ALGID', 'ALGIN', 'ALGOR', 'ALGOS', 'ALGUM', 'ALIAS', 'ALICK', 'ALIFS', 'ALIMS', 'ALINE', 'ALIOS', 'ALIST', 'ALIYA', 'ALKIE', 'ALKIN', 'ALKOS', 'ALKYD', 'ALKYL', 'ALLAN', 'ALLEE', 'ALLEL', 'ALLEN', 'ALLER', 'ALLIN', 'ALLIS', 'ALLOD', 'ALLUS', 'ALLYL', 'ALMAH', 'ALMAS', 'ALMEH', 'ALMES', 'ALMUD', 'ALMUG', 'ALODS', 'ALOED', 'ALOES', 'ALOHA', 'ALOIN', 'ALOOS', 'ALOSE', 'ALOWE', 'ALTHO', 'ALTOS', 'ALULA', 'ALUMS', 'ALUMY', 'ALURE', 'ALURK', 'ALVAR', 'ALWAY', 'AMAHS', 'AMAIN', 'AMARI', 'AMARO', 'AMATE', 'AMAUT', 'AMBAN', 'AMBIT', 'AMBOS', 'AMBRY', 'AMEBA', 'AMEER', 'AMENE', 'AMENS', 'AMENT', 'AMIAS', 'AMICE', 'AMICI', 'AMIDE', 'AMIDO', 'AMIDS', 'AMIES', 'AMIGA', 'AMIGO', 'AMINE', 'AMINO', 'AMINS', 'AMIRS', 'AMLAS', 'AMMAN', 'AMMAS', 'AMMON', 'AMMOS', 'AMNIA', 'AMNIC', 'AMNIO', 'AMOKS', 'AMOLE', 'AMORE', 'AMORT', 'AMOUR', 'AMOVE', 'AMOWT', 'AMPED', 'AMPUL', 'AMRIT', 'AMUCK', 'AMYLS', 'ANANA', 'ANATA', 'ANCHO', 'ANCLE', 'ANCON', 'ANDIC', 'ANDRO', 'ANEAR', 'ANELE', 'ANENT', 'ANGAS', 'ANGLO', 'ANIGH', 'ANILE', 'ANILS', 'ANIMA', 'ANIMI', 'ANION', 'ANISE', 'ANKER', 'ANKHS', 'ANKUS', 'ANLAS', 'ANNAL', 'ANNAN', 'ANNAS', 'ANNAT', 'ANNUM', 'ANNUS', 'ANOAS', 'ANOLE', 'ANOMY', 'ANSAE', 'ANSAS', 'ANTAE', 'ANTAR', 'ANTAS', 'ANTED', 'ANTES', 'ANTIS', 'ANTRA', 'ANTRE', 'ANTSY', 'ANURA', 'ANYON', 'APACE', 'APAGE', 'APAID', 'APAYD', 'APAYS', 'APEAK', 'APEEK', 'APERS', 'APERT', 'APERY', 'APGAR', 'APHIS', 'APIAN', 'APIOL', 'APISH', 'APISM', 'APODE', 'APODS', 'APOLS', 'APOOP', 'APORT', 'APPAL', 'APPAM', 'APPAY', 'APPEL', 'APPRO', 'APPTS', 'APPUI', 'APPUY', 'APRES', 'APSES', 'APSIS', 'APSOS', 'APTED', 'APTER', 'AQUAE', 'AQUAS', 'ARABA', 'ARAKS', 'ARAME', 'ARARS', 'ARBAH', 'ARBAS', 'ARCED', 'ARCHI', 'ARCOS', 'ARCUS', 'ARDEB', 'ARDRI', 'AREAD', 'AREAE', 'AREAL', 'AREAR', 'AREAS', 'ARECA', 'AREDD', 'AREDE', 'AREFY', 'AREIC', 'ARENE', 'AREPA', 'ARERE', 'ARETE', 'ARETS', 'ARETT', 'ARGAL', 'ARGAN', 'ARGIL', 'ARGLE', 'ARGOL', 'ARGON', 'ARGOT', 'ARGUS', 'ARHAT', 'ARIAS', 'ARIEL', 'ARIKI', 'ARILS', 'ARIOT', 'ARISH', 'ARITH', 'ARKED', 'ARLED', 'ARLES', 'ARMED', 'ARMER', 'ARMET', 'ARMIL', 'ARNAS', 'ARNIS', 'ARNUT', 'AROBA', 'AROHA', 'AROID', 'ARPAS', 'ARPEN', 'ARRAH', 'ARRAS', 'ARRET', 'ARRIS', 'ARROZ', 'ARSED', 'ARSES', 'ARSEY', 'ARSIS', 'ARTAL', 'ARTEL', 'ARTER', 'ARTIC', 'ARTIS', 'ARTLY', 'ARUHE', 'ARUMS', 'ARVAL', 'ARVEE', 'ARVOS', 'ARYLS', 'ASADA', 'ASANA', 'ASCON', 'ASCUS', 'ASDIC', 'ASHED', 'ASHES', 'ASHET', 'ASITY', 'ASKAR', 'ASKED', 'ASKER', 'ASKOI', 'ASKOS', 'ASPEN', 'ASPER', 'ASPIC', 'ASPIE', 'ASPIS', 'ASPRO', 'ASSAI', 'ASSAM', 'ASSED', 'ASSES', 'ASSEZ', 'ASSOT', 'ASTER', 'ASTIR', 'ASTUN', 'ASURA', 'ASWAY', 'ASWIM', 'ASYLA', 'ATAPS', 'ATAXY', 'ATIGI', 'ATILT', 'ATIMY', 'ATLAS', 'ATMAN', 'ATMAS', 'ATMOS', 'ATOCS', 'ATOKE', 'ATOKS', 'ATOMS', 'ATOMY', 'ATONY', 'ATOPY', 'ATRIA', 'ATRIP', 'ATTAP', 'ATTAR', 'ATTAS', 'ATTER', 'ATUAS', 'AUCHT', 'AUDAD', 'AUDAX', 'AUGEN', 'AUGER', 'AUGES', 'AUGHT', 'AULAS', 'AULIC', 'AULOI', 'AULOS', 'AUMIL', 'AUNES', 'AUNTS', 'AURAE', 'AURAL', 'AURAR', 'AURAS', 'AUREI', 'AURES', 'AURIC', 'AURIS', 'AURUM', 'AUTOS', 'AUXIN', 'AVALE', 'AVANT', 'AVAST', 'AVELS', 'AVENS', 'AVERS', 'AVGAS', 'AVINE', 'AVION', 'AVISE', 'AVISO', 'AVIZE', 'AVOWS', 'AVYZE', 'AWARI', 'AWARN', 'AWATO', 'AWAVE', 'AWAYS', 'AWDLS', 'AWEEL', 'AWETO', 'AWING', 'AWKIN', 'AWMRY', 'AWNED', 'AWNER', 'AWOLS', 'AWORK', 'AXELS', 'AXILE', 'AXILS', 'AXING', 'AXITE', 'AXLED', 'AXLES', 'AXMAN', 'AXMEN', 'AXOID', 'AXONE', 'AXONS', 'AYAHS', 'AYAYA', 'AYELP', 'AYGRE', 'AYINS', 'AYMAG', 'AYONT', 'AYRES', 'AYRIE', 'AZANS', 'AZIDE', 'AZIDO', 'AZINE', 'AZLON', 'AZOIC', 'AZOLE', 'AZONS', 'AZOTE', 'AZOTH', 'AZUKI', 'AZURN', 'AZURY', 'AZYGY', 'AZYME', 'AZYMS', 'BAAED', 'BAALS', 'BAAPS', 'BABAS', 'BABBY', 'BABEL', 'BABES', 'BABKA', 'BABOO', 'BABUL', 'BABUS', 'BACCA', 'BACCO', 'BACCY', 'BACHA', 'BACHS', 'BACKS', 'BACKY', 'BACNE', 'BADAM', 'BADDY', 'BAELS', 'BAFFS', 'BAFFY', 'BAFTA', 'BAFTS', 'BAGHS', 'BAGIE', 'BAGSY', 'BAGUA', 'BAHTS', 'BAHUS', 'BAHUT', 'BAIKS', 'BAILE', 'BAILS', 'BAIRN', 'BAISA', 'BAITH', 'BAITS', 'BAIZA', 'BAIZE', 'BAJAN', 'BAJRA', 'BAJRI', 'BAJUS', 'BAKED', 'BAKEN', 'BAKES', 'BAKRA', 'BALAS', 'BALDS', 'BALDY', 'BALED', 'BALES', 'BALKS', 'BALKY', 'BALLO', 'BALLS', 'BALLY', 'BALMS', 'BALOI', 'BALON', 'BALOO', 'BALOT', 'BALSA', 'BALTI', 'BALUN', 'BALUS', 'BALUT', 'BAMAS', 'BAMBI', 'BAMMA', 'BAMMY', 'BANAK', 'BANCO', 'BANCS', 'BANDA', 'BANDH', 'BANDS', 'BANDY', 'BANED', 'BANES', 'BANGS', 'BANIA', 'BANKS', 'BANKY', 'BANNS', 'BANTS', 'BANTU', 'BANTY', 'BANTZ', 'BANYA', 'BAONS', 'BAOZI', 'BAPPU', 'BAPUS', 'BARBE', 'BARBS', 'BARBY', 'BARCA', 'BARDE', 'BARDO', 'BARDS', 'BARDY', 'BARED', 'BARER', 'BARES', 'BARFI', 'BARFS', 'BARFY', 'BARIC', 'BARKS', 'BARKY', 'BARMS', 'BARMY', 'BARNS', 'BARNY', 'BARPS', 'BARRA', 'BARRE', 'BARRO', 'BARRY', 'BARYE', 'BASAN', 'BASAS', 'BASED', 'BASEN', 'BASER', 'BASES', 'BASHA', 'BASHO', 'BASIJ', 'BASKS', 'BASON', 'BASSE', 'BASSI', 'BASSO', 'BASSY', 'BASTA', 'BASTI', 'BASTO', 'BASTS', 'BATED', 'BATES', 'BATHS', 'BATIK', 'BATOS', 'BATTA', 'BATTS', 'BATTU', 'BAUDS', 'BAUKS', 'BAULK', 'BAURS', 'BAVIN', 'BAWDS', 'BAWKS', 'BAWLS', 'BAWNS', 'BAWRS', 'BAWTY', 'BAYAS', 'BAYED', 'BAYER', 'BAYES', 'BAYLE', 'BAYTS', 'BAZAR', 'BAZAS', 'BAZOO', 'BBALL', 'BDAYS', 'BEADS', 'BEAKS', 'BEAKY', 'BEALS', 'BEAMS', 'BEAMY', 'BEANO', 'BEANS', 'BEANY', 'BEARE', 'BEARS', 'BEATH', 'BEATS', 'BEATY', 'BEAUS', 'BEAUT', 'BEAUX', 'BEBOP', 'BECAP', 'BECKE', 'BECKS', 'BEDAD', 'BEDEL', 'BEDES', 'BEDEW', 'BEDIM', 'BEDYE', 'BEEDI', 'BEEFS', 'BEEPS', 'BEERS', 'BEERY', 'BEETS', 'BEFOG', 'BEGAD', 'BEGAR', 'BEGEM', 'BEGOB', 'BEGOT', 'BEGUM', 'BEIGE', 'BEIGY', 'BEINS', 'BEIRA', 'BEISA', 'BEKAH', 'BELAH', 'BELAR', 'BELAY', 'BELEE', 'BELGA', 'BELIT', 'BELLI', 'BELLO', 'BELLS', 'BELON', 'BELTS', 'BELVE', 'BEMAD', 'BEMAS', 'BEMIX', 'BEMUD', 'BENDS', 'BENDY', 'BENES', 'BENET', 'BENGA', 'BENIS', 'BENJI', 'BENNE', 'BENNI', 'BENNY', 'BENTO', 'BENTS', 'BENTY', 'BEPAT', 'BERAY', 'BERES', 'BERGS', 'BERKO', 'BERKS', 'BERME', 'BERMS', 'BEROB', 'BERYL', 'BESAT', 'BESAW', 'BESEE', 'BESES', 'BESIT', 'BESOM', 'BESOT', 'BESTI', 'BESTS', 'BETAS', 'BETED', 'BETES', 'BETHS', 'BETID', 'BETON', 'BETTA', 'BETTY', 'BEVAN', 'BEVER', 'BEVOR', 'BEVUE', 'BEVVY', 'BEWDY', 'BEWET', 'BEWIG', 'BEZES', 'BEZIL', 'BEZZY', 'BHAIS', 'BHAJI', 'BHANG', 'BHATS', 'BHAVA', 'BHELS', 'BHOOT', 'BHUNA', 'BHUTS', 'BIACH', 'BIALI', 'BIALY', 'BIBBS', 'BIBES', 'BIBIS', 'BICCY', 'BICES', 'BICKY', 'BIDED', 'BIDER', 'BIDES', 'BIDET', 'BIDIS', 'BIDON', 'BIDRI', 'BIELD', 'BIERS', 'BIFFO', 'BIFFS', 'BIFFY', 'BIFID', 'BIGAE', 'BIGGS', 'BIGGY', 'BIGHA', 'BIGHT', 'BIGLY', 'BIGOS', 'BIHON', 'BIJOU', 'BIKED', 'BIKER', 'BIKES', 'BIKIE', 'BIKKY', 'BILAL', 'BILAT', 'BILBO', 'BILBY', 'BILED', 'BILES', 'BILGY', 'BILKS', 'BILLS', 'BIMAH', 'BIMAS', 'BIMBO', 'BINAL', 'BINDI', 'BINDS', 'BINER', 'BINES', 'BINGS', 'BINGY', 'BINIT', 'BINKS', 'BINKY', 'BINTS', 'BIOGS', 'BIONS', 'BIONT', 'BIOSE', 'BIOTA', 'BIPED', 'BIPOD', 'BIPPY', 'BIRDO', 'BIRDS', 'BIRIS', 'BIRKS', 'BIRLE', 'BIRLS', 'BIROS', 'BIRRS', 'BIRSE', 'BIRSY', 'BIRZE', 'BIRZZ', 'BISES', 'BISKS', 'BISOM', 'BITCH', 'BITER', 'BITES', 'BITEY', 'BITOS', 'BITOU', 'BITSY', 'BITTE', 'BITTS', 'BIVIA', 'BIVVY', 'BIZES', 'BIZZO', 'BIZZY', 'BLABS', 'BLADS', 'BLADY', 'BLAER', 'BLAES', 'BLAFF', 'BLAGS', 'BLAHS', 'BLAIN', 'BLAMS', 'BLANC', 'BLART', 'BLASE', 'BLASH', 'BLATE', 'BLATS', 'BLATT', 'BLAUD', 'BLAWN', 'BLAWS', 'BLAYS', 'BLEAH', 'BLEAR', 'BLEBS', 'BLECH', 'BLEES', 'BLENT', 'BLERT', 'BLEST', 'BLETS', 'BLEYS', 'BLIMY', 'BLING', 'BLINI', 'BLINS', 'BLINY', 'BLIPS', 'BLIST', 'BLITE', 'BLITS', 'BLIVE', 'BLOBS', 'BLOCS', 'BLOGS', 'BLONX', 'BLOOK', 'BLOOP', 'BLORE', 'BLOTS', 'BLOWS', 'BLOWY', 'BLUBS', 'BLUDE', 'BLUDS', 'BLUDY', 'BLUED', 'BLUES', 'BLUET', 'BLUEY', 'BLUID', 'BLUME', 'BLUNK', 'BLURS', 'BLYPE', 'BOABS', 'BOAKS', 'BOARS', 'BOART', 'BOATS', 'BOATY', 'BOBAC', 'BOBAK', 'BOBAS', 'BOBOL', 'BOBOS', 'BOCCA', 'BOCCE', 'BOCCI', 'BOCHE', 'BOCKS', 'BODED', 'BODES', 'BODGE', 'BODGY', 'BODHI', 'BODLE', 'BODOH', 'BOEPS', 'BOERS', 'BOETI', 'BOETS', 'BOEUF', 'BOFFO', 'BOFFS', 'BOGAN', 'BOGEY', 'BOGGY', 'BOGIE', 'BOGLE', 'BOGUE', 'BOGUS', 'BOHEA', 'BOHOS', 'BOILS', 'BOING', 'BOINK', 'BOITE', 'BOKED', 'BOKEH', 'BOKES', 'BOKOS', 'BOLAR', 'BOLAS', 'BOLDO', 'BOLDS', 'BOLES', 'BOLET', 'BOLIX', 'BOLKS', 'BOLLS', 'BOLOS', 'BOLTS', 'BOLUS', 'BOMAS', 'BOMBE', 'BOMBO', 'BOMBS', 'BOMOH', 'BOMOR', 'BONCE', 'BONDS', 'BONED', 'BONER', 'BONES', 'BONGS', 'BONIE', 'BONKS', 'BONNE', 'BONNY', 'BONUM', 'BONZA', 'BONZE', 'BOOAI', 'BOOAY', 'BOOBS', 'BOODY', 'BOOED', 'BOOFY', 'BOOGY', 'BOOHS', 'BOOKS', 'BOOKY', 'BOOLS', 'BOOMS', 'BOOMY', 'BOONG', 'BOONS', 'BOORD', 'BOORS', 'BOOSE', 'BOOTS', 'BOPPY', 'BORAK', 'BORAL', 'BORAS', 'BORDE', 'BORDS', 'BORED', 'BOREE', 'BOREK', 'BOREL', 'BORER', 'BORES', 'BORGO', 'BORIC', 'BORKS', 'BORMS', 'BORNA', 'BORON', 'BORTS', 'BORTY', 'BORTZ', 'BOSEY', 'BOSIE', 'BOSKS', 'BOSKY', 'BOSON', 'BOSSA', 'BOSUN', 'BOTAS', 'BOTEH', 'BOTEL', 'BOTES', 'BOTEW', 'BOTHY', 'BOTOS', 'BOTTE', 'BOTTS', 'BOTTY', 'BOUGE', 'BOUKS', 'BOULT', 'BOUNS', 'BOURD', 'BOURG', 'BOURN', 'BOUSE', 'BOUSY', 'BOUTS', 'BOUTU', 'BOVID', 'BOWAT', 'BOWED', 'BOWER', 'BOWES', 'BOWET', 'BOWIE', 'BOWLS', 'BOWNE', 'BOWRS', 'BOWSE', 'BOXED', 'BOXEN', 'BOXES', 'BOXLA', 'BOXTY', 'BOYAR', 'BOYAU', 'BOYED', 'BOYEY', 'BOYFS', 'BOYGS', 'BOYLA', 'BOYLY', 'BOYOS', 'BOYSY', 'BOZOS', 'BRAAI', 'BRACH', 'BRACK', 'BRACT', 'BRADS', 'BRAES', 'BRAGS', 'BRAHS', 'BRAIL', 'BRAKS', 'BRAKY', 'BRAME', 'BRANE', 'BRANK', 'BRANS', 'BRANT', 'BRAST', 'BRATS', 'BRAVA', 'BRAVI', 'BRAWS', 'BRAXY', 'BRAYS', 'BRAZA', 'BRAZE', 'BREAM', 'BREDE', 'BREDS', 'BREEM', 'BREER', 'BREES', 'BREID', 'BREIS', 'BREME', 'BRENS', 'BRENT', 'BRERE', 'BRERS', 'BREVE', 'BREWS', 'BREYS', 'BRIER', 'BRIES', 'BRIGS', 'BRIKI', 'BRIKS', 'BRILL', 'BRIMS', 'BRINS', 'BRIOS', 'BRISE', 'BRISS', 'BRITH', 'BRITS', 'BRITT', 'BRIZE', 'BROCH', 'BROCK', 'BRODS', 'BROGH', 'BROGS', 'BROME', 'BROMO', 'BRONC', 'BROND', 'BROOL', 'BROOS', 'BROSE', 'BROSY', 'BROWS', 'BRUCK', 'BRUGH', 'BRUHS', 'BRUIN', 'BRUIT', 'BRUJA', 'BRUJO', 'BRULE', 'BRUME', 'BRUNG', 'BRUSK', 'BRUST', 'BRUTS', 'BRUVS', 'BUATS', 'BUAZE', 'BUBAL', 'BUBAS', 'BUBBA', 'BUBBE', 'BUBBY', 'BUBUS', 'BUCHU', 'BUCKO', 'BUCKS', 'BUCKU', 'BUDAS', 'BUDED', 'BUDES', 'BUDIS', 'BUDOS', 'BUENA', 'BUFFA', 'BUFFE', 'BUFFI', 'BUFFO', 'BUFFS', 'BUFFY', 'BUFOS', 'BUFTY', 'BUGAN', 'BUHLS', 'BUHRS', 'BUIKS', 'BUIST', 'BUKES', 'BUKOS', 'BULBS', 'BULGY', 'BULKS', 'BULLA', 'BULLS', 'BULSE', 'BUMBO', 'BUMFS', 'BUMPH', 'BUMPS', 'BUMPY', 'BUNAS', 'BUNCE', 'BUNCO', 'BUNDE', 'BUNDH', 'BUNDS', 'BUNDT', 'BUNDU', 'BUNDY', 'BUNGS', 'BUNGY', 'BUNIA', 'BUNJE', 'BUNJY', 'BUNKO', 'BUNKS', 'BUNNS', 'BUNTS', 'BUNTY', 'BUNYA', 'BUOYS', 'BUPPY', 'BURAN', 'BURAS', 'BURBS', 'BURDS', 'BURET', 'BURFI', 'BURGH', 'BURGS', 'BURIN', 'BURKA', 'BURKE', 'BURKS', 'BURLS', 'BURNS', 'BUROO', 'BURPS', 'BURQA', 'BURRA', 'BURRO', 'BURRS', 'BURRY', 'BURSA', 'BURSE', 'BUSBY', 'BUSES', 'BUSKS', 'BUSKY', 'BUSSU', 'BUSTI', 'BUSTS', 'BUSTY', 'BUTEO', 'BUTES', 'BUTLE', 'BUTOH', 'BUTTS', 'BUTTY', 'BUTUT', 'BUTYL', 'BUYIN', 'BUZZY', 'BWANA', 'BWAZI', 'BYDED', 'BYDES', 'BYKED', 'BYKES', 'BYRES', 'BYRLS', 'BYSSI', 'BYTES', 'BYWAY', 'CAAED', 'CABAS', 'CABER', 'CABOB', 'CABOC', 'CABRE', 'CACAS', 'CACKS', 'CACKY', 'CADEE', 'CADES', 'CADGE', 'CADGY', 'CADIE', 'CADIS', 'CADRE', 'CAECA', 'CAESE', 'CAFES', 'CAFFE', 'CAFFS', 'CAGED', 'CAGER', 'CAGES', 'CAGOT', 'CAHOW', 'CAIDS', 'CAINS', 'CAIRD', 'CAJON', 'CAJUN', 'CAKED', 'CAKES', 'CAKEY', 'CALFS', 'CALID', 'CALIF', 'CALIX', 'CALKS', 'CALLA', 'CALLE', 'CALLS', 'CALMS', 'CALMY', 'CALOS', 'CALPA', 'CALPS', 'CALVE', 'CALYX', 'CAMAN', 'CAMAS', 'CAMES', 'CAMIS', 'CAMOS', 'CAMPI', 'CAMPO', 'CAMPS', 'CAMPY', 'CAMUS', 'CANDO', 'CANED', 'CANEH', 'CANER', 'CANES', 'CANGS', 'CANID', 'CANNA', 'CANNS', 'CANSO', 'CANST', 'CANTI', 'CANTO', 'CANTS', 'CANTY', 'CAPAS', 'CAPAX', 'CAPED', 'CAPES', 'CAPEX', 'CAPHS', 'CAPIZ', 'CAPLE', 'CAPON', 'CAPOS', 'CAPOT', 'CAPRI', 'CAPUL', 'CARAP', 'CARBO', 'CARBS', 'CARBY', 'CARDI', 'CARDS', 'CARDY', 'CARED', 'CARER', 'CARES', 'CARET', 'CAREX', 'CARKS', 'CARLE', 'CARLS', 'CARNE', 'CARNS', 'CARNY', 'CAROB', 'CAROM', 'CARON', 'CARPE', 'CARPI', 'CARPS', 'CARRS', 'CARSE', 'CARTA', 'CARTE', 'CARTS', 'CARVY', 'CASAS', 'CASCO', 'CASED', 'CASER', 'CASES', 'CASKS', 'CASKY', 'CASTS', 'CASUS', 'CATES', 'CAUDA', 'CAUKS', 'CAULD', 'CAULS', 'CAUMS', 'CAUPS', 'CAURI', 'CAUSA', 'CAVAS', 'CAVED', 'CAVEL', 'CAVER', 'CAVES', 'CAVIE', 'CAVUS', 'CAWED', 'CAWKS', 'CAXON', 'CEAZE', 'CEBID', 'CECAL', 'CECUM', 'CEDED', 'CEDER', 'CEDES', 'CEDIS', 'CEIBA', 'CEILI', 'CEILS', 'CELEB', 'CELLA', 'CELLI', 'CELLS', 'CELLY', 'CELOM', 'CELTS', 'CENSE', 'CENTO', 'CENTS', 'CENTU', 'CEORL', 'CEPES', 'CERCI', 'CERED', 'CERES', 'CERGE', 'CERIA', 'CERIC', 'CERNE', 'CEROC', 'CEROS', 'CERTS', 'CERTY', 'CESSE', 'CESTA', 'CESTI', 'CETES', 'CETYL', 'CEZVE', 'CHAAP', 'CHAAT', 'CHACE', 'CHACK', 'CHACO', 'CHADO', 'CHADS', 'CHAFT', 'CHAIS', 'CHALS', 'CHAMS', 'CHANA', 'CHANG', 'CHANK', 'CHAPE', 'CHAPS', 'CHAPT', 'CHARA', 'CHARE', 'CHARK', 'CHARR', 'CHARS', 'CHARY', 'CHATS', 'CHAVA', 'CHAVE', 'CHAVS', 'CHAWK', 'CHAWL', 'CHAWS', 'CHAYA', 'CHAYS', 'CHEBA', 'CHEDI', 'CHEEB', 'CHEEP', 'CHEET', 'CHEFS', 'CHEKA', 'CHELA', 'CHELP', 'CHEMO', 'CHEMS', 'CHERE', 'CHERT', 'CHETH', 'CHEVY', 'CHEWS', 'CHEWY', 'CHIAO', 'CHIAS', 'CHIBA', 'CHIBS', 'CHICA', 'CHICH', 'CHICO', 'CHICS', 'CHIEL', 'CHIKO', 'CHIKS', 'CHILE', 'CHIMB', 'CHIMO', 'CHIMP', 'CHINE', 'CHING', 'CHINK', 'CHINO', 'CHINS', 'CHIPS', 'CHIRK', 'CHIRL', 'CHIRM', 'CHIRO', 'CHIRR', 'CHIRT', 'CHIRU', 'CHITI', 'CHITS', 'CHIVA', 'CHIVE', 'CHIVS', 'CHIVY', 'CHIZZ', 'CHOCO', 'CHOCS', 'CHODE', 'CHOGS', 'CHOIL', 'CHOKO', 'CHOKY', 'CHOLA', 'CHOLI', 'CHOLO', 'CHOMP', 'CHONS', 'CHOOF', 'CHOOK', 'CHOOM', 'CHOON', 'CHOPS', 'CHOSS', 'CHOTA', 'CHOTT', 'CHOUT', 'CHOUX', 'CHOWK', 'CHOWS', 'CHUBS', 'CHUFA', 'CHUFF', 'CHUGS', 'CHUMS', 'CHURL', 'CHURR', 'CHUSE', 'CHUTS', 'CHYLE', 'CHYME', 'CHYND', 'CIBOL', 'CIDED', 'CIDES', 'CIELS', 'CIGGY', 'CILIA', 'CILLS', 'CIMAR', 'CIMEX', 'CINCT', 'CINES', 'CINQS', 'CIONS', 'CIPPI', 'CIRCS', 'CIRES', 'CIRLS', 'CIRRI', 'CISCO', 'CISSY', 'CISTS', 'CITAL', 'CITED', 'CITEE', 'CITER', 'CITES', 'CIVES', 'CIVET', 'CIVIE', 'CIVVY', 'CLACH', 'CLADE', 'CLADS', 'CLAES', 'CLAGS', 'CLAIR', 'CLAME', 'CLAMS', 'CLANS', 'CLAPS', 'CLAPT', 'CLARO', 'CLART', 'CLARY', 'CLAST', 'CLATS', 'CLAUT', 'CLAVE', 'CLAVI', 'CLAWS', 'CLAYS', 'CLECK', 'CLEEK', 'CLEEP', 'CLEFS', 'CLEGS', 'CLEIK', 'CLEMS', 'CLEPE', 'CLEPT', 'CLEVE', 'CLEWS', 'CLIED', 'CLIES', 'CLIFT', 'CLIME', 'CLINE', 'CLINT', 'CLIPE', 'CLIPS', 'CLIPT', 'CLITS', 'CLOAM', 'CLODS', 'CLOFF', 'CLOGS', 'CLOKE', 'CLOMB', 'CLOMP', 'CLONK', 'CLONS', 'CLOOP', 'CLOOT', 'CLOPS', 'CLOTE', 'CLOTS', 'CLOUR', 'CLOUS', 'CLOWS', 'CLOYE', 'CLOYS', 'CLOZE', 'CLUBS', 'CLUES', 'CLUEY', 'CLUNK', 'CLYPE', 'CNIDA', 'COACT', 'COADY', 'COALA', 'COALS', 'COALY', 'COAPT', 'COARB', 'COATE', 'COATI', 'COATS', 'COBBS', 'COBBY', 'COBIA', 'COBLE', 'COBOT', 'COBZA', 'COCAS', 'COCCI', 'COCCO', 'COCKS', 'COCKY', 'COCOS', 'COCUS', 'CODAS', 'CODEC', 'CODED', 'CODEN', 'CODER', 'CODES', 'CODEX', 'CODON', 'COEDS', 'COFFS', 'COGIE', 'COGON', 'COGUE', 'COHAB', 'COHEN', 'COHOE', 'COHOG', 'COHOS', 'COIFS', 'COIGN', 'COILS', 'COINS', 'COIRS', 'COITS', 'COKED', 'COKES', 'COKEY', 'COLAS', 'COLBY', 'COLDS', 'COLED', 'COLES', 'COLEY', 'COLIC', 'COLIN', 'COLLE', 'COLLS', 'COLLY', 'COLOG', 'COLTS', 'COLZA', 'COMAE', 'COMAL', 'COMAS', 'COMBE', 'COMBI', 'COMBO', 'COMBS', 'COMBY', 'COMER', 'COMES', 'COMIX', 'COMME', 'COMMO', 'COMMS', 'COMMY', 'COMPO', 'COMPS', 'COMPT', 'COMTE', 'COMUS', 'CONED', 'CONES', 'CONEX', 'CONEY', 'CONFS', 'CONGA', 'CONGE', 'CONGO', 'CONIA', 'CONIN', 'CONKS', 'CONKY', 'CONNE', 'CONNS', 'CONTE', 'CONTO', 'CONUS', 'CONVO', 'COOCH', 'COOED', 'COOEE', 'COOER', 'COOEY', 'COOFS', 'COOKS', 'COOKY', 'COOLS', 'COOLY', 'COOMB', 'COOMS', 'COOMY', 'COONS', 'COOPS', 'COOPT', 'COOST', 'COOTS', 'COOTY', 'COOZE', 'COPAL', 'COPAY', 'COPED', 'COPEN', 'COPER', 'COPES', 'COPHA', 'COPPY', 'COPRA', 'COPSY', 'COQUI', 'CORAM', 'CORBE', 'CORBY', 'CORDA', 'CORDS', 'CORED', 'CORES', 'COREY', 'CORGI', 'CORIA', 'CORKS', 'CORKY', 'CORMS', 'CORNI', 'CORNO', 'CORNS', 'CORNU', 'CORPS', 'CORSE', 'CORSO', 'COSEC', 'COSED', 'COSES', 'COSET', 'COSEY', 'COSIE', 'COSTA', 'COSTE', 'COSTS', 'COTAN', 'COTCH', 'COTED', 'COTES', 'COTHS', 'COTTA', 'COTTS', 'COUDE', 'COUPS', 'COURB', 'COURD', 'COURE', 'COURS', 'COUTA', 'COUTH', 'COVED', 'COVES', 'COVIN', 'COWAL', 'COWAN', 'COWED', 'COWKS', 'COWLS', 'COWPS', 'COWRY', 'COXAE', 'COXAL', 'COXED', 'COXES', 'COXIB', 'COYAU', 'COYED', 'COYER', 'COYPU', 'COZED', 'COZEN', 'COZES', 'COZEY', 'COZIE', 'CRAAL', 'CRABS', 'CRAGS', 'CRAIC', 'CRAIG', 'CRAKE', 'CRAME', 'CRAMS', 'CRANS', 'CRAPE', 'CRAPS', 'CRAPY', 'CRARE', 'CRAWS', 'CRAYS', 'CREDS', 'CREEL', 'CREES', 'CREIN', 'CREMA', 'CREMS', 'CRENA', 'CREPS', 'CREPY', 'CREWE', 'CREWS', 'CRIAS', 'CRIBO', 'CRIBS', 'CRIES', 'CRIMS', 'CRINE', 'CRINK', 'CRINS', 'CRIOS', 'CRIPE', 'CRIPS', 'CRISE', 'CRISS', 'CRITH', 'CRITS', 'CROCI', 'CROCS', 'CROFT', 'CROGS', 'CROMB', 'CROME', 'CRONK', 'CRONS', 'CROOL', 'CROON', 'CROPS', 'CRORE', 'CROST', 'CROUT', 'CROWL', 'CROWS', 'CROZE', 'CRUCK', 'CRUDO', 'CRUDS', 'CRUDY', 'CRUES', 'CRUET', 'CRUFT', 'CRUNK', 'CRUOR', 'CRURA', 'CRUSE', 'CRUSY', 'CRUVE', 'CRWTH', 'CRYER', 'CRYNE', 'CTENE', 'CUBBY', 'CUBEB', 'CUBED', 'CUBER', 'CUBES', 'CUBIT', 'CUCKS', 'CUDDA', 'CUDDY', 'CUECA', 'CUFFO', 'CUFFS', 'CUIFS', 'CUING', 'CUISH', 'CUITS', 'CUKES', 'CULCH', 'CULET', 'CULEX', 'CULLS', 'CULLY', 'CULMS', 'CULPA', 'CULTI', 'CULTS', 'CULTY', 'CUMEC', 'CUNDY', 'CUNEI', 'CUNIT', 'CUNNY', 'CUNTS', 'CUPEL', 'CUPID', 'CUPPA', 'CUPPY', 'CUPRO', 'CURAT', 'CURBS', 'CURCH', 'CURDS', 'CURDY', 'CURED', 'CURER', 'CURES', 'CURET', 'CURFS', 'CURIA', 'CURIE', 'CURLI', 'CURLS', 'CURNS', 'CURNY', 'CURRS', 'CURSI', 'CURST', 'CUSEC', 'CUSHY', 'CUSKS', 'CUSPS', 'CUSPY', 'CUSSO', 'CUSUM', 'CUTCH', 'CUTER', 'CUTES', 'CUTEY', 'CUTIN', 'CUTIS', 'CUTTO', 'CUTTY', 'CUTUP', 'CUVEE', 'CUZES', 'CWTCH', 'CYANO', 'CYANS', 'CYCAD', 'CYCAS', 'CYCLO', 'CYDER', 'CYLIX', 'CYMAE', 'CYMAR', 'CYMAS', 'CYMES', 'CYMOL', 'CYSTS', 'CYTES', 'CYTON', 'CZARS', 'DAALS', 'DABBA', 'DACES', 'DACHA', 'DACKS', 'DADAH', 'DADAS', 'DADIS', 'DADLA', 'DADOS', 'DAFFS', 'DAFFY', 'DAGGA', 'DAGGY', 'DAGOS', 'DAHIS', 'DAHLS', 'DAIKO', 'DAINE', 'DAINT', 'DAKER', 'DALED', 'DALEK', 'DALES', 'DALIS', 'DALLE', 'DALTS', 'DAMAN', 'DAMAR', 'DAMES', 'DAMME', 'DAMNA', 'DAMNS', 'DAMPS', 'DAMPY', 'DANCY', 'DANDA', 'DANGS', 'DANIO', 'DANKS', 'DANNY', 'DANSE', 'DANTS', 'DAPPY', 'DARAF', 'DARBS', 'DARCY', 'DARED', 'DARER', 'DARES', 'DARGA', 'DARGS', 'DARIC', 'DARIS', 'DARKS', 'DARKY', 'DARLS', 'DARNS', 'DARRE', 'DARTS', 'DARZI', 'DASHI', 'DASHY', 'DATAL', 'DATED', 'DATER', 'DATES', 'DATIL', 'DATOS', 'DATTO', 'DAUBE', 'DAUBS', 'DAUBY', 'DAUDS', 'DAULT', 'DAURS', 'DAUTS', 'DAVEN', 'DAVIT', 'DAWAH', 'DAWDS', 'DAWED', 'DAWEN', 'DAWGS', 'DAWKS', 'DAWNS', 'DAWTS', 'DAYAL', 'DAYAN', 'DAYCH', 'DAYNT', 'DAZED', 'DAZER', 'DAZES', 'DBAGS', 'DEADS', 'DEAIR', 'DEALS', 'DEANS', 'DEARE', 'DEARN', 'DEARS', 'DEARY', 'DEASH', 'DEAVE', 'DEAWS', 'DEAWY', 'DEBAG', 'DEBBY', 'DEBEL', 'DEBES', 'DEBTS', 'DEBUD', 'DEBUR', 'DEBUS', 'DEBYE', 'DECAD', 'DECAF', 'DECAN', 'DECIM', 'DECKO', 'DECKS', 'DECOS', 'DECYL', 'DEDAL', 'DEEDS', 'DEEDY', 'DEELY', 'DEEMS', 'DEENS', 'DEEPS', 'DEERE', 'DEERS', 'DEETS', 'DEEVE', 'DEEVS', 'DEFAT', 'DEFFO', 'DEFIS', 'DEFOG', 'DEGAS', 'DEGUM', 'DEGUS', 'DEICE', 'DEIDS', 'DEIFY', 'DEILS', 'DEINK', 'DEISM', 'DEIST', 'DEKED', 'DEKES', 'DEKKO', 'DELED', 'DELES', 'DELFS', 'DELFT', 'DELIS', 'DELLA', 'DELLS', 'DELLY', 'DELOS', 'DELPH', 'DELTS', 'DEMAN', 'DEMES', 'DEMIC', 'DEMIT', 'DEMOB', 'DEMOI', 'DEMOS', 'DEMOT', 'DEMPT', 'DENAR', 'DENAY', 'DENCH', 'DENES', 'DENET', 'DENIS', 'DENTE', 'DENTS', 'DEOCH', 'DEOXY', 'DERAT', 'DERAY', 'DERED', 'DERES', 'DERIG', 'DERMA', 'DERMS', 'DERNS', 'DERNY', 'DEROS', 'DERPY', 'DERRO', 'DERRY', 'DERTH', 'DERVS', 'DESEX', 'DESHI', 'DESIS', 'DESKS', 'DESSE', 'DETAG', 'DEVAS', 'DEVEL', 'DEVIS', 'DEVON', 'DEVOS', 'DEVOT', 'DEWAN', 'DEWAR', 'DEWAX', 'DEWED', 'DEXES', 'DEXIE', 'DEXYS', 'DHABA', 'DHAKS', 'DHALS', 'DHIKR', 'DHOBI', 'DHOLE', 'DHOLL', 'DHOLS', 'DHONI', 'DHOTI', 'DHOWS', 'DHUTI', 'DIACT', 'DIALS', 'DIANA', 'DIANE', 'DIAZO', 'DIBBS', 'DICED', 'DICER', 'DICES', 'DICHT', 'DICKS', 'DICKY', 'DICOT', 'DICTA', 'DICTO', 'DICTS', 'DICTU', 'DICTY', 'DIDDY', 'DIDIE', 'DIDIS', 'DIDOS', 'DIDST', 'DIEBS', 'DIELS', 'DIENE', 'DIETS', 'DIFFS', 'DIGHT', 'DIKAS', 'DIKED', 'DIKER', 'DIKES', 'DIKEY', 'DILDO', 'DILLI', 'DILLS', 'DIMBO', 'DIMER', 'DIMES', 'DIMPS', 'DINAR', 'DINED', 'DINES', 'DINGE', 'DINGS', 'DINIC', 'DINKS', 'DINKY', 'DINLO', 'DINNA', 'DINOS', 'DINTS', 'DIOCH', 'DIOLS', 'DIOTA', 'DIPPY', 'DIPSO', 'DIRAM', 'DIRER', 'DIRKE', 'DIRKS', 'DIRLS', 'DIRTS', 'DISAS', 'DISCI', 'DISCS', 'DISHY', 'DISKS', 'DISME', 'DITAL', 'DITAS', 'DITED', 'DITES', 'DITSY', 'DITTS', 'DITZY', 'DIVAN', 'DIVAS', 'DIVED', 'DIVES', 'DIVEY', 'DIVIS', 'DIVNA', 'DIVOS', 'DIVOT', 'DIVVY', 'DIWAN', 'DIXIE', 'DIXIT', 'DIYAS', 'DIZEN', 'DJINN', 'DJINS', 'DOABS', 'DOATS', 'DOBBY', 'DOBES', 'DOBIE', 'DOBLA', 'DOBLE', 'DOBRA', 'DOBRO', 'DOCHT', 'DOCKS', 'DOCOS', 'DOCUS', 'DODDY', 'DODOS', 'DOEKS', 'DOERS', 'DOEST', 'DOETH', 'DOFFS', 'DOGAL', 'DOGAN', 'DOGES', 'DOGEY', 'DOGGO', 'DOGGY', 'DOGIE', 'DOGLY', 'DOHYO', 'DOILT', 'DOILY', 'DOITS', 'DOJOS', 'DOLCE', 'DOLCI', 'DOLED', 'DOLEE', 'DOLES', 'DOLEY', 'DOLIA', 'DOLIE', 'DOLLS', 'DOLMA', 'DOLOR', 'DOLOS', 'DOLTS', 'DOMAL', 'DOMED', 'DOMES', 'DOMIC', 'DONAH', 'DONAS', 'DONEE', 'DONER', 'DONGA', 'DONGS', 'DONKO', 'DONNA', 'DONNE', 'DONNY', 'DONSY', 'DOOBS', 'DOOCE', 'DOODY', 'DOOFS', 'DOOKS', 'DOOKY', 'DOOLE', 'DOOLS', 'DOOLY', 'DOOMS', 'DOOMY', 'DOONA', 'DOORN', 'DOORS', 'DOOZY', 'DOPAS', 'DOPED', 'DOPER', 'DOPES', 'DOPPE', 'DORAD', 'DORBA', 'DORBS', 'DOREE', 'DORES', 'DORIC', 'DORIS', 'DORJE', 'DORKS', 'DORKY', 'DORMS', 'DORMY', 'DORPS', 'DORRS', 'DORSA', 'DORSE', 'DORTS', 'DORTY', 'DOSAI', 'DOSAS', 'DOSED', 'DOSEH', 'DOSER', 'DOSES', 'DOSHA', 'DOTAL', 'DOTED', 'DOTER', 'DOTES', 'DOTTY', 'DOUAR', 'DOUCE', 'DOUCS', 'DOUKS', 'DOULA', 'DOUMA', 'DOUMS', 'DOUPS', 'DOURA', 'DOUSE', 'DOUTS', 'DOVED', 'DOVEN', 'DOVER', 'DOVES', 'DOVIE', 'DOWAK', 'DOWAR', 'DOWDS', 'DOWED', 'DOWER', 'DOWFS', 'DOWIE', 'DOWLE', 'DOWLS', 'DOWLY', 'DOWNA', 'DOWNS', 'DOWPS', 'DOWSE', 'DOWTS', 'DOXED', 'DOXES', 'DOXIE', 'DOYEN', 'DOYLY', 'DOZED', 'DOZER', 'DOZES', 'DRABS', 'DRACK', 'DRACO', 'DRAFF', 'DRAGS', 'DRAIL', 'DRAMS', 'DRANT', 'DRAPS', 'DRAPY', 'DRATS', 'DRAVE', 'DRAWS', 'DRAYS', 'DREAR', 'DRECK', 'DREED', 'DREER', 'DREES', 'DREGS', 'DREKS', 'DRENT', 'DRERE', 'DREST', 'DREYS', 'DRIBS', 'DRICE', 'DRIES', 'DRILY', 'DRIPS', 'DRIPT', 'DROCK', 'DROID', 'DROIL', 'DROKE', 'DROLE', 'DROME', 'DRONY', 'DROOB', 'DROOG', 'DROOK', 'DROPS', 'DROPT', 'DROUK', 'DROWS', 'DRUBS', 'DRUGS', 'DRUMS', 'DRUPE', 'DRUSE', 'DRUSY', 'DRUXY', 'DRYAD', 'DRYAS', 'DSOBO', 'DSOMO', 'DUADS', 'DUALS', 'DUANS', 'DUARS', 'DUBBO', 'DUBBY', 'DUCAL', 'DUCAT', 'DUCES', 'DUCKS', 'DUCKY', 'DUCTI', 'DUCTS', 'DUDDY', 'DUDED', 'DUDES', 'DUELS', 'DUETS', 'DUETT', 'DUFFS', 'DUFUS', 'DUING', 'DUITS', 'DUKAS', 'DUKED', 'DUKES', 'DUKKA', 'DUKUN', 'DULCE', 'DULES', 'DULIA', 'DULLS', 'DULSE', 'DUMAS', 'DUMBO', 'DUMBS', 'DUMKA', 'DUMKY', 'DUMPS', 'DUNAM', 'DUNCH', 'DUNES', 'DUNGS', 'DUNGY', 'DUNKS', 'DUNNO', 'DUNNY', 'DUNSH', 'DUNTS', 'DUOMI', 'DUOMO', 'DUPED', 'DUPER', 'DUPES', 'DUPLE', 'DUPLY', 'DUPPY', 'DURAL', 'DURAS', 'DURED', 'DURES', 'DURGY', 'DURNS', 'DUROC', 'DUROS', 'DUROY', 'DURRA', 'DURRS', 'DURRY', 'DURST', 'DURUM', 'DURZI', 'DUSKS', 'DUSTS', 'DUXES', 'DWAAL', 'DWALE', 'DWALM', 'DWAMS', 'DWAMY', 'DWANG', 'DWAUM', 'DWEEB', 'DWILE', 'DWINE', 'DYADS', 'DYERS', 'DYKED', 'DYKES', 'DYKEY', 'DYKON', 'DYNEL', 'DYNES', 'DYNOS', 'DZHOS', 'EAGLY', 'EAGRE', 'EALED', 'EALES', 'EANED', 'EARDS', 'EARED', 'EARLS', 'EARNS', 'EARNT', 'EARST', 'EASED', 'EASER', 'EASES', 'EASLE', 'EASTS', 'EATHE', 'EATIN', 'EAVED', 'EAVER', 'EAVES', 'EBANK', 'EBBED', 'EBBET', 'EBENA', 'EBENE', 'EBIKE', 'EBONS', 'EBOOK', 'ECADS', 'ECARD', 'ECASH', 'ECHED', 'ECHES', 'ECHOS', 'ECIGS', 'ECOLE', 'ECRUS', 'EDEMA', 'EDGED', 'EDGER', 'EDGES', 'EDILE', 'EDITS', 'EDUCE', 'EDUCT', 'EEJIT', 'EENSY', 'EEVEN', 'EEVER', 'EEVNS', 'EFFED', 'EFFER', 'EFITS', 'EGADS', 'EGERS', 'EGEST', 'EGGAR', 'EGGED', 'EGGER', 'EGMAS', 'EHING', 'EIDER', 'EIDOS', 'EIGNE', 'EIKED', 'EIKON', 'EILDS', 'EIRON', 'EISEL', 'EJIDO', 'EKDAM', 'EKKAS', 'ELAIN', 'ELAND', 'ELANS', 'ELCHI', 'ELDIN', 'ELEET', 'ELEMI', 'ELFED', 'ELIAD', 'ELINT', 'ELMEN', 'ELOGE', 'ELOGY', 'ELOIN', 'ELOPS', 'ELPEE', 'ELSIN', 'ELUTE', 'ELVAN', 'ELVEN', 'ELVER', 'ELVES', 'EMACS', 'EMBAR', 'EMBAY', 'EMBOG', 'EMBOW', 'EMBOX', 'EMBUS', 'EMEER', 'EMEND', 'EMERG', 'EMERY', 'EMEUS', 'EMICS', 'EMIRS', 'EMITS', 'EMMAS', 'EMMER', 'EMMET', 'EMMEW', 'EMMYS', 'EMOJI', 'EMONG', 'EMOTE', 'EMOVE', 'EMPTS', 'EMULE', 'EMURE', 'EMYDE', 'EMYDS', 'ENARM', 'ENATE', 'ENDED', 'ENDER', 'ENDEW', 'ENDUE', 'ENEWS', 'ENFIX', 'ENIAC', 'ENLIT', 'ENMEW', 'ENNOG', 'ENOKI', 'ENOLS', 'ENORM', 'ENOWS', 'ENROL', 'ENSEW', 'ENSKY', 'ENTIA', 'ENTRE', 'ENURE', 'ENURN', 'ENVOI', 'ENZYM', 'EOLID', 'EORLS', 'EOSIN', 'EPACT', 'EPEES', 'EPENA', 'EPENE', 'EPHAH', 'EPHAS', 'EPHOD', 'EPHOR', 'EPICS', 'EPODE', 'EPOPT', 'EPPIE', 'EPRIS', 'EQUES', 'EQUID', 'ERBIA', 'EREVS', 'ERGON', 'ERGOS', 'ERGOT', 'ERHUS', 'ERICA', 'ERICK', 'ERICS', 'ERING', 'ERNED', 'ERNES', 'EROSE', 'ERRED', 'ERSES', 'ERUCT', 'ERUGO', 'ERUVS', 'ERVEN', 'ERVIL', 'ESCAR', 'ESCOT', 'ESILE', 'ESKAR', 'ESKER', 'ESNES', 'ESROG', 'ESSES', 'ESTOC', 'ESTOP', 'ESTRO', 'ETAGE', 'ETAPE', 'ETATS', 'ETENS', 'ETHAL', 'ETHNE', 'ETHYL', 'ETICS', 'ETNAS', 'ETROG', 'ETTIN', 'ETTLE', 'ETUIS', 'ETWEE', 'ETYMA', 'EUGHS', 'EUKED', 'EUPAD', 'EUROS', 'EUSOL', 'EVEGS', 'EVENS', 'EVERT', 'EVETS', 'EVHOE', 'EVILS', 'EVITE', 'EVOHE', 'EWERS', 'EWEST', 'EWHOW', 'EWKED', 'EXAMS', 'EXEAT', 'EXECS', 'EXEEM', 'EXEME', 'EXFIL', 'EXIER', 'EXIES', 'EXINE', 'EXING', 'EXITE', 'EXITS', 'EXODE', 'EXOME', 'EXONS', 'EXPAT', 'EXPOS', 'EXUDE', 'EXULS', 'EXURB', 'EYASS', 'EYERS', 'EYOTS', 'EYRAS', 'EYRES', 'EYRIE', 'EYRIR', 'EZINE', 'FABBO', 'FABBY', 'FACED', 'FACER', 'FACES', 'FACEY', 'FACIA', 'FACIE', 'FACTA', 'FACTO', 'FACTS', 'FACTY', 'FADDY', 'FADED', 'FADER', 'FADES', 'FADGE', 'FADOS', 'FAENA', 'FAERY', 'FAFFS', 'FAFFY', 'FAGGY', 'FAGIN', 'FAGOT', 'FAIKS', 'FAILS', 'FAINE', 'FAINS', 'FAIRE', 'FAIRS', 'FAKED', 'FAKER', 'FAKES', 'FAKEY', 'FAKIE', 'FAKIR', 'FALAJ', 'FALES', 'FALLS', 'FALSY', 'FAMED', 'FAMES', 'FANAL', 'FANDS', 'FANES', 'FANGA', 'FANGO', 'FANGS', 'FANKS', 'FANON', 'FANOS', 'FANUM', 'FAQIR', 'FARAD', 'FARCI', 'FARCY', 'FARDS', 'FARED', 'FARER', 'FARES', 'FARLE', 'FARLS', 'FARMS', 'FAROS', 'FARRO', 'FARSE', 'FARTS', 'FASCI', 'FASTI', 'FASTS', 'FATED', 'FATES', 'FATLY', 'FATSO', 'FATWA', 'FAUCH', 'FAUGH', 'FAULD', 'FAUNS', 'FAURD', 'FAUTE', 'FAUTS', 'FAUVE', 'FAVAS', 'FAVEL', 'FAVER', 'FAVES', 'FAVUS', 'FAWNS', 'FAWNY', 'FAXED', 'FAXES', 'FAYED', 'FAYER', 'FAYNE', 'FAYRE', 'FAZED', 'FAZES', 'FEALS', 'FEARD', 'FEARE', 'FEARS', 'FEART', 'FEASE', 'FEATS', 'FEAZE', 'FECES', 'FECHT', 'FECIT', 'FECKS', 'FEDAI', 'FEDEX', 'FEEBS', 'FEEDS', 'FEELS', 'FEELY', 'FEENS', 'FEERS', 'FEESE', 'FEEZE', 'FEHME', 'FEINT', 'FEIST', 'FELCH', 'FELID', 'FELIX', 'FELLS', 'FELLY', 'FELTS', 'FELTY', 'FEMAL', 'FEMES', 'FEMIC', 'FEMMY', 'FENDS', 'FENDY', 'FENIS', 'FENKS', 'FENNY', 'FENTS', 'FEODS', 'FEOFF', 'FERER', 'FERES', 'FERIA', 'FERLY', 'FERMI', 'FERMS', 'FERNS', 'FERNY', 'FEROX', 'FESSE', 'FESTA', 'FESTS', 'FESTY', 'FETAS', 'FETED', 'FETES', 'FETOR', 'FETTA', 'FETTS', 'FETWA', 'FEUAR', 'FEUDS', 'FEUED', 'FEYED', 'FEYER', 'FEYLY', 'FEZES', 'FEZZY', 'FIARS', 'FIATS', 'FIBRE', 'FIBRO', 'FICES', 'FICHE', 'FICHU', 'FICIN', 'FICOS', 'FICTA', 'FIDES', 'FIDGE', 'FIDOS', 'FIDUS', 'FIEFS', 'FIENT', 'FIERE', 'FIERI', 'FIERS', 'FIEST', 'FIFED', 'FIFER', 'FIFES', 'FIFIS', 'FIGGY', 'FIGOS', 'FIKED', 'FIKES', 'FILAR', 'FILCH', 'FILED', 'FILES', 'FILII', 'FILKS', 'FILLE', 'FILLO', 'FILLS', 'FILMI', 'FILMS', 'FILON', 'FILOS', 'FILUM', 'FINCA', 'FINDS', 'FINED', 'FINES', 'FINIS', 'FINKS', 'FINNY', 'FINOS', 'FIORD', 'FIQHS', 'FIQUE', 'FIRED', 'FIRER', 'FIRES', 'FIRIE', 'FIRKS', 'FIRMA', 'FIRMS', 'FIRNI', 'FIRNS', 'FIRRY', 'FIRTH', 'FISCS', 'FISHO', 'FISKS', 'FISTS', 'FISTY', 'FITCH', 'FITLY', 'FITNA', 'FITTE', 'FITTS', 'FIVER', 'FIVES', 'FIXED', 'FIXES', 'FIXIE', 'FIXIT', 'FJELD', 'FLABS', 'FLAFF', 'FLAGS', 'FLAKS', 'FLAMM', 'FLAMS', 'FLAMY', 'FLANE', 'FLANS', 'FLAPS', 'FLARY', 'FLATS', 'FLAVA', 'FLAWN', 'FLAWS', 'FLAWY', 'FLAXY', 'FLAYS', 'FLEAM', 'FLEAS', 'FLEEK', 'FLEER', 'FLEES', 'FLEGS', 'FLEME', 'FLEUR', 'FLEWS', 'FLEXI', 'FLEXO', 'FLEYS', 'FLICS', 'FLIED', 'FLIES', 'FLIMP', 'FLIMS', 'FLIPS', 'FLIRS', 'FLISK', 'FLITE', 'FLITS', 'FLITT', 'FLOBS', 'FLOCS', 'FLOES', 'FLOGS', 'FLONG', 'FLOPS', 'FLORE', 'FLORS', 'FLORY', 'FLOSH', 'FLOTA', 'FLOTE', 'FLOWS', 'FLOWY', 'FLUBS', 'FLUED', 'FLUES', 'FLUEY', 'FLUKY', 'FLUMP', 'FLUOR', 'FLURR', 'FLUTY', 'FLUYT', 'FLYBY', 'FLYIN', 'FLYPE', 'FLYTE', 'FNARR', 'FOALS', 'FOAMS', 'FOEHN', 'FOGEY', 'FOGIE', 'FOGLE', 'FOGOS', 'FOGOU', 'FOHNS', 'FOIDS', 'FOILS', 'FOINS', 'FOLDS', 'FOLEY', 'FOLIA', 'FOLIC', 'FOLIE', 'FOLKS', 'FOLKY', 'FOMES', 'FONDA', 'FONDS', 'FONDU', 'FONES', 'FONIO', 'FONLY', 'FONTS', 'FOODS', 'FOODY', 'FOOLS', 'FOOTS', 'FOOTY', 'FORAM', 'FORBS', 'FORBY', 'FORDO', 'FORDS', 'FOREL', 'FORES', 'FOREX', 'FORKS', 'FORKY', 'FORMA', 'FORME', 'FORMS', 'FORTS', 'FORZA', 'FORZE', 'FOSSA', 'FOSSE', 'FOUAT', 'FOUDS', 'FOUER', 'FOUET', 'FOULE', 'FOULS', 'FOUNT', 'FOURS', 'FOUTH', 'FOVEA', 'FOWLS', 'FOWTH', 'FOXED', 'FOXES', 'FOXIE', 'FOYLE', 'FOYNE', 'FRABS', 'FRACK', 'FRACT', 'FRAGS', 'FRAIM', 'FRAIS', 'FRANC', 'FRAPE', 'FRAPS', 'FRASS', 'FRATE', 'FRATI', 'FRATS', 'FRAUS', 'FRAYS', 'FREES', 'FREET', 'FREIT', 'FREMD', 'FRENA', 'FREON', 'FRERE', 'FRETS', 'FRIBS', 'FRIER', 'FRIES', 'FRIGS', 'FRISE', 'FRIST', 'FRITA', 'FRITE', 'FRITH', 'FRITS', 'FRITT', 'FRIZE', 'FRIZZ', 'FROES', 'FROGS', 'FROMM', 'FRONS', 'FROOM', 'FRORE', 'FRORN', 'FRORY', 'FROSH', 'FROWS', 'FROWY', 'FROYO', 'FRUGS', 'FRUMP', 'FRUSH', 'FRUST', 'FRYER', 'FUBAR', 'FUBBY', 'FUBSY', 'FUCKS', 'FUCUS', 'FUDDY', 'FUDGY', 'FUELS', 'FUERO', 'FUFFS', 'FUFFY', 'FUGAL', 'FUGGY', 'FUGIE', 'FUGIO', 'FUGIS', 'FUGLE', 'FUGLY', 'FUGUS', 'FUJIS', 'FULLA', 'FULLS', 'FULTH', 'FULWA', 'FUMED', 'FUMER', 'FUMES', 'FUMET', 'FUNDA', 'FUNDI', 'FUNDO', 'FUNDS', 'FUNDY', 'FUNGO', 'FUNGS', 'FUNIC', 'FUNIS', 'FUNKS', 'FUNSY', 'FUNTS', 'FURAL', 'FURAN', 'FURCA', 'FURLS', 'FUROL', 'FUROS', 'FURRS', 'FURTH', 'FURZE', 'FURZY', 'FUSED', 'FUSEE', 'FUSEL', 'FUSES', 'FUSIL', 'FUSKS', 'FUSTS', 'FUSTY', 'FUTON', 'FUZED', 'FUZEE', 'FUZES', 'FUZIL', 'FYCES', 'FYKED', 'FYKES', 'FYLES', 'FYRDS', 'FYTTE', 'GABBA', 'GABBY', 'GABLE', 'GADDI', 'GADES', 'GADGE', 'GADGY', 'GADID', 'GADIS', 'GADJE', 'GADJO', 'GADSO', 'GAFFS', 'GAGED', 'GAGER', 'GAGES', 'GAIDS', 'GAINS', 'GAIRS', 'GAITA', 'GAITS', 'GAITT', 'GAJOS', 'GALAH', 'GALAS', 'GALAX', 'GALEA', 'GALED', 'GALES', 'GALIA', 'GALIS', 'GALLS', 'GALLY', 'GALOP', 'GALUT', 'GALVO', 'GAMAS', 'GAMAY', 'GAMBA', 'GAMBE', 'GAMBO', 'GAMBS', 'GAMED', 'GAMES', 'GAMEY', 'GAMIC', 'GAMIN', 'GAMME', 'GAMMY', 'GAMPS', 'GANCH', 'GANDY', 'GANEF', 'GANEV', 'GANGS', 'GANJA', 'GANKS', 'GANOF', 'GANTS', 'GAOLS', 'GAPED', 'GAPER', 'GAPES', 'GAPOS', 'GAPPY', 'GARAM', 'GARBA', 'GARBE', 'GARBO', 'GARBS', 'GARDA', 'GARDE', 'GARES', 'GARIS', 'GARMS', 'GARNI', 'GARRE', 'GARRI', 'GARTH', 'GARUM', 'GASES', 'GASHY', 'GASPS', 'GASPY', 'GASTS', 'GATCH', 'GATED', 'GATER', 'GATES', 'GATHS', 'GATOR', 'GAUCH', 'GAUCY', 'GAUDS', 'GAUJE', 'GAULT', 'GAUMS', 'GAUMY', 'GAUPS', 'GAURS', 'GAUSS', 'GAUZY', 'GAVOT', 'GAWCY', 'GAWDS', 'GAWKS', 'GAWPS', 'GAWSY', 'GAYAL', 'GAZAL', 'GAZAR', 'GAZED', 'GAZES', 'GAZON', 'GAZOO', 'GEALS', 'GEANS', 'GEARE', 'GEARS', 'GEASA', 'GEATS', 'GEBUR', 'GECKS', 'GEEKS', 'GEEPS', 'GEEST', 'GEIST', 'GEITS', 'GELDS', 'GELEE', 'GELID', 'GELLY', 'GELTS', 'GEMEL', 'GEMMA', 'GEMMY', 'GEMOT', 'GENAE', 'GENAL', 'GENAS', 'GENES', 'GENET', 'GENIC', 'GENII', 'GENIN', 'GENIO', 'GENIP', 'GENNY', 'GENOA', 'GENOM', 'GENRO', 'GENTS', 'GENTY', 'GENUA', 'GENUS', 'GEODE', 'GEOID', 'GERAH', 'GERBE', 'GERES', 'GERLE', 'GERMS', 'GERMY', 'GERNE', 'GESSE', 'GESSO', 'GESTE', 'GESTS', 'GETAS', 'GETUP', 'GEUMS', 'GEYAN', 'GEYER', 'GHAST', 'GHATS', 'GHAUT', 'GHAZI', 'GHEES', 'GHEST', 'GHUSL', 'GHYLL', 'GIBED', 'GIBEL', 'GIBER', 'GIBES', 'GIBLI', 'GIBUS', 'GIFTS', 'GIGAS', 'GIGHE', 'GIGOT', 'GIGUE', 'GILAS', 'GILDS', 'GILET', 'GILIA', 'GILLS', 'GILLY', 'GILPY', 'GILTS', 'GIMEL', 'GIMME', 'GIMPS', 'GIMPY', 'GINCH', 'GINGA', 'GINGE', 'GINGS', 'GINKS', 'GINNY', 'GINZO', 'GIPON', 'GIPPO', 'GIPPY', 'GIRDS', 'GIRLF', 'GIRLS', 'GIRNS', 'GIRON', 'GIROS', 'GIRRS', 'GIRSH', 'GIRTS', 'GISMO', 'GISMS', 'GISTS', 'GITCH', 'GITES', 'GIUST', 'GIVED', 'GIVES', 'GIZMO', 'GLACE', 'GLADS', 'GLADY', 'GLAIK', 'GLAIR', 'GLAMP', 'GLAMS', 'GLANS', 'GLARY', 'GLATT', 'GLAUM', 'GLAUR', 'GLAZY', 'GLEBA', 'GLEBE', 'GLEBY', 'GLEDE', 'GLEDS', 'GLEED', 'GLEEK', 'GLEES', 'GLEET', 'GLEIS', 'GLENS', 'GLENT', 'GLEYS', 'GLIAL', 'GLIAS', 'GLIBS', 'GLIFF', 'GLIFT', 'GLIKE', 'GLIME', 'GLIMS', 'GLISK', 'GLITS', 'GLITZ', 'GLOAM', 'GLOBI', 'GLOBS', 'GLOBY', 'GLODE', 'GLOGG', 'GLOMS', 'GLOOP', 'GLOPS', 'GLOST', 'GLOUT', 'GLOWS', 'GLOWY', 'GLOZE', 'GLUED', 'GLUER', 'GLUES', 'GLUEY', 'GLUGG', 'GLUGS', 'GLUME', 'GLUMS', 'GLUON', 'GLUTE', 'GLUTS', 'GNAPI', 'GNARL', 'GNARR', 'GNARS', 'GNATS', 'GNAWN', 'GNAWS', 'GNOWS', 'GOADS', 'GOAFS', 'GOAFT', 'GOALS', 'GOARY', 'GOATS', 'GOATY', 'GOAVE', 'GOBAN', 'GOBAR', 'GOBBE', 'GOBBI', 'GOBBO', 'GOBBY', 'GOBIS', 'GOBOS', 'GODET', 'GODSO', 'GOELS', 'GOERS', 'GOEST', 'GOETH', 'GOETY', 'GOFER', 'GOFFS', 'GOGGA', 'GOGOS', 'GOIER', 'GOJIS', 'GOKES', 'GOLDS', 'GOLDY', 'GOLES', 'GOLFS', 'GOLPE', 'GOLPS', 'GOMBO', 'GOMER', 'GOMPA', 'GONCH', 'GONEF', 'GONGS', 'GONIA', 'GONIF', 'GONKS', 'GONNA', 'GONOF', 'GONYS', 'GONZO', 'GOOBY', 'GOODO', 'GOODS', 'GOOFS', 'GOOGS', 'GOOKS', 'GOOKY', 'GOOLD', 'GOOLS', 'GOOLY', 'GOOMY', 'GOONS', 'GOONY', 'GOOPS', 'GOOPY', 'GOORS', 'GOORY', 'GOOSY', 'GOPAK', 'GOPIK', 'GORAL', 'GORAS', 'GORAY', 'GORBS', 'GORDO', 'GORED', 'GORES', 'GORIS', 'GORMS', 'GORMY', 'GORPS', 'GORSE', 'GORSY', 'GOSHT', 'GOSSE', 'GOTCH', 'GOTHS', 'GOTHY', 'GOTTA', 'GOUCH', 'GOUKS', 'GOURA', 'GOUTS', 'GOUTY', 'GOVED', 'GOVES', 'GOWAN', 'GOWDS', 'GOWFS', 'GOWKS', 'GOWLS', 'GOWNS', 'GOXES', 'GOYIM', 'GOYLE', 'GRAAL', 'GRABS', 'GRADS', 'GRAFF', 'GRAIP', 'GRAMA', 'GRAME', 'GRAMP', 'GRAMS', 'GRANA', 'GRANO', 'GRANS', 'GRAPY', 'GRATA', 'GRATS', 'GRAVS', 'GRAYS', 'GREBE', 'GREBO', 'GRECE', 'GREEK', 'GREES', 'GREGE', 'GREGO', 'GREIN', 'GRENS', 'GREPS', 'GRESE', 'GREVE', 'GREWS', 'GREYS', 'GRICE', 'GRIDE', 'GRIDS', 'GRIFF', 'GRIFT', 'GRIGS', 'GRIKE', 'GRINS', 'GRIOT', 'GRIPS', 'GRIPT', 'GRIPY', 'GRISE', 'GRIST', 'GRISY', 'GRITH', 'GRITS', 'GRIZE', 'GROAT', 'GRODY', 'GROGS', 'GROKS', 'GROMA', 'GROMS', 'GRONE', 'GROOF', 'GROSZ', 'GROTS', 'GROUF', 'GROVY', 'GROWS', 'GRRLS', 'GRRRL', 'GRUBS', 'GRUED', 'GRUES', 'GRUFE', 'GRUME', 'GRUMP', 'GRUND', 'GRYCE', 'GRYDE', 'GRYKE', 'GRYPE', 'GRYPT', 'GUACO', 'GUANA', 'GUANO', 'GUANS', 'GUARS', 'GUBBA', 'GUCKS', 'GUCKY', 'GUDES', 'GUFFS', 'GUGAS', 'GUGGL', 'GUIDO', 'GUIDS', 'GUIMP', 'GUIRO', 'GULAB', 'GULAG', 'GULAR', 'GULAS', 'GULES', 'GULET', 'GULFS', 'GULFY', 'GULLS', 'GULPH', 'GULPS', 'GULPY', 'GUMMA', 'GUMMI', 'GUMPS', 'GUNAS', 'GUNDI', 'GUNDY', 'GUNGE', 'GUNGY', 'GUNKS', 'GUNKY', 'GUNNY', 'GUQIN', 'GURDY', 'GURGE', 'GURKS', 'GURLS', 'GURLY', 'GURNS', 'GURRY', 'GURSH', 'GURUS', 'GUSHY', 'GUSLA', 'GUSLE', 'GUSLI', 'GUSSY', 'GUSTS', 'GUTSY', 'GUTTA', 'GUTTY', 'GUYED', 'GUYLE', 'GUYOT', 'GUYSE', 'GWINE', 'GYALS', 'GYANS', 'GYBED', 'GYBES', 'GYELD', 'GYMPS', 'GYNAE', 'GYNIE', 'GYNNY', 'GYNOS', 'GYOZA', 'GYPES', 'GYPOS', 'GYPPO', 'GYPPY', 'GYRAL', 'GYRED', 'GYRES', 'GYRON', 'GYROS', 'GYRUS', 'GYTES', 'GYVED', 'GYVER', 'GYVES', 'HAAFS', 'HAARS', 'HAATS', 'HABLE', 'HABUS', 'HACEK', 'HACKS', 'HACKY', 'HADAL', 'HADED', 'HADES', 'HADJI', 'HADST', 'HAEMS', 'HAERE', 'HAETS', 'HAFFS', 'HAFIZ', 'HAFTA', 'HAFTS', 'HAGGS', 'HAHAM', 'HAHAS', 'HAICK', 'HAIKA', 'HAIKS', 'HAIKU', 'HAILS', 'HAILY', 'HAINS', 'HAINT', 'HAIRS', 'HAITH', 'HAJES', 'HAJIS', 'HAJJI', 'HAKAM', 'HAKAS', 'HAKEA', 'HAKES', 'HAKIM', 'HAKUS', 'HALAL', 'HALDI', 'HALED', 'HALER', 'HALES', 'HALFA', 'HALFS', 'HALID', 'HALLO', 'HALLS', 'HALMA', 'HALMS', 'HALON', 'HALOS', 'HALSE', 'HALSH', 'HALTS', 'HALVA', 'HALWA', 'HAMAL', 'HAMBA', 'HAMED', 'HAMEL', 'HAMES', 'HAMMY', 'HAMZA', 'HANAP', 'HANCE', 'HANCH', 'HANDI', 'HANDS', 'HANGI', 'HANGS', 'HANKS', 'HANKY', 'HANSA', 'HANSE', 'HANTS', 'HAOLE', 'HAOMA', 'HAPAS', 'HAPAX', 'HAPLY', 'HAPPI', 'HAPUS', 'HARAM', 'HARDS', 'HARED', 'HARES', 'HARIM', 'HARKS', 'HARLS', 'HARMS', 'HARNS', 'HAROS', 'HARPS', 'HARTS', 'HASHY', 'HASKS', 'HASPS', 'HASTA', 'HATED', 'HATES', 'HATHA', 'HATHI', 'HATTY', 'HAUDS', 'HAUFS', 'HAUGH', 'HAUGO', 'HAULD', 'HAULM', 'HAULS', 'HAULT', 'HAUNS', 'HAUSE', 'HAVAN', 'HAVEL', 'HAVER', 'HAVES', 'HAWED', 'HAWKS', 'HAWMS', 'HAWSE', 'HAYED', 'HAYER', 'HAYEY', 'HAYLE', 'HAZAN', 'HAZED', 'HAZER', 'HAZES', 'HAZLE', 'HEADS', 'HEALD', 'HEALS', 'HEAME', 'HEAPS', 'HEAPY', 'HEARE', 'HEARS', 'HEAST', 'HEATS', 'HEATY', 'HEBEN', 'HEBES', 'HECHT', 'HECKS', 'HEDER', 'HEDGY', 'HEEDS', 'HEEDY', 'HEELS', 'HEEZE', 'HEFTE', 'HEFTS', 'HEIAU', 'HEIDS', 'HEIGH', 'HEILS', 'HEIRS', 'HEJAB', 'HEJRA', 'HELED', 'HELES', 'HELIO', 'HELLA', 'HELLS', 'HELLY', 'HELMS', 'HELOS', 'HELOT', 'HELPS', 'HELVE', 'HEMAL', 'HEMES', 'HEMIC', 'HEMIN', 'HEMPS', 'HEMPY', 'HENCH', 'HENDS', 'HENGE', 'HENNA', 'HENNY', 'HENRY', 'HENTS', 'HEPAR', 'HERBS', 'HERBY', 'HERDS', 'HERES', 'HERLS', 'HERMA', 'HERMS', 'HERNS', 'HEROS', 'HERPS', 'HERRY', 'HERSE', 'HERTZ', 'HERYE', 'HESPS', 'HESTS', 'HETES', 'HETHS', 'HEUCH', 'HEUGH', 'HEVEA', 'HEVEL', 'HEWED', 'HEWER', 'HEWGH', 'HEXAD', 'HEXED', 'HEXER', 'HEXES', 'HEXYL', 'HEYED', 'HIANT', 'HIBAS', 'HICKS', 'HIDED', 'HIDER', 'HIDES', 'HIEMS', 'HIFIS', 'HIGHS', 'HIGHT', 'HIJAB', 'HIJRA', 'HIKED', 'HIKER', 'HIKES', 'HIKOI', 'HILAR', 'HILCH', 'HILLO', 'HILLS', 'HILSA', 'HILTS', 'HILUM', 'HILUS', 'HIMBO', 'HINAU', 'HINDS', 'HINGS', 'HINKY', 'HINNY', 'HINTS', 'HIOIS', 'HIPED', 'HIPER', 'HIPES', 'HIPLY', 'HIRED', 'HIREE', 'HIRER', 'HIRES', 'HISSY', 'HISTS', 'HITHE', 'HIVED', 'HIVER', 'HIVES', 'HIZEN', 'HOACH', 'HOAED', 'HOAGY', 'HOARS', 'HOARY', 'HOAST', 'HOBOS', 'HOCKS', 'HOCUS', 'HODAD', 'HODJA', 'HOERS', 'HOGAN', 'HOGEN', 'HOGGS', 'HOGHS', 'HOGOH', 'HOGOS', 'HOHED', 'HOICK', 'HOIED', 'HOIKS', 'HOING', 'HOISE', 'HOKAS', 'HOKED', 'HOKES', 'HOKEY', 'HOKIS', 'HOKKU', 'HOKUM', 'HOLDS', 'HOLED', 'HOLES', 'HOLEY', 'HOLKS', 'HOLLA', 'HOLLO', 'HOLME', 'HOLMS', 'HOLON', 'HOLOS', 'HOLTS', 'HOMAS', 'HOMED', 'HOMES', 'HOMEY', 'HOMIE', 'HOMME', 'HOMOS', 'HONAN', 'HONDA', 'HONDS', 'HONED', 'HONER', 'HONES', 'HONGI', 'HONGS', 'HONKS', 'HONKY', 'HOOCH', 'HOODS', 'HOODY', 'HOOEY', 'HOOFS', 'HOOGO', 'HOOHA', 'HOOKA', 'HOOKS', 'HOOKY', 'HOOLY', 'HOONS', 'HOOPS', 'HOORD', 'HOORS', 'HOOSH', 'HOOTS', 'HOOTY', 'HOOVE', 'HOPAK', 'HOPED', 'HOPER', 'HOPES', 'HOPPY', 'HORAH', 'HORAL', 'HORAS', 'HORIS', 'HORKS', 'HORME', 'HORNS', 'HORST', 'HORSY', 'HOSED', 'HOSEL', 'HOSEN', 'HOSER', 'HOSES', 'HOSEY', 'HOSTA', 'HOSTS', 'HOTCH', 'HOTEN', 'HOTIS', 'HOTTE', 'HOTTY', 'HOUFF', 'HOUFS', 'HOUGH', 'HOURI', 'HOURS', 'HOUTS', 'HOVEA', 'HOVED', 'HOVEN', 'HOVES', 'HOWAY', 'HOWBE', 'HOWES', 'HOWFF', 'HOWFS', 'HOWKS', 'HOWLS', 'HOWRE', 'HOWSO', 'HOWTO', 'HOXED', 'HOXES', 'HOYAS', 'HOYED', 'HOYLE', 'HUBBA', 'HUBBY', 'HUCKS', 'HUDNA', 'HUDUD', 'HUERS', 'HUFFS', 'HUFFY', 'HUGER', 'HUGGY', 'HUHUS', 'HUIAS', 'HUIES', 'HUKOU', 'HULAS', 'HULES', 'HULKS', 'HULKY', 'HULLO', 'HULLS', 'HULLY', 'HUMAS', 'HUMFS', 'HUMIC', 'HUMPS', 'HUMPY', 'HUNDO', 'HUNKS', 'HUNTS', 'HURDS', 'HURLS', 'HURLY', 'HURRA', 'HURST', 'HURTS', 'HURTY', 'HUSHY', 'HUSKS', 'HUSOS', 'HUTIA', 'HUZZA', 'HUZZY', 'HWYLS', 'HYDEL', 'HYDRA', 'HYENS', 'HYGGE', 'HYING', 'HYKES', 'HYLAS', 'HYLEG', 'HYLES', 'HYLIC', 'HYMNS', 'HYNDE', 'HYOID', 'HYPED', 'HYPES', 'HYPHA', 'HYPHY', 'HYPOS', 'HYRAX', 'HYSON', 'HYTHE', 'IAMBI', 'IAMBS', 'IBRIK', 'ICERS', 'ICHED', 'ICHES', 'ICHOR', 'ICIER', 'ICKER', 'ICKLE', 'ICONS', 'ICTAL', 'ICTIC', 'ICTUS', 'IDANT', 'IDDAH', 'IDDAT', 'IDDUT', 'IDEAS', 'IDEES', 'IDENT', 'IDLED', 'IDLES', 'IDLIS', 'IDOLA', 'IDOLS', 'IDYLS', 'IFTAR', 'IGAPO', 'IGGED', 'IGLUS', 'IGNIS', 'IHRAM', 'IIWIS', 'IKANS', 'IKATS', 'IKONS', 'ILEAC', 'ILEAL', 'ILEUM', 'ILEUS', 'ILIAD', 'ILIAL', 'ILIUM', 'ILLER', 'ILLTH', 'IMAGO', 'IMAGY', 'IMAMS', 'IMARI', 'IMAUM', 'IMBAR', 'IMBED', 'IMBOS', 'IMIDE', 'IMIDO', 'IMIDS', 'IMINE', 'IMINO', 'IMLIS', 'IMMEW', 'IMMIT', 'IMMIX', 'IMPED', 'IMPIS', 'IMPOT', 'IMPRO', 'IMSHI', 'IMSHY', 'INAPT', 'INARM', 'INBYE', 'INCAS', 'INCEL', 'INCLE', 'INCOG', 'INCUS', 'INCUT', 'INDEW', 'INDIA', 'INDIE', 'INDOL', 'INDOW', 'INDRI', 'INDUE', 'INERM', 'INFIX', 'INFOS', 'INFRA', 'INGAN', 'INGLE', 'INION', 'INKED', 'INKER', 'INKLE', 'INNED', 'INNIE', 'INNIT', 'INORB', 'INROS', 'INRUN', 'INSEE', 'INSET', 'INSPO', 'INTEL', 'INTIL', 'INTIS', 'INTRA', 'INULA', 'INURE', 'INURN', 'INUST', 'INVAR', 'INVER', 'INWIT', 'IODIC', 'IODID', 'IODIN', 'IORAS', 'IOTAS', 'IPPON', 'IRADE', 'IRIDS', 'IRING', 'IRKED', 'IROKO', 'IRONE', 'IRONS', 'ISBAS', 'ISHES', 'ISLED', 'ISLES', 'ISNAE', 'ISSEI', 'ISTLE', 'ITEMS', 'ITHER', 'IVIED', 'IVIES', 'IXIAS', 'IXNAY', 'IXORA', 'IXTLE', 'IZARD', 'IZARS', 'IZZAT', 'JAAPS', 'JABOT', 'JACAL', 'JACET', 'JACKS', 'JACKY', 'JADED', 'JADES', 'JAFAS', 'JAFFA', 'JAGAS', 'JAGER', 'JAGGS', 'JAGGY', 'JAGIR', 'JAGRA', 'JAILS', 'JAKER', 'JAKES', 'JAKEY', 'JAKIE', 'JALAP', 'JALEO', 'JALOP', 'JAMBE', 'JAMBO', 'JAMBS', 'JAMBU', 'JAMES', 'JAMMY', 'JAMON', 'JAMUN', 'JANES', 'JANKY', 'JANNS', 'JANNY', 'JANTY', 'JAPAN', 'JAPED', 'JAPER', 'JAPES', 'JARKS', 'JARLS', 'JARPS', 'JARTA', 'JARUL', 'JASEY', 'JASPE', 'JASPS', 'JATHA', 'JATIS', 'JATOS', 'JAUKS', 'JAUNE', 'JAUPS', 'JAVAS', 'JAVEL', 'JAWAN', 'JAWED', 'JAWNS', 'JAXIE', 'JEANS', 'JEATS', 'JEBEL', 'JEDIS', 'JEELS', 'JEELY', 'JEEPS', 'JEERA', 'JEERS', 'JEEZE', 'JEFES', 'JEFFS', 'JEHAD', 'JEHUS', 'JELAB', 'JELLO', 'JELLS', 'JEMBE', 'JEMMY', 'JENNY', 'JEONS', 'JERID', 'JERKS', 'JERRY', 'JESSE', 'JESSY', 'JESTS', 'JESUS', 'JETEE', 'JETES', 'JETON', 'JEUNE', 'JEWED', 'JEWIE', 'JHALA', 'JHEEL', 'JHILS', 'JIAOS', 'JIBBA', 'JIBBS', 'JIBED', 'JIBER', 'JIBES', 'JIFFS', 'JIGGY', 'JIGOT', 'JIHAD', 'JILLS', 'JILTS', 'JIMMY', 'JIMPY', 'JINGO', 'JINGS', 'JINKS', 'JINNE', 'JINNI', 'JINNS', 'JIRDS', 'JIRGA', 'JIRRE', 'JISMS', 'JITIS', 'JITTY', 'JIVED', 'JIVER', 'JIVES', 'JIVEY', 'JNANA', 'JOBED', 'JOBES', 'JOCKO', 'JOCKS', 'JOCKY', 'JOCOS', 'JODEL', 'JOEYS', 'JOHNS', 'JOINS', 'JOKED', 'JOKES', 'JOKEY', 'JOKOL', 'JOLED', 'JOLES', 'JOLIE', 'JOLLO', 'JOLLS', 'JOLTS', 'JOLTY', 'JOMON', 'JOMOS', 'JONES', 'JONGS', 'JONTY', 'JOOKS', 'JORAM', 'JORTS', 'JORUM', 'JOTAS', 'JOTTY', 'JOTUN', 'JOUAL', 'JOUGS', 'JOUKS', 'JOULE', 'JOURS', 'JOWAR', 'JOWED', 'JOWLS', 'JOWLY', 'JOYED', 'JUBAS', 'JUBES', 'JUCOS', 'JUDAS', 'JUDGY', 'JUDOS', 'JUGAL', 'JUGUM', 'JUJUS', 'JUKED', 'JUKES', 'JUKUS', 'JULEP', 'JULIA', 'JUMAR', 'JUMBY', 'JUMPS', 'JUNCO', 'JUNKS', 'JUNKY', 'JUPES', 'JUPON', 'JURAL', 'JURAT', 'JUREL', 'JURES', 'JURIS', 'JUSTE', 'JUSTS', 'JUTES', 'JUTTY', 'JUVES', 'JUVIE', 'KAAMA', 'KABAB', 'KABAR', 'KABOB', 'KACHA', 'KACKS', 'KADAI', 'KADES', 'KADIS', 'KAFIR', 'KAGOS', 'KAGUS', 'KAHAL', 'KAIAK', 'KAIDS', 'KAIES', 'KAIFS', 'KAIKA', 'KAIKS', 'KAILS', 'KAIMS', 'KAING', 'KAINS', 'KAJAL', 'KAKAS', 'KAKIS', 'KALAM', 'KALAS', 'KALES', 'KALIF', 'KALIS', 'KALPA', 'KALUA', 'KAMAS', 'KAMES', 'KAMIK', 'KAMIS', 'KAMME', 'KANAE', 'KANAL', 'KANAS', 'KANAT', 'KANDY', 'KANEH', 'KANES', 'KANGA', 'KANGS', 'KANJI', 'KANTS', 'KANZU', 'KAONS', 'KAPAI', 'KAPAS', 'KAPHA', 'KAPHS', 'KAPOK', 'KAPOW', 'KAPUR', 'KAPUS', 'KAPUT', 'KARAI', 'KARAS', 'KARAT', 'KAREE', 'KAREZ', 'KARKS', 'KARNS', 'KAROO', 'KAROS', 'KARRI', 'KARST', 'KARSY', 'KARTS', 'KARZY', 'KASHA', 'KASME', 'KATAL', 'KATAS', 'KATIS', 'KATTI', 'KAUGH', 'KAURI', 'KAURU', 'KAURY', 'KAVAL', 'KAVAS', 'KAWAS', 'KAWAU', 'KAWED', 'KAYLE', 'KAYOS', 'KAZIS', 'KAZOO', 'KBARS', 'KCALS', 'KEAKI', 'KEBAR', 'KEBOB', 'KECKS', 'KEDGE', 'KEDGY', 'KEECH', 'KEEFS', 'KEEKS', 'KEELS', 'KEEMA', 'KEENO', 'KEENS', 'KEEPS', 'KEETS', 'KEEVE', 'KEFIR', 'KEHUA', 'KEIRS', 'KELEP', 'KELIM', 'KELLS', 'KELLY', 'KELPS', 'KELPY', 'KELTS', 'KELTY', 'KEMBO', 'KEMBS', 'KEMPS', 'KEMPT', 'KEMPY', 'KENAF', 'KENCH', 'KENDO', 'KENOS', 'KENTE', 'KENTS', 'KEPIS', 'KERBS', 'KEREL', 'KERFS', 'KERKY', 'KERMA', 'KERNE', 'KERNS', 'KEROS', 'KERRY', 'KERVE', 'KESAR', 'KESTS', 'KETAS', 'KETCH', 'KETES', 'KETOL', 'KEVEL', 'KEVIL', 'KEXES', 'KEYED', 'KEYER', 'KHADI', 'KHADS', 'KHAFS', 'KHANA', 'KHANS', 'KHAPH', 'KHATS', 'KHAYA', 'KHAZI', 'KHEDA', 'KHEER', 'KHETH', 'KHETS', 'KHIRS', 'KHOJA', 'KHORS', 'KHOUM', 'KHUDS', 'KHULA', 'KHYAL', 'KIAAT', 'KIACK', 'KIAKI', 'KIANG', 'KIASU', 'KIBBE', 'KIBBI', 'KIBEI', 'KIBES', 'KIBLA', 'KICKS', 'KICKY', 'KIDDO', 'KIDDY', 'KIDEL', 'KIDEO', 'KIDGE', 'KIEFS', 'KIERS', 'KIEVE', 'KIEVS', 'KIGHT', 'KIKAY', 'KIKES', 'KIKOI', 'KILEY', 'KILIG', 'KILIM', 'KILLS', 'KILNS', 'KILOS', 'KILPS', 'KILTS', 'KILTY', 'KIMBO', 'KIMET', 'KINAS', 'KINDA', 'KINDS', 'KINDY', 'KINES', 'KINGS', 'KINGY', 'KININ', 'KINKS', 'KINOS', 'KIORE', 'KIPAH', 'KIPAS', 'KIPES', 'KIPPA', 'KIPPS', 'KIPSY', 'KIRBY', 'KIRKS', 'KIRNS', 'KIRRI', 'KISAN', 'KISSY', 'KISTS', 'KITAB', 'KITED', 'KITER', 'KITES', 'KITHE', 'KITHS', 'KITKE', 'KITUL', 'KIVAS', 'KIWIS', 'KLANG', 'KLAPS', 'KLETT', 'KLICK', 'KLIEG', 'KLIKS', 'KLONG', 'KLOOF', 'KLUGE', 'KLUTZ', 'KNAGS', 'KNAPS', 'KNARL', 'KNARS', 'KNAUR', 'KNAWE', 'KNEES', 'KNELL', 'KNICK', 'KNISH', 'KNITS', 'KNIVE', 'KNOBS', 'KNOOP', 'KNOPS', 'KNOSP', 'KNOTS', 'KNOUD', 'KNOUT', 'KNOWD', 'KNOWE', 'KNOWS', 'KNUBS', 'KNULE', 'KNURL', 'KNURR', 'KNURS', 'KNUTS', 'KOANS', 'KOAPS', 'KOBAN', 'KOBOS', 'KOELS', 'KOFFS', 'KOFTA', 'KOGAL', 'KOHAS', 'KOHEN', 'KOHLS', 'KOINE', 'KOIWI', 'KOJIS', 'KOKAM', 'KOKAS', 'KOKER', 'KOKRA', 'KOKUM', 'KOLAS', 'KOLOS', 'KOMBI', 'KOMBU', 'KONBU', 'KONDO', 'KONKS', 'KOOKS', 'KOOKY', 'KOORI', 'KOPEK', 'KOPHS', 'KOPJE', 'KOPPA', 'KORAI', 'KORAN', 'KORAS', 'KORAT', 'KORES', 'KORIS', 'KORMA', 'KOROS', 'KORUN', 'KORUS', 'KOSES', 'KOTCH', 'KOTOS', 'KOTOW', 'KOURA', 'KRAAL', 'KRABS', 'KRAFT', 'KRAIS', 'KRAIT', 'KRANG', 'KRANS', 'KRANZ', 'KRAUT', 'KRAYS', 'KREEF', 'KREEN', 'KREEP', 'KRENG', 'KREWE', 'KRIOL', 'KRONA', 'KRONE', 'KROON', 'KRUBI', 'KRUMP', 'KRUNK', 'KSARS', 'KUBIE', 'KUDOS', 'KUDUS', 'KUDZU', 'KUFIS', 'KUGEL', 'KUIAS', 'KUKRI', 'KUKUS', 'KULAK', 'KULAN', 'KULAS', 'KULFI', 'KUMIS', 'KUMYS', 'KUNAS', 'KUNDS', 'KURIS', 'KURRE', 'KURTA', 'KURUS', 'KUSSO', 'KUSTI', 'KUTAI', 'KUTAS', 'KUTCH', 'KUTIS', 'KUTUS', 'KUYAS', 'KUZUS', 'KVASS', 'KVELL', 'KWAAI', 'KWELA', 'KWINK', 'KWIRL', 'KYACK', 'KYAKS', 'KYANG', 'KYARS', 'KYATS', 'KYBOS', 'KYDST', 'KYLES', 'KYLIE', 'KYLIN', 'KYLIX', 'KYLOE', 'KYNDE', 'KYNDS', 'KYPES', 'KYRIE', 'KYTES', 'KYTHE', 'KYUDO', 'LAARF', 'LAARI', 'LABDA', 'LABIA', 'LABIS', 'LABNE', 'LABRA', 'LACCY', 'LACED', 'LACER', 'LACES', 'LACET', 'LACEY', 'LACIS', 'LACKA', 'LACKS', 'LACKY', 'LADDU', 'LADDY', 'LADED', 'LADEE', 'LADER', 'LADES', 'LADOO', 'LAERS', 'LAEVO', 'LAGAN', 'LAGAR', 'LAGGY', 'LAHAL', 'LAHAR', 'LAICH', 'LAICS', 'LAIDE', 'LAIDS', 'LAIGH', 'LAIKA', 'LAIKS', 'LAIRD', 'LAIRS', 'LAIRY', 'LAITH', 'LAITY', 'LAKED', 'LAKER', 'LAKES', 'LAKHS', 'LAKIN', 'LAKSA', 'LALDY', 'LALLS', 'LAMAS', 'LAMBS', 'LAMBY', 'LAMED', 'LAMER', 'LAMES', 'LAMIA', 'LAMMY', 'LAMPS', 'LANAI', 'LANAS', 'LANCH', 'LANDE', 'LANDS', 'LANED', 'LANES', 'LANKS', 'LANTS', 'LAPAS', 'LAPIN', 'LAPIS', 'LAPJE', 'LAPPA', 'LAPPY', 'LARCH', 'LARDS', 'LARDY', 'LAREE', 'LARES', 'LARFS', 'LARGA', 'LARGO', 'LARIS', 'LARKS', 'LARKY', 'LARNS', 'LARNT', 'LARUM', 'LASED', 'LASER', 'LASES', 'LASSI', 'LASSU', 'LASSY', 'LASTS', 'LATAH', 'LATED', 'LATEN', 'LATEX', 'LATHI', 'LATHS', 'LATHY', 'LATKE', 'LATUS', 'LAUAN', 'LAUCH', 'LAUDE', 'LAUDS', 'LAUFS', 'LAUND', 'LAURA', 'LAVAL', 'LAVAS', 'LAVED', 'LAVER', 'LAVES', 'LAVRA', 'LAVVY', 'LAWED', 'LAWER', 'LAWIN', 'LAWKS', 'LAWNS', 'LAWNY', 'LAWSY', 'LAXED', 'LAXER', 'LAXES', 'LAXLY', 'LAYBY', 'LAYED', 'LAYIN', 'LAYUP', 'LAZAR', 'LAZED', 'LAZES', 'LAZOS', 'LAZZI', 'LAZZO', 'LEADS', 'LEADY', 'LEAFS', 'LEAKS', 'LEAMS', 'LEANS', 'LEANY', 'LEAPS', 'LEARE', 'LEARS', 'LEARY', 'LEATS', 'LEAVY', 'LEAZE', 'LEBEN', 'LECCY', 'LECHE', 'LEDES', 'LEDGY', 'LEDUM', 'LEEAR', 'LEEKS', 'LEEPS', 'LEERS', 'LEESE', 'LEETS', 'LEEZE', 'LEFTE', 'LEFTS', 'LEGER', 'LEGES', 'LEGGE', 'LEGGO', 'LEGIT', 'LEGNO', 'LEHRS', 'LEHUA', 'LEIRS', 'LEISH', 'LEMAN', 'LEMED', 'LEMEL', 'LEMES', 'LEMMA', 'LEMME', 'LENDS', 'LENES', 'LENGS', 'LENIS', 'LENOS', 'LENSE', 'LENTI', 'LENTO', 'LEONE', 'LEPAK', 'LEPID', 'LEPRA', 'LEPTA', 'LERED', 'LERES', 'LERPS', 'LESBO', 'LESES', 'LESOS', 'LESTS', 'LETCH', 'LETHE', 'LETTY', 'LETUP', 'LEUCH', 'LEUCO', 'LEUDS', 'LEUGH', 'LEVAS', 'LEVEE', 'LEVES', 'LEVIN', 'LEVIS', 'LEWIS', 'LEXES', 'LEXIS', 'LEZES', 'LEZZA', 'LEZZO', 'LEZZY', 'LIANA', 'LIANE', 'LIANG', 'LIARD', 'LIARS', 'LIART', 'LIBER', 'LIBOR', 'LIBRA', 'LIBRE', 'LIBRI', 'LICET', 'LICHI', 'LICHT', 'LICIT', 'LICKS', 'LIDAR', 'LIDOS', 'LIEFS', 'LIENS', 'LIERS', 'LIEUS', 'LIEVE', 'LIFER', 'LIFES', 'LIFEY', 'LIFTS', 'LIGAN', 'LIGER', 'LIGGE', 'LIGNE', 'LIKED', 'LIKER', 'LIKES', 'LIKIN', 'LILLS', 'LILOS', 'LILTS', 'LILTY', 'LIMAN', 'LIMAS', 'LIMAX', 'LIMBA', 'LIMBI', 'LIMBS', 'LIMBY', 'LIMED', 'LIMEN', 'LIMES', 'LIMEY', 'LIMMA', 'LIMNS', 'LIMOS', 'LIMPA', 'LIMPS', 'LINAC', 'LINCH', 'LINDS', 'LINDY', 'LINED', 'LINES', 'LINEY', 'LINGA', 'LINGS', 'LINGY', 'LININ', 'LINKS', 'LINKY', 'LINNS', 'LINNY', 'LINOS', 'LINTS', 'LINTY', 'LINUM', 'LINUX', 'LIONS', 'LIPAS', 'LIPES', 'LIPIN', 'LIPOS', 'LIPPY', 'LIRAS', 'LIRKS', 'LIROT', 'LISES', 'LISKS', 'LISLE', 'LISPS', 'LISTS', 'LITAI', 'LITAS', 'LITED', 'LITEM', 'LITER', 'LITES', 'LITHO', 'LITHS', 'LITIE', 'LITRE', 'LIVED', 'LIVEN', 'LIVES', 'LIVOR', 'LIVRE', 'LIWAA', 'LIWAS', 'LLANO', 'LOACH', 'LOADS', 'LOAFS', 'LOAMS', 'LOANS', 'LOAST', 'LOAVE', 'LOBAR', 'LOBED', 'LOBES', 'LOBOS', 'LOBUS', 'LOCHE', 'LOCHS', 'LOCHY', 'LOCIE', 'LOCIS', 'LOCKS', 'LOCKY', 'LOCOS', 'LOCUM', 'LODEN', 'LODES', 'LOESS', 'LOFTS', 'LOGAN', 'LOGES', 'LOGGY', 'LOGIA', 'LOGIE', 'LOGOI', 'LOGON', 'LOGOS', 'LOHAN', 'LOIDS', 'LOINS', 'LOIPE', 'LOIRS', 'LOKES', 'LOKEY', 'LOKUM', 'LOLAS', 'LOLED', 'LOLLO', 'LOLLS', 'LOLLY', 'LOLOG', 'LOLOS', 'LOMAS', 'LOMED', 'LOMES', 'LONER', 'LONGA', 'LONGE', 'LONGS', 'LOOBY', 'LOOED', 'LOOEY', 'LOOFA', 'LOOFS', 'LOOIE', 'LOOKS', 'LOOKY', 'LOOMS', 'LOONS', 'LOONY', 'LOOPS', 'LOORD', 'LOOTS', 'LOPED', 'LOPER', 'LOPES', 'LOPPY', 'LORAL', 'LORAN', 'LORDS', 'LORDY', 'LOREL', 'LORES', 'LORIC', 'LORIS', 'LOSED', 'LOSEL', 'LOSEN', 'LOSES', 'LOSSY', 'LOTAH', 'LOTAS', 'LOTES', 'LOTIC', 'LOTOS', 'LOTSA', 'LOTTA', 'LOTTE', 'LOTTO', 'LOTUS', 'LOUED', 'LOUGH', 'LOUIE', 'LOUIS', 'LOUMA', 'LOUND', 'LOUNS', 'LOUPE', 'LOUPS', 'LOURE', 'LOURS', 'LOURY', 'LOUTS', 'LOVAT', 'LOVED', 'LOVEE', 'LOVES', 'LOVEY', 'LOVIE', 'LOWAN', 'LOWED', 'LOWEN', 'LOWES', 'LOWND', 'LOWNE', 'LOWNS', 'LOWPS', 'LOWRY', 'LOWSE', 'LOWTH', 'LOWTS', 'LOXED', 'LOXES', 'LOZEN', 'LUACH', 'LUAUS', 'LUBED', 'LUBES', 'LUBRA', 'LUCES', 'LUCKS', 'LUCRE', 'LUDES', 'LUDIC', 'LUDOS', 'LUFFA', 'LUFFS', 'LUGED', 'LUGER', 'LUGES', 'LULLS', 'LULUS', 'LUMAS', 'LUMBI', 'LUMME', 'LUMMY', 'LUMPS', 'LUNAS', 'LUNES', 'LUNET', 'LUNGI', 'LUNGS', 'LUNKS', 'LUNTS', 'LUPIN', 'LURED', 'LURER', 'LURES', 'LUREX', 'LURGI', 'LURGY', 'LURKS', 'LURRY', 'LURVE', 'LUSER', 'LUSHY', 'LUSKS', 'LUSTS', 'LUSUS', 'LUTEA', 'LUTED', 'LUTER', 'LUTES', 'LUVVY', 'LUXED', 'LUXER', 'LUXES', 'LWEIS', 'LYAMS', 'LYARD', 'LYART', 'LYASE', 'LYCEA', 'LYCEE', 'LYCRA', 'LYMES', 'LYNCH', 'LYNES', 'LYRES', 'LYSED', 'LYSES', 'LYSIN', 'LYSIS', 'LYSOL', 'LYSSA', 'LYTED', 'LYTES', 'LYTHE', 'LYTIC', 'LYTTA', 'MAAED', 'MAARE', 'MAARS', 'MABAN', 'MABES', 'MACAS', 'MACCA', 'MACED', 'MACER', 'MACES', 'MACHE', 'MACHI', 'MACHS', 'MACKA', 'MACKS', 'MACLE', 'MACON', 'MACTE', 'MADAL', 'MADAR', 'MADDY', 'MADGE', 'MADID', 'MADOS', 'MADRE', 'MAEDI', 'MAERL', 'MAFIC', 'MAFTS', 'MAGAS', 'MAGES', 'MAGGS', 'MAGNA', 'MAGOT', 'MAGUS', 'MAHAL', 'MAHEM', 'MAHIS', 'MAHOE', 'MAHRS', 'MAHUA', 'MAHWA', 'MAIDS', 'MAIKO', 'MAIKS', 'MAILE', 'MAILL', 'MAILO', 'MAILS', 'MAIMS', 'MAINS', 'MAIRE', 'MAIRS', 'MAISE', 'MAIST', 'MAJAS', 'MAJAT', 'MAJOE', 'MAJOS', 'MAKAF', 'MAKAI', 'MAKAN', 'MAKAR', 'MAKEE', 'MAKES', 'MAKIE', 'MAKIS', 'MAKOS', 'MALAE', 'MALAI', 'MALAM', 'MALAR', 'MALAS', 'MALAX', 'MALEO', 'MALES', 'MALIC', 'MALIK', 'MALIS', 'MALKY', 'MALLS', 'MALMS', 'MALMY', 'MALTS', 'MALTY', 'MALUS', 'MALVA', 'MALWA', 'MAMAK', 'MAMAS', 'MAMBA', 'MAMBU', 'MAMEE', 'MAMEY', 'MAMIE', 'MAMIL', 'MANAS', 'MANAT', 'MANDI', 'MANDS', 'MANDY', 'MANEB', 'MANED', 'MANEH', 'MANES', 'MANET', 'MANGI', 'MANGS', 'MANIE', 'MANIS', 'MANKS', 'MANKY', 'MANNA', 'MANNY', 'MANOA', 'MANOS', 'MANSE', 'MANSO', 'MANTA', 'MANTE', 'MANTO', 'MANTS', 'MANTY', 'MANUL', 'MANUS', 'MANZO', 'MAPAU', 'MAPES', 'MAPOU', 'MAPPY', 'MAQAM', 'MAQUI', 'MARAE', 'MARAH', 'MARAL', 'MARAN', 'MARAS', 'MARAY', 'MARCS', 'MARDS', 'MARDY', 'MARES', 'MARGA', 'MARGE', 'MARGO', 'MARGS', 'MARIA', 'MARID', 'MARIL', 'MARKA', 'MARKS', 'MARLE', 'MARLS', 'MARLY', 'MARMA', 'MARMS', 'MARON', 'MAROR', 'MARRA', 'MARRI', 'MARSE', 'MARTS', 'MARUA', 'MARVY', 'MASAS', 'MASED', 'MASER', 'MASES', 'MASHA', 'MASHY', 'MASKS', 'MASSA', 'MASSY', 'MASTS', 'MASTY', 'MASUR', 'MASUS', 'MASUT', 'MATAI', 'MATED', 'MATER', 'MATES', 'MATHE', 'MATHS', 'MATIN', 'MATLO', 'MATRA', 'MATSU', 'MATTE', 'MATTS', 'MATTY', 'MATZA', 'MATZO', 'MAUBY', 'MAUDS', 'MAUKA', 'MAULA', 'MAULS', 'MAUMS', 'MAUMY', 'MAUND', 'MAUNT', 'MAURI', 'MAUSY', 'MAUTS', 'MAUVY', 'MAUZY', 'MAVEN', 'MAVIE', 'MAVIN', 'MAVIS', 'MAWED', 'MAWKS', 'MAWKY', 'MAWLA', 'MAWNS', 'MAWPS', 'MAWRS', 'MAXED', 'MAXES', 'MAXIS', 'MAYAN', 'MAYAS', 'MAYED', 'MAYOS', 'MAYST', 'MAZAC', 'MAZAK', 'MAZAR', 'MAZAS', 'MAZED', 'MAZEL', 'MAZER', 'MAZES', 'MAZET', 'MAZEY', 'MAZUT', 'MBARI', 'MBARS', 'MBILA', 'MBIRA', 'MBRET', 'MBUBE', 'MBUGA', 'MEADS', 'MEAKE', 'MEAKS', 'MEALS', 'MEANE', 'MEANS', 'MEANY', 'MEARE', 'MEASE', 'MEATH', 'MEATS', 'MEBBE', 'MEBOS', 'MECHA', 'MECHS', 'MECKS', 'MECUM', 'MEDII', 'MEDIN', 'MEDLE', 'MEECH', 'MEEDS', 'MEEJA', 'MEEPS', 'MEERS', 'MEETS', 'MEFFS', 'MEIDS', 'MEIKO', 'MEILS', 'MEINS', 'MEINT', 'MEINY', 'MEISM', 'MEITH', 'MEKKA', 'MELAM', 'MELAS', 'MELBA', 'MELCH', 'MELDS', 'MELES', 'MELIC', 'MELIK', 'MELLS', 'MELOE', 'MELOS', 'MELTS', 'MELTY', 'MEMES', 'MEMIC', 'MEMOS', 'MENAD', 'MENCE', 'MENDS', 'MENED', 'MENES', 'MENGE', 'MENGS', 'MENIL', 'MENSA', 'MENSE', 'MENSH', 'MENTA', 'MENTO', 'MENTS', 'MENUS', 'MEOUS', 'MEOWS', 'MERCH', 'MERCS', 'MERDE', 'MERDS', 'MERED', 'MEREL', 'MERER', 'MERES', 'MERIL', 'MERIS', 'MERKS', 'MERLE', 'MERLS', 'MERSE', 'MERSK', 'MESAD', 'MESAL', 'MESAS', 'MESCA', 'MESEL', 'MESEM', 'MESES', 'MESHY', 'MESIA', 'MESIC', 'MESNE', 'MESON', 'MESSY', 'MESTO', 'MESYL', 'METAS', 'METED', 'METEG', 'METEL', 'METES', 'METHI', 'METHO', 'METHS', 'METHY', 'METIC', 'METIF', 'METIS', 'METOL', 'METRE', 'METTA', 'MEUMS', 'MEUSE', 'MEVED', 'MEVES', 'MEWED', 'MEWLS', 'MEYNT', 'MEZES', 'MEZZA', 'MEZZE', 'MEZZO', 'MGALS', 'MHORR', 'MIAIS', 'MIAOU', 'MIAOW', 'MIASM', 'MIAUL', 'MICAS', 'MICHE', 'MICHI', 'MICHT', 'MICKS', 'MICKY', 'MICOS', 'MICRA', 'MIDDY', 'MIDGY', 'MIDIS', 'MIENS', 'MIEUX', 'MIEVE', 'MIFFS', 'MIFFY', 'MIFTY', 'MIGGS', 'MIGMA', 'MIGOD', 'MIHAS', 'MIHIS', 'MIKAN', 'MIKED', 'MIKES', 'MIKOS', 'MIKRA', 'MIKVA', 'MILCH', 'MILDS', 'MILER', 'MILES', 'MILFS', 'MILIA', 'MILKO', 'MILKS', 'MILLE', 'MILLS', 'MILLY', 'MILOR', 'MILOS', 'MILPA', 'MILTS', 'MILTY', 'MILTZ', 'MIMED', 'MIMEO', 'MIMER', 'MIMES', 'MIMIS', 'MIMSY', 'MINAE', 'MINAR', 'MINAS', 'MINCY', 'MINDI', 'MINDS', 'MINED', 'MINES', 'MINGE', 'MINGI', 'MINGS', 'MINGY', 'MINIS', 'MINKE', 'MINKS', 'MINNY', 'MINOS', 'MINSE', 'MINTS', 'MINXY', 'MIRAA', 'MIRAH', 'MIRCH', 'MIRED', 'MIRES', 'MIREX', 'MIRID', 'MIRIN', 'MIRKN', 'MIRKS', 'MIRKY', 'MIRLS', 'MIRLY', 'MIROS', 'MIRRL', 'MIRRS', 'MIRVS', 'MIRZA', 'MISAL', 'MISCH', 'MISDO', 'MISES', 'MISGO', 'MISKY', 'MISLS', 'MISOS', 'MISSA', 'MISTO', 'MISTS', 'MISTY', 'MITAS', 'MITCH', 'MITER', 'MITES', 'MITEY', 'MITIE', 'MITIS', 'MITRE', 'MITRY', 'MITTA', 'MITTS', 'MIVEY', 'MIVVY', 'MIXED', 'MIXEN', 'MIXER', 'MIXES', 'MIXIE', 'MIXIS', 'MIXTE', 'MIXUP', 'MIYAS', 'MIZEN', 'MIZES', 'MIZZY', 'MMKAY', 'MNEME', 'MOAIS', 'MOAKY', 'MOALS', 'MOANA', 'MOANS', 'MOANY', 'MOARS', 'MOATS', 'MOBBY', 'MOBED', 'MOBEE', 'MOBES', 'MOBEY', 'MOBIE', 'MOBLE', 'MOBOS', 'MOCAP', 'MOCHI', 'MOCHS', 'MOCHY', 'MOCKS', 'MOCKY', 'MOCOS', 'MOCUS', 'MODER', 'MODES', 'MODGE', 'MODII', 'MODIN', 'MODOC', 'MODOM', 'MODUS', 'MOENI', 'MOERS', 'MOFOS', 'MOGAR', 'MOGAS', 'MOGGY', 'MOGOS', 'MOGRA', 'MOGUE', 'MOHAR', 'MOHEL', 'MOHOS', 'MOHRS', 'MOHUA', 'MOHUR', 'MOILE', 'MOILS', 'MOIRA', 'MOIRE', 'MOITS', 'MOITY', 'MOJOS', 'MOKER', 'MOKES', 'MOKEY', 'MOKIS', 'MOKKY', 'MOKOS', 'MOKUS', 'MOLAL', 'MOLAS', 'MOLDS', 'MOLED', 'MOLER', 'MOLES', 'MOLEY', 'MOLIE', 'MOLLA', 'MOLLE', 'MOLLO', 'MOLLS', 'MOLLY', 'MOLOI', 'MOLOS', 'MOLTO', 'MOLTS', 'MOLUE', 'MOLVI', 'MOLYS', 'MOMES', 'MOMIE', 'MOMMA', 'MOMME', 'MOMMY', 'MOMOS', 'MOMPE', 'MOMUS', 'MONAD', 'MONAL', 'MONAS', 'MONDE', 'MONDO', 'MONER', 'MONGO', 'MONGS', 'MONIC', 'MONIE', 'MONKS', 'MONOS', 'MONPE', 'MONTE', 'MONTY', 'MOOBS', 'MOOCH', 'MOODS', 'MOOED', 'MOOEY', 'MOOKS', 'MOOLA', 'MOOLI', 'MOOLS', 'MOOLY', 'MOONG', 'MOONI', 'MOONS', 'MOONY', 'MOOPS', 'MOORS', 'MOORY', 'MOOTH', 'MOOTS', 'MOOVE', 'MOPED', 'MOPER', 'MOPES', 'MOPEY', 'MOPPY', 'MOPSY', 'MOPUS', 'MORAE', 'MORAH', 'MORAN', 'MORAS', 'MORAT', 'MORAY', 'MOREE', 'MOREL', 'MORES', 'MORGY', 'MORIA', 'MORIN', 'MORMO', 'MORNA', 'MORNE', 'MORNS', 'MOROR', 'MORRA', 'MORRO', 'MORSE', 'MORTS', 'MORUK', 'MOSED', 'MOSES', 'MOSEY', 'MOSKS', 'MOSSO', 'MOSTE', 'MOSTO', 'MOSTS', 'MOTED', 'MOTEN', 'MOTES', 'MOTET', 'MOTEY', 'MOTHS', 'MOTHY', 'MOTIS', 'MOTON', 'MOTTE', 'MOTTS', 'MOTTY', 'MOTUS', 'MOTZA', 'MOUCH', 'MOUES', 'MOUFS', 'MOULD', 'MOULE', 'MOULS', 'MOULY', 'MOUPS', 'MOUST', 'MOUSY', 'MOVED', 'MOVES', 'MOWAS', 'MOWED', 'MOWIE', 'MOWRA', 'MOXAS', 'MOXIE', 'MOYAS', 'MOYLE', 'MOYLS', 'MOZED', 'MOZES', 'MOZOS', 'MPRET', 'MRADS', 'MSASA', 'MTEPE', 'MUCHO', 'MUCIC', 'MUCID', 'MUCIN', 'MUCKO', 'MUCKS', 'MUCOR', 'MUCRO', 'MUDAR', 'MUDGE', 'MUDIF', 'MUDIM', 'MUDIR', 'MUDRA', 'MUFFS', 'MUFFY', 'MUFTI', 'MUGGA', 'MUGGS', 'MUGGY', 'MUGHO', 'MUGIL', 'MUGOS', 'MUHLY', 'MUIDS', 'MUILS', 'MUIRS', 'MUIRY', 'MUIST', 'MUJIK', 'MUKIM', 'MUKTI', 'MULAI', 'MULCT', 'MULED', 'MULES', 'MULEY', 'MULGA', 'MULIE', 'MULLA', 'MULLS', 'MULSE', 'MULSH', 'MUMBO', 'MUMMS', 'MUMPH', 'MUMPS', 'MUMSY', 'MUMUS', 'MUNDS', 'MUNDU', 'MUNGA', 'MUNGE', 'MUNGI', 'MUNGO', 'MUNGS', 'MUNGY', 'MUNIA', 'MUNIS', 'MUNJA', 'MUNJS', 'MUNTS', 'MUNTU', 'MUONS', 'MURAS', 'MURED', 'MURES', 'MUREX', 'MURGH', 'MURGI', 'MURID', 'MURKS', 'MURLS', 'MURLY', 'MURRA', 'MURRE', 'MURRI', 'MURRS', 'MURRY', 'MURTH', 'MURTI', 'MURUK', 'MURVA', 'MUSAR', 'MUSCA', 'MUSED', 'MUSEE', 'MUSER', 'MUSES', 'MUSET', 'MUSHA', 'MUSIT', 'MUSKS', 'MUSOS', 'MUSSE', 'MUSSY', 'MUSTA', 'MUSTH', 'MUSTS', 'MUTAS', 'MUTCH', 'MUTED', 'MUTER', 'MUTES', 'MUTHA', 'MUTIC', 'MUTIS', 'MUTON', 'MUTTI', 'MUTTS', 'MUTUM', 'MUVVA', 'MUXED', 'MUXES', 'MUZAK', 'MUZZY', 'MVULA', 'MVULE', 'MVULI', 'MYALL', 'MYALS', 'MYLAR', 'MYNAH', 'MYNAS', 'MYOID', 'MYOMA', 'MYONS', 'MYOPE', 'MYOPS', 'MYOPY', 'MYSID', 'MYSIE', 'MYTHI', 'MYTHS', 'MYTHY', 'MYXOS', 'MZEES', 'NAAMS', 'NAANS', 'NAATS', 'NABAM', 'NABBY', 'NABES', 'NABIS', 'NABKS', 'NABLA', 'NABOB', 'NACHE', 'NACHO', 'NACRE', 'NADAS', 'NAEVE', 'NAEVI', 'NAFFS', 'NAGAR', 'NAGAS', 'NAGES', 'NAGGY', 'NAGOR', 'NAHAL', 'NAIAD', 'NAIBS', 'NAICE', 'NAIDS', 'NAIEO', 'NAIFS', 'NAIKS', 'NAILS', 'NAILY', 'NAINS', 'NAIOS', 'NAIRA', 'NAIRU', 'NAJIB', 'NAKAS', 'NAKED', 'NAKER', 'NAKFA', 'NALAS', 'NALED', 'NALLA', 'NAMAD', 'NAMAK', 'NAMAZ', 'NAMED', 'NAMER', 'NAMES', 'NAMMA', 'NAMUS', 'NANAS', 'NANCE', 'NANCY', 'NANDU', 'NANNA', 'NANOS', 'NANTE', 'NANTI', 'NANTO', 'NANTS', 'NANTY', 'NANUA', 'NAPAS', 'NAPED', 'NAPES', 'NAPOH', 'NAPOO', 'NAPPA', 'NAPPE', 'NAPPY', 'NARAS', 'NARCO', 'NARCS', 'NARDS', 'NARES', 'NARIC', 'NARIS', 'NARKS', 'NARKY', 'NAROD', 'NARRA', 'NARRE', 'NASHI', 'NASHO', 'NASIS', 'NASON', 'NASUS', 'NATAK', 'NATCH', 'NATES', 'NATIS', 'NATTO', 'NATTY', 'NATYA', 'NAUCH', 'NAUNT', 'NAVAR', 'NAVED', 'NAVES', 'NAVEW', 'NAVVY', 'NAWAB', 'NAWAL', 'NAZAR', 'NAZES', 'NAZIR', 'NAZIS', 'NAZZY', 'NDUJA', 'NEAFE', 'NEALS', 'NEANT', 'NEAPS', 'NEARS', 'NEATH', 'NEATO', 'NEATS', 'NEBBY', 'NEBEK', 'NEBEL', 'NECHE', 'NECKS', 'NEDDY', 'NEEBS', 'NEEDS', 'NEEFS', 'NEELD', 'NEELE', 'NEEMB', 'NEEMS', 'NEEPS', 'NEESE', 'NEEZE', 'NEFIE', 'NEGRI', 'NEGRO', 'NEGUS', 'NEIFS', 'NEIST', 'NEIVE', 'NELIA', 'NELIS', 'NELLY', 'NEMAS', 'NEMIC', 'NEMNS', 'NEMPT', 'NENES', 'NENTA', 'NEONS', 'NEOSA', 'NEOZA', 'NEPER', 'NEPIT', 'NERAL', 'NERAM', 'NERDS', 'NERFS', 'NERKA', 'NERKS', 'NEROL', 'NERTS', 'NERTZ', 'NERVY', 'NESKI', 'NESTS', 'NESTY', 'NETAS', 'NETES', 'NETOP', 'NETTA', 'NETTS', 'NETTY', 'NEUKS', 'NEUME', 'NEUMS', 'NEVEL', 'NEVES', 'NEVIS', 'NEVUS', 'NEVVY', 'NEWBS', 'NEWED', 'NEWEL', 'NEWIE', 'NEWSY', 'NEWTS', 'NEXAL', 'NEXIN', 'NEXTS', 'NEXUM', 'NEXUS', 'NGAIO', 'NGAKA', 'NGANA', 'NGAPI', 'NGATI', 'NGEGE', 'NGOMA', 'NGONI', 'NGRAM', 'NGWEE', 'NIBBY', 'NICAD', 'NICED', 'NICEY', 'NICHT', 'NICKS', 'NICKY', 'NICOL', 'NIDAL', 'NIDED', 'NIDES', 'NIDOR', 'NIDUS', 'NIEFS', 'NIESS', 'NIEVE', 'NIFES', 'NIFFS', 'NIFFY', 'NIFLE', 'NIFTY', 'NIGER', 'NIGGA', 'NIGHS', 'NIGRE', 'NIGUA', 'NIHIL', 'NIKAB', 'NIKAH', 'NIKAU', 'NILAS', 'NILLS', 'NIMBI', 'NIMBS', 'NIMBY', 'NIMPS', 'NINER', 'NINES', 'NINON', 'NINTA', 'NIOPO', 'NIOZA', 'NIPAS', 'NIPET', 'NIPPY', 'NIQAB', 'NIRLS', 'NIRLY', 'NISEI', 'NISIN', 'NISSE', 'NISUS', 'NITAL', 'NITER', 'NITES', 'NITID', 'NITON', 'NITRE', 'NITRO', 'NITRY', 'NITTA', 'NITTO', 'NITTY', 'NIVAL', 'NIVAS', 'NIVEL', 'NIXED', 'NIXER', 'NIXES', 'NIXIE', 'NIZAM', 'NJIRL', 'NKOSI', 'NMOLI', 'NMOLS', 'NOAHS', 'NOBBY', 'NOCKS', 'NODAL', 'NODDY', 'NODED', 'NODES', 'NODUM', 'NODUS', 'NOELS', 'NOEMA', 'NOEME', 'NOGAL', 'NOGGS', 'NOGGY', 'NOHOW', 'NOIAS', 'NOILS', 'NOILY', 'NOINT', 'NOIRE', 'NOIRS', 'NOKES', 'NOLES', 'NOLLE', 'NOLLS', 'NOLOS', 'NOMAS', 'NOMEN', 'NOMES', 'NOMIC', 'NOMOI', 'NOMOS', 'NONAN', 'NONAS', 'NONCE', 'NONCY', 'NONDA', 'NONDO', 'NONES', 'NONET', 'NONGS', 'NONIC', 'NONIS', 'NONNA', 'NONNO', 'NONNY', 'NONYL', 'NOOBS', 'NOOIS', 'NOOIT', 'NOOKS', 'NOOKY', 'NOONE', 'NOONS', 'NOOPS', 'NOOVE', 'NOPAL', 'NORIA', 'NORIE', 'NORIS', 'NORKS', 'NORMA', 'NORMS', 'NOSED', 'NOSER', 'NOSES', 'NOSHI', 'NOSIR', 'NOTAL', 'NOTAM', 'NOTED', 'NOTER', 'NOTES', 'NOTUM', 'NOUGS', 'NOUJA', 'NOULD', 'NOULE', 'NOULS', 'NOUNS', 'NOUNY', 'NOUPS', 'NOUST', 'NOVAE', 'NOVAS', 'NOVIA', 'NOVIO', 'NOVUM', 'NOWAY', 'NOWDS', 'NOWED', 'NOWLS', 'NOWTS', 'NOWTY', 'NOXAL', 'NOXAS', 'NOXES', 'NOYAU', 'NOYED', 'NOYES', 'NRTTA', 'NRTYA', 'NSIMA', 'NUBBY', 'NUBIA', 'NUCHA', 'NUCIN', 'NUDDY', 'NUDER', 'NUDES', 'NUDGY', 'NUDIE', 'NUDZH', 'NUEVO', 'NUFFS', 'NUGAE', 'NUJOL', 'NUKED', 'NUKES', 'NULLA', 'NULLO', 'NULLS', 'NULLY', 'NUMBS', 'NUMEN', 'NUMMY', 'NUMPS', 'NUNKS', 'NUNKY', 'NUNNY', 'NUNUS', 'NUQUE', 'NURDS', 'NURDY', 'NURLS', 'NURRS', 'NURTS', 'NURTZ', 'NUSED', 'NUSES', 'NUTSO', 'NUTSY', 'NYAFF', 'NYALA', 'NYAMS', 'NYING', 'NYONG', 'NYSSA', 'NYUNG', 'NYUSE', 'NYUZE', 'OAFOS', 'OAKED', 'OAKER', 'OAKUM', 'OARED', 'OARER', 'OASAL', 'OASES', 'OASIS', 'OASTS', 'OATEN', 'OATER', 'OATHS', 'OAVES', 'OBANG', 'OBBOS', 'OBEAH', 'OBELI', 'OBEYS', 'OBIAS', 'OBIED', 'OBIIT', 'OBITS', 'OBJET', 'OBOES', 'OBOLE', 'OBOLI', 'OBOLS', 'OCCAM', 'OCHER', 'OCHES', 'OCHRE', 'OCHRY', 'OCKER', 'OCOTE', 'OCREA', 'OCTAD', 'OCTAN', 'OCTAS', 'OCTIC', 'OCTLI', 'OCTYL', 'OCULI', 'ODAHS', 'ODALS', 'ODEON', 'ODEUM', 'ODISM', 'ODIST', 'ODIUM', 'ODOOM', 'ODORS', 'ODOUR', 'ODUMS', 'ODYLE', 'ODYLS', 'OFAYS', 'OFFED', 'OFFIE', 'OFLAG', 'OFTER', 'OFURO', 'OGAMS', 'OGEED', 'OGEES', 'OGGIN', 'OGHAM', 'OGIVE', 'OGLED', 'OGLER', 'OGLES', 'OGMIC', 'OGRES', 'OHELO', 'OHIAS', 'OHING', 'OHMIC', 'OHONE', 'OICKS', 'OIDIA', 'OILED', 'OILER', 'OILET', 'OINKS', 'OINTS', 'OIRAN', 'OJIME', 'OKAPI', 'OKAYS', 'OKEHS', 'OKIES', 'OKING', 'OKOLE', 'OKRAS', 'OKRUG', 'OKTAS', 'OLATE', 'OLDIE', 'OLDLY', 'OLEHS', 'OLEIC', 'OLEIN', 'OLENT', 'OLEOS', 'OLEUM', 'OLEYL', 'OLIGO', 'OLIOS', 'OLIVA', 'OLLAS', 'OLLAV', 'OLLER', 'OLLIE', 'OLOGY', 'OLONA', 'OLPAE', 'OLPES', 'OMASA', 'OMBER', 'OMBUS', 'OMDAH', 'OMDAS', 'OMDDA', 'OMDEH', 'OMEES', 'OMENS', 'OMERS', 'OMIAI', 'OMITS', 'OMLAH', 'OMMEL', 'OMMIN', 'OMNES', 'OMOVS', 'OMRAH', 'OMULS', 'ONCER', 'ONCES', 'ONCET', 'ONCUS', 'ONDES', 'ONDOL', 'ONELY', 'ONERS', 'ONERY', 'ONGON', 'ONIUM', 'ONKUS', 'ONLAP', 'ONLAY', 'ONMUN', 'ONNED', 'ONSEN', 'ONTAL', 'ONTIC', 'OOAAS', 'OOBIT', 'OOHED', 'OOIDS', 'OOJAH', 'OOMPH', 'OONTS', 'OOPAK', 'OOPED', 'OOPSY', 'OORIE', 'OOSES', 'OOTID', 'OOYAH', 'OOZED', 'OOZES', 'OOZIE', 'OOZLE', 'OPAHS', 'OPALS', 'OPENS', 'OPEPE', 'OPERY', 'OPGAF', 'OPIHI', 'OPING', 'OPPOS', 'OPSAT', 'OPSIN', 'OPSIT', 'OPTED', 'OPTER', 'OPZIT', 'ORACH', 'ORACY', 'ORALS', 'ORANG', 'ORANS', 'ORANT', 'ORATE', 'ORBAT', 'ORBED', 'ORBIC', 'ORCAS', 'ORCIN', 'ORDIE', 'ORDOS', 'OREAD', 'ORFES', 'ORFUL', 'ORGIA', 'ORGIC', 'ORGUE', 'ORIBI', 'ORIEL', 'ORIGO', 'ORIXA', 'ORLES', 'ORLON', 'ORLOP', 'ORMER', 'ORNEE', 'ORNIS', 'ORPED', 'ORPIN', 'ORRIS', 'ORTET', 'ORTHO', 'ORVAL', 'ORZOS', 'OSARS', 'OSCAR', 'OSETR', 'OSEYS', 'OSHAC', 'OSIER', 'OSKIN', 'OSLIN', 'OSMIC', 'OSMOL', 'OSONE', 'OSSIA', 'OSTIA', 'OTAKU', 'OTARY', 'OTHYL', 'OTIUM', 'OTTAR', 'OTTOS', 'OUBIT', 'OUCHE', 'OUCHT', 'OUEDS', 'OUENS', 'OUIJA', 'OULKS', 'OUMAS', 'OUNDY', 'OUPAS', 'OUPED', 'OUPHE', 'OUPHS', 'OUREY', 'OURIE', 'OUSEL', 'OUSIA', 'OUSTS', 'OUTBY', 'OUTED', 'OUTEN', 'OUTIE', 'OUTRE', 'OUTRO', 'OUTTA', 'OUZEL', 'OUZOS', 'OVALS', 'OVELS', 'OVENS', 'OVERS', 'OVISM', 'OVIST', 'OVOLI', 'OVOLO', 'OVULE', 'OWARE', 'OWARI', 'OWCHE', 'OWERS', 'OWIES', 'OWLED', 'OWLER', 'OWLET', 'OWNED', 'OWNIO', 'OWRES', 'OWRIE', 'OWSEN', 'OXBOW', 'OXEAS', 'OXERS', 'OXEYE', 'OXIDS', 'OXIES', 'OXIME', 'OXIMS', 'OXINE', 'OXLIP', 'OXMAN', 'OXMEN', 'OXTER', 'OYAMA', 'OYERS', 'OZEKI', 'OZENA', 'OZZIE', 'PAAHO', 'PAALS', 'PAANS', 'PACAI', 'PACAS', 'PACAY', 'PACED', 'PACER', 'PACES', 'PACEY', 'PACHA', 'PACKS', 'PACKY', 'PACOS', 'PACTA', 'PACTS', 'PADAM', 'PADAS', 'PADDO', 'PADIS', 'PADLE', 'PADMA', 'PADOU', 'PADRE', 'PADRI', 'PAEAN', 'PAEDO', 'PAEON', 'PAGED', 'PAGER', 'PAGES', 'PAGLE', 'PAGNE', 'PAGOD', 'PAGRI', 'PAHIT', 'PAHOS', 'PAHUS', 'PAIKS', 'PAILS', 'PAINS', 'PAIPE', 'PAIPS', 'PAIRE', 'PAIRS', 'PAISA', 'PAISE', 'PAKAY', 'PAKKA', 'PAKKI', 'PAKUA', 'PAKUL', 'PALAK', 'PALAR', 'PALAS', 'PALAY', 'PALEA', 'PALED', 'PALES', 'PALET', 'PALIS', 'PALKI', 'PALLA', 'PALLS', 'PALLU', 'PALLY', 'PALMS', 'PALMY', 'PALPI', 'PALPS', 'PALSA', 'PALUS', 'PAMBY', 'PAMPA', 'PANAX', 'PANCE', 'PANCH', 'PANDA', 'PANDS', 'PANDY', 'PANED', 'PANES', 'PANGA', 'PANGS', 'PANIM', 'PANIR', 'PANKO', 'PANKS', 'PANNA', 'PANNE', 'PANNI', 'PANNY', 'PANTO', 'PANTS', 'PANTY', 'PAOLI', 'PAOLO', 'PAPAD', 'PAPAS', 'PAPAW', 'PAPES', 'PAPEY', 'PAPPI', 'PAPPY', 'PAPRI', 'PARAE', 'PARAS', 'PARCH', 'PARCS', 'PARDI', 'PARDS', 'PARDY', 'PARED', 'PAREN', 'PAREO', 'PARES', 'PAREU', 'PAREV', 'PARGE', 'PARGO', 'PARID', 'PARIS', 'PARKI', 'PARKS', 'PARKY', 'PARLE', 'PARLY', 'PARMA', 'PARMO', 'PARMS', 'PAROL', 'PARPS', 'PARRA', 'PARRS', 'PARTE', 'PARTI', 'PARTS', 'PARVE', 'PARVO', 'PASAG', 'PASAR', 'PASCH', 'PASEO', 'PASES', 'PASHA', 'PASHM', 'PASKA', 'PASMO', 'PASPY', 'PASSE', 'PASSU', 'PASTS', 'PATAS', 'PATED', 'PATEE', 'PATEL', 'PATEN', 'PATER', 'PATES', 'PATHS', 'PATIA', 'PATIN', 'PATKA', 'PATLY', 'PATTA', 'PATTE', 'PATTU', 'PATUS', 'PAUAS', 'PAULS', 'PAUXI', 'PAVAN', 'PAVAS', 'PAVED', 'PAVEN', 'PAVER', 'PAVES', 'PAVID', 'PAVIE', 'PAVIN', 'PAVIS', 'PAVON', 'PAVVY', 'PAWAS', 'PAWAW', 'PAWED', 'PAWER', 'PAWKS', 'PAWKY', 'PAWLS', 'PAWNS', 'PAXES', 'PAYED', 'PAYOR', 'PAYSD', 'PEAGE', 'PEAGS', 'PEAKE', 'PEAKS', 'PEAKY', 'PEALS', 'PEANS', 'PEARE', 'PEARS', 'PEART', 'PEASE', 'PEASY', 'PEATS', 'PEATY', 'PEAVY', 'PEAZE', 'PEBAS', 'PECHS', 'PECIA', 'PECKE', 'PECKS', 'PECKY', 'PECTS', 'PEDES', 'PEDIS', 'PEDON', 'PEDOS', 'PEDRO', 'PEECE', 'PEEKS', 'PEEKY', 'PEELS', 'PEELY', 'PEENS', 'PEENT', 'PEEOY', 'PEEPE', 'PEEPS', 'PEEPY', 'PEERS', 'PEERY', 'PEEVE', 'PEEVO', 'PEGGY', 'PEGHS', 'PEGMA', 'PEGOS', 'PEINE', 'PEINS', 'PEISE', 'PEISY', 'PEIZE', 'PEKAN', 'PEKAU', 'PEKEA', 'PEKES', 'PEKID', 'PEKIN', 'PEKOE', 'PELAS', 'PELAU', 'PELCH', 'PELES', 'PELFS', 'PELLS', 'PELMA', 'PELOG', 'PELON', 'PELSH', 'PELTA', 'PELTS', 'PELUS', 'PENDS', 'PENDU', 'PENED', 'PENES', 'PENGO', 'PENIE', 'PENIS', 'PENKS', 'PENNA', 'PENNI', 'PENSE', 'PENSY', 'PENTS', 'PEOLA', 'PEONS', 'PEONY', 'PEPLA', 'PEPLE', 'PEPON', 'PEPOS', 'PEPPY', 'PEPSI', 'PEQUI', 'PERAE', 'PERAI', 'PERCE', 'PERCS', 'PERDU', 'PERDY', 'PEREA', 'PERES', 'PERFS', 'PERIS', 'PERKS', 'PERLE', 'PERLS', 'PERMS', 'PERMY', 'PERNE', 'PERNS', 'PEROG', 'PERPS', 'PERRY', 'PERSE', 'PERSP', 'PERST', 'PERTS', 'PERVE', 'PERVO', 'PERVS', 'PERVY', 'PESCH', 'PESOS', 'PESTA', 'PESTS', 'PESTY', 'PETAR', 'PETER', 'PETIT', 'PETOS', 'PETRE', 'PETRI', 'PETTI', 'PETTO', 'PEWED', 'PEWEE', 'PEWIT', 'PEYSE', 'PFFTT', 'PHAGE', 'PHANG', 'PHARE', 'PHARM', 'PHASM', 'PHEER', 'PHEME', 'PHENE', 'PHEON', 'PHESE', 'PHIAL', 'PHIES', 'PHISH', 'PHIZZ', 'PHLOX', 'PHOBE', 'PHOCA', 'PHONO', 'PHONS', 'PHOOH', 'PHOOO', 'PHOTA', 'PHOTS', 'PHOTY', 'PHPHT', 'PHUBS', 'PHUTS', 'PHUTU', 'PHWAT', 'PHYLA', 'PHYLE', 'PHYMA', 'PHYNX', 'PHYSA', 'PIAIS', 'PIANI', 'PIANS', 'PIBAL', 'PICAL', 'PICAS', 'PICCY', 'PICEY', 'PICHI', 'PICKS', 'PICON', 'PICOT', 'PICRA', 'PICUL', 'PIEDS', 'PIEND', 'PIERS', 'PIERT', 'PIETA', 'PIETS', 'PIEZO', 'PIGHT', 'PIGLY', 'PIGMY', 'PIING', 'PIKAS', 'PIKAU', 'PIKED', 'PIKEL', 'PIKER', 'PIKES', 'PIKEY', 'PIKIS', 'PIKUL', 'PILAE', 'PILAF', 'PILAO', 'PILAR', 'PILAU', 'PILAW', 'PILCH', 'PILEA', 'PILED', 'PILEI', 'PILER', 'PILES', 'PILEY', 'PILIN', 'PILIS', 'PILLS', 'PILON', 'PILOW', 'PILUM', 'PILUS', 'PIMAS', 'PIMPS', 'PINAS', 'PINAX', 'PINCE', 'PINDA', 'PINDS', 'PINED', 'PINER', 'PINES', 'PINGA', 'PINGE', 'PINGO', 'PINGS', 'PINKO', 'PINKS', 'PINNA', 'PINNY', 'PINOL', 'PINON', 'PINOT', 'PINTA', 'PINTS', 'PINUP', 'PIONS', 'PIONY', 'PIOUS', 'PIOYE', 'PIOYS', 'PIPAL', 'PIPAS', 'PIPED', 'PIPES', 'PIPET', 'PIPID', 'PIPIS', 'PIPIT', 'PIPPY', 'PIPUL', 'PIQUI', 'PIRAI', 'PIRKS', 'PIRLS', 'PIRNS', 'PIROG', 'PIRRE', 'PIRRI', 'PIRRS', 'PISCO', 'PISES', 'PISKY', 'PISOS', 'PISSY', 'PISTE', 'PITAS', 'PITHS', 'PITON', 'PITOT', 'PITSO', 'PITSU', 'PITTA', 'PITTU', 'PIUMA', 'PIUMS', 'PIVOS', 'PIXES', 'PIYUT', 'PIZED', 'PIZER', 'PIZES', 'PLAAS', 'PLACK', 'PLAGA', 'PLAGE', 'PLAIG', 'PLANC', 'PLANH', 'PLANS', 'PLAPS', 'PLASH', 'PLASM', 'PLAST', 'PLATS', 'PLATT', 'PLATY', 'PLAUD', 'PLAUR', 'PLAVS', 'PLAYA', 'PLAYS', 'PLEAS', 'PLEBE', 'PLEBS', 'PLECK', 'PLEEP', 'PLEIN', 'PLENA', 'PLENE', 'PLENO', 'PLEON', 'PLESH', 'PLETS', 'PLEWS', 'PLEXI', 'PLICA', 'PLIES', 'PLIGS', 'PLIMS', 'PLING', 'PLINK', 'PLIPS', 'PLISH', 'PLOAT', 'PLOCE', 'PLOCK', 'PLODS', 'PLOIT', 'PLOMB', 'PLONG', 'PLONK', 'PLOOK', 'PLOOT', 'PLOPS', 'PLORE', 'PLOTS', 'PLOTZ', 'PLOUK', 'PLOUT', 'PLOWS', 'PLOWT', 'PLOYE', 'PLOYS', 'PLUDS', 'PLUES', 'PLUFF', 'PLUGS', 'PLUKE', 'PLUMS', 'PLUMY', 'PLUNG', 'PLUOT', 'PLUPS', 'PLUTE', 'PLUTO', 'PLUTY', 'PLYER', 'PNEUS', 'POACH', 'POAKA', 'POAKE', 'POALO', 'POBBY', 'POBOY', 'POCAN', 'POCHE', 'POCHO', 'POCKS', 'POCKY', 'PODAL', 'PODDY', 'PODEX', 'PODGE', 'PODGY', 'PODIA', 'PODOS', 'PODUS', 'POEMS', 'POENA', 'POEPS', 'POETE', 'POETS', 'POGEY', 'POGGE', 'POGGY', 'POGOS', 'POGUE', 'POHED', 'POILU', 'POIND', 'POIRE', 'POKAL', 'POKED', 'POKES', 'POKEY', 'POKIE', 'POKIT', 'POLED', 'POLER', 'POLES', 'POLEY', 'POLIO', 'POLIS', 'POLJE', 'POLKS', 'POLLO', 'POLLS', 'POLLY', 'POLOS', 'POLTS', 'POLYS', 'POMAS', 'POMBE', 'POMES', 'POMME', 'POMMY', 'POMOS', 'POMPA', 'POMPS', 'PONCE', 'PONCY', 'PONDS', 'PONDY', 'PONES', 'PONEY', 'PONGA', 'PONGO', 'PONGS', 'PONGY', 'PONKS', 'PONOR', 'PONTO', 'PONTS', 'PONTY', 'PONZU', 'POOAY', 'POODS', 'POOED', 'POOEY', 'POOFS', 'POOFY', 'POOHS', 'POOHY', 'POOJA', 'POOKA', 'POOKS', 'POOLS', 'POOLY', 'POONS', 'POOPA', 'POOPS', 'POOPY', 'POORI', 'POORT', 'POOTS', 'POOTY', 'POOVE', 'POOVY', 'POPES', 'POPIA', 'POPOS', 'POPPA', 'POPSY', 'POPUP', 'PORAE', 'PORAL', 'PORED', 'PORER', 'PORES', 'POREY', 'PORGE', 'PORGY', 'PORIN', 'PORKS', 'PORKY', 'PORNO', 'PORNS', 'PORNY', 'PORTA', 'PORTE', 'PORTH', 'PORTS', 'PORTY', 'PORUS', 'POSCA', 'POSED', 'POSES', 'POSET', 'POSEY', 'POSHO', 'POSOL', 'POSTE', 'POSTS', 'POTAE', 'POTAI', 'POTCH', 'POTED', 'POTES', 'POTIN', 'POTOO', 'POTRO', 'POTSY', 'POTTO', 'POTTS', 'POTTY', 'POUCE', 'POUFF', 'POUFS', 'POUFY', 'POUIS', 'POUKE', 'POUKS', 'POULE', 'POULP', 'POULT', 'POUPE', 'POUPT', 'POURS', 'POUSY', 'POUTS', 'POVOS', 'POWAN', 'POWIE', 'POWIN', 'POWIS', 'POWLT', 'POWND', 'POWNS', 'POWNY', 'POWRE', 'POWSY', 'POXED', 'POXES', 'POYAS', 'POYNT', 'POYOU', 'POYSE', 'POZZY', 'PRAAM', 'PRADS', 'PRAGS', 'PRAHU', 'PRAMS', 'PRANA', 'PRANG', 'PRAOS', 'PRAPS', 'PRASE', 'PRATE', 'PRATS', 'PRATT', 'PRATY', 'PRAUS', 'PRAYS', 'PREAK', 'PREDY', 'PREED', 'PREEM', 'PREES', 'PREIF', 'PREKE', 'PREMS', 'PREMY', 'PRENT', 'PREON', 'PREOP', 'PREPS', 'PRESA', 'PRESE', 'PREST', 'PRETA', 'PREUX', 'PREVE', 'PREXY', 'PREYS', 'PRIAL', 'PRIAN', 'PRICY', 'PRIDY', 'PRIEF', 'PRIER', 'PRIES', 'PRIGS', 'PRILL', 'PRIMA', 'PRIMI', 'PRIMP', 'PRIMS', 'PRIMY', 'PRING', 'PRINK', 'PRION', 'PRISE', 'PRISS', 'PRIUS', 'PROAL', 'PROAS', 'PROBS', 'PROBY', 'PRODD', 'PRODS', 'PROEM', 'PROFS', 'PROGS', 'PROIN', 'PROKE', 'PROLE', 'PROLL', 'PROMO', 'PROMS', 'PRONK', 'PROOK', 'PROOT', 'PROPS', 'PRORA', 'PRORE', 'PROSO', 'PROSS', 'PROST', 'PROSY', 'PROTO', 'PROUL', 'PROWK', 'PROWS', 'PROYN', 'PRUNO', 'PRUNT', 'PRUNY', 'PRUTA', 'PRYAN', 'PRYER', 'PRYSE', 'PSEUD', 'PSHAW', 'PSHUT', 'PSIAS', 'PSION', 'PSOAE', 'PSOAI', 'PSOAS', 'PSORA', 'PSYCH', 'PSYOP', 'PTISH', 'PTYPE', 'PUBBY', 'PUBCO', 'PUBES', 'PUBIS', 'PUBSY', 'PUCAN', 'PUCER', 'PUCES', 'PUCKA', 'PUCKS', 'PUDDY', 'PUDGE', 'PUDIC', 'PUDOR', 'PUDSY', 'PUDUS', 'PUERS', 'PUFFA', 'PUFFS', 'PUGGY', 'PUGIL', 'PUHAS', 'PUJAH', 'PUJAS', 'PUKAS', 'PUKED', 'PUKER', 'PUKES', 'PUKEY', 'PUKKA', 'PUKUS', 'PULAO', 'PULAS', 'PULED', 'PULER', 'PULES', 'PULIK', 'PULIS', 'PULKA', 'PULKS', 'PULLI', 'PULLS', 'PULLY', 'PULMO', 'PULPS', 'PULUS', 'PULUT', 'PUMAS', 'PUMIE', 'PUMPS', 'PUMPY', 'PUNAS', 'PUNCE', 'PUNGA', 'PUNGI', 'PUNGO', 'PUNGS', 'PUNGY', 'PUNIM', 'PUNJI', 'PUNKA', 'PUNKS', 'PUNKY', 'PUNNY', 'PUNTO', 'PUNTS', 'PUNTY', 'PUPAE', 'PUPAL', 'PUPAS', 'PUPPA', 'PUPUS', 'PURAO', 'PURAU', 'PURDA', 'PURDY', 'PURED', 'PURES', 'PURGA', 'PURIN', 'PURIS', 'PURLS', 'PUROS', 'PURPS', 'PURPY', 'PURRE', 'PURRS', 'PURRY', 'PURSY', 'PURTY', 'PUSES', 'PUSLE', 'PUSSY', 'PUTAS', 'PUTER', 'PUTID', 'PUTIN', 'PUTON', 'PUTOS', 'PUTTI', 'PUTTO', 'PUTTS', 'PUTTU', 'PUTZA', 'PUUKO', 'PUYAS', 'PUZEL', 'PUZTA', 'PWNED', 'PYATS', 'PYETS', 'PYGAL', 'PYINS', 'PYLON', 'PYNED', 'PYNES', 'PYOID', 'PYOTS', 'PYRAL', 'PYRAN', 'PYRES', 'PYREX', 'PYRIC', 'PYROS', 'PYRUS', 'PYUFF', 'PYXED', 'PYXES', 'PYXIE', 'PYXIS', 'PZAZZ', 'QADIS', 'QAIDS', 'QAJAQ', 'QANAT', 'QAPIK', 'QIBLA', 'QILAS', 'QIPAO', 'QOPHS', 'QORMA', 'QUABS', 'QUADS', 'QUAFF', 'QUAGS', 'QUAIR', 'QUAIS', 'QUAKY', 'QUALE', 'QUALY', 'QUANK', 'QUANT', 'QUARE', 'QUARL', 'QUASS', 'QUATE', 'QUATS', 'QUAWK', 'QUAWS', 'QUAYD', 'QUAYS', 'QUBIT', 'QUEAN', 'QUECK', 'QUEEK', 'QUEEM', 'QUEME', 'QUENA', 'QUERN', 'QUESO', 'QUETE', 'QUEYN', 'QUEYS', 'QUEYU', 'QUIBS', 'QUICH', 'QUIDS', 'QUIES', 'QUIFF', 'QUILA', 'QUIMS', 'QUINA', 'QUINE', 'QUINK', 'QUINO', 'QUINS', 'QUINT', 'QUIPO', 'QUIPS', 'QUIPU', 'QUIRE', 'QUIRL', 'QUIRT', 'QUIST', 'QUITS', 'QUOAD', 'QUODS', 'QUOIF', 'QUOIN', 'QUOIS', 'QUOIT', 'QUOLL', 'QUONK', 'QUOPS', 'QUORK', 'QUORL', 'QUOUK', 'QUOYS', 'QURAN', 'QURSH', 'QUYTE', 'RAADS', 'RAAKE', 'RABAT', 'RABIC', 'RABIS', 'RACED', 'RACES', 'RACHE', 'RACKS', 'RACON', 'RADDI', 'RADDY', 'RADGE', 'RADGY', 'RADIF', 'RADIX', 'RADON', 'RAFEE', 'RAFFS', 'RAFFY', 'RAFIK', 'RAFIQ', 'RAFTS', 'RAFTY', 'RAGAS', 'RAGDE', 'RAGED', 'RAGEE', 'RAGER', 'RAGES', 'RAGGA', 'RAGGS', 'RAGGY', 'RAGIS', 'RAGUS', 'RAHED', 'RAHUI', 'RAIAH', 'RAIAS', 'RAIDS', 'RAIKE', 'RAIKS', 'RAILE', 'RAILS', 'RAINE', 'RAINS', 'RAIRD', 'RAITA', 'RAITH', 'RAITS', 'RAJAS', 'RAJES', 'RAKED', 'RAKEE', 'RAKER', 'RAKES', 'RAKHI', 'RAKIA', 'RAKIS', 'RAKKI', 'RAKSI', 'RAKUS', 'RALES', 'RALLI', 'RAMAL', 'RAMEE', 'RAMES', 'RAMET', 'RAMIE', 'RAMIN', 'RAMIS', 'RAMMY', 'RAMON', 'RAMPS', 'RAMSE', 'RAMSH', 'RAMUS', 'RANAS', 'RANCE', 'RANDO', 'RANDS', 'RANED', 'RANEE', 'RANES', 'RANGA', 'RANGI', 'RANGS', 'RANGY', 'RANID', 'RANIS', 'RANKE', 'RANKS', 'RANNS', 'RANNY', 'RANSE', 'RANTS', 'RANTY', 'RAPED', 'RAPEE', 'RAPER', 'RAPES', 'RAPHE', 'RAPIN', 'RAPPE', 'RAPSO', 'RARED', 'RAREE', 'RARES', 'RARKS', 'RASAM', 'RASAS', 'RASED', 'RASER', 'RASES', 'RASPS', 'RASSE', 'RASTA', 'RATAL', 'RATAN', 'RATAS', 'RATCH', 'RATED', 'RATEL', 'RATER', 'RATES', 'RATHA', 'RATHE', 'RATHS', 'RATOO', 'RATOS', 'RATTI', 'RATUS', 'RAULI', 'RAUNS', 'RAUPO', 'RAVED', 'RAVEL', 'RAVER', 'RAVES', 'RAVEY', 'RAVIN', 'RAWDY', 'RAWER', 'RAWIN', 'RAWKS', 'RAWLY', 'RAWNS', 'RAXED', 'RAXES', 'RAYAH', 'RAYAS', 'RAYED', 'RAYLE', 'RAYLS', 'RAYNE', 'RAZAI', 'RAZED', 'RAZEE', 'RAZER', 'RAZES', 'RAZET', 'RAZOO', 'READD', 'READS', 'REAIS', 'REAKS', 'REALO', 'REALS', 'REAME', 'REAMS', 'REAMY', 'REANS', 'REAPS', 'REARD', 'REARS', 'REAST', 'REATA', 'REATE', 'REAVE', 'REBAB', 'REBBE', 'REBEC', 'REBID', 'REBIT', 'REBOP', 'REBUD', 'REBUY', 'RECAL', 'RECCE', 'RECCO', 'RECCY', 'RECEP', 'RECIT', 'RECKS', 'RECON', 'RECTA', 'RECTE', 'RECTI', 'RECTO', 'RECUE', 'REDAN', 'REDDS', 'REDDY', 'REDED', 'REDES', 'REDIA', 'REDID', 'REDIF', 'REDIG', 'REDIP', 'REDLY', 'REDON', 'REDOS', 'REDOX', 'REDRY', 'REDUB', 'REDUG', 'REDUX', 'REDYE', 'REEAF', 'REECH', 'REEDE', 'REEDS', 'REEFS', 'REEFY', 'REEKS', 'REEKY', 'REELS', 'REELY', 'REEMS', 'REENS', 'REERD', 'REEST', 'REEVE', 'REEZE', 'REFAN', 'REFED', 'REFEL', 'REFFO', 'REFIS', 'REFIX', 'REFLY', 'REFRY', 'REGAR', 'REGES', 'REGET', 'REGEX', 'REGGO', 'REGIA', 'REGIE', 'REGLE', 'REGMA', 'REGNA', 'REGOS', 'REGOT', 'REGUR', 'REHEM', 'REIFS', 'REIFY', 'REIKI', 'REIKS', 'REINE', 'REING', 'REINK', 'REINS', 'REIRD', 'REIST', 'REIVE', 'REJAS', 'REJIG', 'REJON', 'REKED', 'REKES', 'REKEY', 'RELET', 'RELIE', 'RELIT', 'RELLO', 'RELOS', 'REMAN', 'REMAP', 'REMEN', 'REMET', 'REMEX', 'REMIX', 'REMOU', 'RENAY', 'RENDS', 'RENDU', 'RENEY', 'RENGA', 'RENGS', 'RENIG', 'RENIN', 'RENKS', 'RENNE', 'RENOS', 'RENTE', 'RENTS', 'REOIL', 'REORG', 'REPAS', 'REPAT', 'REPEG', 'REPEN', 'REPIN', 'REPLA', 'REPOS', 'REPOT', 'REPPS', 'REPRO', 'REPUN', 'REPUT', 'RERAN', 'RERIG', 'RESAM', 'RESAT', 'RESAW', 'RESAY', 'RESEE', 'RESES', 'RESEW', 'RESID', 'RESIT', 'RESOD', 'RESOL', 'RESOW', 'RESTO', 'RESTS', 'RESTY', 'RESUE', 'RESUS', 'RETAG', 'RETAM', 'RETAX', 'RETEM', 'RETIA', 'RETIE', 'RETIN', 'RETIP', 'RETOX', 'REUNE', 'REUPS', 'REVET', 'REVIE', 'REVOW', 'REWAN', 'REWAX', 'REWED', 'REWET', 'REWIN', 'REWON', 'REWTH', 'REXES', 'REZES', 'RHABD', 'RHEAS', 'RHEID', 'RHEME', 'RHEUM', 'RHIES', 'RHIME', 'RHINE', 'RHODY', 'RHOMB', 'RHONE', 'RHUMB', 'RHYMY', 'RHYNE', 'RHYTA', 'RIADS', 'RIALS', 'RIANT', 'RIATA', 'RIATO', 'RIBAS', 'RIBBY', 'RIBES', 'RICED', 'RICER', 'RICES', 'RICEY', 'RICHE', 'RICHT', 'RICIN', 'RICKS', 'RIDES', 'RIDGY', 'RIDIC', 'RIELS', 'RIEMS', 'RIEVE', 'RIFER', 'RIFFS', 'RIFFY', 'RIFTE', 'RIFTS', 'RIFTY', 'RIGGS', 'RIGMO', 'RIGOL', 'RIKKA', 'RIKWA', 'RILED', 'RILES', 'RILEY', 'RILLE', 'RILLS', 'RILLY', 'RIMAE', 'RIMED', 'RIMER', 'RIMES', 'RIMON', 'RIMUS', 'RINCE', 'RINDS', 'RINDY', 'RINES', 'RINGE', 'RINGS', 'RINGY', 'RINKS', 'RIOJA', 'RIONE', 'RIOTS', 'RIOTY', 'RIPED', 'RIPES', 'RIPPS', 'RIQQS', 'RISES', 'RISHI', 'RISKS', 'RISPS', 'RISTS', 'RISUS', 'RITES', 'RITHE', 'RITTS', 'RITZY', 'RIVAS', 'RIVED', 'RIVEL', 'RIVEN', 'RIVES', 'RIYAL', 'RIZAS', 'ROADS', 'ROADY', 'ROAKE', 'ROAKY', 'ROAMS', 'ROANS', 'ROANY', 'ROARS', 'ROARY', 'ROATE', 'ROBBO', 'ROBED', 'ROBER', 'ROBES', 'ROBLE', 'ROBUG', 'ROBUR', 'ROCHE', 'ROCKS', 'RODED', 'RODES', 'RODNY', 'ROERS', 'ROGAN', 'ROGUY', 'ROHAN', 'ROHES', 'ROHUN', 'ROHUS', 'ROIDS', 'ROILS', 'ROILY', 'ROINS', 'ROIST', 'ROJAK', 'ROJIS', 'ROKED', 'ROKER', 'ROKES', 'ROKEY', 'ROKOS', 'ROLAG', 'ROLEO', 'ROLES', 'ROLFS', 'ROLLS', 'ROLLY', 'ROMAL', 'ROMAN', 'ROMEO', 'ROMER', 'ROMPS', 'ROMPU', 'ROMPY', 'RONDE', 'RONDO', 'RONEO', 'RONES', 'RONIN', 'RONNE', 'RONTE', 'RONTS', 'RONUK', 'ROODS', 'ROOFS', 'ROOFY', 'ROOKS', 'ROOKY', 'ROOMS', 'ROONS', 'ROOPS', 'ROOPY', 'ROOSA', 'ROOSE', 'ROOTS', 'ROOTY', 'ROPED', 'ROPER', 'ROPES', 'ROPEY', 'ROQUE', 'RORAL', 'RORES', 'RORIC', 'RORID', 'RORIE', 'RORTS', 'RORTY', 'ROSAL', 'ROSCO', 'ROSED', 'ROSES', 'ROSET', 'ROSHA', 'ROSHI', 'ROSIN', 'ROSIT', 'ROSPS', 'ROSSA', 'ROSSO', 'ROSTI', 'ROSTS', 'ROTAL', 'ROTAN', 'ROTAS', 'ROTCH', 'ROTED', 'ROTES', 'ROTIS', 'ROTLS', 'ROTON', 'ROTOS', 'ROTTA', 'ROTTE', 'ROTTO', 'ROTTY', 'ROUEN', 'ROUES', 'ROUET', 'ROUFS', 'ROUGY', 'ROUKS', 'ROUKY', 'ROULE', 'ROULS', 'ROUMS', 'ROUPS', 'ROUPY', 'ROUST', 'ROUTH', 'ROUTS', 'ROVED', 'ROVEN', 'ROVES', 'ROWAN', 'ROWED', 'ROWEL', 'ROWEN', 'ROWET', 'ROWIE', 'ROWME', 'ROWND', 'ROWNS', 'ROWTH', 'ROWTS', 'ROYET', 'ROYNE', 'ROYST', 'ROZES', 'ROZET', 'ROZIT', 'RUACH', 'RUANA', 'RUBAI', 'RUBAN', 'RUBBY', 'RUBEL', 'RUBES', 'RUBIN', 'RUBIO', 'RUBLE', 'RUBLI', 'RUBOR', 'RUBUS', 'RUCHE', 'RUCHY', 'RUCKS', 'RUDAS', 'RUDDS', 'RUDES', 'RUDIE', 'RUDIS', 'RUEDA', 'RUERS', 'RUFFE', 'RUFFS', 'RUFFY', 'RUFUS', 'RUGAE', 'RUGAL', 'RUGAS', 'RUGGY', 'RUICE', 'RUING', 'RUINS', 'RUKHS', 'RULED', 'RULES', 'RULLY', 'RUMAL', 'RUMBO', 'RUMEN', 'RUMES', 'RUMLY', 'RUMMY', 'RUMPO', 'RUMPS', 'RUMPY', 'RUNCE', 'RUNCH', 'RUNDS', 'RUNED', 'RUNER', 'RUNES', 'RUNGS', 'RUNIC', 'RUNNY', 'RUNOS', 'RUNTS', 'RUNTY', 'RUNUP', 'RUOTE', 'RUPIA', 'RURPS', 'RURUS', 'RUSAS', 'RUSES', 'RUSHY', 'RUSKS', 'RUSKY', 'RUSMA', 'RUSSE', 'RUSTS', 'RUTHS', 'RUTIN', 'RUTTY', 'RUVID', 'RYALS', 'RYBAT', 'RYIJI', 'RYIJY', 'RYKED', 'RYKES', 'RYMER', 'RYMME', 'RYNDS', 'RYOTI', 'RYOTS', 'RYPER', 'RYPIN', 'RYTHE', 'RYUGI', 'SAAGS', 'SABAL', 'SABED', 'SABER', 'SABES', 'SABHA', 'SABIN', 'SABIR', 'SABJI', 'SABLE', 'SABOS', 'SABOT', 'SABRA', 'SABRE', 'SABZI', 'SACKS', 'SACRA', 'SACRE', 'SADDO', 'SADDY', 'SADES', 'SADHE', 'SADHU', 'SADIC', 'SADIS', 'SADOS', 'SADZA', 'SAETA', 'SAFED', 'SAFES', 'SAGAR', 'SAGAS', 'SAGER', 'SAGES', 'SAGGY', 'SAGOS', 'SAGUM', 'SAHAB', 'SAHEB', 'SAHIB', 'SAICE', 'SAICK', 'SAICS', 'SAIDS', 'SAIGA', 'SAILS', 'SAIMS', 'SAINE', 'SAINS', 'SAIRS', 'SAIST', 'SAITH', 'SAJOU', 'SAKAI', 'SAKER', 'SAKES', 'SAKIA', 'SAKIS', 'SAKTI', 'SALAL', 'SALAS', 'SALAT', 'SALEP', 'SALES', 'SALET', 'SALIC', 'SALIS', 'SALIX', 'SALLE', 'SALMI', 'SALOL', 'SALOP', 'SALPA', 'SALPS', 'SALSE', 'SALTO', 'SALTS', 'SALUD', 'SALUE', 'SALUT', 'SAMAN', 'SAMAS', 'SAMBA', 'SAMBO', 'SAMEK', 'SAMEL', 'SAMEN', 'SAMES', 'SAMEY', 'SAMFI', 'SAMFU', 'SAMMY', 'SAMPI', 'SAMPS', 'SANAD', 'SANDS', 'SANED', 'SANES', 'SANGA', 'SANGH', 'SANGO', 'SANGS', 'SANKO', 'SANSA', 'SANTO', 'SANTS', 'SAOLA', 'SAPAN', 'SAPID', 'SAPOR', 'SARAN', 'SARDS', 'SARED', 'SAREE', 'SARGE', 'SARGO', 'SARIN', 'SARIR', 'SARIS', 'SARKS', 'SARKY', 'SAROD', 'SAROS', 'SARUS', 'SARVO', 'SASER', 'SASIN', 'SASSE', 'SATAI', 'SATAY', 'SATED', 'SATEM', 'SATER', 'SATES', 'SATIS', 'SAUBA', 'SAUCH', 'SAUGH', 'SAULS', 'SAULT', 'SAUNF', 'SAUNT', 'SAURY', 'SAUTS', 'SAUVE', 'SAVED', 'SAVER', 'SAVES', 'SAVEY', 'SAVIN', 'SAWAH', 'SAWED', 'SAWER', 'SAXES', 'SAYAS', 'SAYED', 'SAYEE', 'SAYER', 'SAYID', 'SAYNE', 'SAYON', 'SAYST', 'SAZES', 'SCABS', 'SCADS', 'SCAFF', 'SCAGS', 'SCAIL', 'SCALA', 'SCALL', 'SCAMS', 'SCAND', 'SCANS', 'SCAPA', 'SCAPE', 'SCAPI', 'SCARP', 'SCARS', 'SCART', 'SCATH', 'SCATS', 'SCATT', 'SCAUD', 'SCAUP', 'SCAUR', 'SCAWS', 'SCEAT', 'SCENA', 'SCEND', 'SCHAV', 'SCHIF', 'SCHMO', 'SCHUL', 'SCHWA', 'SCIFI', 'SCIND', 'SCIRE', 'SCLIM', 'SCOBE', 'SCODY', 'SCOGS', 'SCOOG', 'SCOOT', 'SCOPA', 'SCOPS', 'SCORP', 'SCOTE', 'SCOTS', 'SCOUG', 'SCOUP', 'SCOWP', 'SCOWS', 'SCRAB', 'SCRAE', 'SCRAG', 'SCRAN', 'SCRAT', 'SCRAW', 'SCRAY', 'SCRIM', 'SCRIP', 'SCROB', 'SCROD', 'SCROG', 'SCROO', 'SCROW', 'SCUDI', 'SCUDO', 'SCUDS', 'SCUFF', 'SCUFT', 'SCUGS', 'SCULK', 'SCULL', 'SCULP', 'SCULS', 'SCUMS', 'SCUPS', 'SCURF', 'SCURS', 'SCUSE', 'SCUTA', 'SCUTE', 'SCUTS', 'SCUZZ', 'SCYES', 'SDAYN', 'SDEIN', 'SEALS', 'SEAME', 'SEAMS', 'SEAMY', 'SEANS', 'SEARE', 'SEARS', 'SEASE', 'SEATS', 'SEAZE', 'SEBUM', 'SECCO', 'SECHS', 'SECTS', 'SEDER', 'SEDES', 'SEDGE', 'SEDGY', 'SEDUM', 'SEEDS', 'SEEKS', 'SEELD', 'SEELS', 'SEELY', 'SEEMS', 'SEEPS', 'SEEPY', 'SEERS', 'SEFER', 'SEGAR', 'SEGAS', 'SEGNI', 'SEGNO', 'SEGOL', 'SEGOS', 'SEHRI', 'SEIFS', 'SEILS', 'SEINE', 'SEIRS', 'SEISE', 'SEISM', 'SEITY', 'SEIZA', 'SEKOS', 'SEKTS', 'SELAH', 'SELES', 'SELFS', 'SELFY', 'SELKY', 'SELLA', 'SELLE', 'SELLS', 'SELVA', 'SEMAS', 'SEMEE', 'SEMES', 'SEMIE', 'SEMIS', 'SENAS', 'SENDS', 'SENES', 'SENEX', 'SENGI', 'SENNA', 'SENOR', 'SENSA', 'SENSI', 'SENSU', 'SENTE', 'SENTI', 'SENTS', 'SENVY', 'SENZA', 'SEPAD', 'SEPAL', 'SEPIC', 'SEPOY', 'SEPPO', 'SEPTA', 'SEPTS', 'SERAC', 'SERAI', 'SERAL', 'SERED', 'SERER', 'SERES', 'SERFS', 'SERGE', 'SERIA', 'SERIC', 'SERIN', 'SERIR', 'SERKS', 'SERON', 'SEROW', 'SERRA', 'SERRE', 'SERRS', 'SERRY', 'SERVO', 'SESEY', 'SESSA', 'SETAE', 'SETAL', 'SETER', 'SETHS', 'SETON', 'SETTS', 'SEVAK', 'SEVIR', 'SEWAN', 'SEWAR', 'SEWED', 'SEWEL', 'SEWEN', 'SEWIN', 'SEXED', 'SEXER', 'SEXES', 'SEXOR', 'SEXTO', 'SEXTS', 'SEYEN', 'SEZES', 'SHADS', 'SHAGS', 'SHAHS', 'SHAKA', 'SHAKO', 'SHAKT', 'SHALM', 'SHALY', 'SHAMA', 'SHAMS', 'SHAND', 'SHANS', 'SHAPS', 'SHARN', 'SHART', 'SHASH', 'SHAUL', 'SHAWM', 'SHAWN', 'SHAWS', 'SHAYA', 'SHAYS', 'SHCHI', 'SHEAF', 'SHEAL', 'SHEAS', 'SHEDS', 'SHEEL', 'SHEND', 'SHENG', 'SHENT', 'SHEOL', 'SHERD', 'SHERE', 'SHERO', 'SHETS', 'SHEVA', 'SHEWN', 'SHEWS', 'SHIAI', 'SHIEL', 'SHIER', 'SHIES', 'SHILL', 'SHILY', 'SHIMS', 'SHINS', 'SHIOK', 'SHIPS', 'SHIRR', 'SHIRS', 'SHISH', 'SHISO', 'SHIST', 'SHITE', 'SHITS', 'SHIUR', 'SHIVA', 'SHIVE', 'SHIVS', 'SHLEP', 'SHLUB', 'SHMEK', 'SHMOE', 'SHOAT', 'SHOED', 'SHOER', 'SHOES', 'SHOGI', 'SHOGS', 'SHOJI', 'SHOJO', 'SHOLA', 'SHONK', 'SHOOL', 'SHOON', 'SHOOS', 'SHOPE', 'SHOPS', 'SHORL', 'SHOTE', 'SHOTS', 'SHOTT', 'SHOUD', 'SHOWD', 'SHOWS', 'SHOYU', 'SHRED', 'SHRIS', 'SHROW', 'SHTAR', 'SHTIK', 'SHTUM', 'SHTUP', 'SHUBA', 'SHULE', 'SHULN', 'SHULS', 'SHUNS', 'SHURA', 'SHUTE', 'SHUTS', 'SHWAS', 'SHYER', 'SIALS', 'SIBBS', 'SIBIA', 'SIBYL', 'SICES', 'SICHT', 'SICKO', 'SICKS', 'SICKY', 'SIDAS', 'SIDED', 'SIDER', 'SIDES', 'SIDEY', 'SIDHA', 'SIDHE', 'SIDLE', 'SIELD', 'SIENS', 'SIENT', 'SIETH', 'SIEUR', 'SIFTS', 'SIGHS', 'SIGIL', 'SIGLA', 'SIGNA', 'SIGNS', 'SIGRI', 'SIJOS', 'SIKAS', 'SIKER', 'SIKES', 'SILDS', 'SILED', 'SILEN', 'SILER', 'SILES', 'SILEX', 'SILKS', 'SILLS', 'SILOS', 'SILTS', 'SILTY', 'SILVA', 'SIMAR', 'SIMAS', 'SIMBA', 'SIMIS', 'SIMPS', 'SIMUL', 'SINDS', 'SINED', 'SINES', 'SINGS', 'SINHS', 'SINKS', 'SINKY', 'SINSI', 'SINUS', 'SIPED', 'SIPES', 'SIPPY', 'SIRED', 'SIREE', 'SIRES', 'SIRIH', 'SIRIS', 'SIROC', 'SIRRA', 'SIRUP', 'SISAL', 'SISES', 'SISTA', 'SISTS', 'SITAR', 'SITCH', 'SITED', 'SITES', 'SITHE', 'SITKA', 'SITUP', 'SITUS', 'SIVER', 'SIXER', 'SIXES', 'SIXMO', 'SIXTE', 'SIZAR', 'SIZED', 'SIZEL', 'SIZER', 'SIZES', 'SKAGS', 'SKAIL', 'SKALD', 'SKANK', 'SKARN', 'SKART', 'SKATS', 'SKATT', 'SKAWS', 'SKEAN', 'SKEAR', 'SKEDS', 'SKEED', 'SKEEF', 'SKEEN', 'SKEER', 'SKEES', 'SKEET', 'SKEEV', 'SKEEZ', 'SKEGG', 'SKEGS', 'SKEIN', 'SKELF', 'SKELL', 'SKELM', 'SKELP', 'SKENE', 'SKENS', 'SKEOS', 'SKEPS', 'SKERM', 'SKERS', 'SKETS', 'SKEWS', 'SKIDS', 'SKIED', 'SKIES', 'SKIEY', 'SKIMO', 'SKIMS', 'SKINK', 'SKINS', 'SKINT', 'SKIOS', 'SKIPS', 'SKIRL', 'SKIRR', 'SKITE', 'SKITS', 'SKIVE', 'SKIVY', 'SKLIM', 'SKOAL', 'SKOBE', 'SKODY', 'SKOFF', 'SKOFS', 'SKOGS', 'SKOLS', 'SKOOL', 'SKORT', 'SKOSH', 'SKRAN', 'SKRIK', 'SKROO', 'SKUAS', 'SKUGS', 'SKYED', 'SKYER', 'SKYEY', 'SKYFS', 'SKYRE', 'SKYRS', 'SKYTE', 'SLABS', 'SLADE', 'SLAES', 'SLAGS', 'SLAID', 'SLAKE', 'SLAMS', 'SLANE', 'SLANK', 'SLAPS', 'SLART', 'SLATS', 'SLATY', 'SLAVE', 'SLAWS', 'SLAYS', 'SLEBS', 'SLEDS', 'SLEER', 'SLEWS', 'SLEYS', 'SLIER', 'SLILY', 'SLIMS', 'SLIPE', 'SLIPS', 'SLIPT', 'SLISH', 'SLITS', 'SLIVE', 'SLOAN', 'SLOBS', 'SLOES', 'SLOGS', 'SLOID', 'SLOJD', 'SLOKA', 'SLOMO', 'SLOOM', 'SLOOT', 'SLOPS', 'SLOPY', 'SLORM', 'SLOTS', 'SLOVE', 'SLOWS', 'SLOYD', 'SLUBB', 'SLUBS', 'SLUED', 'SLUES', 'SLUFF', 'SLUGS', 'SLUIT', 'SLUMS', 'SLURB', 'SLURS', 'SLUSE', 'SLUTS', 'SLYER', 'SLYPE', 'SMAAK', 'SMAIK', 'SMALM', 'SMALT', 'SMARM', 'SMAZE', 'SMEEK', 'SMEES', 'SMEIK', 'SMEKE', 'SMERK', 'SMEWS', 'SMICK', 'SMILY', 'SMIRR', 'SMIRS', 'SMITS', 'SMIZE', 'SMOGS', 'SMOKO', 'SMOLT', 'SMOOR', 'SMOOT', 'SMORE', 'SMORG', 'SMOUT', 'SMOWT', 'SMUGS', 'SMURS', 'SMUSH', 'SMUTS', 'SNABS', 'SNAFU', 'SNAGS', 'SNAPS', 'SNARF', 'SNARK', 'SNARS', 'SNARY', 'SNASH', 'SNATH', 'SNAWS', 'SNEAD', 'SNEAP', 'SNEBS', 'SNECK', 'SNEDS', 'SNEED', 'SNEES', 'SNELL', 'SNIBS', 'SNICK', 'SNIED', 'SNIES', 'SNIFT', 'SNIGS', 'SNIPS', 'SNIPY', 'SNIRT', 'SNITS', 'SNIVE', 'SNOBS', 'SNODS', 'SNOEK', 'SNOEP', 'SNOGS', 'SNOKE', 'SNOOD', 'SNOOK', 'SNOOL', 'SNOOT', 'SNOTS', 'SNOWK', 'SNOWS', 'SNUBS', 'SNUGS', 'SNUSH', 'SNYES', 'SOAKS', 'SOAPS', 'SOARE', 'SOARS', 'SOAVE', 'SOBAS', 'SOCAS', 'SOCES', 'SOCIA', 'SOCKO', 'SOCKS', 'SOCLE', 'SODAS', 'SODDY', 'SODIC', 'SODOM', 'SOFAR', 'SOFAS', 'SOFTA', 'SOFTS', 'SOFTY', 'SOGER', 'SOHUR', 'SOILS', 'SOILY', 'SOJAS', 'SOJUS', 'SOKAH', 'SOKEN', 'SOKES', 'SOKOL', 'SOLAH', 'SOLAN', 'SOLAS', 'SOLDE', 'SOLDI', 'SOLDO', 'SOLDS', 'SOLED', 'SOLEI', 'SOLER', 'SOLES', 'SOLON', 'SOLOS', 'SOLUM', 'SOLUS', 'SOMAN', 'SOMAS', 'SONCE', 'SONDE', 'SONES', 'SONGO', 'SONGS', 'SONGY', 'SONLY', 'SONNE', 'SONNY', 'SONSE', 'SONSY', 'SOOEY', 'SOOKS', 'SOOKY', 'SOOLE', 'SOOLS', 'SOOMS', 'SOOPS', 'SOOTE', 'SOOTS', 'SOPHS', 'SOPHY', 'SOPOR', 'SOPPY', 'SOPRA', 'SORAL', 'SORAS', 'SORBI', 'SORBO', 'SORBS', 'SORDA', 'SORDO', 'SORDS', 'SORED', 'SOREE', 'SOREL', 'SORER', 'SORES', 'SOREX', 'SORGO', 'SORNS', 'SORRA', 'SORTA', 'SORTS', 'SORUS', 'SOTHS', 'SOTOL', 'SOTTO', 'SOUCE', 'SOUCT', 'SOUGH', 'SOUKS', 'SOULS', 'SOULY', 'SOUMS', 'SOUPS', 'SOUPY', 'SOURS', 'SOUSE', 'SOUTS', 'SOWAR', 'SOWCE', 'SOWED', 'SOWFF', 'SOWFS', 'SOWLE', 'SOWLS', 'SOWMS', 'SOWND', 'SOWNE', 'SOWPS', 'SOWSE', 'SOWTH', 'SOXES', 'SOYAS', 'SOYLE', 'SOYUZ', 'SOZIN', 'SPACK', 'SPACY', 'SPADO', 'SPADS', 'SPAED', 'SPAER', 'SPAES', 'SPAGS', 'SPAHI', 'SPAIL', 'SPAIN', 'SPAIT', 'SPAKE', 'SPALD', 'SPALE', 'SPALL', 'SPALT', 'SPAMS', 'SPANE', 'SPANG', 'SPANS', 'SPARD', 'SPARS', 'SPART', 'SPATE', 'SPATS', 'SPAUL', 'SPAWL', 'SPAWS', 'SPAYD', 'SPAYS', 'SPAZA', 'SPAZZ', 'SPEAL', 'SPEAN', 'SPEAT', 'SPECS', 'SPECT', 'SPEEL', 'SPEER', 'SPEIL', 'SPEIR', 'SPEKS', 'SPELD', 'SPELK', 'SPEOS', 'SPESH', 'SPETS', 'SPEUG', 'SPEWS', 'SPEWY', 'SPIAL', 'SPICA', 'SPICK', 'SPICS', 'SPIDE', 'SPIER', 'SPIES', 'SPIFF', 'SPIFS', 'SPIKS', 'SPILE', 'SPIMS', 'SPINA', 'SPINK', 'SPINS', 'SPIRT', 'SPIRY', 'SPITS', 'SPITZ', 'SPIVS', 'SPLAY', 'SPLOG', 'SPODE', 'SPODS', 'SPOOM', 'SPOOR', 'SPOOT', 'SPORK', 'SPOSA', 'SPOSH', 'SPOSO', 'SPOTS', 'SPRAD', 'SPRAG', 'SPRAT', 'SPRED', 'SPREW', 'SPRIT', 'SPROD', 'SPROG', 'SPRUE', 'SPRUG', 'SPUDS', 'SPUED', 'SPUER', 'SPUES', 'SPUGS', 'SPULE', 'SPUME', 'SPUMY', 'SPURS', 'SPUTA', 'SPYAL', 'SPYRE', 'SQUAB', 'SQUAW', 'SQUEE', 'SQUEG', 'SQUID', 'SQUIT', 'SQUIZ', 'SRSLY', 'STABS', 'STADE', 'STAGS', 'STAGY', 'STAIG', 'STANE', 'STANG', 'STANS', 'STAPH', 'STAPS', 'STARN', 'STARR', 'STARS', 'STARY', 'STATS', 'STATU', 'STAUN', 'STAWS', 'STAYS', 'STEAN', 'STEAR', 'STEDD', 'STEDE', 'STEDS', 'STEEK', 'STEEM', 'STEEN', 'STEEZ', 'STEIK', 'STEIL', 'STELA', 'STELE', 'STELL', 'STEME', 'STEMS', 'STEND', 'STENO', 'STENS', 'STENT', 'STEPS', 'STEPT', 'STERE', 'STETS', 'STEWS', 'STEWY', 'STEYS', 'STICH', 'STIED', 'STIES', 'STILB', 'STILE', 'STIME', 'STIMS', 'STIMY', 'STIPA', 'STIPE', 'STIRE', 'STIRK', 'STIRP', 'STIRS', 'STIVE', 'STIVY', 'STOAE', 'STOAI', 'STOAS', 'STOAT', 'STOBS', 'STOEP', 'STOGS', 'STOGY', 'STOIT', 'STOLN', 'STOMA', 'STOND', 'STONG', 'STONK', 'STONN', 'STOOK', 'STOOR', 'STOPE', 'STOPS', 'STOPT', 'STOSS', 'STOTS', 'STOTT', 'STOUN', 'STOUP', 'STOUR', 'STOWN', 'STOWP', 'STOWS', 'STRAD', 'STRAE', 'STRAG', 'STRAK', 'STREP', 'STREW', 'STRIA', 'STRIG', 'STRIM', 'STROP', 'STROW', 'STROY', 'STRUM', 'STUBS', 'STUCS', 'STUDE', 'STUDS', 'STULL', 'STULM', 'STUMM', 'STUMS', 'STUNS', 'STUPA', 'STUPE', 'STURE', 'STURT', 'STUSH', 'STYED', 'STYES', 'STYLI', 'STYLO', 'STYME', 'STYMY', 'STYRE', 'STYTE', 'SUBAH', 'SUBAK', 'SUBAS', 'SUBBY', 'SUBER', 'SUBHA', 'SUCCI', 'SUCKS', 'SUCKY', 'SUCRE', 'SUDAN', 'SUDDS', 'SUDOR', 'SUDSY', 'SUEDE', 'SUENT', 'SUERS', 'SUETE', 'SUETS', 'SUETY', 'SUGAN', 'SUGHS', 'SUGOS', 'SUHUR', 'SUIDS', 'SUINT', 'SUITS', 'SUJEE', 'SUKHS', 'SUKIS', 'SUKUK', 'SULCI', 'SULFA', 'SULFO', 'SULKS', 'SULLS', 'SULPH', 'SULUS', 'SUMIS', 'SUMMA', 'SUMOS', 'SUMPH', 'SUMPS', 'SUNIS', 'SUNKS', 'SUNNA', 'SUNNS', 'SUNTS', 'SUNUP', 'SUONA', 'SUPED', 'SUPES', 'SUPRA', 'SURAH', 'SURAL', 'SURAS', 'SURAT', 'SURDS', 'SURED', 'SURES', 'SURFS', 'SURFY', 'SURGY', 'SURRA', 'SUSED', 'SUSES', 'SUSUS', 'SUTOR', 'SUTRA', 'SUTTA', 'SWABS', 'SWACK', 'SWADS', 'SWAGE', 'SWAGS', 'SWAIL', 'SWAIN', 'SWALE', 'SWALY', 'SWAMY', 'SWANG', 'SWANK', 'SWANS', 'SWAPS', 'SWAPT', 'SWARD', 'SWARE', 'SWARF', 'SWART', 'SWATS', 'SWAYL', 'SWAYS', 'SWEAL', 'SWEDE', 'SWEED', 'SWEEL', 'SWEER', 'SWEES', 'SWEIR', 'SWELT', 'SWERF', 'SWEYS', 'SWIES', 'SWIGS', 'SWILE', 'SWIMS', 'SWINK', 'SWIPE', 'SWIRE', 'SWISS', 'SWITH', 'SWITS', 'SWIVE', 'SWIZZ', 'SWOBS', 'SWOLE', 'SWOLL', 'SWOLN', 'SWOPS', 'SWOPT', 'SWOTS', 'SWOUN', 'SYBBE', 'SYBIL', 'SYBOE', 'SYBOW', 'SYCEE', 'SYCES', 'SYCON', 'SYEDS', 'SYENS', 'SYKER', 'SYKES', 'SYLIS', 'SYLPH', 'SYLVA', 'SYMAR', 'SYNCH', 'SYNCS', 'SYNDS', 'SYNED', 'SYNES', 'SYNTH', 'SYPED', 'SYPES', 'SYPHS', 'SYRAH', 'SYREN', 'SYSOP', 'SYTHE', 'SYVER', 'TAALS', 'TAATA', 'TABAC', 'TABER', 'TABES', 'TABID', 'TABIS', 'TABLA', 'TABLS', 'TABOR', 'TABOS', 'TABUN', 'TABUS', 'TACAN', 'TACES', 'TACET', 'TACHE', 'TACHI', 'TACHO', 'TACHS', 'TACKS', 'TACOS', 'TACTS', 'TADAH', 'TAELS', 'TAFIA', 'TAGGY', 'TAGMA', 'TAGUA', 'TAHAS', 'TAHRS', 'TAIGA', 'TAIGS', 'TAIKO', 'TAILS', 'TAINS', 'TAIRA', 'TAISH', 'TAITS', 'TAJES', 'TAKAS', 'TAKES', 'TAKHI', 'TAKHT', 'TAKIN', 'TAKIS', 'TAKKY', 'TALAK', 'TALAQ', 'TALAR', 'TALAS', 'TALCS', 'TALCY', 'TALEA', 'TALER', 'TALES', 'TALIK', 'TALKS', 'TALKY', 'TALLS', 'TALMA', 'TALPA', 'TALUK', 'TALUS', 'TAMAL', 'TAMAS', 'TAMED', 'TAMES', 'TAMIN', 'TAMIS', 'TAMMY', 'TAMPS', 'TANAS', 'TANGA', 'TANGI', 'TANGS', 'TANHS', 'TANIA', 'TANKA', 'TANKS', 'TANKY', 'TANNA', 'TANSU', 'TANSY', 'TANTE', 'TANTI', 'TANTO', 'TANTY', 'TAPAS', 'TAPED', 'TAPEN', 'TAPES', 'TAPET', 'TAPIS', 'TAPPA', 'TAPUS', 'TARAS', 'TARDO', 'TARDS', 'TARED', 'TARES', 'TARGA', 'TARGE', 'TARKA', 'TARNS', 'TAROC', 'TAROK', 'TAROS', 'TARPS', 'TARRE', 'TARRY', 'TARSE', 'TARSI', 'TARTE', 'TARTS', 'TARTY', 'TARZY', 'TASAR', 'TASCA', 'TASED', 'TASER', 'TASES', 'TASKS', 'TASSA', 'TASSE', 'TASSO', 'TASTO', 'TATAR', 'TATER', 'TATES', 'TATHS', 'TATIE', 'TATOU', 'TATTS', 'TATUS', 'TAUBE', 'TAULD', 'TAUON', 'TAUPE', 'TAUTS', 'TAUTY', 'TAVAH', 'TAVAS', 'TAVER', 'TAWAF', 'TAWAI', 'TAWAS', 'TAWED', 'TAWER', 'TAWIE', 'TAWSE', 'TAWTS', 'TAXED', 'TAXER', 'TAXES', 'TAXIS', 'TAXOL', 'TAXON', 'TAXOR', 'TAXUS', 'TAYRA', 'TAZZA', 'TAZZE', 'TEADE', 'TEADS', 'TEAED', 'TEAKS', 'TEALS', 'TEAMS', 'TEARS', 'TEATS', 'TEAZE', 'TECHS', 'TECHY', 'TECTA', 'TECUM', 'TEELS', 'TEEMS', 'TEEND', 'TEENE', 'TEENS', 'TEENY', 'TEERS', 'TEETS', 'TEFFS', 'TEGGS', 'TEGUA', 'TEGUS', 'TEHEE', 'TEHRS', 'TEIID', 'TEILS', 'TEIND', 'TEINS', 'TEKKE', 'TELAE', 'TELCO', 'TELES', 'TELEX', 'TELIA', 'TELIC', 'TELLS', 'TELLY', 'TELOI', 'TELOS', 'TEMED', 'TEMES', 'TEMPI', 'TEMPS', 'TEMPT', 'TEMSE', 'TENCH', 'TENDS', 'TENDU', 'TENES', 'TENGE', 'TENIA', 'TENNE', 'TENNO', 'TENNY', 'TENON', 'TENTS', 'TENTY', 'TENUE', 'TEPAL', 'TEPAS', 'TEPOY', 'TERAI', 'TERAS', 'TERCE', 'TEREK', 'TERES', 'TERFE', 'TERFS', 'TERGA', 'TERMS', 'TERNE', 'TERNS', 'TERRE', 'TERRY', 'TERTS', 'TERZA', 'TESLA', 'TESTA', 'TESTE', 'TESTS', 'TETES', 'TETHS', 'TETRA', 'TETRI', 'TEUCH', 'TEUGH', 'TEWED', 'TEWEL', 'TEWIT', 'TEXAS', 'TEXES', 'TEXTA', 'TEXTS', 'THACK', 'THAGI', 'THAIM', 'THALE', 'THALI', 'THANA', 'THANE', 'THANG', 'THANS', 'THANX', 'THARM', 'THARS', 'THAWS', 'THAWT', 'THAWY', 'THEBE', 'THECA', 'THEED', 'THEEK', 'THEES', 'THEGN', 'THEIC', 'THEIN', 'THELF', 'THEMA', 'THENS', 'THEOR', 'THEOW', 'THERM', 'THESP', 'THETE', 'THEWS', 'THEWY', 'THIGS', 'THILK', 'THILL', 'THINE', 'THINS', 'THIOL', 'THIRL', 'THOFT', 'THOLE', 'THOLI', 'THORO', 'THORP', 'THOTS', 'THOUS', 'THOWL', 'THRAE', 'THRAW', 'THRID', 'THRIP', 'THROE', 'THUDS', 'THUGS', 'THUJA', 'THUNK', 'THURL', 'THUYA', 'THYMI', 'THYMY', 'TIANS', 'TIARE', 'TIARS', 'TICAL', 'TICCA', 'TICED', 'TICES', 'TICHY', 'TICKS', 'TICKY', 'TIDDY', 'TIDED', 'TIDES', 'TIEFS', 'TIERS', 'TIFFS', 'TIFOS', 'TIFTS', 'TIGES', 'TIGON', 'TIKAS', 'TIKES', 'TIKIA', 'TIKIS', 'TIKKA', 'TILAK', 'TILED', 'TILER', 'TILES', 'TILLS', 'TILLY', 'TILTH', 'TILTS', 'TIMBO', 'TIMED', 'TIMES', 'TIMON', 'TIMPS', 'TINAS', 'TINCT', 'TINDS', 'TINEA', 'TINED', 'TINES', 'TINGE', 'TINGS', 'TINKS', 'TINNY', 'TINTO', 'TINTS', 'TINTY', 'TIPIS', 'TIPPY', 'TIPUP', 'TIRED', 'TIRES', 'TIRLS', 'TIROS', 'TIRRS', 'TIRTH', 'TITAR', 'TITAS', 'TITCH', 'TITER', 'TITHI', 'TITIN', 'TITIR', 'TITIS', 'TITRE', 'TITTY', 'TITUP', 'TIYIN', 'TIYNS', 'TIZES', 'TIZZY', 'TOADS', 'TOADY', 'TOAZE', 'TOCKS', 'TOCKY', 'TOCOS', 'TODDE', 'TODEA', 'TODOS', 'TOEAS', 'TOFFS', 'TOFFY', 'TOFTS', 'TOFUS', 'TOGAE', 'TOGAS', 'TOGED', 'TOGES', 'TOGUE', 'TOHOS', 'TOIDY', 'TOILE', 'TOILS', 'TOING', 'TOISE', 'TOITS', 'TOITY', 'TOKAY', 'TOKED', 'TOKER', 'TOKES', 'TOKOS', 'TOLAN', 'TOLAR', 'TOLAS', 'TOLED', 'TOLES', 'TOLLS', 'TOLLY', 'TOLTS', 'TOLUS', 'TOLYL', 'TOMAN', 'TOMBO', 'TOMBS', 'TOMEN', 'TOMES', 'TOMIA', 'TOMIN', 'TOMME', 'TOMMY', 'TOMOS', 'TOMOZ', 'TONDI', 'TONDO', 'TONED', 'TONER', 'TONES', 'TONEY', 'TONGS', 'TONKA', 'TONKS', 'TONNE', 'TONUS', 'TOOLS', 'TOOMS', 'TOONS', 'TOOTS', 'TOPED', 'TOPEE', 'TOPEK', 'TOPER', 'TOPES', 'TOPHE', 'TOPHI', 'TOPHS', 'TOPIS', 'TOPOI', 'TOPOS', 'TOPPY', 'TOQUE', 'TORAH', 'TORAN', 'TORAS', 'TORCS', 'TORES', 'TORIC', 'TORII', 'TOROS', 'TOROT', 'TORRS', 'TORSE', 'TORSI', 'TORSK', 'TORTA', 'TORTE', 'TORTS', 'TOSAS', 'TOSED', 'TOSES', 'TOSHY', 'TOSSY', 'TOSYL', 'TOTED', 'TOTER', 'TOTES', 'TOTTY', 'TOUKS', 'TOUNS', 'TOURS', 'TOUSE', 'TOUSY', 'TOUTS', 'TOUZE', 'TOUZY', 'TOWAI', 'TOWED', 'TOWIE', 'TOWNO', 'TOWNS', 'TOWNY', 'TOWSE', 'TOWSY', 'TOWTS', 'TOWZE', 'TOWZY', 'TOYED', 'TOYER', 'TOYON', 'TOYOS', 'TOZED', 'TOZES', 'TOZIE', 'TRABS', 'TRADS', 'TRADY', 'TRAGA', 'TRAGI', 'TRAGS', 'TRAGU', 'TRAIK', 'TRAMS', 'TRANK', 'TRANQ', 'TRANS', 'TRANT', 'TRAPE', 'TRAPO', 'TRAPS', 'TRAPT', 'TRASS', 'TRATS', 'TRATT', 'TRAVE', 'TRAYF', 'TRAYS', 'TRECK', 'TREED', 'TREEN', 'TREES', 'TREFA', 'TREIF', 'TREKS', 'TREMA', 'TREMS', 'TRESS', 'TREST', 'TRETS', 'TREWS', 'TREYF', 'TREYS', 'TRIAC', 'TRIDE', 'TRIER', 'TRIES', 'TRIFA', 'TRIFF', 'TRIGO', 'TRIGS', 'TRIKE', 'TRILD', 'TRILL', 'TRIMS', 'TRINE', 'TRINS', 'TRIOL', 'TRIOR', 'TRIOS', 'TRIPS', 'TRIPY', 'TRIST', 'TROAD', 'TROAK', 'TROAT', 'TROCK', 'TRODE', 'TRODS', 'TROGS', 'TROIS', 'TROKE', 'TROMP', 'TRONA', 'TRONC', 'TRONE', 'TRONK', 'TRONS', 'TROOZ', 'TROPO', 'TROTH', 'TROTS', 'TROWS', 'TROYS', 'TRUED', 'TRUES', 'TRUGO', 'TRUGS', 'TRULL', 'TRYER', 'TRYKE', 'TRYMA', 'TRYPS', 'TSADE', 'TSADI', 'TSARS', 'TSKED', 'TSUBA', 'TSUBO', 'TUANS', 'TUART', 'TUATH', 'TUBAE', 'TUBAR', 'TUBAS', 'TUBBY', 'TUBED', 'TUBES', 'TUCKS', 'TUFAS', 'TUFFE', 'TUFFS', 'TUFTS', 'TUFTY', 'TUGRA', 'TUILE', 'TUINA', 'TUISM', 'TUKTU', 'TULES', 'TULPA', 'TULPS', 'TULSI', 'TUMID', 'TUMMY', 'TUMPS', 'TUMPY', 'TUNAS', 'TUNDS', 'TUNED', 'TUNER', 'TUNES', 'TUNGS', 'TUNNY', 'TUPEK', 'TUPIK', 'TUPLE', 'TUQUE', 'TURDS', 'TURFS', 'TURFY', 'TURKS', 'TURME', 'TURMS', 'TURNS', 'TURNT', 'TURON', 'TURPS', 'TURRS', 'TUSHY', 'TUSKS', 'TUSKY', 'TUTEE', 'TUTES', 'TUTTI', 'TUTTY', 'TUTUS', 'TUXES', 'TUYER', 'TWAES', 'TWAIN', 'TWALS', 'TWANK', 'TWATS', 'TWAYS', 'TWEEL', 'TWEEN', 'TWEEP', 'TWEER', 'TWERK', 'TWERP', 'TWIER', 'TWIGS', 'TWILL', 'TWILT', 'TWINK', 'TWINS', 'TWINY', 'TWIRE', 'TWIRK', 'TWIRP', 'TWITE', 'TWITS', 'TWOCS', 'TWOER', 'TWONK', 'TWYER', 'TYEES', 'TYERS', 'TYIYN', 'TYKES', 'TYLER', 'TYMPS', 'TYNDE', 'TYNED', 'TYNES', 'TYPAL', 'TYPED', 'TYPES', 'TYPEY', 'TYPIC', 'TYPOS', 'TYPPS', 'TYPTO', 'TYRAN', 'TYRED', 'TYRES', 'TYROS', 'TYTHE', 'TZARS', 'UBACS', 'UBITY', 'UDALS', 'UDONS', 'UDYOG', 'UGALI', 'UGGED', 'UHLAN', 'UHURU', 'UKASE', 'ULAMA', 'ULANS', 'ULEMA', 'ULMIN', 'ULMOS', 'ULNAD', 'ULNAE', 'ULNAR', 'ULNAS', 'ULPAN', 'ULVAS', 'ULYIE', 'ULZIE', 'UMAMI', 'UMBEL', 'UMBER', 'UMBLE', 'UMBOS', 'UMBRE', 'UMIAC', 'UMIAK', 'UMIAQ', 'UMMAH', 'UMMAS', 'UMMED', 'UMPED', 'UMPHS', 'UMPIE', 'UMPTY', 'UMRAH', 'UMRAS', 'UNAGI', 'UNAIS', 'UNAPT', 'UNARM', 'UNARY', 'UNAUS', 'UNBAG', 'UNBAN', 'UNBAR', 'UNBED', 'UNBID', 'UNBOX', 'UNCAP', 'UNCES', 'UNCIA', 'UNCOS', 'UNCOY', 'UNCUS', 'UNDAM', 'UNDEE', 'UNDOS', 'UNDUG', 'UNETH', 'UNFIX', 'UNGAG', 'UNGET', 'UNGOD', 'UNGOT', 'UNGUM', 'UNHAT', 'UNHIP', 'UNICA', 'UNIOS', 'UNITS', 'UNJAM', 'UNKED', 'UNKET', 'UNKEY', 'UNKID', 'UNKUT', 'UNLAP', 'UNLAW', 'UNLAY', 'UNLED', 'UNLEG', 'UNLET', 'UNLID', 'UNMAD', 'UNMAN', 'UNMEW', 'UNMIX', 'UNODE', 'UNOLD', 'UNOWN', 'UNPAY', 'UNPEG', 'UNPEN', 'UNPIN', 'UNPLY', 'UNPOT', 'UNPUT', 'UNRED', 'UNRID', 'UNRIG', 'UNRIP', 'UNSAW', 'UNSAY', 'UNSEE', 'UNSEW', 'UNSEX', 'UNSOD', 'UNSUB', 'UNTAG', 'UNTAX', 'UNTIN', 'UNWET', 'UNWIT', 'UNWON', 'UPBOW', 'UPBYE', 'UPDOS', 'UPDRY', 'UPEND', 'UPFUL', 'UPJET', 'UPLAY', 'UPLED', 'UPLIT', 'UPPED', 'UPRAN', 'UPRUN', 'UPSEE', 'UPSEY', 'UPTAK', 'UPTER', 'UPTIE', 'URAEI', 'URALI', 'URAOS', 'URARE', 'URARI', 'URASE', 'URATE', 'URBEX', 'URBIA', 'URDEE', 'UREAL', 'UREAS', 'UREDO', 'UREIC', 'UREID', 'URENA', 'URENT', 'URGED', 'URGER', 'URGES', 'URIAL', 'URITE', 'URMAN', 'URNAL', 'URNED', 'URPED', 'URSAE', 'URSID', 'URSON', 'URUBU', 'URUPA', 'URVAS', 'USENS', 'USERS', 'USETA', 'USNEA', 'USNIC', 'USQUE', 'USTAD', 'USTER', 'USURE', 'USURY', 'UTERI', 'UTERO', 'UVEAL', 'UVEAS', 'UVULA', 'VACAS', 'VACAY', 'VACUA', 'VACUI', 'VACUO', 'VADAS', 'VADED', 'VADES', 'VADGE', 'VAGAL', 'VAGUS', 'VAIDS', 'VAILS', 'VAIRE', 'VAIRS', 'VAIRY', 'VAJRA', 'VAKAS', 'VAKIL', 'VALES', 'VALIS', 'VALLI', 'VALSE', 'VAMPS', 'VAMPY', 'VANDA', 'VANED', 'VANES', 'VANGA', 'VANGS', 'VANTS', 'VAPED', 'VAPER', 'VAPES', 'VARAN', 'VARAS', 'VARDA', 'VARDO', 'VARDY', 'VAREC', 'VARES', 'VARIA', 'VARIX', 'VARNA', 'VARUS', 'VARVE', 'VASAL', 'VASES', 'VASTS', 'VASTY', 'VATAS', 'VATHA', 'VATIC', 'VATJE', 'VATOS', 'VATUS', 'VAUCH', 'VAUTE', 'VAUTS', 'VAWTE', 'VAXES', 'VEALE', 'VEALS', 'VEALY', 'VEENA', 'VEEPS', 'VEERS', 'VEERY', 'VEGAS', 'VEGES', 'VEGGO', 'VEGIE', 'VEGOS', 'VEHME', 'VEILS', 'VEILY', 'VEINS', 'VEINY', 'VELAR', 'VELDS', 'VELDT', 'VELES', 'VELLS', 'VELUM', 'VENAE', 'VENAL', 'VENAS', 'VENDS', 'VENDU', 'VENEY', 'VENGE', 'VENIN', 'VENTI', 'VENTS', 'VENUS', 'VERBA', 'VERBS', 'VERDE', 'VERRA', 'VERRE', 'VERRY', 'VERSA', 'VERST', 'VERTE', 'VERTS', 'VERTU', 'VESPA', 'VESTA', 'VESTS', 'VETCH', 'VEUVE', 'VEVES', 'VEXED', 'VEXER', 'VEXES', 'VEXIL', 'VEZIR', 'VIALS', 'VIAND', 'VIBED', 'VIBES', 'VIBEX', 'VIBEY', 'VICED', 'VICES', 'VICHY', 'VICUS', 'VIERS', 'VIEUX', 'VIEWS', 'VIEWY', 'VIFDA', 'VIFFS', 'VIGAS', 'VIGIA', 'VILDE', 'VILER', 'VILLE', 'VILLI', 'VILLS', 'VIMEN', 'VINAL', 'VINAS', 'VINCA', 'VINED', 'VINER', 'VINES', 'VINEW', 'VINHO', 'VINIC', 'VINNY', 'VINOS', 'VINTS', 'VIOLD', 'VIOLS', 'VIRED', 'VIREO', 'VIRES', 'VIRGA', 'VIRGE', 'VIRGO', 'VIRID', 'VIRLS', 'VIRTU', 'VISAS', 'VISED', 'VISES', 'VISIE', 'VISNA', 'VISNE', 'VISON', 'VISTO', 'VITAE', 'VITAS', 'VITEX', 'VITRO', 'VITTA', 'VIVAS', 'VIVAT', 'VIVDA', 'VIVER', 'VIVES', 'VIVOS', 'VIVRE', 'VIZIR', 'VIZOR', 'VLAST', 'VLEIS', 'VLIES', 'VLOGS', 'VOARS', 'VOBLA', 'VOCAB', 'VOCES', 'VODDY', 'VODOU', 'VODUN', 'VOEMA', 'VOGIE', 'VOICI', 'VOIDS', 'VOILE', 'VOIPS', 'VOLAE', 'VOLAR', 'VOLED', 'VOLES', 'VOLET', 'VOLKE', 'VOLKS', 'VOLTA', 'VOLTE', 'VOLTI', 'VOLTS', 'VOLVA', 'VOLVE', 'VOMER', 'VOTED', 'VOTES', 'VOUGE', 'VOULU', 'VOWED', 'VOWER', 'VOXEL', 'VOXES', 'VOZHD', 'VRAIC', 'VRILS', 'VROOM', 'VROUS', 'VROUW', 'VROWS', 'VUGGS', 'VUGGY', 'VUGHS', 'VUGHY', 'VULGO', 'VULNS', 'VULVA', 'VUTTY', 'VYGIE', 'WAACS', 'WACKE', 'WACKO', 'WACKS', 'WADAS', 'WADDS', 'WADDY', 'WADED', 'WADER', 'WADES', 'WADGE', 'WADIS', 'WADTS', 'WAFFS', 'WAFTS', 'WAGED', 'WAGES', 'WAGGA', 'WAGYU', 'WAHAY', 'WAHEY', 'WAHOO', 'WAIDE', 'WAIFS', 'WAIFT', 'WAILS', 'WAINS', 'WAIRS', 'WAITE', 'WAITS', 'WAKAS', 'WAKED', 'WAKEN', 'WAKER', 'WAKES', 'WAKFS', 'WALDO', 'WALDS', 'WALED', 'WALER', 'WALES', 'WALIE', 'WALIS', 'WALKS', 'WALLA', 'WALLS', 'WALLY', 'WALTY', 'WAMED', 'WAMES', 'WAMUS', 'WANDS', 'WANED', 'WANES', 'WANEY', 'WANGS', 'WANKS', 'WANKY', 'WANLE', 'WANLY', 'WANNA', 'WANTA', 'WANTS', 'WANTY', 'WANZE', 'WAQFS', 'WARBS', 'WARBY', 'WARDS', 'WARED', 'WARES', 'WAREZ', 'WARKS', 'WARMS', 'WARNS', 'WARPS', 'WARRE', 'WARST', 'WARTS', 'WASES', 'WASHI', 'WASHY', 'WASMS', 'WASPS', 'WASPY', 'WASTS', 'WATAP', 'WATTS', 'WAUFF', 'WAUGH', 'WAUKS', 'WAULK', 'WAULS', 'WAURS', 'WAVED', 'WAVES', 'WAVEY', 'WAWAS', 'WAWES', 'WAWLS', 'WAXED', 'WAXER', 'WAXES', 'WAYED', 'WAZIR', 'WAZOO', 'WEALD', 'WEALS', 'WEAMB', 'WEANS', 'WEARS', 'WEBBY', 'WEBER', 'WECHT', 'WEDEL', 'WEDGY', 'WEEDS', 'WEEIS', 'WEEKE', 'WEEKS', 'WEELS', 'WEEMS', 'WEENS', 'WEENY', 'WEEPS', 'WEEPY', 'WEEST', 'WEETE', 'WEETS', 'WEFTE', 'WEFTS', 'WEIDS', 'WEILS', 'WEIRS', 'WEISE', 'WEIZE', 'WEKAS', 'WELDS', 'WELKE', 'WELKS', 'WELKT', 'WELLS', 'WELLY', 'WELTS', 'WEMBS', 'WENCH', 'WENDS', 'WENGE', 'WENNY', 'WENTS', 'WERFS', 'WEROS', 'WERSH', 'WESTS', 'WETAS', 'WETLY', 'WEXED', 'WEXES', 'WHAMO', 'WHAMS', 'WHANG', 'WHAPS', 'WHARE', 'WHATA', 'WHATS', 'WHAUP', 'WHAUR', 'WHEAL', 'WHEAR', 'WHEEK', 'WHEEN', 'WHEEP', 'WHEFT', 'WHELK', 'WHELM', 'WHENS', 'WHETS', 'WHEWS', 'WHEYS', 'WHIDS', 'WHIES', 'WHIFT', 'WHIGS', 'WHILK', 'WHIMS', 'WHINS', 'WHIOS', 'WHIPS', 'WHIPT', 'WHIRR', 'WHIRS', 'WHISH', 'WHISS', 'WHIST', 'WHITS', 'WHITY', 'WHIZZ', 'WHOMP', 'WHOOF', 'WHOOT', 'WHOPS', 'WHORE', 'WHORL', 'WHORT', 'WHOSO', 'WHOWS', 'WHUMP', 'WHUPS', 'WHYDA', 'WICCA', 'WICKS', 'WICKY', 'WIDDY', 'WIDES', 'WIELS', 'WIFED', 'WIFES', 'WIFEY', 'WIFIE', 'WIFTS', 'WIFTY', 'WIGAN', 'WIGGA', 'WIGGY', 'WIKIS', 'WILCO', 'WILDS', 'WILED', 'WILES', 'WILGA', 'WILIS', 'WILJA', 'WILLS', 'WILTS', 'WIMPS', 'WINDS', 'WINED', 'WINES', 'WINEY', 'WINGE', 'WINGS', 'WINGY', 'WINKS', 'WINKY', 'WINNA', 'WINNS', 'WINOS', 'WINZE', 'WIPED', 'WIPER', 'WIPES', 'WIRED', 'WIRER', 'WIRES', 'WIRRA', 'WIRRI', 'WISED', 'WISES', 'WISHA', 'WISHT', 'WISPS', 'WISTS', 'WITAN', 'WITED', 'WITES', 'WITHE', 'WITHS', 'WITHY', 'WIVED', 'WIVER', 'WIVES', 'WIZEN', 'WIZES', 'WIZZO', 'WOADS', 'WOADY', 'WOALD', 'WOCKS', 'WODGE', 'WODGY', 'WOFUL', 'WOJUS', 'WOKER', 'WOKKA', 'WOLDS', 'WOLFS', 'WOLLY', 'WOLVE', 'WOMAS', 'WOMBS', 'WOMBY', 'WOMYN', 'WONGA', 'WONGI', 'WONKS', 'WONKY', 'WONTS', 'WOODS', 'WOOED', 'WOOFS', 'WOOFY', 'WOOLD', 'WOOLS', 'WOONS', 'WOOPS', 'WOOPY', 'WOOSE', 'WOOSH', 'WOOTZ', 'WORDS', 'WORKS', 'WORKY', 'WORMS', 'WORMY', 'WORTS', 'WOWED', 'WOWEE', 'WOWSE', 'WOXEN', 'WRANG', 'WRAPS', 'WRAPT', 'WRAST', 'WRATE', 'WRAWL', 'WRENS', 'WRICK', 'WRIED', 'WRIER', 'WRIES', 'WRITS', 'WROKE', 'WROOT', 'WROTH', 'WRYER', 'WUDDY', 'WUDUS', 'WUFFS', 'WULLS', 'WUNGA', 'WURST', 'WUSES', 'WUSHU', 'WUSSY', 'WUXIA', 'WYLED', 'WYLES', 'WYNDS', 'WYNNS', 'WYTED', 'WYTES', 'WYTHE', 'XEBEC', 'XENIA', 'XENIC', 'XENON', 'XERIC', 'XEROX', 'XERUS', 'XOANA', 'XOLOS', 'XRAYS', 'XVIII', 'XYLAN', 'XYLEM', 'XYLIC', 'XYLOL', 'XYLYL', 'XYSTI', 'XYSTS', 'YAARS', 'YAASS', 'YABAS', 'YABBA', 'YABBY', 'YACCA', 'YACKA', 'YACKS', 'YADDA', 'YAFFS', 'YAGER', 'YAGES', 'YAGIS', 'YAGNA', 'YAHOO', 'YAIRD', 'YAJNA', 'YAKKA', 'YAKOW', 'YALES', 'YAMEN', 'YAMPA', 'YAMPY', 'YAMUN', 'YANDY', 'YANGS', 'YANKS', 'YAPOK', 'YAPON', 'YAPPS', 'YAPPY', 'YARAK', 'YARCO', 'YARDS', 'YARER', 'YARFA', 'YARKS', 'YARNS', 'YARRA', 'YARRS', 'YARTA', 'YARTO', 'YATES', 'YATRA', 'YAUDS', 'YAULD', 'YAUPS', 'YAWED', 'YAWEY', 'YAWLS', 'YAWNS', 'YAWNY', 'YAWPS', 'YAYAS', 'YBORE', 'YCLAD', 'YCLED', 'YCOND', 'YDRAD', 'YDRED', 'YEADS', 'YEAHS', 'YEALM', 'YEANS', 'YEARD', 'YEARS', 'YECCH', 'YECHS', 'YECHY', 'YEDES', 'YEEDS', 'YEEEK', 'YEESH', 'YEGGS', 'YELKS', 'YELLS', 'YELMS', 'YELPS', 'YELTS', 'YENTA', 'YENTE', 'YERBA', 'YERDS', 'YERKS', 'YESES', 'YESKS', 'YESTS', 'YESTY', 'YETIS', 'YETTS', 'YEUCH', 'YEUKS', 'YEUKY', 'YEVEN', 'YEVES', 'YEWEN', 'YEXED', 'YEXES', 'YFERE', 'YIKED', 'YIKES', 'YILLS', 'YINCE', 'YIPES', 'YIPPY', 'YIRDS', 'YIRKS', 'YIRRS', 'YIRTH', 'YITES', 'YITIE', 'YLEMS', 'YLIDE', 'YLIDS', 'YLIKE', 'YLKES', 'YMOLT', 'YMPES', 'YOBBO', 'YOBBY', 'YOCKS', 'YODEL', 'YODHS', 'YODLE', 'YOGAS', 'YOGEE', 'YOGHS', 'YOGIC', 'YOGIN', 'YOGIS', 'YOHAH', 'YOHAY', 'YOICK', 'YOJAN', 'YOKAN', 'YOKED', 'YOKEG', 'YOKEL', 'YOKER', 'YOKES', 'YOKUL', 'YOLKS', 'YOLKY', 'YOLPS', 'YOMIM', 'YOMPS', 'YONIC', 'YONIS', 'YONKS', 'YONNY', 'YOOFS', 'YOOPS', 'YOPOS', 'YOPPO', 'YORES', 'YORGA', 'YORKS', 'YORPS', 'YOUKS', 'YOURN', 'YOURS', 'YOURT', 'YOUSE', 'YOWED', 'YOWES', 'YOWIE', 'YOWLS', 'YOWSA', 'YOWZA', 'YOYOS', 'YRAPT', 'YRENT', 'YRIVD', 'YRNEH', 'YSAME', 'YTOST', 'YUANS', 'YUCAS', 'YUCCA', 'YUCCH', 'YUCKO', 'YUCKS', 'YUCKY', 'YUFTS', 'YUGAS', 'YUKED', 'YUKES', 'YUKKY', 'YUKOS', 'YULAN', 'YULES', 'YUMMO', 'YUMMY', 'YUMPS', 'YUPON', 'YUPPY', 'YURTA', 'YURTS', 'YUZUS', 'ZABRA', 'ZACKS', 'ZAIDA', 'ZAIDE', 'ZAIDY', 'ZAIRE', 'ZAKAT', 'ZAMAC', 'ZAMAK', 'ZAMAN', 'ZAMBO', 'ZAMIA', 'ZAMIS', 'ZANJA', 'ZANTE', 'ZANZA', 'ZANZE', 'ZAPPY', 'ZARDA', 'ZARFS', 'ZARIS', 'ZATIS', 'ZAWNS', 'ZAXES', 'ZAYDE', 'ZAYIN', 'ZAZEN', 'ZEALS', 'ZEBEC', 'ZEBUB', 'ZEBUS', 'ZEDAS', 'ZEERA', 'ZEINS', 'ZENDO', 'ZERDA', 'ZERKS', 'ZEROS', 'ZESTS', 'ZETAS', 'ZEXES', 'ZEZES', 'ZHOMO', 'ZHUSH', 'ZHUZH', 'ZIBET', 'ZIFFS', 'ZIGAN', 'ZIKRS', 'ZILAS', 'ZILCH', 'ZILLA', 'ZILLS', 'ZIMBI', 'ZIMBS', 'ZINCO', 'ZINCS', 'ZINCY', 'ZINEB', 'ZINES', 'ZINGS', 'ZINGY', 'ZINKE', 'ZINKY', 'ZINOS', 'ZIPPO', 'ZIPPY', 'ZIRAM', 'ZITIS', 'ZITTY', 'ZIZEL', 'ZIZIT', 'ZLOTE', 'ZLOTY', 'ZOAEA', 'ZOBOS', 'ZOBUS', 'ZOCCO', 'ZOEAE', 'ZOEAL', 'ZOEAS', 'ZOISM', 'ZOIST', 'ZOKOR', 'ZOLLE', 'ZOMBI', 'ZONAE', 'ZONDA', 'ZONED', 'ZONER', 'ZONES', 'ZONKS', 'ZOOEA', 'ZOOEY', 'ZOOID', 'ZOOKS', 'ZOOMS', 'ZOOMY', 'ZOONS', 'ZOOTY', 'ZOPPA', 'ZOPPO', 'ZORIL', 'ZORIS', 'ZORRO', 'ZORSE', 'ZOUKS', 'ZOWEE', 'ZOWIE', 'ZULUS', 'ZUPAN', 'ZUPAS', 'ZUPPA', 'ZURFS', 'ZUZIM', 'ZYGAL', 'ZYGON', 'ZYMES', 'ZYMIC'
-    )
+ALLOWED_GUESSES_EXCLUDING_ANSWERS_FILE_PATH = WORD_LISTS_DIRECTORY / 'allowed-guesses-excluding-solutions.bin'
+ALLOWED_GUESSES_EXCLUDING_ANSWERS = PackedWordList(ALLOWED_GUESSES_EXCLUDING_ANSWERS_FILE_PATH)
+# List of all valid (allowed) guesses -- i.e. both the allowed guesses that are not answers, and the answers
+# The index of each word in this list is used to identify it (eg. it is the word's row in the feedback matrix)
+ALL_GUESSES = PackedWordList(ALLOWED_GUESSES_EXCLUDING_ANSWERS_FILE_PATH, ANSWERS_FILE_PATH)
 
 # The strings that the user needs to enter to select these options
 CLASSICAL_ATTEMPT_OPTION = '1'
@@ -41,28 +226,141 @@ WRONG_LETTER_COLOUR = '🟥'
 # Used to indicate lack of feedback
 NO_FEEDBACK_COLOUR = '⬜'
 
-# Colour feedback string when the guess is correct (i.e. matches the answer)
-# Eg. Assuming word_length = 5 and RIGHT_LETTER_RIGHT_SPOT_COLOUR = '🟩': 
-#   '🟩🟩🟩🟩🟩'
-RIGHT_GUESS_FEEDBACK_STRING = WORD_LENGTH * RIGHT_LETTER_RIGHT_SPOT_COLOUR
-
 # Used as a placeholder for when the user hasn't made a guess yet
 NO_GUESS_STRING = WORD_LENGTH * '_'
 # "Blank" colour feedback string used to convey that we don't have any feedback yet
 NO_FEEDBACK_STRING = WORD_LENGTH * NO_FEEDBACK_COLOUR
 
+# Colour feedback can also be represented compactly as a single integer (feedback code), by treating the feedback for each letter of the guess as one base-3 digit
+# The digit for the 1st letter of the guess is the least significant digit
+# Eg. Assuming WORD_LENGTH = 5, feedback '🟥🟨🟥🟩🟨' = digits (0, 1, 0, 2, 1) = (0 * 3^0) + (1 * 3^1) + (0 * 3^2) + (2 * 3^3) + (1 * 3^4) = 3 + 54 + 81 = 138
+WRONG_LETTER_DIGIT = 0
+RIGHT_LETTER_WRONG_SPOT_DIGIT = 1
+RIGHT_LETTER_RIGHT_SPOT_DIGIT = 2
+# Maps each feedback digit to the colour feedback char it represents
+FEEDBACK_DIGIT_TO_COLOUR = (WRONG_LETTER_COLOUR, RIGHT_LETTER_WRONG_SPOT_COLOUR, RIGHT_LETTER_RIGHT_SPOT_COLOUR)
+# Number of possible feedback codes (0 to NUM_FEEDBACK_CODES - 1)
+# Eg. Assuming WORD_LENGTH = 5: 3^5 = 243
+NUM_FEEDBACK_CODES = 3 ** WORD_LENGTH
+# Feedback code when the guess is correct (i.e. every digit is RIGHT_LETTER_RIGHT_SPOT_DIGIT)
+# Eg. Assuming WORD_LENGTH = 5: 242
+RIGHT_GUESS_FEEDBACK_CODE = NUM_FEEDBACK_CODES - 1
+
+# Internally, feedback is always stored as a feedback code -- it is only converted to something displayable (a palette's feedback chars, one per letter) when printed
+# Maps each palette name to the chars for each feedback digit, in the same order as FEEDBACK_DIGIT_TO_COLOUR
+FEEDBACK_PALETTES = {
+    'emoji': FEEDBACK_DIGIT_TO_COLOUR,
+    # Same colours as Wordle's high contrast mode, which are easier to tell apart for colour-blind users
+    'colour_blind': ('⬛', '🟦', '🟧'),
+    'html': tuple(f'<span class="feedback-{feedback_class}"></span>' for feedback_class in ('wrong-letter', 'wrong-spot', 'right-spot')),
+}
+# Palette used to print feedback
+FEEDBACK_PALETTE_NAME = 'emoji'
+
+# File that the precomputed feedback matrix (feedback code for every guess/answer combination) is cached in, so that it only has to be built once
+FEEDBACK_MATRIX_FILE_PATH = CACHE_DIRECTORY / 'feedback-matrix.npy'
+# Saved next to the feedback matrix, and checked when loading it (see FeedbackMatrix). Must be increased whenever the way the matrix is built changes (eg. the feedback code encoding), so that matrices saved by older code are rebuilt rather than misread
+FEEDBACK_MATRIX_FORMAT_VERSION = 1
+
 # Char representing one space
 SPACE_CHAR = ' '
 
+# Number of guesses in each quantum attempt
+# Each quantum attempt is encoded on its own register of ceil(log2(NUM_GUESSES_IN_SUPERPOSITION)) qubits (see get_register_size()). If this is a power of 2, the register is put into superposition with H gates alone, so the game circuit stays Clifford (see USE_STABILIZER_FAST_PATH)
 NUM_GUESSES_IN_SUPERPOSITION = 2
 
-# Backend used to execute quantum circuits
-QUANTUM_BACKEND = Aer.get_backend('qasm_simulator')
+# Name of the backend used to execute quantum circuits (see QUANTUM_BACKEND_CLASSES for the available backends)
+# Can be overridden by setting the QUANTUM_WORDLE_BACKEND environment variable -- eg. headless servers and test runs can use 'os_entropy' to avoid loading Qiskit at all
+QUANTUM_BACKEND_NAME = os.environ.get('QUANTUM_WORDLE_BACKEND', 'aer_qasm')
+
+# Whether game circuits that only contain Clifford gates (see CLIFFORD_GATE_NAMES) are measured using the built-in stabilizer simulator (see StabilizerBackend) rather than QUANTUM_BACKEND
+# The stabilizer simulator takes time polynomial (rather than exponential) in the number of qubits, so it is much faster and isn't limited to ~30 qubits like the Qiskit simulators
+USE_STABILIZER_FAST_PATH = True
+
+# When measuring game circuits for many sessions at once (see MeasurementBatcher), measurement requests that arrive within this many seconds of each other are executed together in a single job, up to MEASUREMENT_BATCH_MAX_SIZE circuits per job
+MEASUREMENT_BATCH_WINDOW = 0.005
+MEASUREMENT_BATCH_MAX_SIZE = 256
+
+# Number of threads used to execute circuits and draw random numbers in the background, for callers that want a future rather than waiting for the result (see get_background_executor())
+BACKGROUND_EXECUTOR_NUM_THREADS = 4
+
+# Max number of compiled (transpiled) circuits that each Qiskit backend keeps cached. When the cache is full, the least recently used circuit is evicted
+COMPILED_CIRCUIT_CACHE_SIZE = 64
+
+# Self-play simulations (see run_simulation()) split the games into shards of this many games, each played by one worker process
+SIMULATION_SHARD_SIZE = 500
+# Backend used to measure game circuits in self-play simulations. Defaults to the fastest backend, since simulations play a huge number of games
+SIMULATION_BACKEND_NAME = 'os_entropy'
+
+# Number of worker processes used to score guesses for hints (see HintEngine)
+HINT_NUM_WORKERS = os.cpu_count() or 1
+# For quantum attempt hints, only pairs of this many of the best single guesses are scored
+HINT_PAIR_BEAM_WIDTH = 150
+
+# File that the precomputed classical strategy (see DecisionTree) is saved in, so that it only has to be built once
+DECISION_TREE_FILE_PATH = CACHE_DIRECTORY / 'decision-tree.npz'
+# Saved in the decision tree file, and checked when loading it. Must be increased whenever the way the tree is built or stored changes
+DECISION_TREE_FORMAT_VERSION = 1
+# Number of guesses tried at each node when building the decision tree (see DecisionTreeBuilder). Larger is closer to optimal, but slower to build
+DECISION_TREE_BEAM_WIDTH = 2
+
+# Address that the game server listens on (see run_server())
+SERVER_HOST = '127.0.0.1'
+SERVER_PORT = 8765
+# Number of threads that the game server uses for blocking work (eg. executing circuits), so that it never stalls the event loop
+SERVER_NUM_EXECUTOR_THREADS = 16
+# Number of most recent move latencies that the game server keeps for its latency report
+SERVER_LATENCY_MAX_SAMPLES = 100_000
+# Moves that can be made in a game on the game server (see GameServer.make_move())
+SERVER_MOVE_NAMES = ('classical', 'quantum', 'measure')
+# Name that the game server records the latency of unknown requests (eg. unknown paths or methods) under, so that clients can't create new latency entries at will
+SERVER_OTHER_ROUTE_NAME = 'other'
+# Whether the game server batches game circuit measurements from different games into shared jobs (see MeasurementBatcher)
+# Off by default: with the stabilizer fast path on (see USE_STABILIZER_FAST_PATH), every game circuit the game currently builds is measured by the stabilizer simulator without executing a job at all, so there is nothing to batch. Only worth turning on if non-Clifford circuits are measured on QUANTUM_BACKEND (eg. the fast path is off, or quantum attempts use a number of guesses that is not a power of 2)
+SERVER_BATCH_MEASUREMENTS = False
+
+# Whether to start warming up the quantum backend on a background thread as soon as this code is run (see start_warm_up())
+WARM_UP_ON_IMPORT = True
+
+# Random numbers are drawn from a pool (buffer) of random bits, generated by measuring a circuit of ENTROPY_POOL_NUM_QUBITS qubits (all in superposition) ENTROPY_POOL_NUM_SHOTS times in a single execution
+# Eg. 20 qubits * 256 shots = 5120 random bits per execution, which is enough for many games
+ENTROPY_POOL_NUM_QUBITS = 20
+ENTROPY_POOL_NUM_SHOTS = 256
+# When the number of random bits left in the pool drops below this, the pool is refilled in the background
+ENTROPY_POOL_REFILL_THRESHOLD = 1024
+
+# Rows of the keyboard shown below the board (see print_letter_usage())
+# Note that, for ease of use (based on user feedback), the letters are in "keyboard order" (the order in which letters are displayed on a computer keyboard), not alphabetical order!
+KEYBOARD_ROWS = ('QWERTYUIOP', 'ASDFGHJKL', 'ZXCVBNM')
+
+# Marks unused slots in a board (see create_board()). Larger than any guess index or feedback code
+BOARD_EMPTY_SLOT = 0xFFFF
+
+# Every session snapshot (see snapshot_session()) starts with these bytes, followed by the version of the snapshot format. The version must be increased whenever the format changes, so that old snapshots are rejected rather than misread
+SESSION_SNAPSHOT_MAGIC = b'QWSS'
+SESSION_SNAPSHOT_VERSION = 2
+# Snapshot header (little-endian): magic, version, max attempts, guesses per quantum attempt, next available attempt index, game status, number of classical attempts seen by the candidate tracker, answer index (in ALL_GUESSES), then the keyboard's used, green, yellow and absent letter bitmasks (see KeyboardState)
+SESSION_SNAPSHOT_HEADER_FORMAT = struct.Struct('<4sBBBBBBHIIII')
 
 # Text after this ANSI escape sequence is displayed in bold
 ANSI_ESCAPE_CODE_BOLD = '\033[1m'
 # Text after this ANSI escape sequence has its formatting reset to default
 ANSI_ESCAPE_CODE_RESET = '\033[0m'
+# Moves the cursor to the top left of the terminal and clears the whole screen
+ANSI_ESCAPE_CODE_CLEAR_SCREEN = '\033[H\033[2J'
+# Clears from the cursor to the end of the current line
+ANSI_ESCAPE_CODE_CLEAR_LINE = '\033[K'
+# Clears from the cursor to the end of the screen
+ANSI_ESCAPE_CODE_CLEAR_BELOW = '\033[J'
+# Matches any ANSI escape sequence of the form used above (eg. to work out how wide formatted text is when displayed)
+ANSI_ESCAPE_CODE_PATTERN = re.compile('\033\\[[0-9;]*[A-Za-z]')
+
+# How the game state is displayed: 'terminal' (only redraw changed lines, using ANSI escape sequences), 'notebook' (clear and replace the output of the Jupyter cell) or 'auto' (terminal if the output is an interactive terminal, notebook otherwise)
+RENDER_MODE = os.environ.get('QUANTUM_WORDLE_RENDER_MODE', 'auto')
+# Number of recently displayed game states whose frames are kept (see GameStateFrameCache)
+GAME_STATE_FRAME_CACHE_SIZE = 16
+# Number of terminal rows kept free below the game state for the menu, input prompts and messages (see TerminalRenderer)
+TERMINAL_RENDER_RESERVED_ROWS = 12
 
 
 class AttemptType(Enum):
@@ -71,19 +369,107 @@ class AttemptType(Enum):
     QUANTUM = auto()
 
 
+def create_board(max_attempts: int = MAX_ATTEMPTS, num_guesses_in_superposition: int = NUM_GUESSES_IN_SUPERPOSITION, empty_slot: int = BOARD_EMPTY_SLOT) -> array:
+    """Creates an empty board: one small, fixed-size array of 16-bit unsigned integers that stores every attempt of a game (used or not), each of which is a view into its own part of the board (see Attempt)
+    
+    Since the whole board is a flat sequence of numbers, it can also be used directly as a cheap key (see get_game_state_key()) or saved as is (see snapshot_session())
+    
+    Each attempt takes up (1 + (3 * num_guesses_in_superposition)) entries:
+        Attempt type (0 = unused, otherwise AttemptType value)
+        Guess index (in ALL_GUESSES) of each guess
+        Feedback code of each guess
+        Feedback codes in display order (quantum attempts only)
+    Slots that aren't used (eg. the extra guesses of a classical attempt) are set to empty_slot
+    Eg. For 6 attempts of up to 2 guesses each, the board is 42 entries (84 bytes)
+    """
+    attempt_size = 1 + (3 * num_guesses_in_superposition)
+    board = array('H', [empty_slot]) * (max_attempts * attempt_size)
+    # All attempts start off unused
+    for attempt_start in range(0, len(board), attempt_size):
+        board[attempt_start] = 0
+    return board
+
+
 class Attempt:
-    """Stores attempt data"""
+    """Stores attempt data
+    
+    Since a server may hold many game sessions at once, attempts are kept small: the data of every attempt of a game is stored in the game's board (see create_board()), and each attempt is just a view into its own part of the board (with no per-instance __dict__ -- see __slots__)
+    Guesses are stored as indices into ALL_GUESSES rather than as strings
+    """
 
-    def __init__(self, qubit_index: int, attempt_type: AttemptType = None):
-        # Keeps track of which qubit is used to encode which of this attempt's guesses should be used (starting at 0)
-        self.qubit_index: int = qubit_index
-        # Tells us whether this is a classical attempt or a quantum attempt
-        self.type: AttemptType = attempt_type
-        # Dictionary mapping each guess to colour feedback (clue) string indicating its correctness
-        # Contains the words guessed by the user in this attempt, in the order that they guessed them in
-        self.guess_to_feedback_dict = {}
-        # For quantum attempts (multiple guesses), we intentionally display the guess feedback strings in a random order, so it's not clear which guess each feedback string corresponds to. This list stores the feedback strings in the random order that they will be displayed in
-        self.feedback_display_list = None
+    __slots__ = ('board', 'board_start', 'num_guesses_in_superposition', 'qubit_indices')
+
+    # Attempt type stored as each value of an attempt's first board entry
+    _attempt_types_by_board_value = (None, *AttemptType)
+
+    def __init__(self, board: array = None, board_start: int = 0, num_guesses_in_superposition: int = NUM_GUESSES_IN_SUPERPOSITION, qubit_indices: list[int] = None):
+        # Board that this attempt is stored in, starting at index board_start. If not given, the attempt is stored in a (one attempt) board of its own
+        self.board: array = create_board(1, num_guesses_in_superposition) if board is None else board
+        self.board_start: int = board_start
+        self.num_guesses_in_superposition: int = num_guesses_in_superposition
+        # For quantum attempts, keeps track of which qubits (register) of the game circuit are used to encode which of this attempt's guesses should be used. Qubit qubit_indices[0] holds the least significant bit of the guess index
+        # Only allocated once the attempt is actually made (see encode_quantum_attempt()), so that classical and unused attempts don't take up any qubits
+        self.qubit_indices: list[int] = qubit_indices
+
+    def _get_values(self, values_position: int, empty_slot: int = BOARD_EMPTY_SLOT) -> tuple[int]:
+        """Returns the used slots of the attempt's guess indices (values_position = 0), feedback codes (1) or feedback display order (2). Used slots always come before unused ones"""
+        values_start = self.board_start + 1 + (values_position * self.num_guesses_in_superposition)
+        values = self.board[values_start:values_start + self.num_guesses_in_superposition]
+        if empty_slot in values:
+            values = values[:values.index(empty_slot)]
+        return tuple(values)
+
+    def _set_values(self, values_position: int, values: tuple[int], empty_slot: int = BOARD_EMPTY_SLOT) -> None:
+        """Reverse of _get_values(): Stores the given values at the start of their slots, marking any remaining slots as unused"""
+        if len(values) > self.num_guesses_in_superposition:
+            raise ValueError(f'Attempt only has room for {self.num_guesses_in_superposition} values, not {len(values)}')
+        values_start = self.board_start + 1 + (values_position * self.num_guesses_in_superposition)
+        for slot_index in range(self.num_guesses_in_superposition):
+            self.board[values_start + slot_index] = values[slot_index] if slot_index < len(values) else empty_slot
+
+    @property
+    def type(self) -> AttemptType:
+        """Tells us whether this is a classical attempt or a quantum attempt (None if the user hasn't made this attempt yet)"""
+        return self._attempt_types_by_board_value[self.board[self.board_start]]
+
+    @type.setter
+    def type(self, attempt_type: AttemptType) -> None:
+        self.board[self.board_start] = 0 if attempt_type is None else attempt_type.value
+
+    @property
+    def guess_indices(self) -> tuple[int]:
+        """Index (in ALL_GUESSES) of each word guessed by the user in this attempt, in the order that they guessed them in"""
+        return self._get_values(0)
+
+    @guess_indices.setter
+    def guess_indices(self, guess_indices: tuple[int]) -> None:
+        self._set_values(0, guess_indices)
+
+    @property
+    def feedback_codes(self) -> tuple[int]:
+        """Feedback (clue) code indicating the correctness of each guess (see get_guess_feedback_code()), in the same order as guess_indices"""
+        return self._get_values(1)
+
+    @feedback_codes.setter
+    def feedback_codes(self, feedback_codes: tuple[int]) -> None:
+        self._set_values(1, feedback_codes)
+
+    @property
+    def feedback_display_list(self) -> tuple[int]:
+        """For quantum attempts (multiple guesses), we intentionally display the guess feedback in a random order, so it's not clear which guess each feedback code corresponds to. This stores the feedback codes in the random order that they will be displayed in (None if no order has been chosen)"""
+        return self._get_values(2) or None
+
+    @feedback_display_list.setter
+    def feedback_display_list(self, feedback_display_list: tuple[int]) -> None:
+        self._set_values(2, feedback_display_list or ())
+
+    @property
+    def guesses(self) -> tuple[str]:
+        """Words guessed by the user in this attempt, in the order that they guessed them in
+        
+        NOTE: Decodes the words from guess_indices on every access, so is only meant for display -- anything that runs often (eg. every move) should use guess_indices instead
+        """
+        return tuple(ALL_GUESSES[guess_index] for guess_index in self.guess_indices)
 
 
 def apply_bold_text(text: str, ansi_escape_code_bold=ANSI_ESCAPE_CODE_BOLD, ansi_escape_code_reset=ANSI_ESCAPE_CODE_RESET) -> str:
@@ -100,21 +486,262 @@ def apply_bold_text(text: str, ansi_escape_code_bold=ANSI_ESCAPE_CODE_BOLD, ansi
     return f'{ansi_escape_code_bold}{text}{ansi_escape_code_reset}'
 
 
-def remove_bold_text(text: str, ansi_escape_code_bold=ANSI_ESCAPE_CODE_BOLD, ansi_escape_code_reset=ANSI_ESCAPE_CODE_RESET) -> str:
-    """Returns given text with any bold formatting removed
+def get_letters_mask(letters: str) -> int:
+    """Returns a bitmask of the given (upper case) letters, where bit 0 = 'A' and bit 25 = 'Z'
+    
+    Eg. 'CAB' -> 0b111 = 7
+    """
+    letters_mask = 0
+    for letter in letters:
+        letters_mask |= 1 << (ord(letter) - ord('A'))
+    return letters_mask
 
-    Input:
-        text: String whose bold formatting you want to be removed
-        ansi_escape_code_bold: ANSI escape sequence to add bold formatting to any following text
-        ansi_escape_code_reset: ANSI escape sequence to reset formatting for any following text
-        
-    Output:
-        Same input text, but without any bold formatting
+
+def letters_mask_to_string(letters_mask: int, keyboard_rows: tuple[str] = KEYBOARD_ROWS) -> str:
+    """Reverse of get_letters_mask(): Returns the letters in the bitmask, in keyboard order"""
+    return ''.join(letter for keyboard_row in keyboard_rows for letter in keyboard_row if letters_mask & (1 << (ord(letter) - ord('A'))))
+
+
+class KeyboardState:
+    """Keeps track of what is known about each letter of the keyboard, as a 26-bit mask per status (bit 0 = 'A', bit 25 = 'Z'), so that every update is a few bit operations
+    
+    Like Wordle, each letter the user has gotten feedback for has the most certain status seen so far: green (right letter, right spot) beats yellow (right letter, wrong spot), which beats absent (wrong letter)
+    Letters only get a colour from feedback the user actually knows -- i.e. not from quantum attempts that haven't been measured yet, even though their letters do count as used
+    """
+
+    __slots__ = ('used_mask', 'green_mask', 'yellow_mask', 'absent_mask')
+
+    def __init__(self):
+        # Letters that have been used in any guess so far
+        self.used_mask: int = 0
+        # Letters known to be in the answer, in at least one known spot
+        self.green_mask: int = 0
+        # Letters known to be in the answer, but not (yet) in any known spot
+        self.yellow_mask: int = 0
+        # Letters known not to be in the answer
+        self.absent_mask: int = 0
+
+    def add_guess(self, guess: str) -> None:
+        """Mark the letters of the guess as used"""
+        self.used_mask |= get_letters_mask(guess)
+
+    def add_feedback(self, guess: str, feedback_code: int) -> None:
+        """Update the letter colours using the (known) feedback for a guess"""
+        guess_green_mask = 0
+        guess_yellow_mask = 0
+        guess_wrong_mask = 0
+        # First letter of the guess is the least significant digit of the feedback code
+        for letter in guess:
+            feedback_code, feedback_digit = divmod(feedback_code, 3)
+            letter_bit = 1 << (ord(letter) - ord('A'))
+            if feedback_digit == RIGHT_LETTER_RIGHT_SPOT_DIGIT:
+                guess_green_mask |= letter_bit
+            elif feedback_digit == RIGHT_LETTER_WRONG_SPOT_DIGIT:
+                guess_yellow_mask |= letter_bit
+            else:
+                guess_wrong_mask |= letter_bit
+
+        self.green_mask |= guess_green_mask
+        self.yellow_mask = (self.yellow_mask | guess_yellow_mask) & ~self.green_mask
+        # A wrong letter is only absent from the answer if none of its other copies in the guess were green or yellow (eg. the second E of a guess, when the first E was yellow)
+        self.absent_mask |= guess_wrong_mask & ~(guess_green_mask | guess_yellow_mask | self.green_mask | self.yellow_mask)
+
+
+def build_keyboard_row_render_table(keyboard_row: str) -> dict[int, str]:
+    """Returns the display string of a keyboard row for every possible combination of used letters in that row, keyed by the used letters mask restricted to the row's letters (i.e. used_mask & get_letters_mask(keyboard_row))
+    
+    Unused letters are in bold, used letters are in lower case. Each letter is preceded by a space
+    Eg. 'ZXCVBNM' has 2^7 = 128 combinations
+    """
+    keyboard_row_render_table = {}
+    for used_positions in range(1 << len(keyboard_row)):
+        used_mask = 0
+        letter_strings = []
+        for position, letter in enumerate(keyboard_row):
+            if used_positions & (1 << position):
+                used_mask |= get_letters_mask(letter)
+                letter_strings.append(f' {letter.lower()}')
+            else:
+                letter_strings.append(f' {apply_bold_text(letter)}')
+        keyboard_row_render_table[used_mask] = sys.intern(''.join(letter_strings))
+    return keyboard_row_render_table
+
+
+# For each keyboard row: The mask of its letters, and its render table (see build_keyboard_row_render_table())
+KEYBOARD_ROW_RENDER_TABLES = tuple((get_letters_mask(keyboard_row), build_keyboard_row_render_table(keyboard_row)) for keyboard_row in KEYBOARD_ROWS)
+
+
+def render_keyboard_rows(used_mask: int, keyboard_row_render_tables: tuple = KEYBOARD_ROW_RENDER_TABLES) -> list[str]:
+    """Returns the display string of each keyboard row, given the mask of used letters"""
+    return [keyboard_row_render_table[used_mask & keyboard_row_mask] for keyboard_row_mask, keyboard_row_render_table in keyboard_row_render_tables]
+
+
+# Time taken (in seconds) by each startup step, in the order the steps first finished. Filled in by record_startup_time(), which only keeps the first measurement of each step
+STARTUP_TIMINGS: dict[str, float] = {}
+# Protects STARTUP_TIMINGS, since startup steps can run on the warm-up thread
+STARTUP_TIMINGS_LOCK = Lock()
+
+
+class record_startup_time:
+    """Context manager that measures how long the code inside it takes and records it in STARTUP_TIMINGS under the given step name
+    
+    Only the first measurement of each step is recorded: later runs of the same step (eg. warm_up() being called again for another game, when everything is already set up) would otherwise overwrite the real startup cost with a near-zero time
+    
+    Eg.
+        with record_startup_time('Qiskit import'):
+            import qiskit
     """
-    return text.removeprefix(ansi_escape_code_bold).removesuffix(ansi_escape_code_reset)
 
+    def __init__(self, step_name: str, startup_timings: dict[str, float] = STARTUP_TIMINGS):
+        self.step_name: str = step_name
+        self.startup_timings: dict[str, float] = startup_timings
+
+    def __enter__(self):
+        self.start_time = perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        with STARTUP_TIMINGS_LOCK:
+            self.startup_timings.setdefault(self.step_name, perf_counter() - self.start_time)
+
+
+def print_startup_time_report(startup_timings: dict[str, float] = STARTUP_TIMINGS) -> None:
+    """Print how long each startup step took. Steps that ran on the warm-up thread overlap with the other steps, so the times do not necessarily add up to the total startup time"""
+    print('Startup time:')
+    with STARTUP_TIMINGS_LOCK:
+        startup_timings = dict(startup_timings)
+    for step_name, duration in startup_timings.items():
+        print(f'  {step_name + ":":<35}{duration * 1000:>8.1f} ms')
+
+
+def is_running_in_notebook() -> bool:
+    """Returns whether this code is running in a Jupyter notebook (i.e. an IPython kernel), without importing IPython to find out"""
+    return 'ipykernel' in sys.modules
 
-def create_circuit(num_qubits: int, num_classical_bits: int = None) -> QuantumCircuit:
+
+@lru_cache(maxsize=None)
+def get_clear_output():
+    """Returns IPython's clear_output() function, only importing IPython the first time it's needed"""
+    with record_startup_time('IPython import'):
+        from IPython.display import clear_output
+    return clear_output
+
+
+@lru_cache(maxsize=None)
+def get_display():
+    """Returns IPython's display() function, only importing IPython the first time it's needed"""
+    with record_startup_time('IPython import'):
+        from IPython.display import display
+    return display
+
+
+@lru_cache(maxsize=None)
+def get_ipywidgets():
+    """Returns the ipywidgets module (used by NotebookGame), only importing it the first time it's needed"""
+    with record_startup_time('ipywidgets import'):
+        import ipywidgets
+    return ipywidgets
+
+
+@lru_cache(maxsize=None)
+def get_background_executor(num_threads: int = BACKGROUND_EXECUTOR_NUM_THREADS) -> ThreadPoolExecutor:
+    """Returns the thread pool that circuits are executed and random numbers are drawn on asynchronously (see QuantumBackend.run_async() and QuantumEntropyPool.get_random_number_async()), only creating it the first time it's needed"""
+    return ThreadPoolExecutor(max_workers=num_threads, thread_name_prefix='quantum-wordle-background')
+
+
+# Gates that map stabilizer states to stabilizer states, and thus can be simulated efficiently by the stabilizer simulator
+CLIFFORD_GATE_NAMES = frozenset({'h', 'x', 'cx'})
+
+
+class Circuit:
+    """Lightweight, backend-independent description of a quantum circuit
+    
+    Only records which gates are applied to which qubits -- each backend then decides how to actually run it (eg. by converting it to a Qiskit QuantumCircuit). This means that Qiskit is only needed if a Qiskit backend is used
+    Mirrors the subset of the Qiskit QuantumCircuit interface that we use
+    """
+
+    def __init__(self, num_qubits: int, num_classical_bits: int = None):
+        if num_classical_bits is None:
+            num_classical_bits = num_qubits
+        self.num_qubits: int = num_qubits
+        self.num_classical_bits: int = num_classical_bits
+        # Gates in the order they were applied. Each gate is stored as a tuple of its name, the qubits it acts on and its parameters (if any)
+        # Eg. [('h', (0,), ()), ('cx', (0, 1), ()), ('uniform', (2, 3), (3,))]
+        self.gates: list[tuple[str, tuple[int], tuple]] = []
+        # Whether all qubits are measured at the end of the circuit
+        self.measured: bool = False
+
+    def h(self, qubits) -> None:
+        """Apply Hadamard gate to the given qubit (or each of the given qubits)"""
+        for qubit in ([qubits] if isinstance(qubits, int) else qubits):
+            self.gates.append(('h', (qubit,), ()))
+
+    def x(self, qubits) -> None:
+        """Apply X (NOT) gate to the given qubit (or each of the given qubits)"""
+        for qubit in ([qubits] if isinstance(qubits, int) else qubits):
+            self.gates.append(('x', (qubit,), ()))
+
+    def cx(self, control_qubit: int, target_qubit: int) -> None:
+        """Apply CNOT gate to the given qubits"""
+        self.gates.append(('cx', (control_qubit, target_qubit), ()))
+
+    def prepare_uniform_superposition(self, qubits: list[int], num_states: int) -> None:
+        """Put the given qubits (register), which must still be in the |00...0> state, into an equal superposition of the basis states |0> to |num_states - 1>
+        
+        Qubit qubits[0] is the least significant bit of the basis state. Eg. qubits=[0, 1], num_states=3 -> (|00> + |01> + |10>) / sqrt(3)
+        If num_states is a power of 2, this is just an H gate on each qubit (which is Clifford). Otherwise, it is recorded as a single (non-Clifford) 'uniform' gate, which each backend prepares in its own way
+        """
+        if num_states == (1 << len(qubits)):
+            self.h(qubits)
+        else:
+            self.gates.append(('uniform', tuple(qubits), (num_states,)))
+
+    def add_qubits(self, num_qubits: int) -> list[int]:
+        """Add num_qubits new qubits (each with its own classical bit) to the circuit, returning their indices"""
+        new_qubits = list(range(self.num_qubits, self.num_qubits + num_qubits))
+        self.num_qubits += num_qubits
+        self.num_classical_bits += num_qubits
+        return new_qubits
+
+    def measure_all(self, add_bits: bool = True) -> None:
+        """Measure all qubits at the end of the circuit. Like Qiskit, qubit i is measured into classical bit i. Only add_bits=False is supported"""
+        if add_bits:
+            raise ValueError('Only add_bits=False is supported')
+        self.measured = True
+
+    def is_clifford(self, clifford_gate_names: frozenset = CLIFFORD_GATE_NAMES) -> bool:
+        """Returns whether the circuit only contains Clifford gates (and, thus, can be simulated by the stabilizer simulator)"""
+        return all(gate_name in clifford_gate_names for gate_name, _, _ in self.gates)
+
+    def get_shape(self) -> tuple:
+        """Returns a hashable description of everything that determines how the circuit executes (qubits, classical bits, gates and measurement)
+        
+        Two circuits with the same shape behave identically, so one circuit's compiled version can be reused for the other
+        """
+        return (self.num_qubits, self.num_classical_bits, tuple(self.gates), self.measured)
+
+    def to_qiskit(self):
+        """Converts circuit to an equivalent Qiskit QuantumCircuit"""
+        from qiskit import QuantumCircuit
+
+        qiskit_circuit = QuantumCircuit(self.num_qubits, self.num_classical_bits)
+        for gate_name, qubits, gate_params in self.gates:
+            if gate_name == 'uniform':
+                from qiskit.circuit.library import StatePreparation
+
+                # Like ours, Qiskit's amplitude order treats the first qubit as the least significant bit
+                num_states, = gate_params
+                num_register_states = 1 << len(qubits)
+                amplitudes = [(1 / num_states) ** 0.5 if state < num_states else 0 for state in range(num_register_states)]
+                qiskit_circuit.append(StatePreparation(amplitudes), list(qubits))
+            else:
+                getattr(qiskit_circuit, gate_name)(*qubits)
+        if self.measured:
+            qiskit_circuit.measure_all(add_bits=False)
+        return qiskit_circuit
+
+
+def create_circuit(num_qubits: int, num_classical_bits: int = None) -> Circuit:
     """Creates a quantum circuit
     
     Input:
@@ -124,86 +751,793 @@ def create_circuit(num_qubits: int, num_classical_bits: int = None) -> QuantumCi
     Output:
         Quantum circuit
     """
+    return Circuit(num_qubits, num_classical_bits)
+
+
+class QuantumBackend:
+    """Interface for a backend that can execute (or simulate) circuits"""
+
+    # Max number of qubits in a circuit that this backend can execute (None = no limit)
+    max_qubits: int = None
+
+    def run(self, circuit: Circuit, shots: int) -> list[str]:
+        """Executes the given circuit, which is assumed to measure all its qubits at the end
+        
+        Input:
+            circuit
+            shots: Number of times to execute the circuit
+
+        Output:
+            List containing the measured value of the qubits for each shot, as a string
+            Like Qiskit, the rightmost char of each string is the value of qubit 0
+            Eg. ['001101', '100100', ...]
+        """
+        raise NotImplementedError
+
+    def run_batch(self, circuits: list[Circuit], shots: int) -> list[list[str]]:
+        """Executes multiple circuits (as a single job, if the backend supports it)
+        
+        Output:
+            For each circuit, the list of measured values that run() would have returned
+        """
+        return [self.run(circuit, shots) for circuit in circuits]
+
+    def run_async(self, circuit: Circuit, shots: int, executor: ThreadPoolExecutor = None) -> Future:
+        """Starts executing the given circuit in the background (on executor, or the background executor if not given -- see get_background_executor()), without waiting for it to finish
+        
+        Output:
+            Future whose result will be the list of measured values that run() would have returned
+        """
+        if executor is None:
+            executor = get_background_executor()
+        return executor.submit(self.run, circuit, shots)
+
+    def warm_up(self) -> None:
+        """Does any slow, one-time setup (eg. importing libraries, creating the simulator) ahead of time, so that the first run() doesn't have to"""
+        pass
 
-    if num_classical_bits is None:
-        num_classical_bits = num_qubits
+
+class CompiledCircuitCache:
+    """Least recently used (LRU) cache of compiled circuits, keyed by circuit shape (see Circuit.get_shape())
     
-    return QuantumCircuit(num_qubits, num_classical_bits)
+    The game executes circuits with the same few shapes over and over (eg. H + measure on the same number of qubits), so compiling each shape once and reusing the result means repeat executions skip compilation entirely
+    """
 
+    def __init__(self, max_size: int = COMPILED_CIRCUIT_CACHE_SIZE):
+        self.max_size: int = max_size
+        # Ordered from least recently used to most recently used
+        self._compiled_circuits: OrderedDict = OrderedDict()
+        # Cache may be shared between threads (eg. warm-up thread, entropy pool refill thread)
+        self._lock = Lock()
+
+    def get(self, circuit: Circuit, compile_circuit):
+        """Returns the compiled version of the given circuit, only calling compile_circuit(circuit) if no circuit with the same shape has been compiled yet"""
+        circuit_shape = circuit.get_shape()
+        with self._lock:
+            if circuit_shape in self._compiled_circuits:
+                self._compiled_circuits.move_to_end(circuit_shape)
+                return self._compiled_circuits[circuit_shape]
+
+        # Compile outside the lock, so that other threads aren't blocked while we compile. Worst case, two threads compile the same shape at the same time and one result overwrites the other
+        compiled_circuit = compile_circuit(circuit)
+        with self._lock:
+            self._compiled_circuits[circuit_shape] = compiled_circuit
+            self._compiled_circuits.move_to_end(circuit_shape)
+            while len(self._compiled_circuits) > self.max_size:
+                # Evict least recently used
+                self._compiled_circuits.popitem(last=False)
+        return compiled_circuit
+
+
+class AerBackend(QuantumBackend):
+    """Executes circuits on a Qiskit Aer simulator. Qiskit is only imported (and the simulator only created) the first time a circuit is executed"""
+
+    # The simulators store the full statevector (2^n amplitudes), so memory use grows exponentially with the number of qubits
+    max_qubits: int = 30
+
+    def __init__(self, aer_backend_name: str):
+        self.aer_backend_name: str = aer_backend_name
+        self._aer_backend = None
+        # Makes sure the simulator is only created once, even if warm_up() is called from multiple threads at the same time
+        self._warm_up_lock = Lock()
+        # Circuits already compiled (transpiled) for this simulator
+        self._compiled_circuit_cache = CompiledCircuitCache()
+
+    def warm_up(self) -> None:
+        with self._warm_up_lock:
+            if self._aer_backend is None:
+                with record_startup_time('Qiskit import'):
+                    from qiskit import Aer
+                with record_startup_time('Backend init'):
+                    self._aer_backend = Aer.get_backend(self.aer_backend_name)
+
+    def _compile(self, circuit: Circuit):
+        """Converts the given circuit to a Qiskit circuit and transpiles it for this simulator"""
+        from qiskit import transpile
+
+        return transpile(circuit.to_qiskit(), backend=self._aer_backend)
+
+    def run(self, circuit: Circuit, shots: int) -> list[str]:
+        self.warm_up()
+        compiled_circuit = self._compiled_circuit_cache.get(circuit, self._compile)
+        # Unlike execute(), the simulator's run() does not transpile the circuit again
+        # Unlike get_counts(), which merges identical results together, memory=True lets us retrieve the individual result of every shot
+        job = self._aer_backend.run(compiled_circuit, shots=shots, memory=True)
+        return job.result().get_memory(compiled_circuit)
+
+    def run_batch(self, circuits: list[Circuit], shots: int) -> list[list[str]]:
+        self.warm_up()
+        compiled_circuits = [self._compiled_circuit_cache.get(circuit, self._compile) for circuit in circuits]
+        # Every circuit is executed in the same job, so the per-job overhead is only paid once
+        result = self._aer_backend.run(compiled_circuits, shots=shots, memory=True).result()
+        return [result.get_memory(circuit_index) for circuit_index in range(len(compiled_circuits))]
+
+
+class AerQasmBackend(AerBackend):
+    """Executes circuits on the Qiskit Aer QASM simulator"""
+
+    def __init__(self):
+        super().__init__('qasm_simulator')
+
+
+class AerStatevectorBackend(AerBackend):
+    """Executes circuits on the Qiskit Aer statevector simulator"""
+
+    def __init__(self):
+        super().__init__('aer_simulator_statevector')
+
+
+class NumpySamplerBackend(QuantumBackend):
+    """Simulates circuits using NumPy, by directly computing the statevector and then sampling from it. Does not need Qiskit"""
+
+    # Like the Aer simulators, but every gate copies the statevector, so keep it smaller
+    max_qubits: int = 20
+
+    def __init__(self, seed: int = None):
+        # If no seed is given, NumPy seeds the generator from OS entropy
+        self._random_generator = np.random.default_rng(seed)
+
+    def run(self, circuit: Circuit, shots: int) -> list[str]:
+        num_qubits = circuit.num_qubits
+
+        # Store the statevector as an n-dimensional array (one dimension of size 2 per qubit), so that a gate can be applied to one qubit by indexing along that qubit's dimension
+        # Like Qiskit, qubit 0 is the least significant bit of the basis state index -- i.e. it is the LAST dimension
+        statevector = np.zeros((2,) * num_qubits, dtype=complex)
+        # Start in the |00...0> state
+        statevector[(0,) * num_qubits] = 1
+        for gate_name, qubits, gate_params in circuit.gates:
+            axes = [num_qubits - 1 - qubit for qubit in qubits]
+            if gate_name == 'uniform':
+                # The register starts off in |00...0>, so the rest of the state is whatever is left when every register qubit is 0
+                num_states, = gate_params
+                rest_amplitudes = statevector[tuple(0 if axis in axes else slice(None) for axis in range(num_qubits))]
+                statevector = np.zeros_like(statevector)
+                for state in range(num_states):
+                    state_index = [slice(None)] * num_qubits
+                    for bit_position, axis in enumerate(axes):
+                        state_index[axis] = (state >> bit_position) & 1
+                    statevector[tuple(state_index)] = rest_amplitudes / np.sqrt(num_states)
+            elif gate_name == 'h':
+                zero_amplitudes = statevector.take(0, axis=axes[0])
+                one_amplitudes = statevector.take(1, axis=axes[0])
+                statevector = np.stack([zero_amplitudes + one_amplitudes, zero_amplitudes - one_amplitudes], axis=axes[0]) / np.sqrt(2)
+            elif gate_name == 'x':
+                statevector = np.flip(statevector, axis=axes[0])
+            elif gate_name == 'cx':
+                control_axis, target_axis = axes
+                # Flip the target qubit, but only in the part of the statevector where the control qubit is |1>
+                control_one_index = [slice(None)] * num_qubits
+                control_one_index[control_axis] = 1
+                control_one_index = tuple(control_one_index)
+                # Target axis number shifts down by 1 if the control axis (which is removed by indexing) comes before it
+                statevector[control_one_index] = np.flip(statevector[control_one_index], axis=(target_axis - (control_axis < target_axis)))
+            else:
+                raise ValueError(f'Unsupported gate: {gate_name}')
+
+        probabilities = np.abs(statevector.reshape(-1)) ** 2
+        measured_values = self._random_generator.choice(len(probabilities), size=shots, p=(probabilities / probabilities.sum()))
+        return [format(measured_value, f'0{num_qubits}b') for measured_value in measured_values]
+
+
+class OsEntropyBackend(QuantumBackend):
+    """Simulates circuits using the operating system's source of randomness, without any statevector simulation. Does not need Qiskit or NumPy
+    
+    Only supports circuits where the qubits are not entangled (i.e. circuits consisting of only single-qubit H and X gates, and uniform superpositions of registers), since each qubit (or register) is simulated separately
+    """
 
-def random_number_generator(max, quantum_backend=QUANTUM_BACKEND):
-    """Generates a random number from 0 to max (inclusive)"""
+    # State of a single (unentangled) qubit after each gate, ignoring global phase
+    # '0' = |0>, '1' = |1>, '+' = |+>, '-' = |->
+    _NEXT_QUBIT_STATE = {
+        'h': {'0': '+', '1': '-', '+': '0', '-': '1'},
+        'x': {'0': '1', '1': '0', '+': '+', '-': '-'},
+    }
+
+    def run(self, circuit: Circuit, shots: int) -> list[str]:
+        qubit_states = ['0'] * circuit.num_qubits
+        # Registers in a uniform superposition, each stored as a tuple of its qubits and its number of states. Each register is measured as a whole
+        uniform_registers = []
+        for gate_name, qubits, gate_params in circuit.gates:
+            if gate_name == 'uniform':
+                uniform_registers.append((qubits, gate_params[0]))
+                # 'u' = part of a register in a uniform superposition. No further gates are supported on it
+                for qubit in qubits:
+                    qubit_states[qubit] = 'u'
+                continue
+            if (gate_name not in self._NEXT_QUBIT_STATE) or (qubit_states[qubits[0]] == 'u'):
+                raise ValueError(f'Unsupported gate: {gate_name}')
+            qubit_states[qubits[0]] = self._NEXT_QUBIT_STATE[gate_name][qubit_states[qubits[0]]]
+
+        # Qubits in the |0> or |1> state always measure as that value, while qubits in the |+> or |-> state measure as 0 or 1 with equal probability
+        # Bit i of each mask refers to qubit i
+        superposition_mask = sum(1 << qubit for qubit, qubit_state in enumerate(qubit_states) if qubit_state in '+-')
+        one_mask = sum(1 << qubit for qubit, qubit_state in enumerate(qubit_states) if qubit_state == '1')
+
+        measured_values = []
+        for _ in range(shots):
+            measured_value = (secrets.randbits(circuit.num_qubits) & superposition_mask) | one_mask
+            for qubits, num_states in uniform_registers:
+                # Every one of the register's states is equally likely
+                register_value = secrets.randbelow(num_states)
+                for bit_position, qubit in enumerate(qubits):
+                    measured_value |= ((register_value >> bit_position) & 1) << qubit
+            measured_values.append(format(measured_value, f'0{circuit.num_qubits}b'))
+        return measured_values
+
+
+class StabilizerBackend(QuantumBackend):
+    """Simulates circuits containing only Clifford gates (see CLIFFORD_GATE_NAMES) using a stabilizer tableau, as described by Aaronson and Gottesman (https://arxiv.org/abs/quant-ph/0406196). Does not need Qiskit
+    
+    Rather than storing all 2^n amplitudes of the statevector, the state of n qubits is stored as the 2n Pauli operators (n destabilizers and n stabilizers) that describe it, which takes time and memory polynomial in n
+    Each Pauli operator (tableau row) is stored as two integers used as bit masks (bit i of x_bits/z_bits = X/Z component on qubit i) and a sign (phase) bit
+    """
 
-    # Number of bits (here, qubits) needed to represent a decimal number (here, max) in binary = floor(log_2(max)) + 1
-    # Source: https://www.exploringbinary.com/number-of-bits-in-a-decimal-integer/
-    # Note that this formula does NOT work if max = 0, since log_2(0) is not defined!
-    #
-    # Eg. Let max = 5
-    #       5 (in decimal) = 101 (in binary) -> needs 3 bits to represent it
-    #       log_2(5) = ~2.32
-    #       floor(log_2(5)) = 2
-    #       floor(log_2(5)) + 1 = 2 + 1 = 3
-    #
-    # Eg. Let max = 8
-    #       8 (in decimal) = 1000 (in binary) -> needs 4 bits to represent it
-    #       log_2(8) = 3
-    #       floor(log_2(8)) = 3
-    #       floor(log_2(8)) + 1 = 3 + 1 = 4
-    if max == 0:
-        num_qubits = 1
-    else:
-        num_qubits = floor(log2(max)) + 1
+    def __init__(self, seed: int = None):
+        # If no seed is given, the generator is seeded from OS entropy
+        self._random_generator = random.Random(seed)
+
+    def _create_tableau(self, circuit: Circuit) -> tuple[list[int], list[int], list[int]]:
+        """Returns the tableau (x_bits, z_bits, sign bits of each row) representing the state after all of the circuit's gates are applied to |00...0>"""
+        num_qubits = circuit.num_qubits
+        # Rows 0 to (n - 1) are the destabilizers (start off as X on each qubit), rows n to (2n - 1) are the stabilizers (start off as Z on each qubit)
+        x_rows = [1 << qubit for qubit in range(num_qubits)] + [0] * num_qubits
+        z_rows = [0] * num_qubits + [1 << qubit for qubit in range(num_qubits)]
+        sign_rows = [0] * (2 * num_qubits)
+
+        for gate_name, qubits, _ in circuit.gates:
+            if gate_name == 'h':
+                qubit_bit = 1 << qubits[0]
+                for row in range(2 * num_qubits):
+                    x, z = x_rows[row], z_rows[row]
+                    # H maps Y -> -Y
+                    if x & z & qubit_bit:
+                        sign_rows[row] ^= 1
+                    # H maps X <-> Z, so swap the X and Z bits for this qubit (only if they differ)
+                    if (x ^ z) & qubit_bit:
+                        x_rows[row] = x ^ qubit_bit
+                        z_rows[row] = z ^ qubit_bit
+            elif gate_name == 'x':
+                qubit_bit = 1 << qubits[0]
+                for row in range(2 * num_qubits):
+                    # X maps Z -> -Z and Y -> -Y
+                    if z_rows[row] & qubit_bit:
+                        sign_rows[row] ^= 1
+            elif gate_name == 'cx':
+                control_qubit, target_qubit = qubits
+                for row in range(2 * num_qubits):
+                    x_control = (x_rows[row] >> control_qubit) & 1
+                    z_control = (z_rows[row] >> control_qubit) & 1
+                    x_target = (x_rows[row] >> target_qubit) & 1
+                    z_target = (z_rows[row] >> target_qubit) & 1
+                    sign_rows[row] ^= x_control & z_target & (x_target ^ z_control ^ 1)
+                    x_rows[row] ^= x_control << target_qubit
+                    z_rows[row] ^= z_target << control_qubit
+            else:
+                raise ValueError(f'Unsupported (non-Clifford) gate: {gate_name}')
+
+        return x_rows, z_rows, sign_rows
+
+    @staticmethod
+    def _multiply_rows(x_rows: list[int], z_rows: list[int], sign_rows: list[int], target_row: int, source_row: int) -> None:
+        """Replaces the Pauli operator in target_row with (source_row * target_row), keeping track of the resulting sign"""
+        x_1, z_1 = x_rows[source_row], z_rows[source_row]
+        x_2, z_2 = x_rows[target_row], z_rows[target_row]
+
+        # Multiplying single-qubit Paulis can introduce a phase of i or -i. Count the qubits where each happens
+        # Eg. X * Z = -iY, Z * X = iY
+        y_1 = x_1 & z_1
+        x_only_1 = x_1 & ~z_1
+        z_only_1 = z_1 & ~x_1
+        num_plus_i = ((y_1 & z_2 & ~x_2) | (x_only_1 & z_2 & x_2) | (z_only_1 & x_2 & ~z_2)).bit_count()
+        num_minus_i = ((y_1 & x_2 & ~z_2) | (x_only_1 & z_2 & ~x_2) | (z_only_1 & x_2 & z_2)).bit_count()
+        # Total phase (in units of i) is always 0 or 2 (mod 4) -- i.e. +1 or -1 -- since stabilizer rows commute
+        total_phase = (2 * sign_rows[target_row]) + (2 * sign_rows[source_row]) + num_plus_i - num_minus_i
+        sign_rows[target_row] = (total_phase % 4) // 2
+        x_rows[target_row] = x_2 ^ x_1
+        z_rows[target_row] = z_2 ^ z_1
+
+    def _measure_all(self, num_qubits: int, x_rows: list[int], z_rows: list[int], sign_rows: list[int]) -> str:
+        """Measures every qubit (in the Z basis), updating the tableau, and returns the measured values as a string (qubit 0 = rightmost char)"""
+        measured_value = 0
+        for qubit in range(num_qubits):
+            qubit_bit = 1 << qubit
+            # Look for a stabilizer that anticommutes with Z on this qubit (i.e. has an X component on it)
+            anticommuting_row = next((row for row in range(num_qubits, 2 * num_qubits) if x_rows[row] & qubit_bit), None)
+
+            if anticommuting_row is not None:
+                # Outcome is random: Update every other row that anticommutes with Z on this qubit
+                for row in range(2 * num_qubits):
+                    if (row != anticommuting_row) and (x_rows[row] & qubit_bit):
+                        self._multiply_rows(x_rows, z_rows, sign_rows, row, anticommuting_row)
+                # The anticommuting stabilizer becomes the corresponding destabilizer, and is replaced by +/-Z on this qubit, depending on the (random) outcome
+                destabilizer_row = anticommuting_row - num_qubits
+                x_rows[destabilizer_row], z_rows[destabilizer_row], sign_rows[destabilizer_row] = x_rows[anticommuting_row], z_rows[anticommuting_row], sign_rows[anticommuting_row]
+                qubit_value = self._random_generator.getrandbits(1)
+                x_rows[anticommuting_row], z_rows[anticommuting_row], sign_rows[anticommuting_row] = 0, qubit_bit, qubit_value
+
+            else:
+                # Outcome is deterministic: It is the sign of the product of the stabilizers whose destabilizers have an X component on this qubit
+                # Compute that product in an extra (scratch) row at the end
+                x_rows.append(0)
+                z_rows.append(0)
+                sign_rows.append(0)
+                scratch_row = len(x_rows) - 1
+                for row in range(num_qubits):
+                    if x_rows[row] & qubit_bit:
+                        self._multiply_rows(x_rows, z_rows, sign_rows, scratch_row, row + num_qubits)
+                qubit_value = sign_rows.pop()
+                x_rows.pop()
+                z_rows.pop()
+
+            measured_value |= qubit_value << qubit
+        return format(measured_value, f'0{num_qubits}b')
+
+    def run(self, circuit: Circuit, shots: int) -> list[str]:
+        x_rows, z_rows, sign_rows = self._create_tableau(circuit)
+        # Measurement changes the tableau, so measure a fresh copy of it for every shot
+        return [self._measure_all(circuit.num_qubits, list(x_rows), list(z_rows), list(sign_rows)) for _ in range(shots)]
+
+
+# Available backends, by name
+QUANTUM_BACKEND_CLASSES = {
+    'aer_qasm': AerQasmBackend,
+    'aer_statevector': AerStatevectorBackend,
+    'numpy': NumpySamplerBackend,
+    'os_entropy': OsEntropyBackend,
+    'stabilizer': StabilizerBackend,
+}
+
+
+def get_quantum_backend(backend_name: str = QUANTUM_BACKEND_NAME) -> QuantumBackend:
+    """Creates the backend with the given name (see QUANTUM_BACKEND_CLASSES)"""
+    if backend_name not in QUANTUM_BACKEND_CLASSES:
+        raise ValueError(f'Unknown quantum backend: {backend_name!r} (available: {", ".join(QUANTUM_BACKEND_CLASSES)})')
+    return QUANTUM_BACKEND_CLASSES[backend_name]()
+
+
+# Backend used to execute quantum circuits
+QUANTUM_BACKEND = get_quantum_backend()
+# Backend used to measure game circuits that only contain Clifford gates (see USE_STABILIZER_FAST_PATH)
+STABILIZER_BACKEND = StabilizerBackend()
+
+
+def test_stabilizer_backend(shots: int = 4000, random_seed: int = 0) -> None:
+    """Used to quickly test that StabilizerBackend gives the same distribution of measured values as NumpySamplerBackend (full statevector simulation), for Clifford circuits
+    
+    Measuring a state made by Clifford gates from |00...0> gives every value it can give with the same probability, so the two backends must give exactly the same set of values, each about shots / (number of values) times
+    """
+
+    # Each tuple contains the number of qubits and the gates of the circuit (name of the Circuit method that adds the gate, followed by its arguments)
+    test_value_tuples = \
+        [
+            # Register of a 2-guess quantum attempt
+            (1, [('prepare_uniform_superposition', [0], 2)]),
+
+            # Register of a 4-guess quantum attempt, after a 2-guess quantum attempt
+            (3, [('prepare_uniform_superposition', [0], 2), ('prepare_uniform_superposition', [1, 2], 4)]),
+
+            # H twice gives back |0>, so only one value can be measured
+            (1, [('h', [0]), ('h', [0])]),
+
+            # X before H (phase that doesn't change the probabilities)
+            (1, [('x', [0]), ('h', [0])]),
+
+            # Entangled (Bell state): Both qubits always have the same value
+            (2, [('h', [0]), ('cx', 0, 1)]),
+
+            # Entangled, with one qubit flipped afterwards: The qubits always have different values
+            (3, [('h', [2]), ('cx', 2, 0), ('cx', 0, 1), ('x', [1])]),
+
+            # CX with its control in |1> always flips the target
+            (2, [('x', [0]), ('cx', 0, 1)]),
+
+            # Phase kickback: Between H gates on both qubits, CX acts as a CX in the other direction, so this always flips qubit 0
+            (2, [('x', [1]), ('h', [0, 1]), ('cx', 0, 1), ('h', [0, 1])]),
+        ]
+
+    stabilizer_backend = StabilizerBackend(seed=random_seed)
+    numpy_sampler_backend = NumpySamplerBackend(seed=random_seed)
+    for num_qubits, gates in test_value_tuples:
+        circuit = create_circuit(num_qubits)
+        for gate_name, *gate_arguments in gates:
+            getattr(circuit, gate_name)(*gate_arguments)
+        circuit.measure_all(add_bits=False)
+
+        stabilizer_counts = Counter(stabilizer_backend.run(circuit, shots))
+        numpy_sampler_counts = Counter(numpy_sampler_backend.run(circuit, shots))
+        expected_count = shots / len(numpy_sampler_counts)
+        # Allow each count to be off by a lot (over 5 standard deviations), so that the test only fails if something is actually wrong
+        if (set(stabilizer_counts) == set(numpy_sampler_counts)) and all(abs(count - expected_count) < (expected_count / 2) for count in stabilizer_counts.values()):
+            print('Pass')
+        else:
+            print(f'Fail! Gates: {circuit.gates}')
+            print(f'\tExpected:\t{dict(numpy_sampler_counts)}')
+            print(f'\tActual:\t\t{dict(stabilizer_counts)}')
+
+# # Uncomment to run test suite
+# test_stabilizer_backend()
+
+
+class MeasurementBatcher:
+    """Collects circuit measurement requests from many game sessions (running on different threads) and executes them together, as a single job per batch
+    
+    When many sessions are running at once, each executing its own tiny one-shot job, the fixed per-job overhead (not the simulation itself) limits how many measurements can be done per second. Batching pays that overhead once for many circuits
+    Requests are batched if they arrive within batch_window seconds of the first request of the batch
+    NOTE: Only circuits measured on quantum_backend are batched. Circuits that take the stabilizer fast path (see get_measurement_backend()) are measured directly, without a job -- with the default settings, this is every game circuit, so the batcher only helps when the fast path is off or a circuit contains non-Clifford gates
+    """
+
+    def __init__(self, quantum_backend: QuantumBackend = QUANTUM_BACKEND, batch_window: float = MEASUREMENT_BATCH_WINDOW, max_batch_size: int = MEASUREMENT_BATCH_MAX_SIZE):
+        self.quantum_backend: QuantumBackend = quantum_backend
+        self.batch_window: float = batch_window
+        self.max_batch_size: int = max_batch_size
+        # Pending requests, each consisting of a circuit and the future that its result will be given to
+        self._request_queue: Queue = Queue()
+        # Thread that executes the batches. Only started once the first request is submitted
+        self._batch_thread: Thread = None
+        self._batch_thread_lock = Lock()
+
+    def submit(self, circuit: Circuit) -> Future:
+        """Requests that the given circuit be executed (with 1 shot) as part of the next batch
+        
+        Output:
+            Future whose result will be the list of measured values that quantum_backend.run(circuit, shots=1) would have returned (eg. ['001101'])
+        """
+        with self._batch_thread_lock:
+            if self._batch_thread is None:
+                self._batch_thread = Thread(target=self._run_batches, daemon=True)
+                self._batch_thread.start()
+
+        measured_value_future = Future()
+        self._request_queue.put((circuit, measured_value_future))
+        return measured_value_future
+
+    def run(self, circuit: Circuit) -> list[str]:
+        """Executes the given circuit (with 1 shot) as part of the next batch, waiting for the result"""
+        return self.submit(circuit).result()
+
+    def _run_batches(self) -> None:
+        """Repeatedly collects a batch of requests and executes it. Runs on a background thread"""
+        while True:
+            # Wait (indefinitely) for the first request of the next batch
+            batch = [self._request_queue.get()]
+            batch_deadline = perf_counter() + self.batch_window
+            # Then, collect any other requests that arrive before the batch window closes
+            while len(batch) < self.max_batch_size:
+                time_left = batch_deadline - perf_counter()
+                if time_left <= 0:
+                    break
+                try:
+                    batch.append(self._request_queue.get(timeout=time_left))
+                except Empty:
+                    break
+
+            circuits = [circuit for circuit, _ in batch]
+            try:
+                batch_results = self.quantum_backend.run_batch(circuits, shots=1)
+            except Exception as error:
+                for _, measured_value_future in batch:
+                    measured_value_future.set_exception(error)
+            else:
+                # Give each session back its own result
+                for (_, measured_value_future), circuit_results in zip(batch, batch_results):
+                    measured_value_future.set_result(circuit_results)
+
+
+# Every entropy pool that currently exists. Weak, so that a pool that is no longer used can still be garbage collected
+ENTROPY_POOLS = weakref.WeakSet()
+
+
+def reset_entropy_pools_after_fork(entropy_pools: weakref.WeakSet = ENTROPY_POOLS) -> None:
+    """Resets every entropy pool in a newly forked child process (eg. a simulation worker)
+    
+    The child doesn't inherit the parent's refill threads, and may inherit a pool's lock in a locked state -- thus, both are reset
+    """
+    for entropy_pool in list(entropy_pools):
+        entropy_pool._reset_after_fork()
+
+
+# Registered once for the whole program (rather than once per pool), so that creating pools doesn't keep adding hooks that keep every pool alive forever
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=reset_entropy_pools_after_fork)
+
+
+class QuantumEntropyPool:
+    """Pool (buffer) of random bits, generated by measuring qubits in superposition
     
-    random_num_circuit = create_circuit(num_qubits)
+    Every circuit execution has a fixed overhead, regardless of how few random bits we need from it -- thus, rather than executing a new circuit every time we need a random number, we execute one circuit with many qubits and many shots, store all the resulting random bits, and then hand them out as needed
+    When the pool runs low, it is refilled on a background thread, so that callers (usually) never have to wait for a circuit execution
+    """
+
+    def __init__(self, quantum_backend: QuantumBackend = QUANTUM_BACKEND, num_qubits: int = ENTROPY_POOL_NUM_QUBITS, num_shots: int = ENTROPY_POOL_NUM_SHOTS, refill_threshold: int = ENTROPY_POOL_REFILL_THRESHOLD):
+        self.quantum_backend = quantum_backend
+        self.num_qubits: int = num_qubits
+        self.num_shots: int = num_shots
+        self.refill_threshold: int = refill_threshold
+        # Random bits that haven't been handed out yet, stored as a single (arbitrarily large) integer. Bits are handed out starting from the least significant bit
+        self._bits: int = 0
+        # Number of random bits currently stored in self._bits
+        self._num_bits: int = 0
+        # Whether a background refill is currently running
+        self._refill_in_progress: bool = False
+        # Incremented every time a refill starts, so that callers waiting for a refill can tell whether it is the one that has finished
+        self._refill_number: int = 0
+        # Error raised by the most recent background refill (if any), so that it can be re-raised to whoever was waiting for that refill. Cleared when the next refill starts
+        self._refill_error: Exception = None
+        # Protects the above state, since it is shared with the background refill thread
+        self._condition = Condition()
+        # Lets the pool be reset in a forked child process (see reset_entropy_pools_after_fork())
+        ENTROPY_POOLS.add(self)
+
+    def _reset_after_fork(self) -> None:
+        """Resets the thread synchronization state in a newly forked child process"""
+        self._condition = Condition()
+        self._refill_in_progress = False
+
+    def _generate_bits(self) -> tuple[int, int]:
+        """Executes the random bit circuit and returns the resulting random bits (as a single integer) and the number of bits generated"""
+        random_bit_circuit = create_circuit(self.num_qubits)
+        # Put all qubits into superposition
+        random_bit_circuit.h(range(self.num_qubits))
+        # Measure all qubits
+        random_bit_circuit.measure_all(add_bits=False)
+
+        # Result of every shot
+        # Eg. ['0110...', '1011...', ...]
+        shot_results = self.quantum_backend.run(random_bit_circuit, shots=self.num_shots)
+        return int(''.join(shot_results), base=2), len(shot_results) * self.num_qubits
+
+    def _add_bits(self, bits: int, num_bits: int) -> None:
+        """Adds new random bits to the pool, above (more significant than) the existing bits. Assumes caller holds self._condition"""
+        self._bits |= bits << self._num_bits
+        self._num_bits += num_bits
+
+    def _background_refill(self) -> None:
+        """Refills the pool. Runs on a background thread"""
+        try:
+            bits, num_bits = self._generate_bits()
+            with self._condition:
+                self._add_bits(bits, num_bits)
+        except Exception as error:
+            with self._condition:
+                self._refill_error = error
+        finally:
+            with self._condition:
+                self._refill_in_progress = False
+                # Wake up any callers that were waiting for this refill
+                self._condition.notify_all()
+
+    def get_random_bits(self, num_bits: int) -> int:
+        """Returns an integer made up of num_bits random bits -- i.e. a random number from 0 to (2^num_bits - 1) (inclusive)"""
+        with self._condition:
+            while self._num_bits < num_bits:
+                # Pool is empty (eg. this is the first time it is being used), so have no choice but to wait for it to be refilled
+                # If a refill is already running (eg. started by the warm-up), this waits for it rather than executing another circuit at the same time
+                self.refill(wait=True)
+
+            random_bits = self._bits & ((1 << num_bits) - 1)
+            self._bits >>= num_bits
+            self._num_bits -= num_bits
+
+            # Refill the pool in the background before it runs out
+            if self._num_bits < self.refill_threshold:
+                self.refill()
+
+        return random_bits
+
+    def refill(self, wait: bool = False) -> None:
+        """Start refilling the pool on a background thread, unless a refill is already running
+        
+        Input:
+            wait: If True, wait for the refill to finish before returning
+        """
+        with self._condition:
+            if not self._refill_in_progress:
+                self._refill_in_progress = True
+                self._refill_number += 1
+                # Any error from an earlier refill has already been reported to whoever was waiting for that refill
+                self._refill_error = None
+                Thread(target=self._background_refill, daemon=True).start()
+            if wait:
+                refill_number = self._refill_number
+                # Stop waiting as soon as this refill finishes, even if another one has started since
+                while self._refill_in_progress and (self._refill_number == refill_number):
+                    self._condition.wait()
+                # Only report an error if it came from the refill this caller was waiting for. Every caller waiting for that refill gets it
+                if (self._refill_number == refill_number) and (self._refill_error is not None):
+                    raise self._refill_error
+
+    def get_random_number(self, max: int) -> int:
+        """Returns a random number from 0 to max (inclusive)"""
+
+        # Number of bits needed to represent a decimal number (here, max) in binary = floor(log_2(max)) + 1
+        # Source: https://www.exploringbinary.com/number-of-bits-in-a-decimal-integer/
+        # Note that this formula does NOT work if max = 0, since log_2(0) is not defined!
+        #
+        # Eg. Let max = 5
+        #       5 (in decimal) = 101 (in binary) -> needs 3 bits to represent it
+        #       log_2(5) = ~2.32
+        #       floor(log_2(5)) = 2
+        #       floor(log_2(5)) + 1 = 2 + 1 = 3
+        #
+        # Eg. Let max = 8
+        #       8 (in decimal) = 1000 (in binary) -> needs 4 bits to represent it
+        #       log_2(8) = 3
+        #       floor(log_2(8)) = 3
+        #       floor(log_2(8)) + 1 = 3 + 1 = 4
+        if max == 0:
+            num_bits = 1
+        else:
+            num_bits = floor(log2(max)) + 1
 
-    # Put all qubits into superposition
-    random_num_circuit.h(range(num_qubits))
+        # NOTE: The random bits will NOT necessarily respect max!
+        # Eg. If max = 4, it needs 3 bits to be represented. However, 3 random bits can produce ANY number from 0 to ((2^3) - 1) = from 0 to 7!
+        # Thus, even though max is 4, we may generate a number greater than 4!
+        # Thus, need to check if that has happened and, if so, keep drawing new random bits until we get a number <= max
+        # Since every number of num_bits bits is equally likely, every number from 0 to max is also equally likely, so this doesn't introduce any bias
+        random_decimal_num = max + 1
+        while random_decimal_num > max:
+            random_decimal_num = self.get_random_bits(num_bits)
+
+        return random_decimal_num
+
+    def get_random_number_async(self, max: int) -> Future:
+        """Starts drawing a random number from 0 to max (inclusive) in the background, without waiting for the pool to be refilled if it is empty
+        
+        Output:
+            Future whose result will be the random number
+        """
+        return get_background_executor().submit(self.get_random_number, max)
+
+
+# Shared by all random number generation, so that random bits left over from one game can be used by the next
+QUANTUM_ENTROPY_POOL = QuantumEntropyPool()
+
+
+def random_number_generator(max, entropy_pool: QuantumEntropyPool = QUANTUM_ENTROPY_POOL):
+    """Generates a random number from 0 to max (inclusive)"""
+    return entropy_pool.get_random_number(max)
+
+
+class RandomDrawPrefetcher:
+    """Speculatively draws random numbers before they are needed, so that whoever needs them later doesn't have to wait for a circuit execution
     
-    # Measure all qubits
-    random_num_circuit.measure_all(add_bits=False)
+    Each draw has a name (eg. 'answer'), and is started with prefetch() at a point where the game is idle anyway (eg. while waiting for the user to type their choice). take() then returns the prefetched number straight away, or draws one on the spot if none was prefetched
+    A prefetched number that ends up not being needed is simply never taken -- since every draw is independent, this doesn't bias any of the draws that are taken
+    """
+
+    def __init__(self, entropy_pool: QuantumEntropyPool = QUANTUM_ENTROPY_POOL):
+        self.entropy_pool: QuantumEntropyPool = entropy_pool
+        # Maps draw name to the max of the prefetched number and the future of the number itself
+        self._prefetched_draws: dict = {}
+        # Prefetcher may be shared between sessions running on different threads (eg. the game server)
+        self._lock = Lock()
+
+    def prefetch(self, draw_name, max: int) -> None:
+        """Starts drawing a random number from 0 to max (inclusive) in the background, unless one has already been prefetched for this draw"""
+        with self._lock:
+            if (draw_name in self._prefetched_draws) and (self._prefetched_draws[draw_name][0] == max):
+                return
+            self._prefetched_draws[draw_name] = (max, self.entropy_pool.get_random_number_async(max))
+
+    def take(self, draw_name, max: int) -> int:
+        """Returns a random number from 0 to max (inclusive), using the prefetched one for this draw if there is one"""
+        with self._lock:
+            prefetched_draw = self._prefetched_draws.pop(draw_name, None)
+        if (prefetched_draw is not None) and (prefetched_draw[0] == max):
+            return prefetched_draw[1].result()
+        return self.entropy_pool.get_random_number(max)
+
+
+# Shared by the interactive games, so that each game's answer can be drawn while the previous game is being played
+RANDOM_DRAW_PREFETCHER = RandomDrawPrefetcher()
 
-    # NOTE: The above circuit will NOT necessarily respect max!
-    # Eg. If max = 4, it needs 3 qubits to be represented. However, a 3-qubit circuit with all qubits in superposition can produce ANY number from 0 to ((2^3) - 1) = from 0 to 7!
-    # Thus, even though max is 4, our circuit may generate a number greater than 4!
-    # Thus, need to check if that has happened and, if so, keep re-running the circuit until we get a number <= max
-    random_decimal_num = max + 1
-    while random_decimal_num > max:
-        # Execute circuit
-        job = execute(random_num_circuit, backend=quantum_backend, shots=1)
-        result = job.result()
-        counts = result.get_counts(random_num_circuit)
-        # Since we only ran one shot above, we already know that we only have one measured value
-        # Eg. '101'
-        random_binary_num_string = list(counts.keys())[0]
-        # Eg. 5
-        random_decimal_num = int(random_binary_num_string, base=2)
+
+def warm_up(quantum_backend: QuantumBackend = QUANTUM_BACKEND, entropy_pool: QuantumEntropyPool = QUANTUM_ENTROPY_POOL, feedback_matrix_file_path: Path = FEEDBACK_MATRIX_FILE_PATH) -> None:
+    """Does all the slow, one-time setup needed before the game can start: creating the backend and executing the first job
+    
+    The first job fills the entropy pool, so it isn't wasted -- it provides the random bits for choosing the answer
+    If the feedback matrix has already been saved, it is also loaded (memory-mapped), so that the game looks up feedback in it rather than computing it (see lookup_guess_feedback_code())
+    """
+    with record_startup_time('Warm-up (total)'):
+        quantum_backend.warm_up()
+        with record_startup_time('First job'):
+            entropy_pool.refill(wait=True)
+        # Building the matrix from scratch takes a while, so that is left to whatever needs the whole matrix (eg. hints)
+        if feedback_matrix_file_path.exists():
+            with record_startup_time('Feedback matrix load'):
+                get_feedback_matrix()
+
+
+def start_warm_up() -> Thread:
+    """Runs warm_up() on a background thread, so that it overlaps with everything else that happens at startup (eg. rendering the welcome screen)
     
-    return random_decimal_num
+    Anything that needs random numbers before the warm-up finishes simply waits for the entropy pool refill that the warm-up started, rather than executing another job
+    """
+    warm_up_thread = Thread(target=warm_up, daemon=True)
+    warm_up_thread.start()
+    return warm_up_thread
 
 
-def choose_answer(answer_list=ANSWERS) -> str:
-    """Randomly chooses a word from the list of all possible answers to be the answer for this run of the game"""
+def choose_answer(answer_list=ANSWERS, entropy_pool: QuantumEntropyPool = QUANTUM_ENTROPY_POOL, random_draw_prefetcher: RandomDrawPrefetcher = None) -> str:
+    """Randomly chooses a word from the list of all possible answers to be the answer for this run of the game
+    
+    If random_draw_prefetcher is given, the answer is taken from it (instead of entropy_pool), and the answer for the NEXT game is prefetched straight away
+    """
 
-    # Note: Currently, the answer list consists of 2309 words (indices 0 to 2308), which, in random_number_generator(), gets encoded using 12 qubits. However, the max value that can be generated by that circuit is (2^12) - 1 = 4095!
-    # At first glance, the wide gap between the desired max value (2308) and the actual max value (4095) suggests that we will have to run the circuit a LOT of times to get a random number <= 2308, but actual probability calculation predicts (and experimentation confirms) that that is not true
+    # Note: Currently, the answer list consists of 2309 words (indices 0 to 2308), which, in random_number_generator(), gets encoded using 12 random bits. However, the max value that can be generated by 12 bits is (2^12) - 1 = 4095!
+    # At first glance, the wide gap between the desired max value (2308) and the actual max value (4095) suggests that we will have to draw a LOT of random bits to get a random number <= 2308, but actual probability calculation predicts (and experimentation confirms) that that is not true
+    # (Either way, the random bits come from the entropy pool, so drawing again doesn't mean executing the circuit again)
     # Specifically, out of the 4096 (0 to 4095) possible numbers, 1787 are bad (> 2308) -- i.e. ~44% of the possible numbers are bad
     # That means:
-    #     If we run the circuit once, we have a (100 - ((0.44^1)*100) = 100 - 44 = 56% chance of getting a good number
-    #     If we run the circuit twice, we have a (100 - ((0.44^2)*100) = ~81% chance of getting a good number
-    #     If we run the circuit thrice, we have a (100 - ((0.44^3)*100) = ~91% chance of getting a good number
-    # Thus, when the user runs this program and we randomly select an answer from the answer list, ~91% of the time we get a valid list index (<= 2308) in <= 3 executions of the random number generator circuit
-    answer_index = random_number_generator(max=(len(answer_list) - 1))
+    #     If we draw once, we have a (100 - ((0.44^1)*100) = 100 - 44 = 56% chance of getting a good number
+    #     If we draw twice, we have a (100 - ((0.44^2)*100) = ~81% chance of getting a good number
+    #     If we draw thrice, we have a (100 - ((0.44^3)*100) = ~91% chance of getting a good number
+    # Thus, when the user runs this program and we randomly select an answer from the answer list, ~91% of the time we get a valid list index (<= 2308) in <= 3 draws
+    if random_draw_prefetcher is None:
+        answer_index = random_number_generator(max=(len(answer_list) - 1), entropy_pool=entropy_pool)
+    else:
+        answer_index = random_draw_prefetcher.take('answer', max=(len(answer_list) - 1))
+        random_draw_prefetcher.prefetch('answer', max=(len(answer_list) - 1))
     answer = answer_list[answer_index]
     return answer
 
 
-def encode_quantum_attempt(current_attempt: Attempt, game_circuit: QuantumCircuit) -> None:
-    """Encode quantum attempt on underlying quantum circuit. Assumes that the quantum attempt consists of only 2 guesses"""
-    # To indicate that we are using two guesses (guess #0 and guess #1) at the same time in this quantum attempt, put the corresponding qubit into a superposition of the |0> and |1> states
-    game_circuit.h(current_attempt.qubit_index)
+def get_register_size(num_guesses: int) -> int:
+    """Returns the number of qubits needed to encode which of num_guesses guesses should be used -- i.e. ceil(log2(num_guesses)), but at least 1
+    
+    Eg. 2 guesses -> 1 qubit, 3 or 4 guesses -> 2 qubits, 5 to 8 guesses -> 3 qubits
+    """
+    return max(1, (num_guesses - 1).bit_length())
+
+
+def get_measurement_backend(game_circuit: Circuit, quantum_backend: QuantumBackend = QUANTUM_BACKEND, use_stabilizer_fast_path: bool = USE_STABILIZER_FAST_PATH, stabilizer_backend: QuantumBackend = STABILIZER_BACKEND) -> QuantumBackend:
+    """Returns the backend that the game circuit will be measured on (see measure_game_circuit())"""
+    # The game circuit usually only contains Clifford gates (eg. H) and, if so, the stabilizer simulator can measure it far faster than a full circuit execution
+    if use_stabilizer_fast_path and game_circuit.is_clifford():
+        return stabilizer_backend
+    return quantum_backend
+
 
+def check_register_fits(game_circuit: Circuit, num_guesses: int, quantum_backend: QuantumBackend = QUANTUM_BACKEND) -> None:
+    """Raises ValueError if adding a register for a quantum attempt with num_guesses guesses would make the game circuit too big for the backend that will measure it"""
+    # Try it out on a copy, so that the game circuit itself is left unchanged
+    new_game_circuit = create_circuit(game_circuit.num_qubits)
+    new_game_circuit.gates = list(game_circuit.gates)
+    new_game_circuit.prepare_uniform_superposition(new_game_circuit.add_qubits(get_register_size(num_guesses)), num_guesses)
+    max_qubits = get_measurement_backend(new_game_circuit, quantum_backend).max_qubits
+    if (max_qubits is not None) and (new_game_circuit.num_qubits > max_qubits):
+        raise ValueError(f'Quantum attempt needs {new_game_circuit.num_qubits} qubits in total, but the backend only supports {max_qubits} -- measure the existing quantum attempts first')
 
-def measure_game_circuit(game_circuit: QuantumCircuit, attempts_list: list[Attempt], quantum_backend=QUANTUM_BACKEND, attempt_types: AttemptType = AttemptType, num_attempts: int = MAX_ATTEMPTS) -> QuantumCircuit:
+
+def encode_quantum_attempt(current_attempt: Attempt, game_circuit: Circuit) -> None:
+    """Encode quantum attempt on underlying quantum circuit, allocating a new register of qubits for it"""
+    num_guesses = len(current_attempt.guess_indices)
+    current_attempt.qubit_indices = game_circuit.add_qubits(get_register_size(num_guesses))
+    # To indicate that we are using all the guesses (guess #0, guess #1, ...) at the same time in this quantum attempt, put the corresponding register into an equal superposition of the states |0>, |1>, ... (one state per guess)
+    # Eg. For 2 guesses, this is just an H gate on a single qubit
+    game_circuit.prepare_uniform_superposition(current_attempt.qubit_indices, num_guesses)
+
+
+def measure_game_circuit(game_circuit: Circuit, attempts_list: list[Attempt], quantum_backend: QuantumBackend = QUANTUM_BACKEND, attempt_types: AttemptType = AttemptType, use_stabilizer_fast_path: bool = USE_STABILIZER_FAST_PATH, stabilizer_backend: QuantumBackend = STABILIZER_BACKEND, measurement_batcher: MeasurementBatcher = None) -> Circuit:
     """Measure all qubits in game circuit, collapsing any that are in superposition to a classical value. Update any of the corresponding attempts that are quantum to classical
     
     Input:
@@ -211,7 +1545,9 @@ def measure_game_circuit(game_circuit: QuantumCircuit, attempts_list: list[Attem
         attempts_list
         quantum_backend
         attempt_types
-        num_attempts
+        use_stabilizer_fast_path: If True, and the game circuit only contains Clifford gates, it is measured using stabilizer_backend instead of quantum_backend
+        stabilizer_backend
+        measurement_batcher: If given, and the game circuit is measured on quantum_backend, the game circuit is executed as part of a batch with other sessions' circuits, rather than as its own job. Circuits measured using the stabilizer fast path don't need a job, so are never batched
     
     Output:
         New game circuit, reflecting game state post-measurement
@@ -221,165 +1557,312 @@ def measure_game_circuit(game_circuit: QuantumCircuit, attempts_list: list[Attem
     game_circuit.measure_all(add_bits=False)
 
     # Execute circuit
-    job = execute(game_circuit, backend=quantum_backend, shots=1)
-    result = job.result()
-    counts = result.get_counts(game_circuit)
-    # Since we only ran one shot above, we already know that we only have one measured value. Specifically, that value is a single string containing the values (0/1) of every qubit in the circuit after measurement
-    # Eg. '001101', where the the rightmost char ('1') refers to qubit 0 (attempt 1) and the leftmost char ('0') refers to qubit 5 (attempt 6)
-    measured_qubit_values_string = list(counts.keys())[0]
-
-    # Although we measured all qubits, we really only care about the qubits that were in superposition (i.e. the qubits that correspond to quantum attempts)
-    # The qubits corresponding to classical attempts had no gates applied to them and, thus, should still be in their default |0> state
+    # All quantum attempts' registers are measured together, in a single execution, no matter how many guesses each attempt has
+    # Since we only run one shot, we already know that we only have one measured value. Specifically, that value is a single string containing the values (0/1) of every qubit in the circuit after measurement
+    # Eg. '001101', where the the rightmost char ('1') refers to qubit 0 and the leftmost char ('0') refers to qubit 5
+    # Only quantum attempts have qubits, so if there aren't any, there's nothing to execute
+    measurement_backend = get_measurement_backend(game_circuit, quantum_backend, use_stabilizer_fast_path, stabilizer_backend)
+    if game_circuit.num_qubits == 0:
+        measured_qubit_values_string = ''
+    elif (measurement_backend is quantum_backend) and (measurement_batcher is not None):
+        measured_qubit_values_string = measurement_batcher.run(game_circuit)[0]
+    else:
+        measured_qubit_values_string = measurement_backend.run(game_circuit, shots=1)[0]
+
+    return collapse_quantum_attempts(attempts_list, measured_qubit_values_string, attempt_types)
+
+
+def start_game_circuit_measurement(game_circuit: Circuit, quantum_backend: QuantumBackend = QUANTUM_BACKEND, use_stabilizer_fast_path: bool = USE_STABILIZER_FAST_PATH, stabilizer_backend: QuantumBackend = STABILIZER_BACKEND, measurement_batcher: MeasurementBatcher = None, executor: ThreadPoolExecutor = None) -> Future:
+    """Same as the first half of measure_game_circuit(), but only starts executing the game circuit, without waiting for it to finish. Used by callers that shouldn't block while the circuit is executed (eg. the game server)
+    
+    Once the future is done, the attempts are updated by passing its (single) measured value to collapse_quantum_attempts()
+    If the game circuit isn't batched, it is executed on executor (see QuantumBackend.run_async())
+
+    Output:
+        Future whose result will be the list containing the single measured value of the game circuit's qubits (eg. ['001101'])
+    """
+    game_circuit.measure_all(add_bits=False)
+
+    measurement_backend = get_measurement_backend(game_circuit, quantum_backend, use_stabilizer_fast_path, stabilizer_backend)
+    if game_circuit.num_qubits == 0:
+        measured_qubit_values_future = Future()
+        measured_qubit_values_future.set_result([''])
+        return measured_qubit_values_future
+    if (measurement_backend is quantum_backend) and (measurement_batcher is not None):
+        return measurement_batcher.submit(game_circuit)
+    return measurement_backend.run_async(game_circuit, shots=1, executor=executor)
+
+
+def collapse_quantum_attempts(attempts_list: list[Attempt], measured_qubit_values_string: str, attempt_types: AttemptType = AttemptType) -> Circuit:
+    """Update every quantum attempt to a classical attempt, using the value that its register collapsed to when the game circuit was measured (see measure_game_circuit())
+    
+    Input:
+        attempts_list
+        measured_qubit_values_string: Measured value of all the game circuit's qubits (eg. '001101')
+        attempt_types
+
+    Output:
+        New game circuit, reflecting game state post-measurement
+    """
     for attempt in attempts_list:
         if attempt.type is attempt_types.QUANTUM:
 
-            # Get value that corresponding qubit collapsed to after measurement
+            # Get value that corresponding register collapsed to after measurement, by reading each of its qubits' values
             # Note that, for example, qubit 0 will correspond to the last (rightmost) char in measured_qubit_values_string -- i.e. the char at index `-(0 + 1)` = `-1`
-            qubit_value = int(measured_qubit_values_string[-(attempt.qubit_index + 1)])
+            register_value = 0
+            for bit_position, qubit_index in enumerate(attempt.qubit_indices):
+                register_value |= int(measured_qubit_values_string[-(qubit_index + 1)]) << bit_position
             
-            # Given a list of multiple guesses currently associated with this attempt, qubit_value gives us the index of the single guess that we should use going forward (discarding the others)
-            current_guess_list = list(attempt.guess_to_feedback_dict.keys())
+            # Given the multiple guesses currently associated with this attempt, register_value gives us the position of the single guess that we should use going forward (discarding the others)
+            # Since the register was only put into a superposition of the states |0> to |num_guesses - 1>, register_value is always a valid position
             # Randomly chosen (via superposition collapse) guess that, going forward, will be the ONLY guess associated with this attempt
-            chosen_guess: str = current_guess_list[qubit_value]
-            # Feedback (clue) associated with randomly chosen guess
-            # Note that chosen_guess_feedback is NOT independently chosen -- it is always the feedback associated with chosen_guess!
-            chosen_guess_feedback: str = attempt.guess_to_feedback_dict[chosen_guess]
-            # Overwrite existing guess_to_feedback dict for this attempt to consist of just this new guess
-            attempt.guess_to_feedback_dict = {chosen_guess: chosen_guess_feedback}
+            # Note that its feedback (clue) is NOT independently chosen -- it is always the feedback associated with the chosen guess!
+            # Overwrite existing guesses and feedback for this attempt to consist of just this guess
+            attempt.guess_indices = (attempt.guess_indices[register_value],)
+            attempt.feedback_codes = (attempt.feedback_codes[register_value],)
 
             # Finally, update the attempt type, now that:
-            #   The corresponding qubit's superposition has been collapsed to a single classical value
+            #   The corresponding register's superposition has been collapsed to a single classical value
             #   The list of multiple guesses associated with this attempt has been reduced to a single guess
             attempt.type = attempt_types.CLASSICAL
+            attempt.qubit_indices = None
 
     # At this point, all quantum attempts have been converted to classical attempts and each of their associated guess lists has been reduced to a single guess
 
     # There doesn't seem to be a way to just continue a previous circuit execution -- instead, every execution starts over from the very beginning. This means that, if we continue reusing the same circuit for all executions, it will have multiple measurements (where all but the latest are redundant), we will be putting qubits that represent FORMERLY quantum attempts back into superposition needlessly and we will have to worry about potential complications caused by those unnecessary superpositions (that we already measured in a previous circuit execution) collapsing to a different value this time.
-    # Thus, instead, for simplicity, we just create a brand new circuit for execution next time -- formerly quantum attempts that are now classical attempts will remain classical in this new circuit (their qubits will not have any gates applied to them)
-    new_game_circuit = create_circuit(num_attempts)
+    # Thus, instead, for simplicity, we just create a brand new circuit for execution next time -- formerly quantum attempts that are now classical attempts will remain classical, since they won't have any qubits in this new circuit
+    new_game_circuit = create_circuit(0)
     return new_game_circuit
 
 
-def setup_game(max_attempts: int = MAX_ATTEMPTS):
+def setup_game(max_attempts: int = MAX_ATTEMPTS, answer: str = None, entropy_pool: QuantumEntropyPool = QUANTUM_ENTROPY_POOL, random_draw_prefetcher: RandomDrawPrefetcher = None, num_guesses_in_superposition: int = NUM_GUESSES_IN_SUPERPOSITION):
     """Perform required setup for the game
     
     Input:
         max_attempts: Number of chances that user has to guess the answer
+        answer: Answer for this run of the game. If not given, a random answer is selected
+        entropy_pool: Source of random numbers used to select the answer
+        random_draw_prefetcher: If given, used instead of entropy_pool (see choose_answer())
+        num_guesses_in_superposition: Max number of guesses that each attempt has room for
         
     Output:
         answer: Randomly-selected answer for this run of the game
-        attempts_list: Stores current game state (state of each attempt)
-        letter_usage_list: List of all letters, visually distinguishing which ones have or have not been used in guesses so far
+        attempts_list: Stores current game state (state of each attempt). All attempts are stored in the same board (see create_board())
+        keyboard_state: Keeps track of which letters have or have not been used in guesses so far
         game_circuit: Quantum circuit used to encode info regarding each attempt's guesses
     """
 
     # Randomly select answer
-    answer = choose_answer()
+    if answer is None:
+        answer = choose_answer(entropy_pool=entropy_pool, random_draw_prefetcher=random_draw_prefetcher)
 
-    # Store info about each attempt
+    # Store info about each attempt, each in its own part of a single board
+    board = create_board(max_attempts, num_guesses_in_superposition)
+    attempt_size = 1 + (3 * num_guesses_in_superposition)
     attempts_list = []
     for i in range(max_attempts):
-        qubit_index = i
-        attempts_list.append(Attempt(qubit_index))
-
-    # Create list of all letters, visually distinguishing which ones have or have not been used in guesses so far
-    # Note that, for ease of use (based on user feedback), the letters are in "keyboard order" (the order in which letters are displayed on a computer keyboard), not alphabetical order!
-    letter_usage_list = [
-        'Q', 'W', 'E', 'R', 'T', 'Y', 'U', 'I', 'O', 'P',
-            'A', 'S', 'D', 'F', 'G', 'H', 'J', 'K', 'L',
-                'Z', 'X', 'C', 'V', 'B', 'N', 'M'
-        ]
-    # Start off all letters formatted to be bold, to indicate that they're unused
-    for index, letter in enumerate(letter_usage_list):
-        letter_usage_list[index] = apply_bold_text(letter)
+        attempts_list.append(Attempt(board, i * attempt_size, num_guesses_in_superposition))
+
+    # Keep track of which letters have or have not been used in guesses so far (all start off unused)
+    keyboard_state = KeyboardState()
 
     # Setup quantum circuit to encode info regarding the attempts -- specifically, for each attempt, which of its guesses should be used
-    game_circuit = create_circuit(max_attempts)
+    # Starts off with no qubits -- each quantum attempt adds its own register of qubits when it's made (see encode_quantum_attempt())
+    game_circuit = create_circuit(0)
+
+    return answer, attempts_list, keyboard_state, game_circuit
+
+
+class GuessType(Enum):
+    """Used to indicate type of a valid guess (i.e. whether it could be the answer or not)"""
+    POSSIBLE_ANSWER = auto()
+    ALLOWED_GUESS_ONLY = auto()
+
+
+def get_guess_index_type(guess_index: int, allowed_guesses_excluding_answers: PackedWordList = ALLOWED_GUESSES_EXCLUDING_ANSWERS) -> GuessType:
+    """Returns whether the guess with the given index (in ALL_GUESSES) could be the answer, or is only an allowed guess
+    
+    ALL_GUESSES is the allowed guesses (excluding answers) followed by the answers, so this is just a comparison -- no lookup needed
+    """
+    if guess_index >= len(allowed_guesses_excluding_answers):
+        return GuessType.POSSIBLE_ANSWER
+    return GuessType.ALLOWED_GUESS_ONLY
+
+
+def get_guess_type(guess: str, all_guesses: PackedWordList = ALL_GUESSES) -> GuessType:
+    """Check whether guess input by user could be the answer, or is only an allowed guess
+    
+    Input:
+        guess: Guess word entered by user
+        all_guesses: List of all allowed guesses
 
-    return answer, attempts_list, letter_usage_list, game_circuit
+    Output:
+        Type of the guess, or None if the guess is not valid (allowed)
+    """
+    # Same binary search over the packed words as is_guess_valid() -- the guess's position in the list then tells us its type
+    try:
+        guess_index = all_guesses.index(guess)
+    except ValueError:
+        return None
+    return get_guess_index_type(guess_index)
 
 
-def is_guess_valid(guess: str, allowed_guesses_excluding_answers: list[str] = ALLOWED_GUESSES_EXCLUDING_ANSWERS, answers: list[str] = ANSWERS) -> bool:
+def is_guess_valid(guess: str, all_guesses: PackedWordList = ALL_GUESSES) -> bool:
     """Check if guess input by user is valid (allowed)
     
     Input:
         guess: Guess word entered by user
-        allowed_guesses_excluding_answers: List of allowed guesses, excluding words that are already in the answers list
-        answers: List of possible answers
+        all_guesses: List of all allowed guesses
 
     Output:
         True/False, depending on whether or not the guess is considered valid
     """
-    if (guess in allowed_guesses_excluding_answers) or (guess in answers):
-        return True
-    else:
-        return False
+    # Binary search over the packed words -- no strings are decoded
+    return guess in all_guesses
+
+
+def build_feedback_string(feedback_code: int, word_length: int = WORD_LENGTH, feedback_digit_to_colour: tuple[str] = FEEDBACK_DIGIT_TO_COLOUR) -> str:
+    """Converts a feedback code (integer) to the colour feedback string it represents, digit by digit. Only used to build the render tables -- use feedback_code_to_string() instead
+
+    Eg. Assuming word_length = 5: 138 -> '🟥🟨🟥🟩🟨'
+    """
+    colour_feedback_list = []
+    for _ in range(word_length):
+        feedback_code, feedback_digit = divmod(feedback_code, 3)
+        colour_feedback_list.append(feedback_digit_to_colour[feedback_digit])
+    return ''.join(colour_feedback_list)
+
+
+def build_feedback_render_table(feedback_digit_to_colour: tuple[str] = FEEDBACK_DIGIT_TO_COLOUR, word_length: int = WORD_LENGTH, num_feedback_codes: int = NUM_FEEDBACK_CODES) -> tuple[str]:
+    """Builds the table used to convert feedback codes to displayable strings, with one (interned) string per possible feedback code
+    
+    Input:
+        feedback_digit_to_colour: Chars to use for each feedback digit (see FEEDBACK_PALETTES)
+        word_length
+        num_feedback_codes
+
+    Output:
+        Tuple where the string at index i is the displayable version of feedback code i
+        Eg. Assuming word_length = 5 and the emoji palette: table[138] = '🟥🟨🟥🟩🟨'
+    """
+    # Interning means every lookup of the same code returns the very same string object, so printing never allocates new feedback strings
+    return tuple(sys.intern(build_feedback_string(feedback_code, word_length, feedback_digit_to_colour)) for feedback_code in range(num_feedback_codes))
 
 
-def print_guess(guess_string: str) -> None:
-    """Print a single guess word, letter by letter. Does not print a newline at the end"""
+def feedback_string_to_code(feedback_string: str, feedback_digit_to_colour: tuple[str] = FEEDBACK_DIGIT_TO_COLOUR) -> int:
+    """Converts a colour feedback string to the feedback code (integer) that represents it
+
+    Eg. Assuming word_length = 5: '🟥🟨🟥🟩🟨' -> 138
+    """
+    feedback_code = 0
+    # Go from the last (most significant) digit to the first (least significant) digit
+    for colour in reversed(feedback_string):
+        feedback_code = (feedback_code * 3) + feedback_digit_to_colour.index(colour)
+    return feedback_code
+
+
+# Table converting each feedback code to its displayable string, for each palette (see build_feedback_render_table())
+FEEDBACK_RENDER_TABLES = {palette_name: build_feedback_render_table(feedback_digit_to_colour) for palette_name, feedback_digit_to_colour in FEEDBACK_PALETTES.items()}
+
+
+def feedback_code_to_string(feedback_code: int, palette_name: str = FEEDBACK_PALETTE_NAME, feedback_render_tables: dict = FEEDBACK_RENDER_TABLES) -> str:
+    """Converts a feedback code (integer) to the displayable feedback string it represents, in the given palette (see FEEDBACK_PALETTES)
+
+    Eg. Assuming word_length = 5 and the emoji palette: 138 -> '🟥🟨🟥🟩🟨'
+    """
+    return feedback_render_tables[palette_name][feedback_code]
+
+
+def print_guess(guess_string: str, file=None) -> None:
+    """Print a single guess word, letter by letter, to file (stdout by default). Does not print a newline at the end"""
     for char in guess_string:
         # Pad each character of guess to be two spaces, to align with each character (coloured square) of the colour feedback string which seems to take up two spaces
-        print(f'{char:>2}', end='')
+        print(f'{char:>2}', end='', file=file)
+
+
+def print_guess_feedback(feedback_code: int, space: str = SPACE_CHAR, output_prefix: str = '', palette_name: str = FEEDBACK_PALETTE_NAME, file=None) -> None:
+    """Print feedback code as a string of coloured squares, where each coloured square indicates the correctness of the corresponding letter of the guess. Does not print a newline at the end"""
+    print_feedback_string(feedback_code_to_string(feedback_code, palette_name), space, output_prefix, file)
 
 
-def print_guess_feedback(feedback_string: str, space: str = SPACE_CHAR, output_prefix: str = '') -> None:
-    """Print string of coloured squares, where each coloured square indicates the correctness of the corresponding letter of the guess. Does not print a newline at the end"""
-    print(f'{output_prefix}{space*23}{feedback_string}', end='')
+def print_feedback_string(feedback_string: str, space: str = SPACE_CHAR, output_prefix: str = '', file=None) -> None:
+    """Print an already-displayable feedback string, aligned under the guess. Does not print a newline at the end"""
+    print(f'{output_prefix}{space*23}{feedback_string}', end='', file=file)
 
 
-def print_unused_attempt(attempt_num: int, no_guess_string: str = NO_GUESS_STRING, no_feedback_string: str = NO_FEEDBACK_STRING, space: str = SPACE_CHAR) -> None:
+def print_unused_attempt(attempt_num: int, no_guess_string: str = NO_GUESS_STRING, no_feedback_string: str = NO_FEEDBACK_STRING, space: str = SPACE_CHAR, file=None) -> None:
     """Prints unused attempt (i.e. attempt that user has not got to yet)"""
 
     # For reasonably consistent output across different platforms, only use spaces, not tabs (as tabs can be rendered differently on different platforms)!
     # Number of spaces in below commands determined experimentally
-    print(f'Attempt {attempt_num}:{space*13}', end='')
+    print(f'Attempt {attempt_num}:{space*13}', end='', file=file)
 
     # Print placeholder to indicate no guess yet
-    print_guess(no_guess_string)
-    print()
+    print_guess(no_guess_string, file)
+    print(file=file)
     # Print placeholder to indicate no guess feedback yet
-    print_guess_feedback(no_feedback_string)
-    print()
+    print_feedback_string(no_feedback_string, file=file)
+    print(file=file)
 
 
-def print_classical_attempt(attempt_num: int, guess_to_feedback_dict, space: str = SPACE_CHAR) -> None:
+def print_classical_attempt(attempt_num: int, guess: str, feedback: int, space: str = SPACE_CHAR, file=None) -> None:
     """Prints classical attempt. Assumed to have only one guess"""
 
     # Number of spaces in below commands determined experimentally
-    print(f'Attempt {attempt_num}:{space*13}', end='')
+    print(f'Attempt {attempt_num}:{space*13}', end='', file=file)
 
-    # Since this is a classical attempt, we know there is only one guess in the dict
-    guess, feedback = list(guess_to_feedback_dict.items())[0]
     # Print guess
-    print_guess(guess)
+    print_guess(guess, file)
     # Print one new line
     # Same as: print('\n', end='')
-    print()
+    print(file=file)
     # Print feedback
-    print_guess_feedback(feedback)
-    print()
+    print_guess_feedback(feedback, file=file)
+    print(file=file)
 
 
-def print_quantum_attempt(attempt_num: int, guess_to_feedback_dict, feedback_display_list: list[str], space: str = SPACE_CHAR) -> None:
-    """Prints quantum attempt. Assumed to have two guesses"""
+def create_feedback_display_list(feedback_list: list[int], entropy_pool: QuantumEntropyPool = QUANTUM_ENTROPY_POOL, random_draw_prefetcher: RandomDrawPrefetcher = None) -> list[int]:
+    """Given the feedback codes for the guesses of a quantum attempt, returns the same feedback codes in a random order, to be used only for DISPLAYING the feedback
+    
+    If random_draw_prefetcher is given, the random draws are taken from it (see prefetch_feedback_display_order()) instead of entropy_pool
+    """
+
+    # A separate list consisting of the same feedback codes as feedback_list, but in random order
+    feedback_display_list = list(feedback_list)
+
+    # Shuffle it (Fisher-Yates shuffle): Going from the end of the list to the start, swap each feedback code with a randomly selected one at or before it
+    # Eg. For 2 feedback codes, this is a single random draw that decides whether or not to swap them
+    for feedback_index in range(len(feedback_display_list) - 1, 0, -1):
+        if random_draw_prefetcher is None:
+            random_feedback_index = random_number_generator(max=feedback_index, entropy_pool=entropy_pool)
+        else:
+            random_feedback_index = random_draw_prefetcher.take(('feedback_display_order', feedback_index), max=feedback_index)
+        feedback_display_list[feedback_index], feedback_display_list[random_feedback_index] = feedback_display_list[random_feedback_index], feedback_display_list[feedback_index]
+
+    return feedback_display_list
 
-    # Number of spaces in below commands determined experimentally
-    print(f'Attempt {attempt_num}:{space*6}', end='')
 
-    # Since this is a quantum attempt, we know there are multiple guesses in the dict
-    guesses = guess_to_feedback_dict.keys()
-    feedback_list = list(guess_to_feedback_dict.values())
+def prefetch_feedback_display_order(num_guesses: int, random_draw_prefetcher: RandomDrawPrefetcher) -> None:
+    """Starts the random draws that create_feedback_display_list() will need to shuffle the feedback of the next quantum attempt (with num_guesses guesses), so that they're ready by the time the attempt is made"""
+    for feedback_index in range(num_guesses - 1, 0, -1):
+        random_draw_prefetcher.prefetch(('feedback_display_order', feedback_index), max=feedback_index)
+
+
+def print_quantum_attempt(attempt_num: int, guesses: tuple[str], feedback_list: tuple[int], feedback_display_list: tuple[int], space: str = SPACE_CHAR, file=None) -> None:
+    """Prints quantum attempt (which has multiple guesses)"""
+
+    # Number of spaces in below commands determined experimentally
+    print(f'Attempt {attempt_num}:{space*6}', end='', file=file)
 
     # Print guesses
     for guess_index, guess in enumerate(guesses):
         # Print separator before every guess, except the first (0th index)
         if guess_index != 0:
-            print(f'{"|":>3} ', end='')
-        print_guess(guess)
+            print(f'{"|":>3} ', end='', file=file)
+        print_guess(guess, file)
     
     # After all guesses have been printed on the same line, go to the next line
-    print()
+    print(file=file)
 
     # Print feedback strings
 
@@ -387,145 +1870,274 @@ def print_quantum_attempt(attempt_num: int, guess_to_feedback_dict, feedback_dis
 
     # For efficiency, only generate this random order once per quantum attempt -- i.e. if we've already come up with a random display order for a quantum attempt, don't bother doing so again
     if feedback_display_list is None:
-
-        # A separate list consisting of the same feedback strings as feedback_list, but in random order -- this list will be used only for DISPLAYING the feedback
-        feedback_display_list = []
-
-        # Randomly select first feedback from feedback_list
-        # NOTE: We assume here that the superposition consists of only 2 guesses, which implies that there are only 2 feedback strings in feedback_list, which implies that the only valid list indices are 0 and 1
-        random_feedback_list_index = random_number_generator(max=1)
-
-        feedback_display_list.append(feedback_list[random_feedback_list_index])
-        # If: 
-        #   random_feedback_list_index = 0 -> remaining_feedback_list_index = 1
-        #   random_feedback_list_index = 1 -> remaining_feedback_list_index = 0
-        remaining_feedback_list_index = 1 - random_feedback_list_index
-        feedback_display_list.append(feedback_list[remaining_feedback_list_index])
+        feedback_display_list = tuple(create_feedback_display_list(feedback_list))
 
     # Print the feedback strings above each other (vertical orientation, as opposed to the horizontal orientation of the guesses), to convey that the feedback strings are in superposition and that we don't know which feedback string corresponds to which guess
     for feedback_index, feedback in enumerate(feedback_display_list):
         # Print separator above every feedback string, except the first (0th index)
         if feedback_index != 0:
-            print(f'{space*23}-----------')
-        print_guess_feedback(feedback)
-        print()
+            print(f'{space*23}-----------', file=file)
+        print_guess_feedback(feedback, file=file)
+        print(file=file)
 
     return feedback_display_list
 
 
-def print_subset_letter_usage(letter_usage_list: list[str], start_index: int, stop_index: int, extra_letter_width: int = 1) -> None:
-    """Print a subset of the letter usage list, from start_index (inclusive) to stop_index (inclusive)
-    
-    Input:
-        letter_usage_list
-        start_index
-        stop_index
-        extra_letter_width: Extra padding (width) that the letter should have when printed. Note that this is in ADDITION to the existing letter width. The letter will be printed right-aligned within this width
+def print_letter_usage(keyboard_state: KeyboardState, space: str = SPACE_CHAR, file=None) -> None:
+    """Display all the letters, visually indicating which have been used so far (in a guess) and which haven't"""
 
-    Output:
-        None
-    """
-    for index in range(start_index, stop_index+1):
-        # Note: Usually, a letter is assumed to have only 1 char and, thus, a width of 1. However, in this case, the letters can be formatted, which means they can have extra invisble characters (ANSI escape sequences) which will increase their existing width and, thus, increase the padding needed to achieve the same visual effect as applying less padding to a single-char letter
-        # In other words, the amount of padding we need to apply to achieve a certain visual spacing depends on the existing letter width
-        letter = letter_usage_list[index]
-        existing_letter_width = len(letter)
-        total_letter_width = existing_letter_width + extra_letter_width
-        print(f'{letter:>{total_letter_width}}', end='')
-
-
-def print_letter_usage(letter_usage_list: list[str], space: str = SPACE_CHAR) -> None:
-    """Display all the letters, visually indicating which have been used so far (in a guess) and which haven't"""
+    # Each keyboard row is looked up, already formatted, rather than being built letter by letter
+    first_row, second_row, third_row = render_keyboard_rows(keyboard_state.used_mask)
     
     # Make sure the word 'UNUSED' is itself in bold formatting, to serve as a hint to the user that the unused letters will be in bold formatting
-    print(f'\n{apply_bold_text("UNUSED")} / used', end='')
+    print(f'\n{apply_bold_text("UNUSED")} / used', end='', file=file)
     # Print first 10 letters
-    print(f'{space*6}', end='')
-    print_subset_letter_usage(letter_usage_list, 0, 9)
-    print()
+    print(f'{space*6}{first_row}', file=file)
     
-    print(f'{space*2}letters:', end='')
+    print(f'{space*2}letters:', end='', file=file)
     # Print next 9 letters
-    print(f'{space*10}', end='')
-    print_subset_letter_usage(letter_usage_list, 10, 18)
-    print()
+    print(f'{space*10}{second_row}', file=file)
 
     # Print last 7 letters
-    print(f'{space*21}', end='')
-    print_subset_letter_usage(letter_usage_list, 19, 25)
-    print()
-
-
-def update_letter_usage(guess: str, letter_usage_list: list[str]) -> list[str]:
-    """Given a guess and a list of all letters, update the list to visually indicate which of the letters have been used in the guess
-
-    Input:
-        guess
-        letter_usage_list
-
-    Output:
-        Updated letter usage list
-    """
-    for letter in guess:
-        # Remember: All letters in letter_usage_list start off in bold formatting so, to facilitate a comparison between those letters and the letters in guess, we need to ensure the letters in guess are also in bold formatting
-        letter = apply_bold_text(letter)
-
-        if letter in letter_usage_list:
-            # Visually distinguish the used letters
-            letter_index = letter_usage_list.index(letter)
-            # Remove bold formatting from the used letter
-            letter_usage_list[letter_index] = remove_bold_text(letter_usage_list[letter_index])
-            # Convert the used letter to lower_case
-            letter_usage_list[letter_index] = letter_usage_list[letter_index].lower()
-    return letter_usage_list
+    print(f'{space*21}{third_row}', file=file)
 
 
-def print_game_state(attempts_list: list[Attempt], letter_usage_list: list[str], word_length: int = WORD_LENGTH, max_attempts: int = MAX_ATTEMPTS, num_guesses_in_superposition: int = NUM_GUESSES_IN_SUPERPOSITION, attempt_types: AttemptType = AttemptType) -> None:
-    """Print out all the attempts, including any guesses the user might have made in those attempts and their associated feedback
+def write_game_state(attempts_list: list[Attempt], keyboard_state: KeyboardState, word_length: int = WORD_LENGTH, max_attempts: int = MAX_ATTEMPTS, num_guesses_in_superposition: int = NUM_GUESSES_IN_SUPERPOSITION, attempt_types: AttemptType = AttemptType, file=None) -> None:
+    """Print out all the attempts, including any guesses the user might have made in those attempts and their associated feedback, followed by the letter usage
     
+    Unlike print_game_state(), does not clear the previous output first -- used to build a frame (see build_game_state_frame())
+
     Input:
         attempts_list: List of all attempts, both used and unused
-        letter_usage_list: List of all unused letters
+        keyboard_state: Which letters have been used so far
         word_length: Number of letters that the answer contains and, thus, that every guess has to contain
         max_attempts: Number of chances that user has to guess the answer
         num_guesses_in_superposition
         attempt_types: Enum containing the various attempt types
+        file: Where to print to (a file-like object). Defaults to stdout
 
     Output:
         None
     """
-    
-    # Clear previous output
-    # Experimentally, setting 'wait' to True (which delays clearing old output till new output is available to replace it) seems to be a little smoother visually, since you're less likely to see the flash of blank screen between old output being cleared and new output being printed
-    clear_output(wait=True)
-
-    print('Welcome to Quantum Wordle!')
-    print(f'Can you guess the mystery {word_length}-letter word in {max_attempts} attempts or less?')
-    print(f'Remember: Each quantum attempt has {num_guesses_in_superposition} guesses and {num_guesses_in_superposition} clues, but you do NOT know which clue corresponds to which guess until you measure the attempt!')
+    print('Welcome to Quantum Wordle!', file=file)
+    print(f'Can you guess the mystery {word_length}-letter word in {max_attempts} attempts or less?', file=file)
+    print(f'Remember: Each quantum attempt has {num_guesses_in_superposition} guesses and {num_guesses_in_superposition} clues, but you do NOT know which clue corresponds to which guess until you measure the attempt!', file=file)
 
     for attempt_index, attempt in enumerate(attempts_list):
         
         attempt_num = attempt_index + 1
-        guess_to_feedback_dict = attempt.guess_to_feedback_dict
         attempt_type = attempt.type
 
         # Add new line before every attempt
-        print()
+        print(file=file)
 
         # User hasn't gotten to this attempt yet
         if attempt_type is None:
-            print_unused_attempt(attempt_num)
+            print_unused_attempt(attempt_num, file=file)
 
         # Classical attempt
         elif attempt_type is attempt_types.CLASSICAL:
-            print_classical_attempt(attempt_num,guess_to_feedback_dict)
+            # Classical attempts only have one guess
+            print_classical_attempt(attempt_num, ALL_GUESSES[attempt.guess_indices[0]], attempt.feedback_codes[0], file=file)
         
         # Quantum attempt
         else:
-            attempt.feedback_display_list = print_quantum_attempt(attempt_num, guess_to_feedback_dict, attempt.feedback_display_list)
+            attempt.feedback_display_list = print_quantum_attempt(attempt_num, attempt.guesses, attempt.feedback_codes, attempt.feedback_display_list, file=file)
 
     # Print letter usage
-    print_letter_usage(letter_usage_list)
+    print_letter_usage(keyboard_state, file=file)
+
+
+def get_game_state_key(attempts_list: list[Attempt], keyboard_state: KeyboardState, num_guesses_in_superposition: int = NUM_GUESSES_IN_SUPERPOSITION) -> tuple:
+    """Returns a hashable summary of everything that write_game_state() displays, so that two game states with the same key are displayed identically"""
+    # Every attempt of a game is stored in the same board (see setup_game()), so the board already holds everything that's displayed about the attempts
+    # Only the used letters are displayed, not their colours
+    return (attempts_list[0].board.tobytes(), keyboard_state.used_mask, num_guesses_in_superposition)
+
+
+class GameStateFrameCache:
+    """Least recently used (LRU) cache of game state frames (the full text that write_game_state() prints), keyed by game state (see get_game_state_key())
+    
+    The game state is redrawn every time the user is asked for a choice, even if nothing changed (eg. invalid choice, failed quantum attempt), so those redraws reuse the previous frame instead of rebuilding it line by line
+    """
+
+    def __init__(self, max_size: int = GAME_STATE_FRAME_CACHE_SIZE):
+        self.max_size: int = max_size
+        # Ordered from least recently used to most recently used
+        self._frames: OrderedDict = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, game_state_key: tuple, build_frame) -> str:
+        """Returns the frame for the given game state, only calling build_frame() if that game state hasn't been displayed recently"""
+        with self._lock:
+            if game_state_key in self._frames:
+                self._frames.move_to_end(game_state_key)
+                return self._frames[game_state_key]
+
+        frame = build_frame()
+        with self._lock:
+            self._frames[game_state_key] = frame
+            self._frames.move_to_end(game_state_key)
+            while len(self._frames) > self.max_size:
+                # Evict least recently used
+                self._frames.popitem(last=False)
+        return frame
+
+
+GAME_STATE_FRAME_CACHE = GameStateFrameCache()
+
+
+def build_game_state_frame(attempts_list: list[Attempt], keyboard_state: KeyboardState, num_guesses_in_superposition: int = NUM_GUESSES_IN_SUPERPOSITION, frame_cache: GameStateFrameCache = GAME_STATE_FRAME_CACHE) -> str:
+    """Returns the full text of the game state (see write_game_state()) as one string, instead of printing it piece by piece"""
+
+    # Quantum attempts must have a feedback display order before the game state key is taken, since print_quantum_attempt() would otherwise choose one (randomly) while building the frame
+    for attempt in attempts_list:
+        if (attempt.type is AttemptType.QUANTUM) and (attempt.feedback_display_list is None):
+            attempt.feedback_display_list = tuple(create_feedback_display_list(attempt.feedback_codes))
+
+    def build_frame() -> str:
+        # Collect everything that would have been printed into a single buffer. The buffer is passed explicitly rather than by redirecting stdout, since sys.stdout is shared by every thread (eg. other game server sessions)
+        frame_buffer = StringIO()
+        write_game_state(attempts_list, keyboard_state, num_guesses_in_superposition=num_guesses_in_superposition, file=frame_buffer)
+        return frame_buffer.getvalue()
+
+    return frame_cache.get(get_game_state_key(attempts_list, keyboard_state, num_guesses_in_superposition), build_frame)
+
+
+def get_display_width(line: str, ansi_escape_code_pattern: re.Pattern = ANSI_ESCAPE_CODE_PATTERN) -> int:
+    """Returns the number of terminal columns that a line of text takes up when displayed
+    
+    ANSI escape sequences (eg. bold formatting) take up no columns, while wide characters (eg. the coloured square emojis) take up two
+    """
+    line = ansi_escape_code_pattern.sub('', line)
+    return sum(2 if unicodedata.east_asian_width(char) in 'WF' else 1 for char in line)
+
+
+class NotebookRenderer:
+    """Displays game state frames in a Jupyter notebook, replacing the previous frame's output"""
+
+    def render(self, frame: str) -> None:
+        # Experimentally, setting 'wait' to True (which delays clearing old output till new output is available to replace it) seems to be a little smoother visually, since you're less likely to see the flash of blank screen between old output being cleared and new output being printed
+        get_clear_output()(wait=True)
+        # Print the whole frame at once, rather than as many small prints (see design notes on the Jupyter input prompt bug)
+        sys.stdout.write(frame)
+        sys.stdout.flush()
+
+
+class DisplayHandleRenderer:
+    """Displays game state frames in a Jupyter notebook through a single display handle, updating it in place instead of clearing and reprinting the cell output
+    
+    Since nothing else in the cell's output is cleared, this is meant to be used with input from widgets (see NotebookGame) rather than input(), whose prompts would otherwise pile up below the frame
+    """
+
+    def __init__(self):
+        # Created when the first frame is displayed
+        self._display_handle = None
+        self._previous_frame: str = None
+
+    def render(self, frame: str) -> None:
+        # Frames are displayed as plain text, which Jupyter shows with its ANSI formatting (eg. bold letters) intact
+        frame_data = {'text/plain': frame}
+        if self._display_handle is None:
+            self._display_handle = get_display()(frame_data, raw=True, display_id=True)
+        # Unchanged game states give back the same (cached) frame, so there's nothing to update
+        elif frame is not self._previous_frame:
+            self._display_handle.update(frame_data, raw=True)
+        self._previous_frame = frame
+
+
+class TerminalRenderer:
+    """Displays game state frames in a terminal, only redrawing the lines that changed since the previous frame
+    
+    The first frame is drawn from the top of a cleared screen. After that, the frame is assumed to still start at the top of the screen, so each changed line is overwritten in place using ANSI cursor movement, and everything below the frame (eg. the previous menu and input) is cleared. Everything is written in one go, followed by a single flush
+    """
+
+    def __init__(self, output=None, reserved_rows: int = TERMINAL_RENDER_RESERVED_ROWS):
+        # Stream that frames are written to. Defaults to the current sys.stdout (looked up on every render, since it can be redirected)
+        self.output = output
+        # Number of rows below the frame that are kept free for the menu, input prompts and messages. If the frame plus these rows don't fit in the terminal, the screen would scroll and the frame would no longer start at the top, so the whole screen is redrawn instead
+        self.reserved_rows: int = reserved_rows
+        # Lines of the previous frame, along with the terminal row that each one starts on. None until the first frame has been drawn (or after the screen has been fully redrawn without fitting)
+        self._previous_lines: list[str] = None
+        self._previous_line_rows: list[int] = None
+        self._previous_terminal_size: os.terminal_size = None
+
+    def _get_line_rows(self, lines: list[str], terminal_num_columns: int) -> tuple[list[int], int]:
+        """Returns the (1-based) terminal row that each line starts on, taking into account lines that wrap over multiple rows, along with the row just after the last line"""
+        line_rows = []
+        row = 1
+        for line in lines:
+            line_rows.append(row)
+            # Even an empty line takes up one row
+            row += max(1, -(-get_display_width(line) // terminal_num_columns))
+        return line_rows, row
+
+    def render(self, frame: str, ansi_clear_screen: str = ANSI_ESCAPE_CODE_CLEAR_SCREEN, ansi_clear_line: str = ANSI_ESCAPE_CODE_CLEAR_LINE, ansi_clear_below: str = ANSI_ESCAPE_CODE_CLEAR_BELOW) -> None:
+        output = self.output or sys.stdout
+        terminal_size = shutil.get_terminal_size()
+        lines = frame.split('\n')
+        line_rows, end_row = self._get_line_rows(lines, terminal_size.columns)
+        frame_fits = end_row - 1 + self.reserved_rows <= terminal_size.lines
+
+        # Build the text to write in one buffer
+        frame_buffer = []
+        if (self._previous_lines is None) or (terminal_size != self._previous_terminal_size) or not frame_fits:
+            # Full redraw
+            frame_buffer.append(ansi_clear_screen)
+            frame_buffer.append(frame)
+        else:
+            for line_index, (line, line_row) in enumerate(zip(lines, line_rows)):
+                # Only redraw a line if its text changed or, since an earlier line now wraps differently, it starts on a different row
+                if (line_index < len(self._previous_lines)) and (line == self._previous_lines[line_index]) and (line_row == self._previous_line_rows[line_index]):
+                    continue
+                # Move cursor to start of the line's row, overwrite the line and clear whatever is left of the old line
+                frame_buffer.append(f'\033[{line_row};1H{line}{ansi_clear_line}')
+            # Move cursor to the end of the frame (where the last line ends, since frames end with a newline) and clear everything below it
+            last_line_row = line_rows[-1]
+            last_line_width = get_display_width(lines[-1]) % terminal_size.columns
+            frame_buffer.append(f'\033[{last_line_row};{last_line_width + 1}H{ansi_clear_below}')
+
+        output.write(''.join(frame_buffer))
+        output.flush()
+
+        if frame_fits:
+            self._previous_lines = lines
+            self._previous_line_rows = line_rows
+            self._previous_terminal_size = terminal_size
+        else:
+            # Frame has (probably) scrolled off the top of the screen, so the next frame can't be drawn in place
+            self._previous_lines = None
+
+
+def create_game_renderer(render_mode: str = RENDER_MODE):
+    """Returns a new renderer for the given render mode ('terminal', 'notebook' or 'auto')
+    
+    In 'auto' mode, the terminal renderer is used if the output is an interactive terminal, and the notebook renderer otherwise
+    """
+    if render_mode == 'auto':
+        render_mode = 'terminal' if sys.stdout.isatty() else 'notebook'
+    if render_mode == 'terminal':
+        return TerminalRenderer()
+    if render_mode == 'notebook':
+        return NotebookRenderer()
+    raise ValueError(f'Unknown render mode: {render_mode!r}')
+
+
+def print_game_state(attempts_list: list[Attempt], keyboard_state: KeyboardState, num_guesses_in_superposition: int = NUM_GUESSES_IN_SUPERPOSITION, renderer=None) -> None:
+    """Replace the previous output with the current game state (see write_game_state())
+    
+    Input:
+        attempts_list: List of all attempts, both used and unused
+        keyboard_state: Which letters have been used so far
+        num_guesses_in_superposition
+        renderer: Used to display the game state. If not given, the previous output is cleared as in a Jupyter notebook (see NotebookRenderer)
+
+    Output:
+        None
+    """
+    if renderer is None:
+        renderer = NotebookRenderer()
+    renderer.render(build_game_state_frame(attempts_list, keyboard_state, num_guesses_in_superposition))
 
 
 def safe_input(user_prompt: str = '') -> str:
@@ -570,7 +2182,7 @@ def safe_guess_input(user_prompt: str = '', allowed_word_length: int = WORD_LENG
     return guess
 
 
-def get_guess_feedback(guess_str: str, answer_str: str, word_length: int = WORD_LENGTH, right_guess_feedback_string: str = RIGHT_GUESS_FEEDBACK_STRING) -> str:
+def get_guess_feedback(guess_str: str, answer_str: str, word_length: int = WORD_LENGTH) -> str:
     """Compares the guess with the answer and returns colour feedback indicating how close the guess was.
 
     Input:
@@ -582,11 +2194,28 @@ def get_guess_feedback(guess_str: str, answer_str: str, word_length: int = WORD_
 
     Output:
         Returns a string consisting of word_length coloured boxes, where each box indicates the correctness of the corresponding letter of the guess word
+        The game itself only stores feedback codes (see get_guess_feedback_code()) -- this is just a convenience for displaying feedback directly
+    """
+    return feedback_code_to_string(get_guess_feedback_code(guess_str, answer_str, word_length))
+
+
+def get_guess_feedback_code(guess_str: str, answer_str: str, word_length: int = WORD_LENGTH, right_guess_feedback_code: int = RIGHT_GUESS_FEEDBACK_CODE) -> int:
+    """Compares the guess with the answer and returns a feedback code indicating how close the guess was.
+
+    Input:
+        guess_str: Guess word input by the user
+        answer_str: Answer word
+        Note: 
+            - Assumes both input strings are the same 'case', so they can be compared
+            - Assumes both input strings consist of word_length characters
+
+    Output:
+        Returns a feedback code (integer) whose base-3 digits indicate the correctness of the corresponding letters of the guess word
     """
 
     # The guess is the same as the answer -- i.e. all the letters of the guess word are both the right letter and in the right position
     if guess_str == answer_str:
-        return right_guess_feedback_string
+        return right_guess_feedback_code
     
     else:
         # Convert both guess and answer from string to list
@@ -597,10 +2226,10 @@ def get_guess_feedback(guess_str: str, answer_str: str, word_length: int = WORD_
         # [0, 1, 2, 3, 4]
         word_index_list = range(word_length)
 
-        # Each element of this list will be a coloured box character, where each box indicates the correctness of the corresponding letter of the guess word
+        # Each element of this list will be a feedback digit, where each digit indicates the correctness of the corresponding letter of the guess word
         # Assuming word_length = 5:
         # [None, None, None, None, None]
-        colour_feedback_list = [None for i in word_index_list]
+        feedback_digit_list = [None for i in word_index_list]
 
         # NOTE: If there are repeated letters in either guess or answer, looking for a match (for each letter of guess) by iterating over the letters of answer from left to right is NOT guaranteed to work!
         # Eg. Let guess be 'CABAL' and 
@@ -616,7 +2245,7 @@ def get_guess_feedback(guess_str: str, answer_str: str, word_length: int = WORD_
         for index, guess_char, answer_char in zip(word_index_list, guess_char_list, answer_char_list[:]):
             # Since we are only comparing guess and answer letters in the same position, if they match, then we already know that it's both the right letter and the right position
             if guess_char == answer_char:
-                colour_feedback_list[index] = RIGHT_LETTER_RIGHT_SPOT_COLOUR
+                feedback_digit_list[index] = RIGHT_LETTER_RIGHT_SPOT_DIGIT
                 # Now that a char in answer has been matched by a char in guess, remove that char from answer so that other chars in guess don't accidentally match it
                 # Specifically, to avoid changing the length of answer_char_list, replace current char with None since that's guaranteed not to match any letter)
                 answer_char_list[index] = None
@@ -632,7 +2261,7 @@ def get_guess_feedback(guess_str: str, answer_str: str, word_length: int = WORD_
         # For efficiency, only check the guess letters whose correctness is still unknown
         for guess_index, guess_char in enumerate(guess_char_list):
             # Correctness of this guess letter is still unknown
-            if colour_feedback_list[guess_index] is None:
+            if feedback_digit_list[guess_index] is None:
                 guess_char_in_answer = False
                 # Technically, we only need to compare each guess letter to all the answer letters that are NOT in the same position (since we already compared against the answer letter in the same position above), but it's simpler to just compare against every answer letter
                 # Can safely compare guess letter against every answer letter without worrying about matching a previously matched answer letter, since the answer letters that were previously matched above have been replaced with None, which is guaranteed not to match any letter in guess
@@ -640,7 +2269,7 @@ def get_guess_feedback(guess_str: str, answer_str: str, word_length: int = WORD_
                     # Guess letter is the right letter but we already know it's in the wrong position (since otherwise we would have matched it above)
                     if guess_char == answer_char:
                         guess_char_in_answer = True
-                        colour_feedback_list[guess_index] = RIGHT_LETTER_WRONG_SPOT_COLOUR
+                        feedback_digit_list[guess_index] = RIGHT_LETTER_WRONG_SPOT_DIGIT
                         # Again, replace the matched answer letter with None so it doesn't accidentally get matched again later on by another (duplicate) guess letter
                         answer_char_list[answer_index] = None
                         # Now that we've found a match for the current guess letter, stop iterating through answer so that we don't wrongly match another (duplicate) answer letter and replace that with None as well!
@@ -648,11 +2277,92 @@ def get_guess_feedback(guess_str: str, answer_str: str, word_length: int = WORD_
                         break
                 # At this point, have checked guess_char against every letter in answer -- if we still haven't found a match, then guess_char is simply the wrong letter
                 if not guess_char_in_answer:
-                    colour_feedback_list[guess_index] = WRONG_LETTER_COLOUR
+                    feedback_digit_list[guess_index] = WRONG_LETTER_DIGIT
+
+        # Now that we've assembled the feedback digits for all the letters in the guess word, combine them into a single feedback code and return it
+        feedback_code = 0
+        # Go from the last (most significant) digit to the first (least significant) digit
+        for feedback_digit in reversed(feedback_digit_list):
+            feedback_code = (feedback_code * 3) + feedback_digit
+        return feedback_code
 
-        # Now that we've assembled the colour feedback list for all the letters in the guess word, convert it from list to string and return it
-        colour_feedback_str = ''.join(colour_feedback_list)
-        return colour_feedback_str
+
+def words_to_letter_array(words: tuple[str], word_length: int = WORD_LENGTH) -> np.ndarray:
+    """Converts a list of words to a 2D array of letters, where each row is one word and each letter is stored as a number from 0 ('A') to 25 ('Z')
+    
+    Eg. ('ABBEY', 'TWINS') -> [[0, 1, 1, 4, 24], [19, 22, 8, 13, 18]]
+    """
+    if isinstance(words, PackedWordList):
+        return words.to_letter_array(word_length)
+
+    # Assumes every word consists of word_length upper case (ASCII) letters, so each letter is exactly one byte
+    letter_array = np.frombuffer(''.join(words).encode('ascii'), dtype=np.uint8).reshape(-1, word_length)
+    return letter_array - ord('A')
+
+
+@lru_cache(maxsize=None)
+def get_answers_letter_array() -> np.ndarray:
+    """Returns ANSWERS as a 2D array of letters (see words_to_letter_array()), converting it only once and then sharing it with every subsequent caller"""
+    return words_to_letter_array(ANSWERS)
+
+
+def get_guess_feedback_codes(guesses, answers: tuple[str] = ANSWERS, word_length: int = WORD_LENGTH, chunk_size: int = 256) -> np.ndarray:
+    """Vectorized version of get_guess_feedback_code(): Compares one or more guesses against every answer at once and returns the feedback codes
+    
+    Input:
+        guesses: Either a single guess word, a list of guess words, or a 2D array of letters (see words_to_letter_array())
+        answers: Either a list of answer words or a 2D array of letters. Defaults to all possible answers
+        chunk_size: Number of guesses compared at a time. Limits how much temporary memory is needed when comparing many guesses
+
+    Output:
+        If guesses is a single word: 1D array containing the feedback code for that guess against each answer
+        Otherwise: 2D array where the value at [guess_index, answer_index] is the feedback code for that guess against that answer
+    """
+    single_guess = isinstance(guesses, str)
+    if single_guess:
+        guesses = (guesses,)
+    if not isinstance(guesses, np.ndarray):
+        guesses = words_to_letter_array(guesses, word_length)
+    if answers is ANSWERS:
+        answers = get_answers_letter_array()
+    elif not isinstance(answers, np.ndarray):
+        answers = words_to_letter_array(answers, word_length)
+
+    # Place value of each feedback digit
+    # Eg. Assuming word_length = 5: [1, 3, 9, 27, 81]
+    place_values = 3 ** np.arange(word_length)
+
+    feedback_codes = np.empty((len(guesses), len(answers)), dtype=np.uint8)
+    for chunk_start in range(0, len(guesses), chunk_size):
+        guess_chunk = guesses[chunk_start:(chunk_start + chunk_size)]
+
+        # Same two-pass logic as get_guess_feedback_code(), but applied to every (guess, answer) pair in the chunk at once
+
+        # 1st pass: Right letter and right position -- compare each guess letter to the answer letter in the same position only
+        # Shape: (num_guesses, num_answers, word_length)
+        right_spot = guess_chunk[:, np.newaxis, :] == answers[np.newaxis, :, :]
+
+        # 2nd pass: Right letter but wrong position
+        # A guess letter (that isn't already in the right spot) is in the wrong spot if the answer still has an unmatched copy of that letter -- i.e. a copy that wasn't matched in the 1st pass and wasn't already matched by a duplicate of the same letter earlier in the guess
+        wrong_spot = np.zeros_like(right_spot)
+        for guess_index in range(word_length):
+            guess_letter = guess_chunk[:, guess_index, np.newaxis]
+            # Number of copies of the guess letter in the answer that weren't matched in the 1st pass
+            num_unmatched_copies = ((answers[np.newaxis, :, :] == guess_letter[:, :, np.newaxis]) & ~right_spot).sum(axis=2)
+            # Number of copies already matched by duplicates of the same letter earlier (further left) in the guess
+            num_copies_already_matched = np.zeros(num_unmatched_copies.shape, dtype=num_unmatched_copies.dtype)
+            for earlier_guess_index in range(guess_index):
+                same_letter = guess_chunk[:, earlier_guess_index, np.newaxis] == guess_letter
+                num_copies_already_matched += same_letter & wrong_spot[:, :, earlier_guess_index]
+            wrong_spot[:, :, guess_index] = ~right_spot[:, :, guess_index] & (num_unmatched_copies > num_copies_already_matched)
+
+        # Combine the feedback digits into feedback codes
+        feedback_digits = (right_spot * RIGHT_LETTER_RIGHT_SPOT_DIGIT) + (wrong_spot * RIGHT_LETTER_WRONG_SPOT_DIGIT)
+        feedback_codes[chunk_start:(chunk_start + chunk_size)] = feedback_digits @ place_values
+
+    if single_guess:
+        return feedback_codes[0]
+    return feedback_codes
 
 
 def test_get_guess_feedback() -> None:
@@ -753,6 +2463,336 @@ def test_get_guess_feedback() -> None:
 # test_get_guess_feedback()
 
 
+def test_get_guess_feedback_codes(num_guesses: int = 200) -> None:
+    """Used to quickly test that get_guess_feedback_codes() gives the same results as get_guess_feedback_code()"""
+
+    # Include the guesses from test_get_guess_feedback(), since they cover the tricky cases with repeated letters
+    guesses = ('TWINS', 'FRAUD', 'SWORE', 'WEEPY', 'EERIE', 'LEVER', 'KEBAB', 'PAPAL', 'WEARY') + ALLOWED_GUESSES_EXCLUDING_ANSWERS[:num_guesses]
+    feedback_codes = get_guess_feedback_codes(guesses)
+    for guess_index, guess in enumerate(guesses):
+        expected_feedback_codes = [get_guess_feedback_code(guess, answer) for answer in ANSWERS]
+        if feedback_codes[guess_index].tolist() == expected_feedback_codes:
+            print('Pass')
+        else:
+            print(f'Fail! Guess: {guess}')
+
+# # Uncomment to run test suite
+# test_get_guess_feedback_codes()
+
+
+def test_feedback_string_to_code(feedback_palettes: dict = FEEDBACK_PALETTES, feedback_render_tables: dict = FEEDBACK_RENDER_TABLES, num_feedback_codes: int = NUM_FEEDBACK_CODES) -> None:
+    """Used to quickly test that feedback_string_to_code() is the reverse of every palette's render table (see build_feedback_render_table())"""
+
+    for palette_name, feedback_digit_to_colour in feedback_palettes.items():
+        # feedback_string_to_code() reads one char per letter, so it can't read palettes whose colours take up more than one char (eg. HTML)
+        if any(len(colour) != 1 for colour in feedback_digit_to_colour):
+            continue
+        render_table = feedback_render_tables[palette_name]
+        wrong_feedback_codes = [feedback_code for feedback_code in range(num_feedback_codes) if feedback_string_to_code(render_table[feedback_code], feedback_digit_to_colour) != feedback_code]
+        if not wrong_feedback_codes:
+            print('Pass')
+        else:
+            print(f'Fail! Palette: {palette_name}, feedback codes: {wrong_feedback_codes}')
+
+    # The feedback strings from the original (string-based) checker must also map back to the right codes
+    for guess, answer in (('SWORE', 'WEARY'), ('EERIE', 'LEVER'), ('KEBAB', 'PAPAL'), ('TWINS', 'TWINS')):
+        if feedback_string_to_code(get_guess_feedback(guess, answer), feedback_palettes[FEEDBACK_PALETTE_NAME]) == get_guess_feedback_code(guess, answer):
+            print('Pass')
+        else:
+            print(f'Fail! Guess: {guess}, answer: {answer}')
+
+# # Uncomment to run test suite
+# test_feedback_string_to_code()
+
+
+def build_feedback_matrix(guesses: tuple[str] = ALL_GUESSES, answers: tuple[str] = ANSWERS) -> np.ndarray:
+    """Computes the feedback code for every combination of guess and answer
+    
+    Input:
+        guesses: Words that will make up the rows of the matrix. Defaults to all allowed guesses
+        answers: Words that will make up the columns of the matrix
+
+    Output:
+        2D array of feedback codes, where the value at [guess_index, answer_index] is the feedback code for that guess compared against that answer
+    """
+    return get_guess_feedback_codes(words_to_letter_array(guesses), answers)
+
+
+def write_file_atomically(file_path: Path, write_contents) -> None:
+    """Writes a file by calling write_contents(file) on a temporary file in the same folder, and then renaming the temporary file to file_path
+    
+    An interrupted write thus never leaves behind a partially-written file. The temporary file's name includes the process and thread ID, so that several processes (or threads) writing the same file at once (eg. all building the same cache on first use) never write into each other's temporary file -- whichever finishes last simply replaces the others' file
+    """
+    file_path = Path(file_path)
+    temp_file_path = file_path.with_name(f'{file_path.name}.{os.getpid()}.{get_ident()}.tmp')
+    try:
+        with open(temp_file_path, 'wb') as temp_file:
+            write_contents(temp_file)
+        temp_file_path.replace(file_path)
+    except BaseException:
+        temp_file_path.unlink(missing_ok=True)
+        raise
+
+
+def get_word_lists_digest(*word_lists) -> str:
+    """Returns a hash of the contents (and order) of the given word lists, eg. to check that a file built from them was built from the same word lists"""
+    word_lists_hash = hashlib.sha256()
+    for word_list in word_lists:
+        if isinstance(word_list, PackedWordList):
+            # Much faster than decoding every word. Always hashed in little-endian byte order, like the packed word files
+            word_lists_hash.update(np.asarray(word_list.packed_words, dtype='<u4').tobytes())
+        else:
+            word_lists_hash.update('\n'.join(word_list).encode())
+        # Separates the lists, so that moving a word from the end of one list to the start of the next changes the hash
+        word_lists_hash.update(b'\0')
+    return word_lists_hash.hexdigest()
+
+
+class FeedbackMatrix:
+    """Precomputed feedback code for every combination of guess and answer, so that looking up feedback does not require comparing words
+    
+    The matrix is built once and saved to disk -- after that, it is memory-mapped from disk rather than rebuilt
+    Next to the matrix, a small JSON file (same name, but .json) records the format version and a hash of the word lists that the matrix was built from. The matrix is rebuilt if either doesn't match, so that editing a word list (even without changing its length) never leaves a stale matrix in use
+    """
+
+    def __init__(self, file_path: Path = FEEDBACK_MATRIX_FILE_PATH, guesses: tuple[str] = ALL_GUESSES, answers: tuple[str] = ANSWERS, format_version: int = FEEDBACK_MATRIX_FORMAT_VERSION):
+        # Words that make up the rows (guesses) and columns (answers) of the matrix. A word's row or column is found with index() -- for a PackedWordList, that is a binary search over the packed words, so no strings are decoded
+        self.guesses: PackedWordList = guesses
+        self.answers: PackedWordList = answers
+        self.num_columns: int = len(answers)
+
+        file_path = Path(file_path)
+        metadata_file_path = file_path.with_suffix('.json')
+        expected_metadata = {'format_version': format_version, 'word_lists_digest': get_word_lists_digest(guesses, answers)}
+        try:
+            saved_metadata = json.loads(metadata_file_path.read_text())
+        except (OSError, ValueError):
+            saved_metadata = None
+        # Only (re)build the matrix if it hasn't been saved yet, or if it was saved for different word lists or by a different version of this code
+        if (not file_path.exists()) or (saved_metadata != expected_metadata):
+            feedback_matrix = build_feedback_matrix(guesses, answers)
+            # The matrix is written before its metadata, so that the metadata never describes a matrix that isn't there yet
+            write_file_atomically(file_path, partial(np.save, arr=feedback_matrix))
+            write_file_atomically(metadata_file_path, lambda metadata_file: metadata_file.write(json.dumps(expected_metadata).encode()))
+
+        # Memory-map the matrix rather than reading it all into memory -- the OS will only load the pages that are actually accessed, and will share them between processes
+        self.matrix: np.ndarray = np.load(file_path, mmap_mode='r')
+        # Flat (1D) view over the same memory. Indexing into a memoryview of bytes returns a plain (cached) Python int, so lookups don't allocate a new NumPy scalar every time
+        self.flat_matrix_view: memoryview = memoryview(self.matrix).cast('B')
+
+    def get_feedback_code(self, guess: str, answer: str) -> int:
+        """Returns the feedback code for the given guess compared against the given answer"""
+        return self.flat_matrix_view[(self.guesses.index(guess) * self.num_columns) + self.answers.index(answer)]
+
+
+@lru_cache(maxsize=None)
+def get_feedback_matrix() -> FeedbackMatrix:
+    """Returns the feedback matrix for all allowed guesses and answers, loading (or, the first time, building) it on first use and then sharing it with every subsequent caller"""
+    return FeedbackMatrix()
+
+
+def lookup_guess_feedback_code(guess: str, answer: str, guess_index: int, answer_index: int) -> int:
+    """Returns the feedback code for the guess compared against the answer (see get_guess_feedback_code())
+    
+    Input:
+        guess, answer
+        guess_index: Index of the guess in ALL_GUESSES (i.e. its row in the feedback matrix)
+        answer_index: Index of the answer in ANSWERS (i.e. its column in the feedback matrix), or None if it isn't one of them
+    
+    If the feedback matrix has been loaded (eg. by warm_up()), the code is a single lookup in it, rather than being computed letter by letter. Otherwise, it is computed directly, so that a game never has to wait for the matrix to be built
+    """
+    # Only use the matrix if something has already loaded it
+    if (answer_index is not None) and get_feedback_matrix.cache_info().currsize:
+        feedback_matrix = get_feedback_matrix()
+        return feedback_matrix.flat_matrix_view[(guess_index * feedback_matrix.num_columns) + answer_index]
+    return get_guess_feedback_code(guess, answer)
+
+
+def mask_to_bitset(mask: np.ndarray) -> int:
+    """Converts a boolean array to a bitset (Python integer), where bit i is set if mask[i] is True"""
+    return int.from_bytes(np.packbits(mask, bitorder='little').tobytes(), 'little')
+
+
+def bitset_to_indices(bitset: int) -> list[int]:
+    """Returns the indices of the set bits in the bitset, in increasing order"""
+    bitset_bytes = bitset.to_bytes((bitset.bit_length() + 7) // 8, 'little')
+    return np.flatnonzero(np.unpackbits(np.frombuffer(bitset_bytes, dtype=np.uint8), bitorder='little')).tolist()
+
+
+class AnswerBitsetIndex:
+    """Index of every possible answer, by letter, used to quickly find the answers that are consistent with a guess's feedback
+    
+    Each set of answers is stored as a bitset (Python integer), where bit i is set if answer i (i.e. answers[i]) is in the set. Narrowing down the answers is then just a few bitwise ANDs, rather than a scan over every answer
+    """
+
+    def __init__(self, answers: PackedWordList = ANSWERS, word_length: int = WORD_LENGTH, num_letters: int = 26):
+        self.answers: PackedWordList = answers
+        letter_array = words_to_letter_array(answers, word_length)
+        # Bitset of all answers
+        self.all_answers_bitset: int = (1 << len(letter_array)) - 1
+        # position_letter_bitsets[position][letter] = Bitset of answers with that letter at that position
+        self.position_letter_bitsets: list[list[int]] = [[mask_to_bitset(letter_array[:, position] == letter) for letter in range(num_letters)] for position in range(word_length)]
+        # min_letter_count_bitsets[letter][count] = Bitset of answers containing that letter at least count times (count from 0 to word_length + 1)
+        letter_counts = np.stack([(letter_array == letter).sum(axis=1) for letter in range(num_letters)])
+        self.min_letter_count_bitsets: list[list[int]] = [[mask_to_bitset(letter_counts[letter] >= count) for count in range(word_length + 2)] for letter in range(num_letters)]
+
+    def get_consistent_answers_bitset(self, guess: str, feedback_code: int, word_length: int = WORD_LENGTH) -> int:
+        """Returns the bitset of answers that would have given this feedback for this guess (which is empty if no answer could give this feedback for this guess)"""
+        consistent_answers_bitset = self.all_answers_bitset
+        # Number of times each guess letter is known to appear in the answer (green or yellow), and whether the answer is known to contain no more than that (i.e. the letter also got a grey)
+        min_letter_counts = {}
+        letter_count_is_exact = set()
+        for position, guess_char in enumerate(guess):
+            letter = ord(guess_char) - ord('A')
+            feedback_code, feedback_digit = divmod(feedback_code, 3)
+            if feedback_digit == RIGHT_LETTER_RIGHT_SPOT_DIGIT:
+                consistent_answers_bitset &= self.position_letter_bitsets[position][letter]
+            else:
+                # Yellow or grey: The answer has some other letter in this position
+                consistent_answers_bitset &= ~self.position_letter_bitsets[position][letter]
+            if feedback_digit == WRONG_LETTER_DIGIT:
+                letter_count_is_exact.add(letter)
+                min_letter_counts.setdefault(letter, 0)
+            elif (feedback_digit == RIGHT_LETTER_WRONG_SPOT_DIGIT) and (letter in letter_count_is_exact):
+                # Yellows are given out from left to right, so a letter can't be yellow after the same letter was grey -- no answer gives this feedback
+                # Eg. 'MINIM' can give 🟨🟥🟥🟥🟥, but not 🟥🟥🟥🟥🟨
+                return 0
+            else:
+                min_letter_counts[letter] = min_letter_counts.get(letter, 0) + 1
+
+        for letter, min_letter_count in min_letter_counts.items():
+            consistent_answers_bitset &= self.min_letter_count_bitsets[letter][min_letter_count]
+            if letter in letter_count_is_exact:
+                consistent_answers_bitset &= ~self.min_letter_count_bitsets[letter][min_letter_count + 1]
+        return consistent_answers_bitset & self.all_answers_bitset
+
+
+@lru_cache(maxsize=None)
+def get_answer_bitset_index() -> AnswerBitsetIndex:
+    """Returns the bitset index of ANSWERS, building it on first use and then sharing it with every subsequent caller"""
+    return AnswerBitsetIndex()
+
+
+class CandidateTracker:
+    """Keeps track of which answers are still possible in a game, narrowing them down incrementally as the feedback for each attempt comes in
+    
+    For a quantum attempt that hasn't been measured yet, it's unknown which feedback belongs to which guess -- each possible pairing of guesses with feedback is a "branch", and the answer is possible if it's consistent with ANY of the attempt's branches
+    Since every attempt constrains the same answer, the possible answers are the intersection (over attempts) of the union (over each attempt's branches), so each quantum attempt is reduced to a single bitset on its own. This avoids combining the branches of different attempts with each other, which would mean 2^q combinations for q quantum attempts (with 2 guesses each)
+    """
+
+    def __init__(self, answer_bitset_index: AnswerBitsetIndex = None, word_length: int = WORD_LENGTH, num_letters: int = 26):
+        if answer_bitset_index is None:
+            answer_bitset_index = get_answer_bitset_index()
+        self.answer_bitset_index: AnswerBitsetIndex = answer_bitset_index
+        # Bitset of answers that are still possible
+        self.candidate_bitset: int = answer_bitset_index.all_answers_bitset
+        # Bitset of answers that are consistent with the feedback of every classical attempt so far
+        self.classical_candidate_bitset: int = answer_bitset_index.all_answers_bitset
+        # Guess and feedback code of each classical attempt added so far
+        self.classical_attempts: list[tuple[str, int]] = []
+        # For each unmeasured quantum attempt (by attempt index): Its guesses, its feedback codes (in display order) and the bitset of answers consistent with any of its branches
+        self.quantum_attempts: dict[int, tuple[tuple[str], tuple[int], int]] = {}
+        # Min and max number of times each letter (0 = 'A' to 25 = 'Z') can appear in the answer, given the feedback of the classical attempts so far. Tightened as each classical attempt is added (see update_letter_count_bounds())
+        self.min_letter_counts: list[int] = [0] * num_letters
+        self.max_letter_counts: list[int] = [word_length] * num_letters
+
+    def add_classical_attempt(self, guess: str, feedback_code: int) -> None:
+        """Narrow down the possible answers using the feedback for a classical attempt"""
+        consistent_answers_bitset = self.answer_bitset_index.get_consistent_answers_bitset(guess, feedback_code)
+        self.classical_candidate_bitset &= consistent_answers_bitset
+        self.candidate_bitset &= consistent_answers_bitset
+        self.classical_attempts.append((guess, feedback_code))
+        self.update_letter_count_bounds(guess, feedback_code)
+
+    def update_letter_count_bounds(self, guess: str, feedback_code: int) -> None:
+        """Tighten the min and max number of times each letter can appear in the answer, using the feedback for one classical attempt"""
+        # Feedback digits of each distinct letter in the guess
+        letter_feedback = {}
+        for guess_char in guess:
+            feedback_code, feedback_digit = divmod(feedback_code, 3)
+            letter_feedback.setdefault(ord(guess_char) - ord('A'), []).append(feedback_digit)
+        for letter, feedback_digits in letter_feedback.items():
+            # Green and yellow both mean that the letter is in the answer. A grey means there are no more of it beyond those
+            num_in_answer = sum(feedback_digit != WRONG_LETTER_DIGIT for feedback_digit in feedback_digits)
+            if num_in_answer > self.min_letter_counts[letter]:
+                self.min_letter_counts[letter] = num_in_answer
+            if (WRONG_LETTER_DIGIT in feedback_digits) and (num_in_answer < self.max_letter_counts[letter]):
+                self.max_letter_counts[letter] = num_in_answer
+
+    def get_letter_count_bounds(self, word_length: int = WORD_LENGTH) -> dict[str, tuple[int, int]]:
+        """Returns the (min, max) number of times each letter can appear in the answer, for the letters that the feedback so far says anything about
+        
+        Eg. {'A': (1, 1), 'E': (0, 0), 'S': (1, 5)}
+        """
+        return {chr(ord('A') + letter): (min_letter_count, max_letter_count) for letter, (min_letter_count, max_letter_count) in enumerate(zip(self.min_letter_counts, self.max_letter_counts)) if (min_letter_count > 0) or (max_letter_count < word_length)}
+
+    def _get_branches_bitset(self, guesses: tuple[str], feedback_codes: tuple[int], starting_bitset: int) -> int:
+        """Returns the bitset of answers (within starting_bitset) that are consistent with at least one pairing (branch) of the guesses with the feedback codes
+        
+        The branches are built up one guess at a time, where each partial branch is the feedback codes not yet paired with a guess, along with the answers consistent with the pairings made so far
+        Partial branches with the same unpaired feedback codes and the same answers will always end up the same, so they're merged into one, and partial branches with no answers left are dropped. Eg. Two guesses with the same feedback only have one distinct branch
+        """
+        # Maps (sorted unpaired feedback codes, bitset) -> None, i.e. an ordered set of partial branches
+        partial_branches = {(tuple(sorted(feedback_codes)), starting_bitset): None}
+        for guess in guesses:
+            next_partial_branches = {}
+            for unpaired_feedback_codes, branch_bitset in partial_branches:
+                # Pair this guess with each distinct unpaired feedback code
+                for code_index, feedback_code in enumerate(unpaired_feedback_codes):
+                    if (code_index > 0) and (feedback_code == unpaired_feedback_codes[code_index - 1]):
+                        continue
+                    next_branch_bitset = branch_bitset & self.answer_bitset_index.get_consistent_answers_bitset(guess, feedback_code)
+                    if next_branch_bitset:
+                        next_partial_branches[(unpaired_feedback_codes[:code_index] + unpaired_feedback_codes[code_index + 1:], next_branch_bitset)] = None
+            partial_branches = next_partial_branches
+
+        branches_bitset = 0
+        for _, branch_bitset in partial_branches:
+            branches_bitset |= branch_bitset
+        return branches_bitset
+
+    def add_quantum_attempt(self, attempt_index: int, guesses: list[str], feedback_codes: list[int]) -> None:
+        """Narrow down the possible answers using the feedback for an (unmeasured) quantum attempt, without knowing which feedback code belongs to which guess
+        
+        Input:
+            attempt_index: Identifies the attempt when it's later measured (see collapse_quantum_attempt())
+            guesses
+            feedback_codes: Feedback codes for the guesses, in any order (eg. display order)
+        """
+        # Only answers that are still possible need to be checked against the branches
+        branches_bitset = self._get_branches_bitset(tuple(guesses), tuple(feedback_codes), self.candidate_bitset)
+        self.quantum_attempts[attempt_index] = (tuple(guesses), tuple(feedback_codes), branches_bitset)
+        self.candidate_bitset &= branches_bitset
+
+    def collapse_quantum_attempt(self, attempt_index: int, chosen_guess: str, chosen_feedback_code: int) -> None:
+        """Update the possible answers after a quantum attempt is measured and collapses to a single guess, whose feedback code is now known
+        
+        Only the branches that pair the chosen guess with its feedback code are kept -- the other guesses' feedback is still remembered
+        """
+        guesses, feedback_codes, branches_bitset = self.quantum_attempts.pop(attempt_index)
+        remaining_guesses = list(guesses)
+        remaining_guesses.remove(chosen_guess)
+        remaining_feedback_codes = list(feedback_codes)
+        remaining_feedback_codes.remove(chosen_feedback_code)
+
+        self.add_classical_attempt(chosen_guess, chosen_feedback_code)
+        # The collapsed attempt's branches are a subset of its previous branches, so the possible answers can only shrink
+        self.candidate_bitset &= self._get_branches_bitset(tuple(remaining_guesses), tuple(remaining_feedback_codes), self.candidate_bitset)
+
+    def get_count(self) -> int:
+        """Returns the number of answers that are still possible"""
+        return self.candidate_bitset.bit_count()
+
+    def get_indices(self) -> list[int]:
+        """Returns the indices (in ANSWERS) of the answers that are still possible"""
+        return bitset_to_indices(self.candidate_bitset)
+
+    def get_candidates(self) -> list[str]:
+        """Returns the answers that are still possible, in alphabetical order"""
+        answers = self.answer_bitset_index.answers
+        return [answers[answer_index] for answer_index in self.get_indices()]
+
+
 def did_user_guess_answer(classical_attempts_list: list[Attempt], answer: str) -> bool:
     """Given a list of classical attempts, check if any of the guesses made by the user in those attempts was correct (i.e. matched the answer)
     
@@ -764,170 +2804,646 @@ def did_user_guess_answer(classical_attempts_list: list[Attempt], answer: str) -
         True/False, depending on whether any of the user's guesses was correct or not
     """
 
+    answer_index = ALL_GUESSES.index(answer)
     for attempt in classical_attempts_list:
         # Since all attempts in the list are assumed to be classical, we can also assume that they only have 1 guess each
-        guess = list(attempt.guess_to_feedback_dict.keys())[0]
-        if guess == answer:
+        if attempt.guess_indices[0] == answer_index:
             return True
         
     # If we get to this point, it means none of the attempts were successful
     return False
 
 
-def print_success_message(answer: str) -> None:
+def print_success_message(answer: str, file=None) -> None:
     """Print success message
     
     Input:
         answer: The correct answer
+        file: Where to print to (a file-like object). Defaults to stdout
     """
-    print(f'\nCongratulations!! You correctly guessed that the mystery word was "{answer}"!')
+    print(f'\nCongratulations!! You correctly guessed that the mystery word was "{answer}"!', file=file)
 
 
-def print_game_result(user_guessed_answer: bool, answer: str) -> None:
+def print_game_result(user_guessed_answer: bool, answer: str, file=None) -> None:
     """Print either a success or failure message, depending on whether the user correctly guessed the answer or not
     
     Input:
         user_guessed_answer: Boolean (True/False) indicating whether the user correctly guessed the answer or not
         answer: The correct answer
+        file: Where to print to (a file-like object). Defaults to stdout
 
     Output:
         None
     """
     if user_guessed_answer:
-        print_success_message(answer)
+        print_success_message(answer, file)
     else:
-        print(f'\nThe mystery word was "{answer}" -- better luck next time!')
+        print(f'\nThe mystery word was "{answer}" -- better luck next time!', file=file)
 
 
-def run_game(classical_attempt_option: int = CLASSICAL_ATTEMPT_OPTION, quantum_attempt_option: int = QUANTUM_ATTEMPT_OPTION, measure_option: int = MEASURE_OPTION, exit_option: int = EXIT_OPTION, num_guesses_in_superposition: int = NUM_GUESSES_IN_SUPERPOSITION, max_attempts: int = MAX_ATTEMPTS, attempt_types: AttemptType = AttemptType) -> None:
-    """Run game
+class GameStatus(Enum):
+    """Used to indicate whether a game is still being played or, if not, how it ended"""
+    IN_PROGRESS = auto()
+    WON = auto()
+    LOST = auto()
+
+
+class GameSession:
+    """A single game of Quantum Wordle: holds the game state and applies the rules of the game, without any input/output or delays
     
-    Input:
-        max_attempts: Maximum number of attempts that user has to guess the answer
+    The interactive game (run_game()) is built on top of this, but it can also be driven directly (eg. by bots, servers or tests)
+    Invalid moves raise ValueError, leaving the game state unchanged
+    """
+
+    def __init__(self, answer: str = None, max_attempts: int = MAX_ATTEMPTS, quantum_backend: QuantumBackend = QUANTUM_BACKEND, entropy_pool: QuantumEntropyPool = QUANTUM_ENTROPY_POOL, measurement_batcher: MeasurementBatcher = None, num_guesses_in_superposition: int = NUM_GUESSES_IN_SUPERPOSITION, random_draw_prefetcher: RandomDrawPrefetcher = None):
+        """
+        Input:
+            answer: Answer for this game. If not given, a random answer is selected
+            max_attempts: Number of chances that user has to guess the answer
+            quantum_backend: Backend used to measure the game circuit
+            entropy_pool: Source of random numbers (eg. for selecting the answer)
+            measurement_batcher: If given, game circuit measurements are batched with those of other sessions sharing the same batcher (see MeasurementBatcher)
+            num_guesses_in_superposition: Number of guesses in each quantum attempt
+            random_draw_prefetcher: If given, random draws (eg. the answer, the feedback display order) are taken from it instead of entropy_pool, so that they can be prefetched (see prefetch_random_draws())
+        """
+        if num_guesses_in_superposition < 2:
+            raise ValueError(f'Quantum attempts need at least 2 guesses, not {num_guesses_in_superposition}')
+        self.answer, self.attempts_list, self.keyboard_state, self.game_circuit = setup_game(max_attempts, answer, entropy_pool, random_draw_prefetcher, num_guesses_in_superposition)
+        # Every attempt is stored in (i.e. is a view into) this board (see create_board())
+        self.board: array = self.attempts_list[0].board
+        # Column of the answer in the feedback matrix (see lookup_guess_feedback_code()), or None if the answer was given and isn't in ANSWERS
+        self.answer_index: int = ANSWERS.index(self.answer) if self.answer in ANSWERS else None
+        self.max_attempts: int = max_attempts
+        self.quantum_backend: QuantumBackend = quantum_backend
+        self.entropy_pool: QuantumEntropyPool = entropy_pool
+        self.measurement_batcher: MeasurementBatcher = measurement_batcher
+        self.num_guesses_in_superposition: int = num_guesses_in_superposition
+        self.random_draw_prefetcher: RandomDrawPrefetcher = random_draw_prefetcher
+        # Answers that are still possible, given the feedback of the attempts so far
+        self.candidate_tracker: CandidateTracker = CandidateTracker()
+        # Index of next/first available attempt
+        # Eg. Attempt 1 is located at index 0
+        self.next_available_attempt_index: int = 0
+        self.status: GameStatus = GameStatus.IN_PROGRESS
+
+    def _check_can_use_attempt(self) -> Attempt:
+        """Returns the next available attempt, raising ValueError if the user can't make another attempt"""
+        if self.status is not GameStatus.IN_PROGRESS:
+            raise ValueError('Game is already over')
+        # Attempts can't run out while the game is in progress, since the game ends as soon as the last attempt is used (see _end_game_if_out_of_attempts())
+        return self.attempts_list[self.next_available_attempt_index]
+
+    def _check_guess(self, guess: str, word_length: int = WORD_LENGTH) -> None:
+        """Raises ValueError if the guess is invalid"""
+        if (len(guess) != word_length) or not is_guess_valid(guess):
+            raise ValueError(f'Guess is invalid: {guess!r}')
+
+    def _end_game_if_out_of_attempts(self) -> None:
+        """If the user has used up all attempts, end the game, first measuring any attempts that are still quantum (i.e. still in superposition)"""
+        if self.next_available_attempt_index < self.max_attempts:
+            return
+        if any(attempt.type is AttemptType.QUANTUM for attempt in self.attempts_list):
+            self.measure()
+        if self.status is GameStatus.IN_PROGRESS:
+            # Check if the user guessed the answer in any of the attempts
+            # This includes the following scenarios, for each attempt:
+            #   - The user originally made a classical attempt, containing one guess, and that guess was correct
+            #   - The user originally made a qauntum attempt, containing multiple guesses, one of which was correct, and after we measured the quantum attempt, the single guess it collapsed to happened to be the correct one
+            self.status = GameStatus.WON if did_user_guess_answer(self.attempts_list, self.answer) else GameStatus.LOST
+
+    def classical(self, guess: str) -> int:
+        """Make a classical attempt, consisting of a single guess
+        
+        Output:
+            Feedback code for the guess (see get_guess_feedback_code())
+        """
+        current_attempt = self._check_can_use_attempt()
+        self._check_guess(guess)
+
+        # Take next available attempt off the list and use it up
+        self.next_available_attempt_index += 1
+        current_attempt.type = AttemptType.CLASSICAL
+        # Even if the guess is correct, we want to get and store its feedback so we can display it
+        guess_index = ALL_GUESSES.index(guess)
+        feedback = lookup_guess_feedback_code(guess, self.answer, guess_index, self.answer_index)
+        current_attempt.guess_indices = (guess_index,)
+        current_attempt.feedback_codes = (feedback,)
+        self.candidate_tracker.add_classical_attempt(guess, feedback)
+        self.keyboard_state.add_guess(guess)
+        self.keyboard_state.add_feedback(guess, feedback)
+
+        # Stop game if the guess is correct
+        if guess == self.answer:
+            self.status = GameStatus.WON
+        else:
+            self._end_game_if_out_of_attempts()
+        return feedback
+
+    def quantum(self, *guesses: str) -> list[int]:
+        """Make a quantum attempt, consisting of a superposition of num_guesses_in_superposition guesses
+        
+        Output:
+            Feedback codes for the guesses, in random order (i.e. it is unknown which feedback code corresponds to which guess)
+        """
+        current_attempt = self._check_can_use_attempt()
+        if len(guesses) != self.num_guesses_in_superposition:
+            raise ValueError(f'Quantum attempt needs {self.num_guesses_in_superposition} guesses, not {len(guesses)}')
+        for guess in guesses:
+            self._check_guess(guess)
+        # If user guesses the same word multiple times in their quantum attempt, that causes issues since the rest of the code reasonably assumes that a quantum attempt always has num_guesses_in_superposition DIFFERENT guesses -- thus, do not accept duplicate guesses (in the same quantum attempt -- it's okay if different attempts have the same guess)
+        if len(set(guesses)) != len(guesses):
+            raise ValueError(f'Duplicate guess: {next(guess for guess in guesses if guesses.count(guess) > 1)!r}')
+        check_register_fits(self.game_circuit, len(guesses), self.quantum_backend)
+
+        # Take next available attempt off the list and use it up
+        self.next_available_attempt_index += 1
+        current_attempt.type = AttemptType.QUANTUM
+        current_attempt.guess_indices = tuple(ALL_GUESSES.index(guess) for guess in guesses)
+        current_attempt.feedback_codes = tuple(lookup_guess_feedback_code(guess, self.answer, guess_index, self.answer_index) for guess, guess_index in zip(guesses, current_attempt.guess_indices))
+        # Letters are used, but it's not known which feedback belongs to which guess, so they don't get a colour until the attempt is measured
+        for guess in guesses:
+            self.keyboard_state.add_guess(guess)
+        current_attempt.feedback_display_list = tuple(create_feedback_display_list(current_attempt.feedback_codes, self.entropy_pool, self.random_draw_prefetcher))
+        # Only the display order of the feedback is given, since that's all the user knows
+        self.candidate_tracker.add_quantum_attempt(self.next_available_attempt_index - 1, list(guesses), current_attempt.feedback_display_list)
+        # Note: Even if one of the guesses is correct, since it's in a superposition (and thus the user has uncertainty as to exactly WHICH guess is correct), we do NOT stop the game
+        encode_quantum_attempt(current_attempt, self.game_circuit)
+
+        self._end_game_if_out_of_attempts()
+        return list(current_attempt.feedback_display_list)
+
+    def measure(self) -> None:
+        """Measure all quantum attempts made so far, collapsing each of them to a classical attempt. Note that this does NOT use up an attempt"""
+        if self.status is not GameStatus.IN_PROGRESS:
+            raise ValueError('Game is already over')
+
+        quantum_attempt_indices = self._get_quantum_attempt_indices()
+        self.game_circuit = measure_game_circuit(self.game_circuit, self.attempts_list, self.quantum_backend, measurement_batcher=self.measurement_batcher)
+        self._add_measured_attempts(quantum_attempt_indices)
+
+    def start_measurement(self, executor: ThreadPoolExecutor = None) -> Future:
+        """Same as measure(), but only starts executing the game circuit, without waiting for it to finish (see start_game_circuit_measurement())
+        
+        The measurement only takes effect once the future's result is passed to finish_measurement(), which must be done before any other move is made
+        """
+        if self.status is not GameStatus.IN_PROGRESS:
+            raise ValueError('Game is already over')
+        return start_game_circuit_measurement(self.game_circuit, self.quantum_backend, measurement_batcher=self.measurement_batcher, executor=executor)
+
+    def finish_measurement(self, measured_qubit_values: list[str]) -> None:
+        """Applies a measurement started by start_measurement(), given its future's result"""
+        quantum_attempt_indices = self._get_quantum_attempt_indices()
+        self.game_circuit = collapse_quantum_attempts(self.attempts_list, measured_qubit_values[0])
+        self._add_measured_attempts(quantum_attempt_indices)
+
+    def _get_quantum_attempt_indices(self) -> list[int]:
+        return [attempt_index for attempt_index, attempt in enumerate(self.attempts_list) if attempt.type is AttemptType.QUANTUM]
+
+    def _add_measured_attempts(self, quantum_attempt_indices: list[int]) -> None:
+        """Updates everything that depends on the attempts at the given indices, which have just been measured (i.e. collapsed from quantum to classical attempts)"""
+        # Now that it's known which guess each quantum attempt collapsed to (and thus which feedback belongs to it), the possible answers can be narrowed down further
+        for attempt_index in quantum_attempt_indices:
+            attempt = self.attempts_list[attempt_index]
+            chosen_guess = ALL_GUESSES[attempt.guess_indices[0]]
+            self.candidate_tracker.collapse_quantum_attempt(attempt_index, chosen_guess, attempt.feedback_codes[0])
+            self.keyboard_state.add_feedback(chosen_guess, attempt.feedback_codes[0])
+
+        # Now that all quantum attempts made so far have been collapsed to classical attempts, check to see if any of them happened to have collapsed to the right answer
+        # Only check the list of attempts made SO FAR -- no point in checking unused attempts. Also, did_user_guess_answer() only accepts classical attempts, not unused attempts
+        if did_user_guess_answer(self.attempts_list[:self.next_available_attempt_index], self.answer):
+            self.status = GameStatus.WON
+
+    def prefetch_random_draws(self) -> None:
+        """Speculatively start the random draws that the next move might need, so that they're ready by the time it is made. Meant to be called while waiting for the user (eg. for their input)
+        
+        Does nothing if the session has no random_draw_prefetcher
+        """
+        if (self.random_draw_prefetcher is not None) and (self.status is GameStatus.IN_PROGRESS):
+            # Next move might be a quantum attempt, whose feedback needs to be shuffled
+            prefetch_feedback_display_order(self.num_guesses_in_superposition, self.random_draw_prefetcher)
+
+    def state(self, include_candidate_answers: bool = True) -> dict:
+        """Returns a snapshot of the game state, containing only what the user is allowed to know (eg. the answer is only included once the game is over)
+        
+        Feedback is given as feedback codes -- use feedback_code_to_string() to display them
+        If include_candidate_answers is False, only the number of candidate answers is given, not the (possibly long) list of them
+        """
+        attempts = []
+        for attempt in self.attempts_list:
+            # Each of these is read from the board, so is only read once
+            attempt_type = attempt.type
+            guess_indices = attempt.guess_indices
+            if attempt_type is AttemptType.QUANTUM:
+                # Feedback in display (random) order, so it doesn't reveal which feedback corresponds to which guess
+                feedback = list(attempt.feedback_display_list)
+            else:
+                feedback = list(attempt.feedback_codes)
+            attempts.append({
+                'type': None if attempt_type is None else attempt_type.name,
+                'guesses': [ALL_GUESSES[guess_index] for guess_index in guess_indices],
+                # Whether each guess could have been the answer (see GuessType)
+                'guess_types': [get_guess_index_type(guess_index).name for guess_index in guess_indices],
+                'feedback': feedback,
+            })
+
+        return {
+            'status': self.status.name,
+            'attempts_used': self.next_available_attempt_index,
+            'max_attempts': self.max_attempts,
+            'attempts': attempts,
+            # Letters are given in keyboard order
+            'unused_letters': letters_mask_to_string(~self.keyboard_state.used_mask),
+            'green_letters': letters_mask_to_string(self.keyboard_state.green_mask),
+            'yellow_letters': letters_mask_to_string(self.keyboard_state.yellow_mask),
+            'absent_letters': letters_mask_to_string(self.keyboard_state.absent_mask),
+            # Answers that are still possible, given the feedback of the attempts so far (including quantum attempts that haven't been measured yet)
+            # Min and max number of times each letter can appear in the answer, for the letters that the classical attempts' feedback says anything about
+            'letter_count_bounds': self.candidate_tracker.get_letter_count_bounds(),
+            'num_candidate_answers': self.candidate_tracker.get_count(),
+            'candidate_answers': self.candidate_tracker.get_candidates() if include_candidate_answers else None,
+            'answer': None if self.status is GameStatus.IN_PROGRESS else self.answer,
+        }
+
+
+def test_candidate_tracker(answers: PackedWordList = ANSWERS) -> None:
+    """Used to quickly test that CandidateTracker gives the same possible answers as checking every answer against every attempt (brute force), after every move -- including quantum attempts that are measured later"""
+
+    # Each tuple contains the answer and the moves to make
+    # Each move is the guesses of an attempt (1 guess = classical attempt, more = quantum attempt), or () to measure
+    test_value_tuples = \
+        [
+            # Repeated letters in both the guesses and the answer
+            ('LEVER', [('EERIE',), ('KEBAB',), ('GEESE',)]),
+
+            # Quantum attempt that is never measured
+            ('CRANE', [('SLATE', 'MINIM'), ('ROUND',)]),
+
+            # Quantum attempt measured after a later classical attempt
+            ('PAPAL', [('SLATE', 'CRANE'), ('KEBAB',), ()]),
+
+            # Two quantum attempts measured together, including a guess that can't be the answer
+            ('WEARY', [('SWORE', 'TWINS'), ('FRAUD', 'ABBEY'), ()]),
+
+            # Game lost, with the last attempt being quantum (so it's measured when the game ends)
+            ('QUEUE', [('SLATE',), ('CRANE',), ('EERIE',), ('KEBAB',), ('PAPAL',), ('WEARY', 'SWORE')]),
+        ]
+
+    answers_list = list(answers)
+    for answer, moves in test_value_tuples:
+        session = GameSession(answer=answer)
+        # Guesses and feedback codes (in display order) of each quantum attempt, by attempt index, since measuring it only keeps the chosen guess
+        quantum_attempts = {}
+        failure = None
+        for guesses in moves:
+            if not guesses:
+                session.measure()
+            elif len(guesses) == 1:
+                session.classical(*guesses)
+            else:
+                feedback_display_list = tuple(session.quantum(*guesses))
+                quantum_attempts[session.next_available_attempt_index - 1] = (guesses, feedback_display_list)
+
+            # Each attempt requires the answer to give its guesses' feedback codes, in some order
+            # Eg. A measured quantum attempt requires the chosen guess to give its own feedback code, and the other guesses to give the other feedback codes
+            requirements = []
+            for attempt_index, attempt in enumerate(session.attempts_list[:session.next_available_attempt_index]):
+                if attempt_index not in quantum_attempts:
+                    requirements.append((attempt.guesses, attempt.feedback_codes))
+                    continue
+                guesses, feedback_codes = quantum_attempts[attempt_index]
+                if attempt.type is AttemptType.QUANTUM:
+                    requirements.append((guesses, feedback_codes))
+                else:
+                    remaining_guesses, remaining_feedback_codes = list(guesses), list(feedback_codes)
+                    remaining_guesses.remove(attempt.guesses[0])
+                    remaining_feedback_codes.remove(attempt.feedback_codes[0])
+                    requirements.append((attempt.guesses, attempt.feedback_codes))
+                    requirements.append((tuple(remaining_guesses), tuple(remaining_feedback_codes)))
+
+            expected_candidates = [candidate for candidate in answers_list if all(sorted(get_guess_feedback_code(guess, candidate) for guess in guesses) == sorted(feedback_codes) for guesses, feedback_codes in requirements)]
+            actual_candidates = session.candidate_tracker.get_candidates()
+            if actual_candidates != expected_candidates:
+                failure = (requirements, expected_candidates, actual_candidates)
+                break
+            # Every possible answer must have each letter within the tracker's letter count bounds
+            letter_count_bounds = session.candidate_tracker.get_letter_count_bounds()
+            out_of_bounds_candidates = [candidate for candidate in expected_candidates if any(not (min_letter_count <= candidate.count(letter) <= max_letter_count) for letter, (min_letter_count, max_letter_count) in letter_count_bounds.items())]
+            if out_of_bounds_candidates:
+                failure = (requirements, expected_candidates, f'{out_of_bounds_candidates} are outside the letter count bounds {letter_count_bounds}')
+                break
+
+        if failure is None:
+            print('Pass')
+        else:
+            requirements, expected_candidates, actual_candidates = failure
+            print(f'Fail! Answer: {session.answer}')
+            print(f'\tAttempts:\t{requirements}')
+            print(f'\tExpected:\t{expected_candidates}')
+            print(f'\tActual:\t\t{actual_candidates}')
+
+# # Uncomment to run test suite
+# test_candidate_tracker()
+
+
+def snapshot_session(session: GameSession, all_guesses: PackedWordList = ALL_GUESSES, answers: PackedWordList = ANSWERS) -> bytes:
+    """Serializes a game session into a compact, versioned binary snapshot, which restore_session() turns back into an identical session (eg. in another process, or after being saved to disk)
+    
+    Layout (all integers little-endian):
+        Header (see SESSION_SNAPSHOT_HEADER_FORMAT), including the keyboard state
+        max_attempts bytes: For each classical attempt seen by the candidate tracker, in the order it saw them, the index of that attempt (unused bytes are 0xFF)
+        Board (see create_board()): Attempt types, guess indices, feedback codes and feedback display order -- including quantum attempts that haven't been measured yet
+        Two bitsets of len(answers) bits each: The candidate tracker's possible answers, and those consistent with just the classical attempts. These can't be recomputed from the board, since a measured quantum attempt only keeps its chosen guess, while the tracker still remembers the feedback of the others
+    Only the game itself is saved -- the backend, entropy pool, etc. are given again when restoring
+    """
+    candidate_tracker = session.candidate_tracker
+
+    # Work out which attempt each of the tracker's classical attempts came from
+    # Eg. A quantum attempt that was measured after a later classical attempt was made comes after it
+    tracked_attempt_indices = bytearray(b'\xff' * session.max_attempts)
+    unmatched_attempt_indices = [attempt_index for attempt_index, attempt in enumerate(session.attempts_list) if attempt.type is AttemptType.CLASSICAL]
+    for position, (guess, feedback_code) in enumerate(candidate_tracker.classical_attempts):
+        for attempt_index in unmatched_attempt_indices:
+            attempt = session.attempts_list[attempt_index]
+            if (attempt.guess_indices[0] == all_guesses.index(guess)) and (attempt.feedback_codes[0] == feedback_code):
+                tracked_attempt_indices[position] = attempt_index
+                unmatched_attempt_indices.remove(attempt_index)
+                break
+
+    board = session.board
+    if sys.byteorder == 'big':
+        # Swap a copy, so that the session's own board is left unchanged
+        board = array('H', board)
+        board.byteswap()
+    bitset_num_bytes = (len(answers) + 7) // 8
+
+    header = SESSION_SNAPSHOT_HEADER_FORMAT.pack(
+        SESSION_SNAPSHOT_MAGIC, SESSION_SNAPSHOT_VERSION,
+        session.max_attempts, session.num_guesses_in_superposition, session.next_available_attempt_index, session.status.value, len(candidate_tracker.classical_attempts),
+        all_guesses.index(session.answer),
+        session.keyboard_state.used_mask, session.keyboard_state.green_mask, session.keyboard_state.yellow_mask, session.keyboard_state.absent_mask)
+    return b''.join((
+        header,
+        tracked_attempt_indices,
+        board.tobytes(),
+        candidate_tracker.candidate_bitset.to_bytes(bitset_num_bytes, 'little'),
+        candidate_tracker.classical_candidate_bitset.to_bytes(bitset_num_bytes, 'little'),
+    ))
+
+
+def restore_session(snapshot, quantum_backend: QuantumBackend = QUANTUM_BACKEND, entropy_pool: QuantumEntropyPool = QUANTUM_ENTROPY_POOL, measurement_batcher: MeasurementBatcher = None, random_draw_prefetcher: RandomDrawPrefetcher = None, all_guesses: PackedWordList = ALL_GUESSES, answers: PackedWordList = ANSWERS) -> GameSession:
+    """Reverse of snapshot_session(): Rebuilds a game session from a snapshot
+    
+    The snapshot can be any bytes-like object (eg. bytes, a memoryview of a larger buffer, a memory-mapped file) -- it is read in place rather than copied, apart from the (small) board, which is copied into the session's own board
+    Raises ValueError if the snapshot is not a valid snapshot of the current version
+    """
+    snapshot_view = memoryview(snapshot).cast('B')
+    if len(snapshot_view) < SESSION_SNAPSHOT_HEADER_FORMAT.size:
+        raise ValueError('Session snapshot is too short')
+    magic, version, max_attempts, num_guesses_in_superposition, next_available_attempt_index, status_value, num_tracked_attempts, answer_index, *keyboard_masks = SESSION_SNAPSHOT_HEADER_FORMAT.unpack_from(snapshot_view)
+    if magic != SESSION_SNAPSHOT_MAGIC:
+        raise ValueError('Not a session snapshot')
+    if version != SESSION_SNAPSHOT_VERSION:
+        raise ValueError(f'Unsupported session snapshot version: {version} (expected {SESSION_SNAPSHOT_VERSION})')
+
+    attempt_size = 1 + (3 * num_guesses_in_superposition)
+    bitset_num_bytes = (len(answers) + 7) // 8
+    tracked_attempts_start = SESSION_SNAPSHOT_HEADER_FORMAT.size
+    board_start = tracked_attempts_start + max_attempts
+    bitsets_start = board_start + (2 * max_attempts * attempt_size)
+    if len(snapshot_view) != bitsets_start + (2 * bitset_num_bytes):
+        raise ValueError('Session snapshot has the wrong size')
+
+    board = array('H')
+    board.frombytes(snapshot_view[board_start:bitsets_start])
+    if sys.byteorder == 'big':
+        board.byteswap()
+    for attempt_start in range(0, len(board), attempt_size):
+        if board[attempt_start] != 0:
+            # Raises ValueError if it isn't a valid attempt type
+            AttemptType(board[attempt_start])
+
+    session = GameSession(answer=all_guesses[answer_index], max_attempts=max_attempts, quantum_backend=quantum_backend, entropy_pool=entropy_pool, measurement_batcher=measurement_batcher, num_guesses_in_superposition=num_guesses_in_superposition, random_draw_prefetcher=random_draw_prefetcher)
+    session.next_available_attempt_index = next_available_attempt_index
+    session.status = GameStatus(status_value)
+
+    # The session's board has the same layout, since the session has the same max_attempts and num_guesses_in_superposition as the snapshot, so the whole board is copied over at once
+    session.board[:] = board
+    for attempt in session.attempts_list:
+        if attempt.type is AttemptType.QUANTUM:
+            # Quantum attempts are given qubits in the order they were made, and all of them are measured (and their qubits discarded) at once, so re-encoding them in order gives them the same qubits as before
+            encode_quantum_attempt(attempt, session.game_circuit)
+
+    keyboard_state = session.keyboard_state
+    keyboard_state.used_mask, keyboard_state.green_mask, keyboard_state.yellow_mask, keyboard_state.absent_mask = keyboard_masks
+
+    # Candidate tracker
+    candidate_tracker = session.candidate_tracker
+    for attempt_index in snapshot_view[tracked_attempts_start:tracked_attempts_start + num_tracked_attempts]:
+        attempt = session.attempts_list[attempt_index]
+        candidate_tracker.classical_attempts.append((all_guesses[attempt.guess_indices[0]], attempt.feedback_codes[0]))
+        # The letter count bounds only depend on the classical attempts, so they can be rebuilt from them
+        candidate_tracker.update_letter_count_bounds(*candidate_tracker.classical_attempts[-1])
+    candidate_tracker.candidate_bitset = int.from_bytes(snapshot_view[bitsets_start:bitsets_start + bitset_num_bytes], 'little')
+    candidate_tracker.classical_candidate_bitset = int.from_bytes(snapshot_view[bitsets_start + bitset_num_bytes:], 'little')
+    for attempt_index, attempt in enumerate(session.attempts_list):
+        if attempt.type is AttemptType.QUANTUM:
+            # The attempt's own branches bitset isn't needed again (only its guesses and feedback codes are used when it's collapsed), so the current possible answers stand in for it
+            candidate_tracker.quantum_attempts[attempt_index] = (attempt.guesses, attempt.feedback_display_list, candidate_tracker.candidate_bitset)
+
+    return session
+
+
+def save_session_snapshot(session: GameSession, file_path: Path) -> None:
+    """Saves a snapshot of the game session (see snapshot_session()) to a file, eg. to evict an idle session from memory"""
+    # Write to a temporary file first and then rename it, so that an interrupted save never leaves behind a partially-written snapshot
+    snapshot = snapshot_session(session)
+    write_file_atomically(file_path, lambda snapshot_file: snapshot_file.write(snapshot))
+
+
+def load_session_snapshot(file_path: Path, **restore_session_kwargs) -> GameSession:
+    """Reverse of save_session_snapshot(): Restores a game session from a snapshot file. Any keyword arguments are passed on to restore_session()"""
+    return restore_session(Path(file_path).read_bytes(), **restore_session_kwargs)
+
+
+def get_session_differences(session: GameSession, other_session: GameSession) -> list[str]:
+    """Returns the names of the parts of the game state that differ between the two sessions (eg. to check a restored session against the original). Used by the tests"""
+    tracker, other_tracker = session.candidate_tracker, other_session.candidate_tracker
+    keyboard_state, other_keyboard_state = session.keyboard_state, other_session.keyboard_state
+    checks = {
+        'state': session.state() == other_session.state(),
+        'answer': session.answer == other_session.answer,
+        'board': session.board == other_session.board,
+        'qubits': (session.game_circuit.num_qubits == other_session.game_circuit.num_qubits) and ([attempt.qubit_indices for attempt in session.attempts_list] == [attempt.qubit_indices for attempt in other_session.attempts_list]),
+        'candidates': (tracker.candidate_bitset == other_tracker.candidate_bitset) and (tracker.classical_candidate_bitset == other_tracker.classical_candidate_bitset),
+        'tracked attempts': (tracker.classical_attempts == other_tracker.classical_attempts) and ({attempt_index: quantum_attempt[:2] for attempt_index, quantum_attempt in tracker.quantum_attempts.items()} == {attempt_index: quantum_attempt[:2] for attempt_index, quantum_attempt in other_tracker.quantum_attempts.items()}),
+        'keyboard': (keyboard_state.used_mask, keyboard_state.green_mask, keyboard_state.yellow_mask, keyboard_state.absent_mask) == (other_keyboard_state.used_mask, other_keyboard_state.green_mask, other_keyboard_state.yellow_mask, other_keyboard_state.absent_mask),
+    }
+    return [check_name for check_name, check_passed in checks.items() if not check_passed]
+
+
+def test_session_snapshot() -> None:
+    """Used to quickly test that restore_session() rebuilds exactly the session that snapshot_session() was given, and that invalid snapshots are rejected"""
+
+    # Each tuple contains the answer and the moves to make before taking the snapshot
+    # Each move is the guesses of an attempt (1 guess = classical attempt, more = quantum attempt), or () to measure
+    test_value_tuples = \
+        [
+            # New game
+            ('CRANE', []),
+
+            # Classical attempt
+            ('CRANE', [('SLATE',)]),
+
+            # Quantum attempt that hasn't been measured yet
+            ('CRANE', [('SLATE', 'MINIM')]),
+
+            # Quantum attempts on either side of a classical attempt, none of them measured yet
+            ('LEVER', [('SLATE', 'MINIM'), ('EERIE',), ('KEBAB', 'TWINS')]),
+
+            # Quantum attempt measured after a later classical attempt (so the tracker saw them in a different order than they were made)
+            ('LEVER', [('SLATE', 'MINIM'), ('EERIE',), ()]),
+
+            # Game won
+            ('CRANE', [('SLATE',), ('CRANE',)]),
+
+            # Game lost, with the last attempt being quantum (so it's measured when the game ends)
+            ('FRAUD', [('SLATE',), ('CRANE',), ('EERIE',), ('KEBAB',), ('PAPAL',), ('WEARY', 'SWORE')]),
+        ]
+
+    for answer, moves in test_value_tuples:
+        session = GameSession(answer=answer)
+        for guesses in moves:
+            if not guesses:
+                session.measure()
+            elif len(guesses) == 1:
+                session.classical(*guesses)
+            else:
+                session.quantum(*guesses)
+        restored_session = restore_session(snapshot_session(session))
+        differences = get_session_differences(session, restored_session)
+        # The restored session must also keep playing the same way: measuring it narrows down the possible answers just like measuring the original would
+        if (not differences) and (session.status is GameStatus.IN_PROGRESS) and any(attempt.type is AttemptType.QUANTUM for attempt in session.attempts_list):
+            restored_session.measure()
+            differences = [f'after measuring: {difference}' for difference in get_session_differences(restored_session, restore_session(snapshot_session(restored_session)))]
+            if (not differences) and (restored_session.candidate_tracker.candidate_bitset & ~session.candidate_tracker.candidate_bitset):
+                differences = ['after measuring: possible answers grew']
+        if differences:
+            print(f'Fail! Answer: {answer}, moves: {moves}, differences: {differences}')
+        else:
+            print('Pass')
+
+    # Saving to a file and loading it again
+    session = GameSession(answer='CRANE')
+    session.quantum('SLATE', 'MINIM')
+    with TemporaryDirectory() as temp_directory_path:
+        snapshot_file_path = Path(temp_directory_path) / 'session.bin'
+        save_session_snapshot(session, snapshot_file_path)
+        differences = get_session_differences(session, load_session_snapshot(snapshot_file_path))
+        leftover_file_names = sorted(path.name for path in Path(temp_directory_path).iterdir() if path != snapshot_file_path)
+    if (not differences) and (not leftover_file_names):
+        print('Pass')
+    else:
+        print(f'Fail! Saved snapshot differences: {differences}, leftover files: {leftover_file_names}')
+
+    # Invalid snapshots
+    snapshot = snapshot_session(session)
+    invalid_snapshots = {
+        'empty': b'',
+        'too short': snapshot[:SESSION_SNAPSHOT_HEADER_FORMAT.size - 1],
+        'wrong magic': b'XXXX' + snapshot[len(SESSION_SNAPSHOT_MAGIC):],
+        'wrong version': SESSION_SNAPSHOT_MAGIC + bytes([SESSION_SNAPSHOT_VERSION + 1]) + snapshot[len(SESSION_SNAPSHOT_MAGIC) + 1:],
+        'truncated': snapshot[:-1],
+        'extra bytes': snapshot + b'\0',
+    }
+    for invalid_snapshot_name, invalid_snapshot in invalid_snapshots.items():
+        try:
+            restore_session(invalid_snapshot)
+        except ValueError:
+            print('Pass')
+        else:
+            print(f'Fail! Snapshot was accepted: {invalid_snapshot_name}')
+
+# # Uncomment to run test suite
+# test_session_snapshot()
+
+
+def run_game(classical_attempt_option: int = CLASSICAL_ATTEMPT_OPTION, quantum_attempt_option: int = QUANTUM_ATTEMPT_OPTION, measure_option: int = MEASURE_OPTION, exit_option: int = EXIT_OPTION, num_guesses_in_superposition: int = NUM_GUESSES_IN_SUPERPOSITION) -> None:
+    """Run game interactively, reading the user's choices and guesses as input and printing the game state as output
     
     Output:
         None
     """
 
-    answer, attempts_list, letter_usage_list, game_circuit = setup_game()
+    # Random draws are prefetched while waiting for the user's input, and the next game's answer is drawn while this game is being played
+    session = GameSession(num_guesses_in_superposition=num_guesses_in_superposition, random_draw_prefetcher=RANDOM_DRAW_PREFETCHER)
+    renderer = create_game_renderer()
     
     # Keeps track of whether the user entered an invalid choice in the previous iteration of the below loop
     user_entered_invalid_choice = False
-
-    # Index of the final attempt
-    final_attempt_index = max_attempts - 1
-    # Index of next/first available attempt
-    # Eg. Attempt 1 is located at index 0
-    next_available_attempt_index = 0
+    # Reason that the user's quantum attempt in the previous iteration of the below loop could not be made (if any)
+    quantum_attempt_error = None
 
     while True:
 
-        print_game_state(attempts_list, letter_usage_list)
-        
-        if next_available_attempt_index <= final_attempt_index:
-            # There is still at least one attempt available to use, so retrieve it
-            next_available_attempt = attempts_list[next_available_attempt_index]
-            # User can choose what to do as long as they haven't run out of attempts
-            print('\nSelect an option by entering the corresponding number:')
-            print(f'{classical_attempt_option}: Classical attempt (1 guess)')
-            print(f'{quantum_attempt_option}: Quantum attempt (superposition of 2 guesses)')
-            print(f'{measure_option}: Measure all quantum attempts (collapse to classical)')
-            print(f'{exit_option}: Exit')
-
-            # There appears to be a longstanding Jupyter notebook bug where input prompt occasionally does not appear (seemingly because previous output is printed out of order and overwrites it), which means that the code is stuck waiting for input that user cannot provide. In particular, appears to only occur at this point in code, possibly because of large quantity of output being printed above right before asking for input below, repeatedly (in a loop)
-            # After lot of research and experimentation, the combination of adding a delay and flushing pending output before asking for input seems to prevent that bug from being triggered
-            # This delay was experimentally determined to be pretty reliable
-            sleep(0.18)
-            print(end='', flush=True)
-            
-            # After printing above options, print error message if user previously made an invalid choice
-            if user_entered_invalid_choice:
-                user_entered_invalid_choice = False
-                print('\nInvalid choice! Please choose one of the available options')
-            user_choice = safe_input('--> ')
+        print_game_state(session.attempts_list, session.keyboard_state, num_guesses_in_superposition, renderer)
 
-        else:
-            # At this point, user has used up all attempts
-            # Reset to avoid confusion from previous value of user choice
-            user_choice = None
-            # If any of the attempts are still quantum (i.e. are still in superposition), measure them automatically
-            for attempt in attempts_list:
-                if attempt.type is attempt_types.QUANTUM:
-                    user_choice = measure_option
-                    break
-            # None of the attempts are still quantum
-            if user_choice is None:
-                # Check if the user guessed the answer in any of the attempts
-                # This includes the following scenarios, for each attempt:
-                #   - The user originally made a classical attempt, containing one guess, and that guess was correct
-                #   - The user originally made a qauntum attempt, containing 2 guesses, one of which was correct, and after we measured the quantum attempt, the single guess it collapsed to happened to be the correct one
-                user_guessed_answer = did_user_guess_answer(attempts_list, answer)
-                # Print either success or failure message
-                print_game_result(user_guessed_answer, answer)
-                break
+        # Game ended after the previous choice
+        if session.status is not GameStatus.IN_PROGRESS:
+            print_game_result(session.status is GameStatus.WON, session.answer)
+            break
+
+        # User can choose what to do as long as they haven't run out of attempts
+        print('\nSelect an option by entering the corresponding number:')
+        print(f'{classical_attempt_option}: Classical attempt (1 guess)')
+        print(f'{quantum_attempt_option}: Quantum attempt (superposition of {num_guesses_in_superposition} guesses)')
+        print(f'{measure_option}: Measure all quantum attempts (collapse to classical)')
+        print(f'{exit_option}: Exit')
+
+        # There appears to be a longstanding Jupyter notebook bug where input prompt occasionally does not appear (seemingly because previous output is printed out of order and overwrites it), which means that the code is stuck waiting for input that user cannot provide. In particular, appears to only occur at this point in code, possibly because of large quantity of output being printed above right before asking for input below, repeatedly (in a loop)
+        # After lot of research and experimentation, the combination of adding a delay and flushing pending output before asking for input seems to prevent that bug from being triggered
+        # This delay was experimentally determined to be pretty reliable
+        # The bug is specific to Jupyter, so there's no need to wait in a terminal
+        if not isinstance(renderer, TerminalRenderer):
+            sleep(0.18)
+        print(end='', flush=True)
+        
+        # After printing above options, print error message if user previously made an invalid choice
+        if user_entered_invalid_choice:
+            user_entered_invalid_choice = False
+            print('\nInvalid choice! Please choose one of the available options')
+        if quantum_attempt_error is not None:
+            print(f'\nQuantum attempt could not be made! {quantum_attempt_error}')
+            quantum_attempt_error = None
+        # Whatever random draws the user's next move might need can be done while they're thinking
+        session.prefetch_random_draws()
+        user_choice = safe_input('--> ')
         
         if user_choice == classical_attempt_option:
-
-            # Take next available attempt off the list and use it up -- will not be available for next iteration
-            current_attempt = next_available_attempt
-            next_available_attempt_index += 1
-
-            current_attempt.type = attempt_types.CLASSICAL
-
             guess = safe_guess_input('Enter guess: ')
-            # Even if the guess is correct, we want to get and store its feedback so we can display it
-            current_attempt.guess_to_feedback_dict[guess] = get_guess_feedback(guess, answer)
-            letter_usage_list = update_letter_usage(guess, letter_usage_list)
-
-            # Stop game if the guess is correct
-            if guess == answer:
-                # Print game state showing correct answer
-                print_game_state(attempts_list, letter_usage_list)
-                # Print message
-                print_game_result(True, answer)
-                break
+            session.classical(guess)
         
         elif user_choice == quantum_attempt_option:
-
-            # Take next available attempt off the list and use it up -- will not be available for next iteration
-            current_attempt = next_available_attempt
-            next_available_attempt_index += 1
-
-            current_attempt.type = attempt_types.QUANTUM
-
+            guesses = []
             # guess_num goes from 1 to num_guesses_in_superposition
             for guess_num in range(1, num_guesses_in_superposition + 1):
-                # If user guesses the same word multiple times in their quantum attempt, that causes issues since the rest of the code reasonably assumes that a quantum attempt always has num_guesses_in_superposition DIFFERENT guesses -- thus, do not accept duplicate guesses (in the same quantum attempt -- it's okay if different attempts have the same guess)
+                # Do not accept duplicate guesses in the same quantum attempt (see GameSession.quantum())
                 while True:
                     guess = safe_guess_input(f'Enter guess {guess_num}: ')
-                    if guess in current_attempt.guess_to_feedback_dict:
+                    if guess in guesses:
                         print('Duplicate guess! Please enter a different word')
                     else:
-                        current_attempt.guess_to_feedback_dict[guess] = get_guess_feedback(guess, answer)
-                        letter_usage_list = update_letter_usage(guess, letter_usage_list)
+                        guesses.append(guess)
                         break
-                # Note: Even if one of the guesses is correct, since it's in a superposition (and thus the user has uncertainty as to exactly WHICH guess is correct), we do NOT stop the game
-            
-            encode_quantum_attempt(current_attempt, game_circuit)
+            try:
+                session.quantum(*guesses)
+            except ValueError as error:
+                # Eg. Not enough qubits left for another quantum attempt
+                quantum_attempt_error = str(error)
 
         elif user_choice == measure_option:
-
             # Note that this choice does NOT use up an attempt!
-
-            # Measure all attempts
-            game_circuit = measure_game_circuit(game_circuit, attempts_list)
-            
-            # Now that all quantum attempts made so far have been collapsed to classical attempts, check to see if any of them happened to have collapsed to the right answer
-            # Since game isn't over yet, only print game result and exit if one of the user's quantum attempts collapsed to the correct answer (i.e. if user guessed correct answer early) -- if not, continue game
-            previous_attempt_index = next_available_attempt_index - 1
-            # Only check the list of attempts made SO FAR (index 0 to previous_attempt_index) -- no point in checking unused attempts. Also, did_user_guess_answer() only accepts classical attempts, not unused attempts
-            if did_user_guess_answer(attempts_list[:(previous_attempt_index+1)], answer):
-                # Show game state after measurement/collapse
-                print_game_state(attempts_list, letter_usage_list)
-                # Print success message
-                print_success_message(answer)
-                # Exit early
-                break
+            # If one of the user's quantum attempts collapsed to the correct answer (i.e. user guessed correct answer early), the game ends
+            session.measure()
 
         elif user_choice == exit_option:
             print('Exiting ...')
@@ -938,5 +3454,1053 @@ def run_game(classical_attempt_option: int = CLASSICAL_ATTEMPT_OPTION, quantum_a
         else:
             user_entered_invalid_choice = True
 
+
+class NotebookGame:
+    """Plays the game in a Jupyter notebook using widgets (text boxes and buttons) for input, instead of input()
+    
+    The game state is displayed once and then updated in place (see DisplayHandleRenderer), and moves are made as soon as a button is clicked, so there is no need to clear and reprint the output every turn or to work around the input prompt bug with a delay
+    """
+
+    def __init__(self, session: GameSession = None, num_guesses_in_superposition: int = NUM_GUESSES_IN_SUPERPOSITION):
+        widgets = get_ipywidgets()
+        self.session: GameSession = session or GameSession(num_guesses_in_superposition=num_guesses_in_superposition, random_draw_prefetcher=RANDOM_DRAW_PREFETCHER)
+        self.renderer: DisplayHandleRenderer = DisplayHandleRenderer()
+
+        num_guesses_in_superposition = self.session.num_guesses_in_superposition
+        # Classical attempts only use the first guess box, quantum attempts use all of them
+        self.guess_inputs = [widgets.Text(placeholder=f'Guess {guess_num}', layout=widgets.Layout(width='9em')) for guess_num in range(1, num_guesses_in_superposition + 1)]
+        self.classical_button = widgets.Button(description='Classical attempt', tooltip='1 guess (first box)')
+        self.quantum_button = widgets.Button(description='Quantum attempt', tooltip=f'Superposition of {num_guesses_in_superposition} guesses (all boxes)')
+        self.measure_button = widgets.Button(description='Measure', tooltip='Measure all quantum attempts (collapse to classical)')
+        self.exit_button = widgets.Button(description='Exit')
+        self.classical_button.on_click(self._on_classical_click)
+        self.quantum_button.on_click(self._on_quantum_click)
+        self.measure_button.on_click(self._on_measure_click)
+        self.exit_button.on_click(self._on_exit_click)
+        # Shows errors (eg. invalid guess) and, at the end, the game result
+        self.message_label = widgets.Label()
+        self.controls = widgets.VBox([
+            widgets.HBox(self.guess_inputs),
+            widgets.HBox([self.classical_button, self.quantum_button, self.measure_button, self.exit_button]),
+            self.message_label,
+        ])
+
+    def show(self) -> None:
+        """Display the game state, followed by the controls"""
+        self._render()
+        get_display()(self.controls)
+
+    def _render(self) -> None:
+        print_game_state(self.session.attempts_list, self.session.keyboard_state, self.session.num_guesses_in_superposition, self.renderer)
+        # Game now waits for the user to click a button, so prepare for their next move in the meantime
+        self.session.prefetch_random_draws()
+
+    def _get_guesses(self, num_guesses: int) -> list[str]:
+        # For consistency with safe_input(), guesses are always in upper case
+        return [guess_input.value.strip().upper() for guess_input in self.guess_inputs[:num_guesses]]
+
+    def _make_move(self, move, *args) -> None:
+        """Apply the given move to the game session and update the display. If the move is invalid, the game state is left unchanged and the reason is shown instead"""
+        try:
+            move(*args)
+        except ValueError as error:
+            self.message_label.value = str(error)
+            return
+
+        self.message_label.value = ''
+        for guess_input in self.guess_inputs:
+            guess_input.value = ''
+        self._render()
+        if self.session.status is not GameStatus.IN_PROGRESS:
+            result_buffer = StringIO()
+            print_game_result(self.session.status is GameStatus.WON, self.session.answer, result_buffer)
+            self._finish(result_buffer.getvalue().strip())
+
+    def _finish(self, message: str) -> None:
+        """Show the final message and stop accepting input"""
+        self.message_label.value = message
+        for widget in (*self.guess_inputs, self.classical_button, self.quantum_button, self.measure_button, self.exit_button):
+            widget.disabled = True
+
+    def _on_classical_click(self, button) -> None:
+        self._make_move(self.session.classical, *self._get_guesses(1))
+
+    def _on_quantum_click(self, button) -> None:
+        self._make_move(self.session.quantum, *self._get_guesses(self.session.num_guesses_in_superposition))
+
+    def _on_measure_click(self, button) -> None:
+        # Note that this does NOT use up an attempt!
+        self._make_move(self.session.measure)
+
+    def _on_exit_click(self, button) -> None:
+        self._finish('Exiting ...')
+
+
+def run_notebook_game(num_guesses_in_superposition: int = NUM_GUESSES_IN_SUPERPOSITION) -> NotebookGame:
+    """Start a game in a Jupyter notebook, played using widgets instead of text input (see NotebookGame). Returns as soon as the game is displayed -- moves are made whenever the user clicks a button"""
+    notebook_game = NotebookGame(num_guesses_in_superposition=num_guesses_in_superposition)
+    notebook_game.show()
+    return notebook_game
+
+
+# # Uncomment to play using notebook widgets instead of text input
+# run_notebook_game()
+
+
+class MoveType(Enum):
+    """Used to indicate the type of move that a self-play policy chooses to make"""
+    CLASSICAL = auto()
+    QUANTUM = auto()
+    MEASURE = auto()
+
+
+def choose_candidate_guesses(session: GameSession, num_guesses: int, random_generator: random.Random, answers: PackedWordList = ANSWERS) -> list[str]:
+    """Randomly chooses num_guesses different words from the answers that are still possible (see CandidateTracker). If there aren't enough possible answers left, the rest are chosen from all answers"""
+    candidate_answer_indices = session.candidate_tracker.get_indices()
+    guess_indices = random_generator.sample(candidate_answer_indices, min(num_guesses, len(candidate_answer_indices)))
+    while len(guess_indices) < num_guesses:
+        guess_index = random_generator.randrange(len(answers))
+        if guess_index not in guess_indices:
+            guess_indices.append(guess_index)
+    return [answers[guess_index] for guess_index in guess_indices]
+
+
+def has_quantum_attempts(session: GameSession) -> bool:
+    """Returns whether any of the session's attempts are still quantum (i.e. in superposition)"""
+    return any(attempt.type is AttemptType.QUANTUM for attempt in session.attempts_list)
+
+
+def random_policy(session: GameSession, random_generator: random.Random) -> MoveType:
+    """Self-play policy: Randomly chooses between a classical attempt, a quantum attempt and (if there is anything to measure) measuring"""
+    move_types = [MoveType.CLASSICAL, MoveType.QUANTUM]
+    if has_quantum_attempts(session):
+        move_types.append(MoveType.MEASURE)
+    return random_generator.choice(move_types)
+
+
+def always_classical_policy(session: GameSession, random_generator: random.Random) -> MoveType:
+    """Self-play policy: Always makes a classical attempt"""
+    return MoveType.CLASSICAL
+
+
+def always_quantum_policy(session: GameSession, random_generator: random.Random) -> MoveType:
+    """Self-play policy: Always makes a quantum attempt (any attempts still in superposition are measured automatically when the attempts run out)"""
+    return MoveType.QUANTUM
+
+
+def measure_at_end_policy(session: GameSession, random_generator: random.Random) -> MoveType:
+    """Self-play policy: Makes quantum attempts until only one attempt is left, then measures them all and uses the last attempt for a classical attempt"""
+    num_attempts_left = session.max_attempts - session.next_available_attempt_index
+    if num_attempts_left > 1:
+        return MoveType.QUANTUM
+    elif has_quantum_attempts(session):
+        return MoveType.MEASURE
+    else:
+        return MoveType.CLASSICAL
+
+
+def decision_tree_policy(session: GameSession, random_generator: random.Random):
+    """Always make the classical attempt chosen by the precomputed decision tree (see DecisionTree)"""
+    return MoveType.CLASSICAL, [get_decision_tree().get_next_guess(session.candidate_tracker.classical_attempts)]
+
+
+# Available self-play policies, by name. Each policy is given the game session and a random number generator, and returns the type of move to make next
+# Unless the policy also returns the guesses to make (as a tuple of the move type and the guesses), the guesses are chosen randomly from the answers that are still possible (see choose_candidate_guesses())
+SIMULATION_POLICIES = {
+    'random': random_policy,
+    'always_classical': always_classical_policy,
+    'always_quantum': always_quantum_policy,
+    'measure_at_end': measure_at_end_policy,
+    'decision_tree': decision_tree_policy,
+}
+
+
+def simulate_games(policy_name: str, num_games: int, max_attempts: int = MAX_ATTEMPTS, backend_name: str = SIMULATION_BACKEND_NAME, seed: int = None) -> dict:
+    """Plays num_games full games using the given self-play policy. Runs in a simulation worker process
+    
+    Output:
+        Statistics for the games played (see SimulationResults.add_shard_results())
+    """
+    policy = SIMULATION_POLICIES[policy_name]
+    random_generator = random.Random(seed)
+    quantum_backend = get_quantum_backend(backend_name)
+    entropy_pool = QuantumEntropyPool(quantum_backend)
+
+    num_wins = 0
+    # Number of attempts that were used in each game that was won, and in each game overall
+    winning_attempts_used = Counter()
+    attempts_used = Counter()
+    start_time = perf_counter()
+    for _ in range(num_games):
+        session = GameSession(max_attempts=max_attempts, quantum_backend=quantum_backend, entropy_pool=entropy_pool)
+        while session.status is GameStatus.IN_PROGRESS:
+            move = policy(session, random_generator)
+            move_type, guesses = move if isinstance(move, tuple) else (move, None)
+            if move_type is MoveType.CLASSICAL:
+                session.classical(*(guesses or choose_candidate_guesses(session, 1, random_generator)))
+            elif move_type is MoveType.QUANTUM:
+                session.quantum(*(guesses or choose_candidate_guesses(session, session.num_guesses_in_superposition, random_generator)))
+            else:
+                session.measure()
+
+        attempts_used[session.next_available_attempt_index] += 1
+        if session.status is GameStatus.WON:
+            num_wins += 1
+            winning_attempts_used[session.next_available_attempt_index] += 1
+
+    return {
+        'num_games': num_games,
+        'num_wins': num_wins,
+        'attempts_used': attempts_used,
+        'winning_attempts_used': winning_attempts_used,
+        'cpu_time': perf_counter() - start_time,
+    }
+
+
+class SimulationResults:
+    """Aggregated statistics from the shards of a self-play simulation"""
+
+    def __init__(self, policy_name: str, max_attempts: int):
+        self.policy_name: str = policy_name
+        self.max_attempts: int = max_attempts
+        self.num_games: int = 0
+        self.num_wins: int = 0
+        self.attempts_used: Counter = Counter()
+        self.winning_attempts_used: Counter = Counter()
+        # Total time spent playing games, summed over all worker processes
+        self.cpu_time: float = 0
+        # Wall-clock time since the simulation started
+        self.elapsed_time: float = 0
+
+    def add_shard_results(self, shard_results: dict) -> None:
+        """Merges the statistics returned by simulate_games() for one shard"""
+        self.num_games += shard_results['num_games']
+        self.num_wins += shard_results['num_wins']
+        self.attempts_used += shard_results['attempts_used']
+        self.winning_attempts_used += shard_results['winning_attempts_used']
+        self.cpu_time += shard_results['cpu_time']
+
+    def print_report(self) -> None:
+        """Print a summary of the statistics"""
+        win_rate = self.num_wins / self.num_games if self.num_games else 0
+        mean_winning_attempts = sum(num_attempts * count for num_attempts, count in self.winning_attempts_used.items()) / self.num_wins if self.num_wins else 0
+        print(f'Policy: {self.policy_name} ({self.max_attempts} attempts)')
+        print(f'  Games played:           {self.num_games}')
+        print(f'  Win rate:               {win_rate:.2%}')
+        print(f'  Mean attempts (wins):   {mean_winning_attempts:.3f}')
+        print('  Attempts used (wins):   ' + ', '.join(f'{num_attempts}: {self.winning_attempts_used[num_attempts]}' for num_attempts in range(1, self.max_attempts + 1)))
+        print(f'  Games/sec:              {self.num_games / self.elapsed_time:,.0f} (per core: {self.num_games / self.cpu_time:,.0f})')
+
+
+def run_simulation(policy_name: str, num_games: int, max_attempts: int = MAX_ATTEMPTS, num_workers: int = None, shard_size: int = SIMULATION_SHARD_SIZE, backend_name: str = SIMULATION_BACKEND_NAME, print_progress: bool = True) -> SimulationResults:
+    """Plays num_games full games with the given self-play policy (see SIMULATION_POLICIES), split into shards across a pool of worker processes, and aggregates the results as each shard finishes
+    
+    Input:
+        policy_name
+        num_games
+        max_attempts: Number of chances to guess the answer in each game
+        num_workers: Number of worker processes. Defaults to the number of CPU cores
+        shard_size: Number of games played by a worker in one go
+        backend_name: Backend used to measure game circuits (see QUANTUM_BACKEND_CLASSES)
+        print_progress: Whether to print progress after every shard -- in a notebook, the aggregated statistics so far (replacing the previous ones), otherwise one plain line per shard, so that headless runs don't need IPython
+
+    Output:
+        Aggregated statistics
+    """
+    if policy_name not in SIMULATION_POLICIES:
+        raise ValueError(f'Unknown policy: {policy_name!r} (available: {", ".join(SIMULATION_POLICIES)})')
+
+    # Build the answer bitset index before starting the workers, so that they all inherit it rather than each building it
+    get_answer_bitset_index()
+    if policy_name == 'decision_tree':
+        get_decision_tree()
+
+    # Worker processes are forked (where possible) rather than spawned, since the functions they run may only exist in this notebook rather than in an importable module
+    if 'fork' in multiprocessing.get_all_start_methods():
+        mp_context = multiprocessing.get_context('fork')
+    else:
+        mp_context = None
+
+    results = SimulationResults(policy_name, max_attempts)
+    start_time = perf_counter()
+    with ProcessPoolExecutor(max_workers=num_workers, mp_context=mp_context) as executor:
+        shard_futures = []
+        for shard_start in range(0, num_games, shard_size):
+            shard_num_games = min(shard_size, num_games - shard_start)
+            shard_futures.append(executor.submit(simulate_games, policy_name, shard_num_games, max_attempts, backend_name, secrets.randbits(64)))
+
+        # Merge each shard's results as soon as it finishes, rather than waiting for all of them
+        for shard_future in as_completed(shard_futures):
+            results.add_shard_results(shard_future.result())
+            results.elapsed_time = perf_counter() - start_time
+            if print_progress:
+                if is_running_in_notebook():
+                    get_clear_output()(wait=True)
+                    results.print_report()
+                else:
+                    print(f'{results.num_games:,} / {num_games:,} games played ({results.elapsed_time:.1f} s)', flush=True)
+
+    return results
+
+
+# # Uncomment to run a self-play simulation
+# run_simulation('measure_at_end', num_games=100_000).print_report()
+
+
+def get_partition_entropies(feedback_codes: np.ndarray, num_feedback_codes: int = NUM_FEEDBACK_CODES, chunk_size: int = 256) -> np.ndarray:
+    """Given the feedback codes of each guess (row) against each candidate answer (column), returns the entropy (in bits) of each guess's feedback partition -- i.e. how much the feedback is expected to tell us about the answer
+    
+    Each guess splits the candidate answers into groups that give the same feedback. The more evenly it splits them, the higher the entropy, and the fewer answers are expected to remain after it
+    """
+    num_guesses, num_candidates = feedback_codes.shape
+    entropies = np.empty(num_guesses)
+    # c * log2(c) for every possible group size c
+    group_sizes = np.arange(num_candidates + 1)
+    group_size_log_terms = np.zeros(num_candidates + 1)
+    group_size_log_terms[1:] = group_sizes[1:] * np.log2(group_sizes[1:])
+    # Count the group sizes of many guesses at once, by shifting each guess's feedback codes into its own range of bins
+    # Done a chunk of guesses at a time, so that the temporary arrays stay small
+    bin_offsets = (num_feedback_codes * np.arange(chunk_size, dtype=np.int32))[:, np.newaxis]
+    for chunk_start in range(0, num_guesses, chunk_size):
+        chunk = feedback_codes[chunk_start:(chunk_start + chunk_size)]
+        chunk_num_guesses = len(chunk)
+        group_size_counts = np.bincount((chunk + bin_offsets[:chunk_num_guesses]).ravel(), minlength=(num_feedback_codes * chunk_num_guesses)).reshape(chunk_num_guesses, num_feedback_codes)
+        # Entropy = -sum(p * log2(p)), where p = c / n for each group, which simplifies to log2(n) - sum(c * log2(c)) / n
+        entropies[chunk_start:(chunk_start + chunk_num_guesses)] = np.log2(num_candidates) - (group_size_log_terms[group_size_counts].sum(axis=1) / num_candidates)
+    return entropies
+
+
+def get_sorted_key_entropies(partition_keys: np.ndarray) -> np.ndarray:
+    """Same as get_partition_entropies(), but for arbitrary (eg. combined) partition keys, which can have too many possible values to count with bins
+    
+    Each row is sorted, so that answers with the same key end up next to each other, and then the length of each run of equal keys is a group size
+    """
+    num_rows, num_candidates = partition_keys.shape
+    sorted_keys = np.sort(partition_keys, axis=1, kind='stable')
+    is_group_start = np.ones((num_rows, num_candidates), dtype=bool)
+    is_group_start[:, 1:] = sorted_keys[:, 1:] != sorted_keys[:, :-1]
+    group_starts = np.flatnonzero(is_group_start)
+    group_sizes = np.diff(np.append(group_starts, num_rows * num_candidates))
+    group_rows = group_starts // num_candidates
+    return np.log2(num_candidates) - (np.bincount(group_rows, weights=(group_sizes * np.log2(group_sizes)), minlength=num_rows) / num_candidates)
+
+
+def get_quantum_partition_keys(first_guess_codes: np.ndarray, other_guesses_codes: np.ndarray, num_feedback_codes: int = NUM_FEEDBACK_CODES) -> np.ndarray:
+    """Returns the partition keys for pairing the first guess with each of the other guesses in a quantum attempt
+    
+    For a quantum attempt, the user sees both feedback codes but not which guess each belongs to, so answers are only told apart by the (unordered) pair of codes: key = (smaller code * 243) + larger code
+    Every key is less than 243^2 = 59049, so it fits in 16 bits (which also makes sorting faster)
+    """
+    smaller_codes = np.minimum(first_guess_codes, other_guesses_codes).astype(np.uint16)
+    larger_codes = np.maximum(first_guess_codes, other_guesses_codes).astype(np.uint16)
+    return (smaller_codes * num_feedback_codes) + larger_codes
+
+
+def score_guess_rows(row_start: int, row_stop: int, candidate_indices: np.ndarray) -> np.ndarray:
+    """Returns the entropy of each guess in rows row_start to row_stop (exclusive) of the feedback matrix, over the candidate answers. Run by the hint workers"""
+    feedback_matrix = get_feedback_matrix().matrix
+    feedback_codes = feedback_matrix[row_start:row_stop]
+    if len(candidate_indices) != feedback_matrix.shape[1]:
+        feedback_codes = feedback_codes[:, candidate_indices]
+    return get_partition_entropies(feedback_codes)
+
+
+def score_guess_pair_rows(first_positions: list[int], beam_rows: np.ndarray, beam_entropies: np.ndarray, candidate_indices: np.ndarray, min_entropy: float) -> list[tuple[float, int, int]]:
+    """Scores quantum attempts that pair beam guess beam_rows[i] (for each i in first_positions) with each later beam guess. Run by the hint workers
+    
+    Input:
+        first_positions: Positions (in the beam) of the first guess of each pair to score
+        beam_rows: Feedback matrix rows of the guesses in the beam, sorted from highest to lowest entropy
+        beam_entropies: Entropy of each guess in the beam on its own
+        candidate_indices
+        min_entropy: Pairs that can't score higher than this are skipped
+    
+    Output:
+        (entropy, first beam position, second beam position) of each pair that was scored
+    """
+    beam_codes = get_feedback_matrix().matrix[beam_rows][:, candidate_indices]
+    max_entropy = np.log2(len(candidate_indices))
+    pair_scores = []
+    for first_position in first_positions:
+        # The pair's partition is a coarsening of the partition by both guesses' codes, so its entropy is at most the sum of the two guesses' entropies (and at most log2(n))
+        # The beam is sorted by entropy, so once that bound drops to min_entropy, none of the remaining second guesses can do better
+        second_positions_stop = first_position + 1 + int(np.count_nonzero(beam_entropies[(first_position + 1):] + beam_entropies[first_position] > min_entropy))
+        if second_positions_stop <= first_position + 1:
+            continue
+        pair_entropies = get_sorted_key_entropies(get_quantum_partition_keys(beam_codes[first_position], beam_codes[(first_position + 1):second_positions_stop]))
+        for second_offset, pair_entropy in enumerate(pair_entropies.tolist()):
+            pair_scores.append((min(pair_entropy, max_entropy), first_position, first_position + 1 + second_offset))
+    return pair_scores
+
+
+class HintEngine:
+    """Suggests the next move, by ranking guesses by how much their feedback is expected to narrow down the answers that are still possible (i.e. the entropy of the feedback partition)
+    
+    Scoring is split across a pool of worker processes. The feedback matrix is memory-mapped from disk (see FeedbackMatrix), so every worker reads the same physical (shared) memory, rather than each having its own copy
+    Quantum attempts are scored as pairs of guesses. Scoring every pair (~14.8k^2) would take far too long, so only pairs of the best HINT_PAIR_BEAM_WIDTH single guesses are considered, and pairs that can't beat the best pairs found so far are skipped
+    """
+
+    def __init__(self, num_workers: int = HINT_NUM_WORKERS, pair_beam_width: int = HINT_PAIR_BEAM_WIDTH, guesses: PackedWordList = ALL_GUESSES):
+        self.num_workers: int = num_workers
+        self.pair_beam_width: int = pair_beam_width
+        self.guesses: PackedWordList = guesses
+        # Only created the first time it's needed, and then kept, so that later hints don't pay for starting the workers again
+        self._executor: ProcessPoolExecutor = None
+        self._executor_lock = Lock()
+
+    def _map(self, function, argument_lists: list[tuple]) -> list:
+        """Calls function once for each list of arguments, on the worker processes (or directly, if there's only one worker), and returns the results in order"""
+        if self.num_workers <= 1:
+            return [function(*arguments) for arguments in argument_lists]
+
+        with self._executor_lock:
+            if self._executor is None:
+                # Load the feedback matrix before forking, so that the workers inherit the memory-mapped matrix rather than each loading it
+                get_feedback_matrix()
+                # Worker processes are forked where possible (see run_simulation())
+                mp_context = multiprocessing.get_context('fork') if 'fork' in multiprocessing.get_all_start_methods() else None
+                self._executor = ProcessPoolExecutor(max_workers=self.num_workers, mp_context=mp_context)
+        futures = [self._executor.submit(function, *arguments) for arguments in argument_lists]
+        return [future.result() for future in futures]
+
+    def _score_all_guesses(self, candidate_indices: np.ndarray) -> np.ndarray:
+        """Returns the entropy of every guess over the candidate answers"""
+        num_guesses = len(self.guesses)
+        rows_per_task = -(-num_guesses // self.num_workers)
+        row_starts = range(0, num_guesses, rows_per_task)
+        return np.concatenate(self._map(score_guess_rows, [(row_start, min(row_start + rows_per_task, num_guesses), candidate_indices) for row_start in row_starts]))
+
+    def _get_is_candidate(self, candidate_indices: np.ndarray, answers: PackedWordList = ANSWERS) -> np.ndarray:
+        """Returns a boolean array indicating which guesses could still be the answer"""
+        is_candidate = np.zeros(len(self.guesses), dtype=bool)
+        # ALL_GUESSES is the allowed guesses followed by the answers, so answer i is in row (number of allowed guesses + i)
+        is_candidate[(len(self.guesses) - len(answers)) + candidate_indices] = True
+        return is_candidate
+
+    def suggest_classical(self, candidate_indices: list[int], num_suggestions: int = 5) -> list[tuple[str, float]]:
+        """Returns the best guesses for a classical attempt, along with the entropy (in bits) of each, from best to worst
+        
+        Guesses with equal entropy are ranked by whether they could be the answer themselves
+        """
+        candidate_indices = np.asarray(candidate_indices, dtype=np.intp)
+        entropies = self._score_all_guesses(candidate_indices)
+        is_candidate = self._get_is_candidate(candidate_indices)
+        # Sort by entropy (rounded, so that tiny floating point differences don't hide ties), then by is_candidate, both descending
+        best_rows = np.lexsort((~is_candidate, -np.round(entropies, 9)))[:num_suggestions]
+        return [(self.guesses[int(row)], float(entropies[row])) for row in best_rows]
+
+    def suggest_quantum(self, candidate_indices: list[int], num_suggestions: int = 5) -> list[tuple[tuple[str, str], float]]:
+        """Returns the best pairs of guesses for a quantum attempt, along with the entropy (in bits) of each, from best to worst
+        
+        Pairs with equal entropy are ranked by how many of their guesses could be the answer
+        """
+        candidate_indices = np.asarray(candidate_indices, dtype=np.intp)
+        entropies = self._score_all_guesses(candidate_indices)
+        beam_rows = np.argsort(-entropies, kind='stable')[:self.pair_beam_width]
+        beam_entropies = entropies[beam_rows]
+
+        # A pair is at least as good as its better guess alone, so the best pairs seen among the first few beam guesses give a lower bound that the rest have to beat
+        seed_scores = score_guess_pair_rows([0], beam_rows, beam_entropies, candidate_indices, min_entropy=-1)
+        min_entropy = sorted((pair_score[0] for pair_score in seed_scores), reverse=True)[:num_suggestions][-1] if len(seed_scores) >= num_suggestions else -1
+
+        # Interleave the first positions across tasks, since earlier positions have more (and better) pairs to score
+        first_position_lists = [list(range(1 + task_index, len(beam_rows), self.num_workers)) for task_index in range(self.num_workers)]
+        pair_scores = list(seed_scores)
+        for task_pair_scores in self._map(score_guess_pair_rows, [(first_positions, beam_rows, beam_entropies, candidate_indices, min_entropy) for first_positions in first_position_lists]):
+            pair_scores.extend(task_pair_scores)
+
+        is_candidate = self._get_is_candidate(candidate_indices)[beam_rows].tolist()
+        pair_scores.sort(key=(lambda pair_score: (round(pair_score[0], 9), is_candidate[pair_score[1]] + is_candidate[pair_score[2]])), reverse=True)
+        return [((self.guesses[int(beam_rows[first_position])], self.guesses[int(beam_rows[second_position])]), pair_entropy) for pair_entropy, first_position, second_position in pair_scores[:num_suggestions]]
+
+
+@lru_cache(maxsize=None)
+def get_hint_engine() -> HintEngine:
+    """Returns the hint engine, creating it on first use and then sharing it with every subsequent caller"""
+    return HintEngine()
+
+
+def suggest_move(session: GameSession, hint_engine: HintEngine = None, num_suggestions: int = 5) -> dict:
+    """Suggests the next move for the given game, based on the answers that are still possible (see CandidateTracker)
+    
+    Output:
+        Dictionary containing:
+            type: Type of attempt to make ('CLASSICAL' or 'QUANTUM')
+            guesses: Guesses to make in that attempt
+            expected_information: Entropy (in bits) of the attempt's feedback over the possible answers
+            classical_suggestions/quantum_suggestions: The best few (guesses, entropy) of each type
+        Quantum suggestions are only scored for quantum attempts with 2 guesses -- for any other number of guesses, quantum_suggestions is empty and only classical moves are suggested
+    """
+    if session.status is not GameStatus.IN_PROGRESS:
+        raise ValueError('Game is already over')
+    if hint_engine is None:
+        hint_engine = get_hint_engine()
+
+    candidate_indices = session.candidate_tracker.get_indices()
+    # Only one possible answer left: Just guess it
+    if len(candidate_indices) == 1:
+        answer = ANSWERS[candidate_indices[0]]
+        return {'type': AttemptType.CLASSICAL.name, 'guesses': [answer], 'expected_information': 0.0, 'classical_suggestions': [(answer, 0.0)], 'quantum_suggestions': []}
+
+    classical_suggestions = hint_engine.suggest_classical(candidate_indices, num_suggestions)
+    # HintEngine only scores pairs of guesses
+    if session.num_guesses_in_superposition == 2:
+        quantum_suggestions = hint_engine.suggest_quantum(candidate_indices, num_suggestions)
+    else:
+        quantum_suggestions = []
+    best_classical_guess, best_classical_entropy = classical_suggestions[0]
+    # Each move uses up one attempt, so suggest whichever tells us more about the answer
+    if quantum_suggestions and (quantum_suggestions[0][1] > best_classical_entropy):
+        best_quantum_guesses, best_quantum_entropy = quantum_suggestions[0]
+        move_type, guesses, expected_information = AttemptType.QUANTUM, list(best_quantum_guesses), best_quantum_entropy
+    else:
+        move_type, guesses, expected_information = AttemptType.CLASSICAL, [best_classical_guess], best_classical_entropy
+    return {
+        'type': move_type.name,
+        'guesses': guesses,
+        'expected_information': expected_information,
+        'classical_suggestions': classical_suggestions,
+        'quantum_suggestions': quantum_suggestions,
+    }
+
+
+# # Uncomment to get a suggestion for the first move of a new game
+# print(suggest_move(GameSession()))
+
+
+class DecisionTreeBuilder:
+    """Searches for the classical strategy (decision tree) that minimizes the expected number of attempts needed to guess the answer
+    
+    Each node of the tree is a set of answers that are still possible, along with the guess to make for it. Each feedback code that the guess can give leads to a child node containing the answers that give that feedback
+    The search is exponential in the worst case, so it is heavily pruned:
+        - Only the beam_width guesses with the highest entropy (see get_partition_entropies()), plus the beam_width possible answers with the highest entropy, are tried at each node
+        - A guess is skipped as soon as a lower bound on its expected attempts can't beat the best guess found so far at that node
+        - If a possible answer splits all the others into groups of 1, it is provably the best guess, so nothing else is tried
+        - Each set of possible answers is only searched once, no matter how many paths lead to it (memoization)
+    """
+
+    def __init__(self, feedback_matrix: FeedbackMatrix = None, beam_width: int = DECISION_TREE_BEAM_WIDTH, max_attempts: int = MAX_ATTEMPTS, answers: PackedWordList = ANSWERS, right_guess_feedback_code: int = RIGHT_GUESS_FEEDBACK_CODE):
+        if feedback_matrix is None:
+            feedback_matrix = get_feedback_matrix()
+        # Read the whole matrix into memory, since the search accesses all of it many times
+        self.matrix: np.ndarray = np.asarray(feedback_matrix.matrix)
+        self.beam_width: int = beam_width
+        self.max_attempts: int = max_attempts
+        self.right_guess_feedback_code: int = right_guess_feedback_code
+        # The answers are the last rows of the feedback matrix (see ALL_GUESSES)
+        self.first_answer_row: int = len(self.matrix) - len(answers)
+        # Maps (possible answers, attempts left) -> (expected attempts, guess row, {feedback code: child key})
+        self._memo: dict = {}
+
+    def _solve(self, candidate_indices: np.ndarray, attempts_left: int) -> tuple:
+        """Returns the node key for the given possible answers, after finding (and memoizing) the best guess for them"""
+        key = (candidate_indices.tobytes(), attempts_left)
+        if key in self._memo:
+            return key
+
+        num_candidates = len(candidate_indices)
+        candidate_rows = self.first_answer_row + candidate_indices
+        if num_candidates == 1:
+            # Just guess it
+            self._memo[key] = (1.0, int(candidate_rows[0]), {})
+            return key
+        if attempts_left <= 1:
+            # Can't guarantee guessing the answer in the last attempt
+            self._memo[key] = (float('inf'), None, {})
+            return key
+
+        feedback_codes = self.matrix[:, candidate_indices]
+        # If one of the possible answers gives different feedback for every other possible answer, guessing it is optimal: It's right 1/n of the time, and otherwise the next guess is always right -- (2n - 1) / n attempts on average
+        candidate_feedback_codes = feedback_codes[candidate_rows]
+        for candidate_position, codes in enumerate(candidate_feedback_codes):
+            if len(np.unique(codes)) == num_candidates:
+                children = {int(code): self._solve(candidate_indices[other_position:(other_position + 1)], attempts_left - 1) for other_position, code in enumerate(codes.tolist()) if code != self.right_guess_feedback_code}
+                self._memo[key] = ((2 * num_candidates - 1) / num_candidates, int(candidate_rows[candidate_position]), children)
+                return key
+
+        entropies = get_partition_entropies(feedback_codes)
+        beam_rows = np.argsort(-entropies, kind='stable')[:self.beam_width].tolist()
+        beam_rows += candidate_rows[np.argsort(-entropies[candidate_rows], kind='stable')[:self.beam_width]].tolist()
+
+        best_expected_attempts, best_guess_row, best_children = float('inf'), None, {}
+        for guess_row in dict.fromkeys(beam_rows):
+            codes, group_indices, group_sizes = np.unique(feedback_codes[guess_row], return_inverse=True, return_counts=True)
+            # Guess doesn't split the possible answers at all
+            if (len(codes) == 1) and (codes[0] != self.right_guess_feedback_code):
+                continue
+            # Lower bound: Every answer takes this attempt, and an answer in a group of size c takes at least (2c - 1) / c more attempts on average
+            total_attempts = num_candidates
+            min_total_attempts = num_candidates + sum((2 * group_size) - 1 for code, group_size in zip(codes.tolist(), group_sizes.tolist()) if code != self.right_guess_feedback_code)
+            if min_total_attempts >= best_expected_attempts * num_candidates:
+                continue
+
+            children = {}
+            for group_index, code in enumerate(codes.tolist()):
+                if code == self.right_guess_feedback_code:
+                    continue
+                child_key = self._solve(candidate_indices[group_indices == group_index], attempts_left - 1)
+                children[code] = child_key
+                # Replace this group's lower bound with its actual expected attempts
+                group_size = int(group_sizes[group_index])
+                min_total_attempts += (self._memo[child_key][0] * group_size) - ((2 * group_size) - 1)
+                if min_total_attempts >= best_expected_attempts * num_candidates:
+                    break
+            else:
+                best_expected_attempts, best_guess_row, best_children = min_total_attempts / num_candidates, guess_row, children
+
+        self._memo[key] = (best_expected_attempts, best_guess_row, best_children)
+        return key
+
+    def build(self, answers: PackedWordList = ANSWERS) -> dict:
+        """Builds the decision tree, returning it as a dictionary of arrays (see DecisionTree)"""
+        root_key = self._solve(np.arange(len(answers)), self.max_attempts)
+        expected_attempts = self._memo[root_key][0]
+        if expected_attempts == float('inf'):
+            raise ValueError(f'No strategy found that always guesses the answer within {self.max_attempts} attempts -- try a larger beam width')
+
+        # Number the nodes in breadth-first order, starting with the root as node 0. Identical subtrees are only stored once
+        node_indices = {root_key: 0}
+        node_keys = [root_key]
+        node_guess_rows = []
+        node_edge_starts = [0]
+        edge_feedback_codes = []
+        edge_child_nodes = []
+        answer_num_attempts = np.zeros(len(answers), dtype=np.uint8)
+        for node_key in node_keys:
+            _, guess_row, children = self._memo[node_key]
+            node_guess_rows.append(guess_row)
+            # If the node's guess is one of the node's possible answers, that answer is guessed at this node -- i.e. in attempt number (max attempts - attempts left + 1)
+            candidate_indices_bytes, attempts_left = node_key
+            guess_answer_index = guess_row - self.first_answer_row
+            if guess_answer_index in np.frombuffer(candidate_indices_bytes, dtype=np.intp):
+                answer_num_attempts[guess_answer_index] = self.max_attempts - attempts_left + 1
+            # Sorted by feedback code, so that a child can be found by binary search
+            for code in sorted(children):
+                child_key = children[code]
+                if child_key not in node_indices:
+                    node_indices[child_key] = len(node_keys)
+                    node_keys.append(child_key)
+                edge_feedback_codes.append(code)
+                edge_child_nodes.append(node_indices[child_key])
+            node_edge_starts.append(len(edge_feedback_codes))
+
+        return {
+            'node_guess_rows': np.array(node_guess_rows, dtype=np.uint16),
+            'node_edge_starts': np.array(node_edge_starts, dtype=np.uint32),
+            'edge_feedback_codes': np.array(edge_feedback_codes, dtype=np.uint8),
+            'edge_child_nodes': np.array(edge_child_nodes, dtype=np.uint32),
+            'answer_num_attempts': answer_num_attempts,
+            'expected_attempts': np.array(expected_attempts),
+        }
+
+
+def build_decision_tree(file_path: Path = DECISION_TREE_FILE_PATH, beam_width: int = DECISION_TREE_BEAM_WIDTH, guesses: PackedWordList = ALL_GUESSES, answers: PackedWordList = ANSWERS, format_version: int = DECISION_TREE_FORMAT_VERSION) -> None:
+    """Batch job: Searches for the best classical strategy (see DecisionTreeBuilder) and saves it to file_path, to be loaded by DecisionTree
+    
+    Takes a while (on the order of tens of seconds with the default beam width), which is why it's only done once
+    The format version and a hash of the word lists are saved with the tree, so that DecisionTree can tell when it needs to be rebuilt
+    """
+    decision_tree_arrays = DecisionTreeBuilder(beam_width=beam_width).build()
+    decision_tree_arrays['format_version'] = np.array(format_version)
+    decision_tree_arrays['word_lists_digest'] = np.array(get_word_lists_digest(guesses, answers))
+    # Write to a temporary file first and then rename it, so that an interrupted build never leaves behind a partially-written tree
+    write_file_atomically(file_path, partial(np.savez, **decision_tree_arrays))
+
+
+class DecisionTree:
+    """Precomputed classical strategy (see DecisionTreeBuilder), loaded from disk, used for instant bot moves and "par" scores
+    
+    Stored as flat arrays rather than nested objects, so that loading it is just reading a few arrays:
+        node_guess_rows[node]: Guess to make at the node (row in the feedback matrix, i.e. index in ALL_GUESSES). Node 0 is the root
+        node_edge_starts[node] to node_edge_starts[node + 1]: Range of the node's edges (children) in the edge arrays
+        edge_feedback_codes[edge], edge_child_nodes[edge]: Feedback code that leads to the child, and the child's node. Sorted by feedback code within each node
+        answer_num_attempts[answer]: Number of attempts the strategy takes to guess each answer (i.e. the answer's par)
+        expected_attempts: Average number of attempts over all answers
+    """
+
+    def __init__(self, file_path: Path = DECISION_TREE_FILE_PATH, guesses: PackedWordList = ALL_GUESSES, answers: PackedWordList = ANSWERS, format_version: int = DECISION_TREE_FORMAT_VERSION):
+        file_path = Path(file_path)
+        # Only (re)build the tree if it hasn't been saved yet, or if it was saved for different word lists or by a different version of this code
+        if (not file_path.exists()) or (not self.is_up_to_date(file_path, guesses, answers, format_version)):
+            build_decision_tree(file_path, guesses=guesses, answers=answers, format_version=format_version)
+        with np.load(file_path) as decision_tree_arrays:
+            self.node_guess_rows: np.ndarray = decision_tree_arrays['node_guess_rows']
+            self.node_edge_starts: np.ndarray = decision_tree_arrays['node_edge_starts']
+            self.edge_feedback_codes: np.ndarray = decision_tree_arrays['edge_feedback_codes']
+            self.edge_child_nodes: np.ndarray = decision_tree_arrays['edge_child_nodes']
+            self.answer_num_attempts: np.ndarray = decision_tree_arrays['answer_num_attempts']
+            self.expected_attempts: float = float(decision_tree_arrays['expected_attempts'])
+        self.guesses: PackedWordList = guesses
+        self.answers: PackedWordList = answers
+
+    @staticmethod
+    def is_up_to_date(file_path: Path, guesses: PackedWordList = ALL_GUESSES, answers: PackedWordList = ANSWERS, format_version: int = DECISION_TREE_FORMAT_VERSION) -> bool:
+        """Returns whether the saved tree was built by this version of the code, from the given word lists"""
+        try:
+            with np.load(file_path) as decision_tree_arrays:
+                return (int(decision_tree_arrays['format_version']) == format_version) and (str(decision_tree_arrays['word_lists_digest']) == get_word_lists_digest(guesses, answers))
+        # Eg. A tree saved before the format version was, or a corrupted file
+        except (OSError, ValueError, KeyError):
+            return False
+
+    def get_child_node(self, node: int, feedback_code: int) -> int:
+        """Returns the node to go to after the node's guess gives the feedback code, or None if the tree doesn't have one (i.e. the feedback means the guess was right, or is impossible)"""
+        edge_start, edge_stop = int(self.node_edge_starts[node]), int(self.node_edge_starts[node + 1])
+        edge = edge_start + int(np.searchsorted(self.edge_feedback_codes[edge_start:edge_stop], feedback_code))
+        if (edge < edge_stop) and (self.edge_feedback_codes[edge] == feedback_code):
+            return int(self.edge_child_nodes[edge])
+        return None
+
+    def get_next_guess(self, classical_attempts: list[tuple[str, int]]) -> str:
+        """Returns the strategy's next guess, given the guesses and feedback codes of the classical attempts so far (in order), or None if the attempts didn't follow the strategy"""
+        node = 0
+        for guess, feedback_code in classical_attempts:
+            if self.guesses[int(self.node_guess_rows[node])] != guess:
+                return None
+            node = self.get_child_node(node, feedback_code)
+            if node is None:
+                return None
+        return self.guesses[int(self.node_guess_rows[node])]
+
+    def get_par(self, answer: str) -> int:
+        """Returns the number of attempts that the strategy takes to guess the given answer"""
+        return int(self.answer_num_attempts[self.answers.index(answer)])
+
+
+@lru_cache(maxsize=None)
+def get_decision_tree() -> DecisionTree:
+    """Returns the decision tree, loading (or, the first time, building) it on first use and then sharing it with every subsequent caller"""
+    return DecisionTree()
+
+
+# # Uncomment to (re)build the decision tree
+# build_decision_tree()
+
+
+def test_decision_tree(decision_tree: DecisionTree = None, answers: PackedWordList = ANSWERS, max_attempts: int = MAX_ATTEMPTS) -> None:
+    """Used to quickly test that the decision tree's par for an answer is the number of attempts it actually takes to guess that answer by following the tree, and that the expected attempts are the average par"""
+
+    if decision_tree is None:
+        decision_tree = get_decision_tree()
+    max_par = max(decision_tree.get_par(answer) for answer in answers)
+    # The tree's first guess (if it can be the answer), the answers that take the most attempts, and answers with repeated letters (whose feedback is the trickiest)
+    test_answers = [decision_tree.get_next_guess([])] + [answer for answer in answers if decision_tree.get_par(answer) == max_par] + ['EERIE', 'LEVER', 'KEBAB', 'PAPAL', 'QUEUE']
+    wrong_pars = []
+    for answer in test_answers:
+        if answer not in answers:
+            continue
+        # Play the game by always making the tree's next guess
+        classical_attempts = []
+        # Stays None if the tree runs out of guesses (or attempts) without guessing the answer
+        num_attempts = None
+        while len(classical_attempts) < max_attempts:
+            guess = decision_tree.get_next_guess(classical_attempts)
+            if guess is None:
+                break
+            classical_attempts.append((guess, get_guess_feedback_code(guess, answer)))
+            if guess == answer:
+                num_attempts = len(classical_attempts)
+                break
+        if num_attempts != decision_tree.get_par(answer):
+            wrong_pars.append((answer, decision_tree.get_par(answer), num_attempts))
+
+    if wrong_pars:
+        print(f'Fail! (Answer, par, actual attempts): {wrong_pars[:10]}')
+    else:
+        print('Pass')
+    # The expected attempts are the average par
+    if abs(decision_tree.expected_attempts - np.mean([decision_tree.get_par(answer) for answer in answers])) < 1e-9:
+        print('Pass')
+    else:
+        print(f'Fail! Expected attempts: {decision_tree.expected_attempts}')
+
+# # Uncomment to run test suite
+# test_decision_tree()
+
+
+class LatencyRecorder:
+    """Keeps the most recent latencies (in seconds) of each kind of move, to report percentiles (eg. p99) of them"""
+
+    def __init__(self, max_samples: int = SERVER_LATENCY_MAX_SAMPLES):
+        self.max_samples: int = max_samples
+        # Maps move name to its most recent latencies
+        self._latencies: dict[str, deque] = {}
+
+    def record(self, move_name: str, latency: float) -> None:
+        if move_name not in self._latencies:
+            self._latencies[move_name] = deque(maxlen=self.max_samples)
+        self._latencies[move_name].append(latency)
+
+    def get_report(self) -> dict:
+        """Returns the number of samples and the p50, p99 and max latency (in milliseconds) of each kind of move"""
+        report = {}
+        for move_name, latencies in self._latencies.items():
+            latencies_ms = np.array(latencies) * 1000
+            p50, p99 = np.percentile(latencies_ms, [50, 99])
+            report[move_name] = {'count': len(latencies_ms), 'p50_ms': round(float(p50), 3), 'p99_ms': round(float(p99), 3), 'max_ms': round(float(latencies_ms.max()), 3)}
+        return report
+
+
+# Reason phrases for the HTTP status codes used by the game server
+HTTP_STATUS_REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed'}
+
+
+def get_server_route_name(method: str, path: str, move_names: tuple[str] = SERVER_MOVE_NAMES, other_route_name: str = SERVER_OTHER_ROUTE_NAME) -> str:
+    """Returns the name of the game server route that a request is for (see GameServer), used to group its latency with requests for the same route
+    
+    Eg. ('POST', '/games/<game_id>/measure') -> 'measure', ('GET', '/games/<game_id>') -> 'GET games'
+    Any request that isn't for one of the routes gets other_route_name, so the number of names is fixed no matter what paths clients send
+    """
+    path_parts = path.strip('/').split('/')
+    if (path_parts == ['games']) and (method == 'POST'):
+        return 'POST games'
+    if (len(path_parts) == 2) and (path_parts[0] == 'games') and (method in ('GET', 'DELETE')):
+        return f'{method} games'
+    if (len(path_parts) == 3) and (path_parts[0] == 'games') and (method == 'POST') and (path_parts[2] in move_names):
+        return path_parts[2]
+    if (path_parts == ['stats']) and (method == 'GET'):
+        return 'GET stats'
+    return other_route_name
+
+
+class GameServer:
+    """Hosts many concurrent games (GameSession) over HTTP, using asyncio
+    
+    All games share the same read-only tables (word lists, guess index, answer bitset index, feedback render tables), which are loaded once when the server starts (see load_shared_tables()). Anything that can block (eg. executing a circuit, waiting for the entropy pool) runs on a thread pool, so that it never stalls the event loop
+    If batch_measurements is True, circuit measurements from different games are batched into shared jobs (see MeasurementBatcher). This is off by default, since game circuits that take the stabilizer fast path don't execute a job at all (see SERVER_BATCH_MEASUREMENTS)
+
+    Requests and responses are JSON:
+        POST   /games                   -> Start a new game. Returns its game_id and state
+        GET    /games/<game_id>         -> Returns the game state (see GameSession.state())
+        POST   /games/<game_id>/classical  {"guess": "CRANE"}
+        POST   /games/<game_id>/quantum    {"guesses": ["CRANE", "SLATE"]}
+        POST   /games/<game_id>/measure
+        DELETE /games/<game_id>         -> End and forget the game
+        GET    /stats                   -> Number of games and move latency percentiles
+    Invalid moves get a 400 response, with the reason in 'error'
+    """
+
+    def __init__(self, quantum_backend: QuantumBackend = QUANTUM_BACKEND, num_executor_threads: int = SERVER_NUM_EXECUTOR_THREADS, batch_measurements: bool = SERVER_BATCH_MEASUREMENTS):
+        self.quantum_backend: QuantumBackend = quantum_backend
+        self.executor = ThreadPoolExecutor(max_workers=num_executor_threads)
+        # None if measurements aren't batched, in which case each game executes its own job (if it needs one)
+        self.measurement_batcher: MeasurementBatcher = MeasurementBatcher(quantum_backend) if batch_measurements else None
+        # Shared by all games, so that a new game's answer is usually already drawn by the time the game is started
+        self.random_draw_prefetcher: RandomDrawPrefetcher = RandomDrawPrefetcher()
+        # Maps game ID to its game session
+        self.sessions: dict[str, GameSession] = {}
+        # Moves on the same game are applied one at a time, even if a client sends several at once
+        self._session_locks: dict[str, asyncio.Lock] = {}
+        self.latencies: LatencyRecorder = LatencyRecorder()
+
+    def load_shared_tables(self) -> None:
+        """Loads everything that is shared between games up front, so that the first games don't have to wait for it"""
+        len(ALL_GUESSES)
+        len(ANSWERS)
+        get_answer_bitset_index()
+        warm_up(self.quantum_backend)
+
+    async def _run_blocking(self, function, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, partial(function, *args))
+
+    async def new_game(self) -> tuple[str, GameSession]:
+        # Choosing the answer may have to wait for the entropy pool to be refilled
+        session = await self._run_blocking(partial(GameSession, quantum_backend=self.quantum_backend, measurement_batcher=self.measurement_batcher, random_draw_prefetcher=self.random_draw_prefetcher))
+        game_id = secrets.token_hex(8)
+        self.sessions[game_id] = session
+        self._session_locks[game_id] = asyncio.Lock()
+        return game_id, session
+
+    def end_game(self, game_id: str) -> None:
+        del self.sessions[game_id]
+        del self._session_locks[game_id]
+
+    async def make_move(self, game_id: str, move_name: str, request_data: dict) -> GameSession:
+        """Applies a move to the given game. Raises KeyError if there is no such game, and ValueError if the move is invalid"""
+        session = self.sessions[game_id]
+        async with self._session_locks[game_id]:
+            if move_name == 'classical':
+                # Using up the last attempt ends the game, which measures any quantum attempts left (i.e. waits for the circuit to be executed)
+                await self._run_blocking(session.classical, str(request_data.get('guess', '')).upper())
+            elif move_name == 'quantum':
+                guesses = request_data.get('guesses')
+                if not isinstance(guesses, list):
+                    raise ValueError('Quantum attempt needs a list of guesses')
+                # Choosing the feedback display order draws from the entropy pool, which may have to wait for it to be refilled
+                await self._run_blocking(session.quantum, *(str(guess).upper() for guess in guesses))
+            elif move_name == 'measure':
+                # Only the circuit execution has to be waited for, and that is awaited as a future rather than holding one of the executor's threads (eg. while a batch of measurements fills up)
+                measured_qubit_values = await asyncio.wrap_future(session.start_measurement(self.executor))
+                session.finish_measurement(measured_qubit_values)
+            else:
+                raise KeyError(move_name)
+        return session
+
+    async def handle_request(self, method: str, path: str, request_data: dict) -> tuple[int, dict]:
+        """Returns the HTTP status code and JSON response for a request"""
+        path_parts = path.strip('/').split('/')
+        try:
+            if path_parts == ['games']:
+                if method != 'POST':
+                    return 405, {'error': f'Method not allowed: {method}'}
+                game_id, session = await self.new_game()
+                return 200, {'game_id': game_id, 'state': session.state(include_candidate_answers=False)}
+
+            if (len(path_parts) == 2) and (path_parts[0] == 'games'):
+                game_id = path_parts[1]
+                if method == 'GET':
+                    return 200, {'game_id': game_id, 'state': self.sessions[game_id].state(include_candidate_answers=False)}
+                if method == 'DELETE':
+                    self.end_game(game_id)
+                    return 200, {'game_id': game_id}
+                return 405, {'error': f'Method not allowed: {method}'}
+
+            if (len(path_parts) == 3) and (path_parts[0] == 'games'):
+                if method != 'POST':
+                    return 405, {'error': f'Method not allowed: {method}'}
+                game_id = path_parts[1]
+                session = await self.make_move(game_id, path_parts[2], request_data)
+                return 200, {'game_id': game_id, 'state': session.state(include_candidate_answers=False)}
+
+            if path_parts == ['stats']:
+                return 200, {'num_games': len(self.sessions), 'latencies': self.latencies.get_report()}
+
+        except KeyError:
+            return 404, {'error': f'Not found: {path}'}
+        except ValueError as error:
+            return 400, {'error': str(error)}
+
+        return 404, {'error': f'Not found: {path}'}
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serves HTTP/1.1 requests on one connection until the client closes it (connections are kept alive between requests)"""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode('latin-1').split(' ', 2)
+                headers = {}
+                while True:
+                    header_line = await reader.readline()
+                    if header_line in (b'\r\n', b'\n', b''):
+                        break
+                    header_name, _, header_value = header_line.decode('latin-1').partition(':')
+                    headers[header_name.strip().lower()] = header_value.strip()
+                request_body = await reader.readexactly(int(headers.get('content-length', 0)))
+
+                start_time = perf_counter()
+                try:
+                    request_data = json.loads(request_body) if request_body else {}
+                    if not isinstance(request_data, dict):
+                        raise ValueError
+                except ValueError:
+                    status, response_data = 400, {'error': 'Request body must be a JSON object'}
+                else:
+                    status, response_data = await self.handle_request(method, path, request_data)
+
+                response_body = json.dumps(response_data).encode()
+                writer.write(f'HTTP/1.1 {status} {HTTP_STATUS_REASONS[status]}\r\nContent-Type: application/json\r\nContent-Length: {len(response_body)}\r\n\r\n'.encode() + response_body)
+                await writer.drain()
+                # Latency of each kind of move, from receiving the request to sending the response
+                # Requests that weren't routed (eg. a game that doesn't exist) are recorded under SERVER_OTHER_ROUTE_NAME, along with unknown routes
+                route_name = get_server_route_name(method, path) if status != 404 else SERVER_OTHER_ROUTE_NAME
+                self.latencies.record(route_name, perf_counter() - start_time)
+
+                if headers.get('connection', '').lower() == 'close':
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            # Client disconnected or sent a malformed request -- just drop the connection
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host: str = SERVER_HOST, port: int = SERVER_PORT) -> asyncio.Server:
+        """Starts listening for connections and returns the (running) asyncio server"""
+        await self._run_blocking(self.load_shared_tables)
+        return await asyncio.start_server(self._handle_connection, host, port)
+
+
+def run_server(host: str = SERVER_HOST, port: int = SERVER_PORT) -> None:
+    """Run the game server until interrupted (eg. Ctrl+C). Meant to be run as a script, since it starts its own event loop"""
+
+    async def serve_forever():
+        server = await GameServer().serve(host, port)
+        print(f'Quantum Wordle server listening on http://{host}:{port}')
+        async with server:
+            await server.serve_forever()
+
+    asyncio.run(serve_forever())
+
+
+async def send_request(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, method: str, path: str, request_data: dict = None) -> tuple[int, dict]:
+    """Sends one request to the game server over an open (kept alive) connection, and returns the HTTP status code and JSON response"""
+    request_body = json.dumps(request_data).encode() if request_data is not None else b''
+    writer.write(f'{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\nContent-Length: {len(request_body)}\r\n\r\n'.encode() + request_body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    headers = {}
+    while True:
+        header_line = await reader.readline()
+        if header_line in (b'\r\n', b'\n', b''):
+            break
+        header_name, _, header_value = header_line.decode('latin-1').partition(':')
+        headers[header_name.strip().lower()] = header_value.strip()
+    return status, json.loads(await reader.readexactly(int(headers['content-length'])))
+
+
+async def play_server_game(host: str, port: int, random_generator: random.Random, answers: PackedWordList = ANSWERS) -> None:
+    """Plays one game against the game server, making random moves (a quantum attempt, then a measurement, then classical attempts until the game ends)"""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        _, response_data = await send_request(reader, writer, 'POST', '/games')
+        game_id = response_data['game_id']
+        await send_request(reader, writer, 'POST', f'/games/{game_id}/quantum', {'guesses': [answers[answer_index] for answer_index in random_generator.sample(range(len(answers)), 2)]})
+        _, response_data = await send_request(reader, writer, 'POST', f'/games/{game_id}/measure')
+        while response_data['state']['status'] == GameStatus.IN_PROGRESS.name:
+            _, response_data = await send_request(reader, writer, 'POST', f'/games/{game_id}/classical', {'guess': random_generator.choice(answers)})
+        await send_request(reader, writer, 'DELETE', f'/games/{game_id}')
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+def run_server_load_test(num_games: int = 2000, host: str = SERVER_HOST, port: int = SERVER_PORT) -> dict:
+    """Starts a game server and plays num_games games against it at the same time (each on its own connection), then prints and returns the server's move latency report"""
+
+    async def load_test() -> dict:
+        server = await GameServer().serve(host, port)
+        async with server:
+            random_generator = random.Random()
+            start_time = perf_counter()
+            await asyncio.gather(*(play_server_game(host, port, random_generator) for _ in range(num_games)))
+            elapsed_time = perf_counter() - start_time
+            reader, writer = await asyncio.open_connection(host, port)
+            _, stats = await send_request(reader, writer, 'GET', '/stats')
+            writer.close()
+            await writer.wait_closed()
+        print(f'Played {num_games} concurrent games in {elapsed_time:.2f} s')
+        for move_name, move_latencies in stats['latencies'].items():
+            print(f'  {move_name + ":":<15}{move_latencies["count"]:>8} requests    p50 {move_latencies["p50_ms"]:>8.2f} ms    p99 {move_latencies["p99_ms"]:>8.2f} ms    max {move_latencies["max_ms"]:>8.2f} ms')
+        return stats
+
+    return asyncio.run(load_test())
+
+
+# # Uncomment to run the game server (from a script -- the notebook already has its own event loop)
+# run_server()
+
+# # Uncomment to measure server latency with many concurrent games
+# run_server_load_test(num_games=2000)
+
+
+STARTUP_TIMINGS['Module import'] = perf_counter() - MODULE_IMPORT_START_TIME
+
+if WARM_UP_ON_IMPORT:
+    start_warm_up()
+
+# # Uncomment to print how long startup took (after the game has started)
+# print_startup_time_report()
+
 #! DEBUG
 # run_game()
\ No newline at end of file
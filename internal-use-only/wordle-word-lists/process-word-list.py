@@ -1,8 +1,33 @@
 import sys
+from array import array
+from pathlib import Path
+
+# Read in original word list from file and convert each word to uppercase. Then, either:
+#   - Write all the words out as a tuple, that can be directly copied and pasted into the main code
+#     Usage: python process-word-list.py <input file>
+#   - Or, if the --packed option is given, write all the words out as a compact binary file (array of packed integers), that can be loaded by the main code
+#     Usage: python process-word-list.py <input file> --packed
+#     The words are sorted alphabetically (and duplicates removed) first, since the main code binary searches them
+#     Eg. solutions.txt -> solutions.bin
+
+# Each letter ('A' to 'Z' -> 0 to 25) fits in 5 bits, so a 5-letter word fits in 25 bits (i.e. one 32-bit unsigned integer)
+BITS_PER_LETTER = 5
+
+
+def pack_word(word: str) -> int:
+    """Packs a word into a single integer, 5 bits per letter, with the first letter in the most significant bits
+
+    Since the first letter is the most significant, sorting the packed integers gives the same order as sorting the words alphabetically
+    Eg. 'ABBEY' -> (0 << 20) | (1 << 15) | (1 << 10) | (4 << 5) | 24 = 33944
+    """
+    packed_word = 0
+    for letter in word:
+        packed_word = (packed_word << BITS_PER_LETTER) | (ord(letter) - ord('A'))
+    return packed_word
 
-# Read in original word list from file, convert each word to uppercase, and then write all the words out as a tuple, that can be directly copied and pasted into the main code
 
 input_file_name = sys.argv[1]
+write_packed_output = '--packed' in sys.argv[2:]
 
 word_list = []
 with open(input_file_name) as input_file:
@@ -10,9 +35,25 @@ with open(input_file_name) as input_file:
     for word in input_file:
         word = word.strip()
         word = word.upper()
-        word_list.append(f'\'{word}\'')
+        word_list.append(word)
+
+if write_packed_output:
+    # The main code binary searches the packed words, so they must be sorted, with no duplicates
+    # (It checks this when loading the file, and refuses to use an unsorted one)
+    for word in word_list:
+        assert len(word) == 5 and word.isascii() and word.isalpha(), f'Invalid word: {word!r}'
+    word_list = sorted(set(word_list))
+    # 'I' is a 32-bit unsigned integer on all the platforms we care about
+    packed_word_array = array('I', [pack_word(word) for word in word_list])
+    assert packed_word_array.itemsize == 4
+    # Always store the file in little-endian byte order, regardless of platform
+    if sys.byteorder == 'big':
+        packed_word_array.byteswap()
+    with open(Path(input_file_name).with_suffix('.bin'), 'wb') as output_file:
+        packed_word_array.tofile(output_file)
 
-word_list_string = ', '.join(word_list)
-with open('output.txt', 'w') as output_file:
-    # Looks like this: ('APPLE', 'BANANA', ...)
-    output_file.write(f'({word_list_string})')
\ No newline at end of file
+else:
+    word_list_string = ', '.join(f'\'{word}\'' for word in word_list)
+    with open('output.txt', 'w') as output_file:
+        # Looks like this: ('APPLE', 'BANANA', ...)
+        output_file.write(f'({word_list_string})')